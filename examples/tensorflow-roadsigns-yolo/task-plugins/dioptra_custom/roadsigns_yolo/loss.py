@@ -22,7 +22,7 @@ from structlog.stdlib import BoundLogger
 from dioptra import pyplugs
 from dioptra.sdk.exceptions import TensorflowDependencyError
 from dioptra.sdk.utilities.decorators import require_package
-from dioptra.sdk.object_detection.losses import YOLOV1Loss
+from dioptra.sdk.object_detection.losses import YOLOV1FusedLoss, YOLOV1Loss
 from dioptra.sdk.object_detection.bounding_boxes.iou import (
     TensorflowBoundingBoxesBatchedGridIOU,
 )
@@ -36,8 +36,11 @@ def init_yolo_v1_loss(
     bbox_iou: TensorflowBoundingBoxesBatchedGridIOU,
     wh_loss: str = "sq_relative_diff",
     classification_loss: str = "categorical_crossentropy",
-) -> YOLOV1Loss:
-    return YOLOV1Loss(
+    fused: bool = False,
+) -> YOLOV1Loss | YOLOV1FusedLoss:
+    loss_cls = YOLOV1FusedLoss if fused else YOLOV1Loss
+
+    return loss_cls(
         bbox_grid_iou=bbox_iou,
         wh_loss_type=wh_loss,
         classification_loss_type=classification_loss,
@@ -16,7 +16,9 @@
 # https://creativecommons.org/licenses/by/4.0/legalcode
 from __future__ import annotations
 
-from typing import Any, Callable, Dict, Optional, Union
+from functools import partial
+from pathlib import Path
+from typing import Any, Callable, Dict, Iterator, Optional, Tuple, Union
 
 import numpy as np
 import structlog
@@ -31,6 +33,8 @@ from dioptra.sdk.utilities.decorators import require_package
 
 LOGGER: BoundLogger = structlog.stdlib.get_logger()
 
+_CHUNKED_PREDICT_KWARGS = ("chunk_size", "num_samples", "output_dir", "return_y_true")
+
 try:
     from tensorflow.keras import Model
 
@@ -42,7 +46,9 @@ except ImportError:  # pragma: nocover
 
 
 @estimator_predict.register
-def _(estimator: Model, x: Any, pred_type: str, **kwargs) -> np.ndarray:
+def _(
+    estimator: Model, x: Any, pred_type: str, **kwargs
+) -> Union[np.ndarray, Tuple[np.ndarray, np.ndarray]]:
     LOGGER.info(
         "Dispatch generic function",
         generic="estimator_predict",
@@ -50,13 +56,16 @@ def _(estimator: Model, x: Any, pred_type: str, **kwargs) -> np.ndarray:
         args_signature=("Model", "Any", "str"),
     )
 
-    predict: Callable[..., np.ndarray] = dict(
+    predict: Callable[..., Any] = dict(
         prob=keras_model_predict_proba,
         label=keras_model_predict_label,
     ).get(pred_type, _null_predict)
 
+    if any(kwargs.get(x) for x in _CHUNKED_PREDICT_KWARGS):
+        predict = partial(keras_model_predict_chunked, pred_type=pred_type)
+
     try:
-        prediction: np.ndarray = predict(
+        prediction: Union[np.ndarray, Tuple[np.ndarray, np.ndarray]] = predict(
             estimator=estimator,
             x=x,
             **kwargs,
@@ -102,6 +111,135 @@ def keras_model_predict_label(
         **{k: v for k, v in predict_kwargs.items() if v is not None},
     )
 
+    return _probabilities_to_labels(prediction)
+
+
+@require_package("tensorflow", exc_type=TensorflowDependencyError)
+def keras_model_predict_chunked(
+    estimator: Model,
+    x: Any,
+    pred_type: str = "prob",
+    chunk_size: Optional[int] = None,
+    num_samples: Optional[int] = None,
+    output_dir: Optional[Union[str, Path]] = None,
+    return_y_true: bool = False,
+    batch_size: Optional[int] = None,
+    **kwargs,
+) -> Union[np.ndarray, Tuple[np.ndarray, np.ndarray]]:
+    """Predicts one chunk of the input at a time into a preallocated output.
+
+    Arrays are split into chunks of `chunk_size` samples. Batched sources, such as a
+    :py:class:`~tf.keras.preprocessing.image.DirectoryIterator`, a
+    :py:class:`~tf.keras.utils.Sequence` or a :py:class:`~tf.data.Dataset`, are
+    traversed once using their own batches. Each chunk's predictions are written into
+    an output array that is allocated once, so with `pred_type="label"` the full
+    matrix of class probabilities is never held in memory.
+
+    Each chunk is predicted as a single batch unless `batch_size` is smaller than
+    `chunk_size` or extra keyword arguments are given, in which case the chunk is
+    passed to the model's `predict` method together with `batch_size` and the extra
+    keyword arguments.
+
+    Args:
+        estimator: A trained Keras model.
+        x: The input data, either an array or a source of batches. The batches can be
+            inputs or `(inputs, targets)` pairs.
+        pred_type: Either `"prob"` for the class probabilities or `"label"` for the
+            predicted class labels. The default is `"prob"`.
+        chunk_size: The number of samples per chunk when `x` is an array. If `None`,
+            `batch_size` is used, or `32` if both are `None`. The default is `None`.
+        num_samples: The number of samples in `x`. It only needs to be given when it
+            cannot be inferred, such as for a :py:class:`~tf.data.Dataset`.
+        output_dir: If given, the outputs are memory-mapped `.npy` files in this
+            directory instead of in-memory arrays. The default is `None`.
+        return_y_true: If `True`, the ground truth labels of the batches are collected
+            in the same pass, as class indices aligned with the predictions. The
+            default is `False`.
+        batch_size: The number of samples per batch within each chunk. The default is
+            `None`.
+        **kwargs: Additional keyword arguments passed to the model's `predict` method,
+            such as `verbose`.
+
+    Returns:
+        The predictions. If `return_y_true` is `True`, a tuple of the ground truth
+        labels and the predictions.
+    """
+    if pred_type not in {"prob", "label"}:
+        raise EstimatorPredictGenericPredTypeError
+
+    num_samples = _infer_num_samples(x) if num_samples is None else num_samples
+    chunk_size = chunk_size or batch_size or 32
+    predict_kwargs: Dict[str, Any] = {k: v for k, v in kwargs.items() if v is not None}
+
+    if batch_size is not None and batch_size < chunk_size:
+        predict_kwargs["batch_size"] = batch_size
+
+    predict_chunk: Callable[[Any], Any] = (
+        partial(estimator.predict, **predict_kwargs)
+        if predict_kwargs
+        else estimator.predict_on_batch
+    )
+    prediction: Optional[np.ndarray] = None
+    y_true: Optional[np.ndarray] = None
+    start: int = 0
+
+    for x_chunk, y_chunk in _iter_chunks(x, chunk_size=chunk_size):
+        chunk_prediction: np.ndarray = np.asarray(predict_chunk(x_chunk))
+
+        if pred_type == "label":
+            chunk_prediction = _probabilities_to_labels(chunk_prediction)
+
+        stop: int = start + len(chunk_prediction)
+
+        if stop > num_samples:
+            raise ValueError(
+                f"The input has more than the expected {num_samples} samples."
+            )
+
+        if prediction is None:
+            prediction = _allocate_output(
+                shape=(num_samples, *chunk_prediction.shape[1:]),
+                dtype=chunk_prediction.dtype,
+                output_dir=output_dir,
+                name="prediction",
+            )
+
+        prediction[start:stop] = chunk_prediction
+
+        if return_y_true:
+            if y_chunk is None:
+                raise ValueError(
+                    "return_y_true requires an input that yields (inputs, targets) "
+                    "pairs."
+                )
+
+            if y_true is None:
+                y_true = _allocate_output(
+                    shape=(num_samples,),
+                    dtype=np.dtype("int64"),
+                    output_dir=output_dir,
+                    name="y_true",
+                )
+
+            y_true[start:stop] = _targets_to_labels(np.asarray(y_chunk))
+
+        start = stop
+
+    LOGGER.info("Chunked prediction complete", num_samples=start, pred_type=pred_type)
+
+    prediction = (
+        np.empty((0,), dtype="float32") if prediction is None else prediction[:start]
+    )
+
+    if not return_y_true:
+        return prediction
+
+    y_true = np.empty((0,), dtype="int64") if y_true is None else y_true[:start]
+
+    return y_true, prediction
+
+
+def _probabilities_to_labels(prediction: np.ndarray) -> np.ndarray:
     if prediction.shape[1] > 1:
         labels: Union[np.integer, np.ndarray] = np.argmax(prediction, axis=1)
 
@@ -116,5 +254,65 @@ def keras_model_predict_label(
     return flattened_labels
 
 
+def _targets_to_labels(y: np.ndarray) -> np.ndarray:
+    if y.ndim > 1 and y.shape[1] > 1:
+        return np.argmax(y, axis=1)
+
+    return y.reshape(len(y)).astype("int64")
+
+
+def _infer_num_samples(x: Any) -> int:
+    num_samples: Optional[int] = getattr(x, "n", None)
+
+    if num_samples is None and hasattr(x, "shape"):
+        num_samples = int(x.shape[0])
+
+    if num_samples is None:
+        raise ValueError(
+            "Unable to infer the number of samples in the input, pass num_samples "
+            "explicitly."
+        )
+
+    return num_samples
+
+
+def _iter_chunks(x: Any, chunk_size: int) -> Iterator[Tuple[Any, Optional[Any]]]:
+    if hasattr(x, "shape"):
+        for start in range(0, int(x.shape[0]), chunk_size):
+            yield x[start : start + chunk_size], None  # noqa: E203
+
+    elif hasattr(x, "__getitem__") and hasattr(x, "__len__"):
+        for batch_num in range(len(x)):
+            yield _split_batch(x[batch_num])
+
+    else:
+        for batch in x:
+            yield _split_batch(batch)
+
+
+def _split_batch(batch: Any) -> Tuple[Any, Optional[Any]]:
+    if isinstance(batch, (tuple, list)) and len(batch) >= 2:
+        return batch[0], batch[1]
+
+    return batch, None
+
+
+def _allocate_output(
+    shape: Tuple[int, ...],
+    dtype: np.dtype,
+    output_dir: Optional[Union[str, Path]],
+    name: str,
+) -> np.ndarray:
+    if output_dir is None:
+        return np.zeros(shape, dtype=dtype)
+
+    output_dir = Path(output_dir)
+    output_dir.mkdir(parents=True, exist_ok=True)
+
+    return np.lib.format.open_memmap(
+        str(output_dir / f"{name}.npy"), mode="w+", dtype=dtype, shape=shape
+    )
+
+
 def _null_predict(*args, **kwargs) -> np.ndarray:
     raise EstimatorPredictGenericPredTypeError
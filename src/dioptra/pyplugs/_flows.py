@@ -0,0 +1,264 @@
+# This Software (Dioptra) is being made available as a public service by the
+# National Institute of Standards and Technology (NIST), an Agency of the United
+# States Department of Commerce. This software was developed in part by employees of
+# NIST and in part by NIST contractors. Copyright in portions of this software that
+# were developed by NIST contractors has been licensed or assigned to NIST. Pursuant
+# to Title 17 United States Code Section 105, works of NIST employees are not
+# subject to copyright protection in the United States. However, NIST may hold
+# international copyright in software created by its employees and domestic
+# copyright (or licensing rights) in portions of software that were assigned or
+# licensed to NIST. To the extent that NIST holds copyright in this software, it is
+# being made available under the Creative Commons Attribution 4.0 International
+# license (CC BY 4.0). The disclaimers of the CC BY 4.0 license apply to all parts
+# of the software developed or licensed by NIST.
+#
+# ACCESS THE FULL CC BY 4.0 LICENSE HERE:
+# https://creativecommons.org/licenses/by/4.0/legalcode
+"""Running Prefect flows of plug-in tasks with a suitable executor.
+
+Flows built with :py:func:`~._plugins.call_task` are DAGs whose independent branches
+can run at the same time. :py:func:`run_flow` picks a Prefect executor for a flow,
+
+- a ``LocalExecutor`` when no two tasks can run at the same time,
+- a ``LocalDaskExecutor`` with the ``"threads"`` scheduler otherwise, which suits the
+  common case of plug-ins that wait on I/O or release the GIL in native code, such
+  as TensorFlow and NumPy.
+
+The ``"processes"`` scheduler is never picked on its own, as it runs every task of the
+flow in a worker process, and so requires the arguments and results of all the tasks
+to be picklable, not only those of the plug-ins registered with ``cpu_bound=True``.
+Flows that are known to meet this requirement can opt in with
+``run_flow(flow, scheduler="processes")``. When a flow contains ``cpu_bound`` plug-ins
+and runs in threads, a hint is logged instead.
+
+Only the edges of the DAG order the tasks. Tasks that depend on running in a given
+order without passing results to each other, such as tasks drawing from the same
+random number generator, must declare the order with ``upstream_tasks``.
+
+Set the environment variable ``DIOPTRA_FLOW_EXECUTOR`` to ``local``, ``threads`` or
+``processes`` to override both the choice and the ``scheduler`` argument.
+"""
+from __future__ import annotations
+
+import os
+import sys
+from typing import TYPE_CHECKING, Any, Dict, Optional, Type
+
+import structlog
+from structlog.stdlib import BoundLogger
+
+from dioptra.sdk.exceptions import PrefectDependencyError
+from dioptra.sdk.utilities.decorators import require_package
+
+from ._instrumentation import flush_task_measurements
+
+LOGGER: BoundLogger = structlog.stdlib.get_logger()
+
+if TYPE_CHECKING:
+    from prefect import Flow, Task
+    from prefect.engine.state import State
+    from prefect.engine.task_runner import TaskRunner
+    from prefect.executors import Executor
+
+FLOW_EXECUTOR_ENV_VAR = "DIOPTRA_FLOW_EXECUTOR"
+FLOW_EXECUTOR_SCHEDULERS = {"local", "threads", "processes"}
+
+# Only expose public functions to the outside
+__all__ = ["is_cpu_bound", "run_flow", "select_executor"]
+
+
+def is_cpu_bound(task: Task) -> bool:
+    """Check if a task runs a plug-in registered with ``cpu_bound=True``"""
+    return bool(getattr(getattr(task, "run", None), "_task_cpu_bound", False))
+
+
+@require_package("prefect", exc_type=PrefectDependencyError)
+def select_executor(
+    flow: Flow, num_workers: Optional[int] = None, scheduler: Optional[str] = None
+) -> Executor:
+    """Pick the executor for running a flow
+
+    Args:
+        flow: The flow to run.
+        num_workers: The number of threads or processes used by a
+            ``LocalDaskExecutor``. If `None`, it is the number of tasks that can run
+            at the same time, which for processes is capped at the number of CPUs.
+            The default is `None`.
+        scheduler: One of ``"local"``, ``"threads"`` or ``"processes"``, which is
+            used instead of the automatic choice. Choosing ``"processes"`` requires
+            the arguments and results of all the tasks of the flow to be picklable.
+            The default is `None`.
+
+    Returns:
+        A Prefect executor.
+
+    Raises:
+        ValueError: If ``DIOPTRA_FLOW_EXECUTOR`` or `scheduler` is set to an unknown
+            value.
+    """
+    from prefect.executors import LocalDaskExecutor, LocalExecutor
+
+    max_parallel_tasks = _max_parallel_tasks(flow)
+    scheduler = os.getenv(FLOW_EXECUTOR_ENV_VAR, "").strip().lower() or scheduler
+    scheduler = scheduler or _choose_scheduler(flow, max_parallel_tasks)
+
+    if scheduler not in FLOW_EXECUTOR_SCHEDULERS:
+        raise ValueError(
+            f"Unknown flow executor {scheduler!r}, "
+            f"expected one of {sorted(FLOW_EXECUTOR_SCHEDULERS)}"
+        )
+
+    if scheduler == "local":
+        return LocalExecutor()
+
+    if num_workers is None:
+        num_workers = max(max_parallel_tasks, 1)
+
+        if scheduler == "processes":
+            num_workers = min(num_workers, os.cpu_count() or 1)
+
+    return LocalDaskExecutor(scheduler=scheduler, num_workers=num_workers)
+
+
+@require_package("prefect", exc_type=PrefectDependencyError)
+def run_flow(
+    flow: Flow,
+    parameters: Optional[Dict[str, Any]] = None,
+    executor: Optional[Executor] = None,
+    num_workers: Optional[int] = None,
+    scheduler: Optional[str] = None,
+    **kwargs: Any,
+) -> State:
+    """Run a flow with the executor picked by :py:func:`select_executor`
+
+    Tasks that run in worker threads or processes do not see the active MLflow run
+    of the thread that called this function, as MLflow tracks the active run per
+    thread. If an MLflow run is active, each task therefore resumes it in its worker
+    before running, so that it logs to the same run as the flow. The task
+    measurements buffered during the flow are sent to MLflow when it finishes, see
+    :py:func:`~._instrumentation.flush_task_measurements`.
+
+    Args:
+        flow: The flow to run.
+        parameters: The values of the flow's parameters.
+        executor: The executor to use instead of the one picked by
+            :py:func:`select_executor`. The default is `None`.
+        num_workers: The number of threads or processes used by a
+            ``LocalDaskExecutor``. The default is `None`.
+        scheduler: The scheduler passed to :py:func:`select_executor`. Set it to
+            ``"processes"`` to run the tasks in separate processes. The default is
+            `None`.
+        **kwargs: Additional keyword arguments passed to ``flow.run()``. Passing a
+            ``runner_cls`` turns off the sharing of the MLflow run.
+
+    Returns:
+        The final state of the flow.
+    """
+    executor = executor or select_executor(
+        flow, num_workers=num_workers, scheduler=scheduler
+    )
+    LOGGER.info(
+        "Running flow",
+        flow=flow.name,
+        executor=type(executor).__name__,
+        scheduler=getattr(executor, "scheduler", None),
+    )
+
+    mlflow = sys.modules.get("mlflow")
+    active_run = None if mlflow is None else mlflow.active_run()
+
+    if active_run is not None and "runner_cls" not in kwargs:
+        kwargs["runner_cls"] = _mlflow_run_flow_runner(
+            run_id=active_run.info.run_id, tracking_uri=mlflow.get_tracking_uri()
+        )
+
+    try:
+        return flow.run(parameters=parameters, executor=executor, **kwargs)
+
+    finally:
+        flush_task_measurements()
+
+
+def _choose_scheduler(flow: Flow, max_parallel_tasks: int) -> str:
+    if max_parallel_tasks < 2:
+        return "local"
+
+    if (os.cpu_count() or 1) > 1 and any(is_cpu_bound(x) for x in flow.tasks):
+        LOGGER.info(
+            "Flow contains CPU-bound tasks, which may run faster in processes. "
+            "Pass scheduler='processes' to run_flow if the arguments and results "
+            "of all its tasks are picklable.",
+            flow=flow.name,
+        )
+
+    return "threads"
+
+
+def _max_parallel_tasks(flow: Flow) -> int:
+    """Estimate how many tasks of a flow can run at the same time
+
+    Tasks are grouped by the length of the longest path leading to them, and the size
+    of the largest group is returned. Parameters are left out, as their values are
+    available as soon as the flow starts.
+    """
+    from prefect import Parameter
+
+    depths: Dict[Task, int] = {}
+    widths: Dict[int, int] = {}
+
+    for task in flow.sorted_tasks():
+        if isinstance(task, Parameter):
+            continue
+
+        depth = max(
+            (depths[x] + 1 for x in flow.upstream_tasks(task) if x in depths),
+            default=0,
+        )
+        depths[task] = depth
+        widths[depth] = widths.get(depth, 0) + 1
+
+    return max(widths.values(), default=0)
+
+
+def _mlflow_run_flow_runner(run_id: str, tracking_uri: str) -> type:
+    """Create a flow runner class whose tasks run inside an existing MLflow run"""
+    from prefect.engine import (
+        get_default_flow_runner_class,
+        get_default_task_runner_class,
+    )
+
+    flow_runner_base: type = get_default_flow_runner_class()
+    task_runner_base: Type[TaskRunner] = get_default_task_runner_class()
+
+    def get_task_run_state(self, state, inputs):
+        _resume_mlflow_run(run_id, tracking_uri)
+
+        return task_runner_base.get_task_run_state(self, state, inputs)
+
+    def __init__(self, flow, task_runner_cls=None, state_handlers=None):
+        flow_runner_base.__init__(
+            self,
+            flow,
+            task_runner_cls=task_runner_cls or mlflow_run_task_runner,
+            state_handlers=state_handlers,
+        )
+
+    mlflow_run_task_runner = type(
+        "MlflowRunTaskRunner",
+        (task_runner_base,),
+        {"get_task_run_state": get_task_run_state},
+    )
+
+    return type("MlflowRunFlowRunner", (flow_runner_base,), {"__init__": __init__})
+
+
+def _resume_mlflow_run(run_id: str, tracking_uri: str) -> None:
+    """Make an MLflow run the active run of the current thread"""
+    import mlflow
+
+    if mlflow.active_run() is not None:
+        return None
+
+    # Worker processes do not inherit a tracking URI that was set programmatically
+    mlflow.set_tracking_uri(tracking_uri)
+    mlflow.start_run(run_id=run_id)
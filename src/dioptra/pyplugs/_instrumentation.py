@@ -0,0 +1,400 @@
+# This Software (Dioptra) is being made available as a public service by the
+# National Institute of Standards and Technology (NIST), an Agency of the United
+# States Department of Commerce. This software was developed in part by employees of
+# NIST and in part by NIST contractors. Copyright in portions of this software that
+# were developed by NIST contractors has been licensed or assigned to NIST. Pursuant
+# to Title 17 United States Code Section 105, works of NIST employees are not
+# subject to copyright protection in the United States. However, NIST may hold
+# international copyright in software created by its employees and domestic
+# copyright (or licensing rights) in portions of software that were assigned or
+# licensed to NIST. To the extent that NIST holds copyright in this software, it is
+# being made available under the Creative Commons Attribution 4.0 International
+# license (CC BY 4.0). The disclaimers of the CC BY 4.0 license apply to all parts
+# of the software developed or licensed by NIST.
+#
+# ACCESS THE FULL CC BY 4.0 LICENSE HERE:
+# https://creativecommons.org/licenses/by/4.0/legalcode
+"""Timing and resource measurements of plug-in tasks.
+
+Plug-ins retrieved with :py:func:`~._plugins.get_task` are wrapped so that every call
+records the task's wall time, CPU time, the process's peak resident set size, and the
+approximate size of the return value. When an MLflow run is active, the measurements
+are logged to it as metrics, and a timeline of all the tasks executed during the run
+is uploaded as a JSON artifact. Tasks that run in worker processes, see
+:py:func:`~._flows.run_flow`, are kept in a separate timeline for each process.
+
+The measurements are buffered and sent to MLflow in a single batch, together with
+one upload of the timeline, by :py:func:`flush_task_measurements`. This happens at
+the end of :py:func:`~._flows.run_flow`, when the process exits, and at most once a
+minute while tasks keep finishing, so the number of uploads does not grow with the
+number of tasks.
+
+Set the environment variable ``DIOPTRA_PYPLUGS_INSTRUMENTATION`` to ``0`` to turn the
+measurements off.
+"""
+from __future__ import annotations
+
+import atexit
+import functools
+import json
+import multiprocessing
+import os
+import sys
+import tempfile
+import threading
+import time
+from multiprocessing import util as multiprocessing_util
+from pathlib import Path
+from typing import Any, Callable, Dict, List, NamedTuple, Optional, Tuple
+
+import structlog
+from structlog.stdlib import BoundLogger
+
+from dioptra.sdk.utilities.imports import lazy_import
+
+try:
+    import resource
+
+except ImportError:  # pragma: nocover
+    resource = None  # type: ignore[assignment]
+
+LOGGER: BoundLogger = structlog.stdlib.get_logger()
+
+mlflow = lazy_import("mlflow")
+
+INSTRUMENTATION_ENV_VAR = "DIOPTRA_PYPLUGS_INSTRUMENTATION"
+TIMELINE_ARTIFACT_PATH = "pyplugs"
+TIMELINE_FILENAME = "task_timeline.json"
+FLUSH_INTERVAL_SECONDS = 60.0
+
+# Measurements of the tasks executed during each MLflow run, keyed by run id. Tasks
+# executed outside of a run are kept under the None key.
+_TIMELINES: Dict[Optional[str], List["TaskMeasurement"]] = {}
+_TIMELINES_LOCK = threading.Lock()
+_ARTIFACT_LOCK = threading.Lock()
+
+# Measurements not yet sent to MLflow and the time of the last flush, keyed by run id
+_PENDING: Dict[str, List[Tuple["TaskMeasurement", int]]] = {}
+_LAST_FLUSHED: Dict[str, float] = {}
+_EXIT_HOOK_PID: Optional[int] = None
+
+# Only expose public functions to the outside
+__all__ = [
+    "TaskMeasurement",
+    "flush_task_measurements",
+    "get_task_timeline",
+    "instrument_task",
+]
+
+
+class TaskMeasurement(NamedTuple):
+    """Resources used by one call of a plug-in task
+
+    Attributes:
+        task: The name of the task, ``<plugin>.<function>``.
+        started_at: The time the call started, in seconds since the epoch.
+        wall_time: The elapsed time of the call in seconds.
+        cpu_time: The CPU time used by the whole process during the call, in seconds.
+        peak_rss: The high-water mark of the resident set size of the process at the
+            end of the call, in bytes. It includes the memory used by everything that
+            ran in the process before the task.
+        peak_rss_growth: How much the process's high-water mark grew during the call,
+            in bytes. This is not the task's own peak memory usage: it is `0` when the
+            task stays below a peak reached earlier in the process.
+        result_bytes: The estimated size of the return value in bytes, or `None` if
+            the call failed.
+        succeeded: Whether the call returned without raising an exception.
+    """
+
+    task: str
+    started_at: float
+    wall_time: float
+    cpu_time: float
+    peak_rss: Optional[int]
+    peak_rss_growth: Optional[int]
+    result_bytes: Optional[int]
+    succeeded: bool
+
+    @property
+    def metric_prefix(self) -> str:
+        return f"pyplugs.{self.task}"
+
+
+def instrument_task(func: Callable[..., Any], task: str) -> Callable[..., Any]:
+    """Wrap a plug-in function so that each call is measured
+
+    Args:
+        func: The plug-in function.
+        task: The name used for the task in the metrics and the timeline, usually
+            ``<plugin>.<function>``.
+
+    Returns:
+        The wrapped function. It keeps the signature and attributes of `func`, so
+        that it can be turned into a Prefect task.
+    """
+
+    @functools.wraps(func)
+    def wrapper(*args: Any, **kwargs: Any) -> Any:
+        if not _is_enabled():
+            return func(*args, **kwargs)
+
+        started_at = time.time()
+        wall_start = time.perf_counter()
+        cpu_start = time.process_time()
+        peak_rss_start = _get_peak_rss()
+        result: Any = None
+        succeeded = False
+
+        try:
+            result = func(*args, **kwargs)
+            succeeded = True
+
+            return result
+
+        finally:
+            wall_time = time.perf_counter() - wall_start
+            cpu_time = time.process_time() - cpu_start
+            peak_rss = _get_peak_rss()
+            _record(
+                TaskMeasurement(
+                    task=task,
+                    started_at=started_at,
+                    wall_time=wall_time,
+                    cpu_time=cpu_time,
+                    peak_rss=peak_rss,
+                    peak_rss_growth=(
+                        None
+                        if peak_rss is None or peak_rss_start is None
+                        else peak_rss - peak_rss_start
+                    ),
+                    result_bytes=_estimate_size(result) if succeeded else None,
+                    succeeded=succeeded,
+                )
+            )
+
+    return wrapper
+
+
+def get_task_timeline(run_id: Optional[str] = None) -> List[TaskMeasurement]:
+    """Get the measurements of the tasks executed during an MLflow run
+
+    Args:
+        run_id: The id of the MLflow run. If `None`, the measurements of the tasks
+            executed outside of an MLflow run are returned. The default is `None`.
+
+    Returns:
+        The measurements in the order the tasks finished.
+    """
+    with _TIMELINES_LOCK:
+        return list(_TIMELINES.get(run_id, []))
+
+
+def flush_task_measurements(run_id: Optional[str] = None) -> None:
+    """Send the buffered task measurements to MLflow
+
+    The metrics are logged in a single batch and the timeline artifact is uploaded
+    once. Errors are logged as warnings and not raised.
+
+    Args:
+        run_id: The id of the MLflow run whose measurements are sent. If `None`, the
+            measurements of every run are sent. The default is `None`.
+    """
+    with _TIMELINES_LOCK:
+        run_ids = list(_PENDING) if run_id is None else [run_id]
+        pending = {x: _PENDING.pop(x, []) for x in run_ids}
+
+        for flushed_run_id in run_ids:
+            _LAST_FLUSHED[flushed_run_id] = time.monotonic()
+
+    for flushed_run_id, measurements in pending.items():
+        if not measurements:
+            continue
+
+        try:
+            _log_metrics(flushed_run_id, measurements)
+            _log_timeline(flushed_run_id)
+
+        except Exception:
+            LOGGER.warning(
+                "Unable to log plug-in task measurements to MLflow",
+                run_id=flushed_run_id,
+                num_measurements=len(measurements),
+                exc_info=True,
+            )
+
+
+def _is_enabled() -> bool:
+    return os.getenv(INSTRUMENTATION_ENV_VAR, "1").strip().lower() not in {
+        "0",
+        "false",
+        "no",
+        "off",
+    }
+
+
+def _record(measurement: TaskMeasurement) -> None:
+    """Add a measurement to the timeline and buffer it for the active MLflow run"""
+    LOGGER.debug("Plug-in task measured", **measurement._asdict())
+
+    run_id = _get_active_run_id()
+
+    with _TIMELINES_LOCK:
+        timeline = _TIMELINES.setdefault(run_id, [])
+        timeline.append(measurement)
+
+        if run_id is None:
+            return None
+
+        step = sum(1 for x in timeline if x.task == measurement.task) - 1
+        _PENDING.setdefault(run_id, []).append((measurement, step))
+        last_flushed = _LAST_FLUSHED.setdefault(run_id, time.monotonic())
+
+    _register_exit_hook()
+
+    if time.monotonic() - last_flushed >= FLUSH_INTERVAL_SECONDS:
+        flush_task_measurements(run_id)
+
+
+def _register_exit_hook() -> None:
+    """Flush the buffered measurements when the current process exits
+
+    Worker processes started by :py:mod:`multiprocessing` skip :py:mod:`atexit`
+    handlers, but run the finalizers registered with :py:mod:`multiprocessing.util`.
+    """
+    global _EXIT_HOOK_PID
+
+    if _EXIT_HOOK_PID == os.getpid():
+        return None
+
+    _EXIT_HOOK_PID = os.getpid()
+
+    if multiprocessing.parent_process() is None:
+        atexit.register(flush_task_measurements)
+
+    else:
+        multiprocessing_util.Finalize(None, flush_task_measurements, exitpriority=10)
+
+
+def _reset_after_fork() -> None:
+    """Forget the measurements inherited from the parent of a forked process
+
+    The parent flushes its own measurements, so a forked worker only keeps the
+    measurements of the tasks it runs itself.
+    """
+    global _TIMELINES_LOCK, _ARTIFACT_LOCK
+
+    _TIMELINES_LOCK = threading.Lock()
+    _ARTIFACT_LOCK = threading.Lock()
+    _TIMELINES.clear()
+    _PENDING.clear()
+    _LAST_FLUSHED.clear()
+
+
+def _get_active_run_id() -> Optional[str]:
+    """Get the id of the active MLflow run without importing MLflow"""
+    active_run = mlflow.active_run() if "mlflow" in sys.modules else None
+
+    return None if active_run is None else active_run.info.run_id
+
+
+def _log_metrics(run_id: str, measurements: List[Tuple[TaskMeasurement, int]]) -> None:
+    metrics = []
+
+    for measurement, step in measurements:
+        timestamp = int((measurement.started_at + measurement.wall_time) * 1000)
+        values: Dict[str, Optional[float]] = {
+            "wall_time_seconds": measurement.wall_time,
+            "cpu_time_seconds": measurement.cpu_time,
+            "peak_rss_bytes": measurement.peak_rss,
+            "peak_rss_growth_bytes": measurement.peak_rss_growth,
+            "result_bytes": measurement.result_bytes,
+        }
+        metrics.extend(
+            mlflow.entities.Metric(
+                f"{measurement.metric_prefix}.{name}", float(value), timestamp, step
+            )
+            for name, value in values.items()
+            if value is not None
+        )
+
+    client = mlflow.tracking.MlflowClient()
+
+    # MLflow accepts at most 1000 metrics per batch
+    for start in range(0, len(metrics), 1000):
+        client.log_batch(run_id, metrics=metrics[start : start + 1000])  # noqa: E203
+
+
+def _log_timeline(run_id: str) -> None:
+    # Flushes from parallel tasks upload the timeline one at a time, and each upload
+    # includes every measurement recorded so far, so the last upload is complete.
+    with _ARTIFACT_LOCK, tempfile.TemporaryDirectory() as tmp_dir:
+        timeline = get_task_timeline(run_id)
+        filepath = Path(tmp_dir) / _get_timeline_filename()
+        filepath.write_text(
+            json.dumps([x._asdict() for x in timeline], indent=2), encoding="utf-8"
+        )
+        mlflow.tracking.MlflowClient().log_artifact(
+            run_id, str(filepath), artifact_path=TIMELINE_ARTIFACT_PATH
+        )
+
+
+def _get_timeline_filename() -> str:
+    if multiprocessing.parent_process() is None:
+        return TIMELINE_FILENAME
+
+    stem, suffix = os.path.splitext(TIMELINE_FILENAME)
+
+    return f"{stem}-{os.getpid()}{suffix}"
+
+
+def _get_peak_rss() -> Optional[int]:
+    """Get the peak resident set size of the process in bytes"""
+    if resource is None:  # pragma: nocover
+        return None
+
+    peak_rss: int = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+
+    # ru_maxrss is reported in kilobytes on Linux and in bytes on macOS
+    return peak_rss if sys.platform == "darwin" else peak_rss * 1024
+
+
+def _estimate_size(obj: Any, depth: int = 0) -> int:
+    """Estimate the memory held by a task's return value without copying it
+
+    Arrays and data frames report the size of their buffers, containers are summed
+    over their items down to a shallow depth, and anything else falls back to
+    :py:func:`sys.getsizeof`.
+    """
+    nbytes = getattr(obj, "nbytes", None)
+
+    if isinstance(nbytes, int):
+        return nbytes
+
+    memory_usage = getattr(obj, "memory_usage", None)
+
+    if callable(memory_usage) and hasattr(obj, "columns"):
+        try:
+            return int(memory_usage(index=True).sum())
+
+        except Exception:
+            pass
+
+    size: int = sys.getsizeof(obj, 0)
+
+    if depth >= 2:
+        return size
+
+    if isinstance(obj, dict):
+        return size + sum(
+            _estimate_size(k, depth + 1) + _estimate_size(v, depth + 1)
+            for k, v in obj.items()
+        )
+
+    if isinstance(obj, (list, tuple, set, frozenset)):
+        return size + sum(_estimate_size(x, depth + 1) for x in obj)
+
+    return size
+
+
+if hasattr(os, "register_at_fork"):
+    os.register_at_fork(after_in_child=_reset_after_fork)
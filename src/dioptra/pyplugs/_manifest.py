@@ -0,0 +1,310 @@
+# This Software (Dioptra) is being made available as a public service by the
+# National Institute of Standards and Technology (NIST), an Agency of the United
+# States Department of Commerce. This software was developed in part by employees of
+# NIST and in part by NIST contractors. Copyright in portions of this software that
+# were developed by NIST contractors has been licensed or assigned to NIST. Pursuant
+# to Title 17 United States Code Section 105, works of NIST employees are not
+# subject to copyright protection in the United States. However, NIST may hold
+# international copyright in software created by its employees and domestic
+# copyright (or licensing rights) in portions of software that were assigned or
+# licensed to NIST. To the extent that NIST holds copyright in this software, it is
+# being made available under the Creative Commons Attribution 4.0 International
+# license (CC BY 4.0). The disclaimers of the CC BY 4.0 license apply to all parts
+# of the software developed or licensed by NIST.
+#
+# ACCESS THE FULL CC BY 4.0 LICENSE HERE:
+# https://creativecommons.org/licenses/by/4.0/legalcode
+"""Static discovery of registered plug-ins.
+
+The manifest is built by parsing the source code of each module in a plug-in package,
+so that the plug-ins can be listed and described without importing their (often
+heavyweight) dependencies.
+"""
+from __future__ import annotations
+
+import ast
+import hashlib
+import json
+import os
+import sys
+import textwrap
+from pathlib import Path
+from typing import Any, Dict, Iterable, List, NamedTuple, Optional, Set, Tuple
+
+import structlog
+from structlog.stdlib import BoundLogger
+
+LOGGER: BoundLogger = structlog.stdlib.get_logger()
+
+MANIFEST_CACHE_FILENAME = "pyplugs-manifest.json"
+MANIFEST_CACHE_VERSION = 1
+PYPLUGS_MODULE = "dioptra.pyplugs"
+
+
+class PluginManifestEntry(NamedTuple):
+    """Static information about one registered plug-in function"""
+
+    func_name: str
+    description: str
+    doc: str
+    sort_value: float
+    task_nout: Optional[int]
+
+
+class ModuleManifest(NamedTuple):
+    """Static information about the plug-ins registered in one module
+
+    Modules that register plug-ins in a way that cannot be resolved without running
+    the module, for example by calling `register` directly or passing a computed
+    `sort_value`, are marked as dynamic and must be imported instead.
+    """
+
+    module_doc: str
+    dynamic: bool
+    plugins: List[PluginManifestEntry]
+
+
+def split_doc(docstring: Optional[str]) -> Tuple[str, str]:
+    """Split a docstring into a description and the remaining documentation"""
+    description, _, doc = (docstring or "").partition("\n\n")
+
+    return description, textwrap.dedent(doc).strip()
+
+
+def build_package_manifest(package_paths: Iterable[str]) -> Dict[str, ModuleManifest]:
+    """Build the manifest for the plug-in modules in the given package directories
+
+    Results are cached in the `__pycache__` directory of each package directory and
+    reused for as long as the module's size and modification time, or failing that its
+    SHA-256 checksum, are unchanged.
+    """
+    manifest: Dict[str, ModuleManifest] = {}
+
+    for package_path in package_paths:
+        manifest.update(_build_directory_manifest(Path(package_path)))
+
+    return manifest
+
+
+def parse_module(source: bytes) -> ModuleManifest:
+    """Extract the registered plug-ins from a module's source code"""
+    try:
+        tree = ast.parse(source)
+
+    except SyntaxError:
+        return ModuleManifest(module_doc="", dynamic=True, plugins=[])
+
+    pyplugs_aliases, register_aliases, task_nout_aliases = _find_aliases(tree)
+    module_doc = ast.get_docstring(tree, clean=False) or ""
+    plugins: List[PluginManifestEntry] = []
+    num_register_decorators = 0
+
+    for node in tree.body:
+        if not isinstance(node, (ast.FunctionDef, ast.AsyncFunctionDef)):
+            continue
+
+        registered = False
+        sort_value: Any = 0
+        task_nout: Any = None
+
+        for decorator in node.decorator_list:
+            target, call = (
+                (decorator.func, decorator)
+                if isinstance(decorator, ast.Call)
+                else (decorator, None)
+            )
+
+            if _refers_to(target, "register", pyplugs_aliases, register_aliases):
+                registered = True
+                num_register_decorators += 1
+                sort_value = _literal_keyword(call, "sort_value", default=0)
+
+            elif _refers_to(target, "task_nout", pyplugs_aliases, task_nout_aliases):
+                task_nout = _literal_argument(call, "nout")
+
+        if not registered:
+            continue
+
+        if not isinstance(sort_value, (int, float)) or not isinstance(
+            task_nout, (int, type(None))
+        ):
+            return ModuleManifest(module_doc=module_doc, dynamic=True, plugins=[])
+
+        description, doc = split_doc(ast.get_docstring(node, clean=False))
+        plugins.append(
+            PluginManifestEntry(
+                func_name=node.name,
+                description=description,
+                doc=doc,
+                sort_value=sort_value,
+                task_nout=task_nout,
+            )
+        )
+
+    num_register_references = sum(
+        1
+        for node in ast.walk(tree)
+        if _refers_to(node, "register", pyplugs_aliases, register_aliases)
+    )
+
+    return ModuleManifest(
+        module_doc=module_doc,
+        dynamic=num_register_references != num_register_decorators,
+        plugins=plugins,
+    )
+
+
+def _build_directory_manifest(package_dir: Path) -> Dict[str, ModuleManifest]:
+    cache_path = package_dir / "__pycache__" / MANIFEST_CACHE_FILENAME
+    cache = _read_cache(cache_path)
+    updated_cache: Dict[str, Dict[str, Any]] = {}
+    manifest: Dict[str, ModuleManifest] = {}
+
+    for module_path in sorted(package_dir.glob("*.py")):
+        if module_path.name.startswith("_"):
+            continue
+
+        plugin = module_path.stem
+        stat = module_path.stat()
+        cached = cache.get(plugin)
+
+        if cached is None or (cached["mtime_ns"], cached["size"]) != (
+            stat.st_mtime_ns,
+            stat.st_size,
+        ):
+            source = module_path.read_bytes()
+            sha256 = hashlib.sha256(source).hexdigest()
+
+            if cached is None or cached["sha256"] != sha256:
+                cached = dict(sha256=sha256, manifest=_to_json(parse_module(source)))
+
+            cached.update(mtime_ns=stat.st_mtime_ns, size=stat.st_size)
+
+        updated_cache[plugin] = cached
+        manifest[plugin] = _from_json(cached["manifest"])
+
+    if updated_cache != cache:
+        _write_cache(cache_path, updated_cache)
+
+    return manifest
+
+
+def _find_aliases(tree: ast.Module) -> Tuple[Set[str], Set[str], Set[str]]:
+    pyplugs_aliases: Set[str] = set()
+    register_aliases: Set[str] = set()
+    task_nout_aliases: Set[str] = set()
+    package, _, module = PYPLUGS_MODULE.rpartition(".")
+
+    for node in ast.walk(tree):
+        if isinstance(node, ast.ImportFrom) and node.module == package:
+            pyplugs_aliases.update(
+                x.asname or x.name for x in node.names if x.name == module
+            )
+
+        elif isinstance(node, ast.ImportFrom) and node.module == PYPLUGS_MODULE:
+            register_aliases.update(
+                x.asname or x.name for x in node.names if x.name == "register"
+            )
+            task_nout_aliases.update(
+                x.asname or x.name for x in node.names if x.name == "task_nout"
+            )
+
+        elif isinstance(node, ast.Import):
+            pyplugs_aliases.update(
+                x.asname for x in node.names if x.name == PYPLUGS_MODULE and x.asname
+            )
+
+    return pyplugs_aliases, register_aliases, task_nout_aliases
+
+
+def _refers_to(
+    node: ast.AST, name: str, module_aliases: Set[str], name_aliases: Set[str]
+) -> bool:
+    if isinstance(node, ast.Name):
+        return node.id in name_aliases
+
+    if isinstance(node, ast.Attribute) and node.attr == name:
+        return isinstance(node.value, ast.Name) and node.value.id in module_aliases
+
+    return False
+
+
+def _literal_keyword(call: Optional[ast.Call], name: str, default: Any) -> Any:
+    if call is None:
+        return default
+
+    for keyword in call.keywords:
+        if keyword.arg == name:
+            return _literal(keyword.value)
+
+    return default
+
+
+def _literal_argument(call: Optional[ast.Call], name: str) -> Any:
+    if call is None:
+        return _DYNAMIC
+
+    if call.args:
+        return _literal(call.args[0])
+
+    return _literal_keyword(call, name, default=_DYNAMIC)
+
+
+def _literal(node: ast.AST) -> Any:
+    try:
+        return ast.literal_eval(node)
+
+    except ValueError:
+        return _DYNAMIC
+
+
+class _Dynamic(object):
+    """Marker for decorator arguments that are only known at runtime"""
+
+
+_DYNAMIC = _Dynamic()
+
+
+def _to_json(manifest: ModuleManifest) -> Dict[str, Any]:
+    return dict(
+        module_doc=manifest.module_doc,
+        dynamic=manifest.dynamic,
+        plugins=[x._asdict() for x in manifest.plugins],
+    )
+
+
+def _from_json(data: Dict[str, Any]) -> ModuleManifest:
+    return ModuleManifest(
+        module_doc=data["module_doc"],
+        dynamic=data["dynamic"],
+        plugins=[PluginManifestEntry(**x) for x in data["plugins"]],
+    )
+
+
+def _read_cache(cache_path: Path) -> Dict[str, Dict[str, Any]]:
+    try:
+        data = json.loads(cache_path.read_text())
+
+    except (OSError, ValueError):
+        return {}
+
+    if data.get("version") != MANIFEST_CACHE_VERSION:
+        return {}
+
+    return data["modules"]
+
+
+def _write_cache(cache_path: Path, modules: Dict[str, Dict[str, Any]]) -> None:
+    if sys.dont_write_bytecode:
+        return None
+
+    data = dict(version=MANIFEST_CACHE_VERSION, modules=modules)
+    temp_path = cache_path.with_name(f"{cache_path.name}.{os.getpid()}.tmp")
+
+    try:
+        cache_path.parent.mkdir(exist_ok=True)
+        temp_path.write_text(json.dumps(data))
+        os.replace(temp_path, cache_path)
+
+    except OSError:
+        LOGGER.debug("Unable to write plug-in manifest cache", path=str(cache_path))
@@ -43,10 +43,11 @@
 
 from __future__ import annotations
 
+import copy
 import functools
 import importlib
 import sys
-import textwrap
+import threading
 from typing import (
     TYPE_CHECKING,
     Any,
@@ -55,6 +56,8 @@ from typing import (
     List,
     NamedTuple,
     Optional,
+    Set,
+    Tuple,
     TypeVar,
     Union,
     overload,
@@ -70,24 +73,14 @@ from dioptra.sdk.exceptions import (
     UnknownPluginFunctionError,
 )
 from dioptra.sdk.utilities.decorators import require_package
+from dioptra.sdk.utilities.imports import lazy_import
 
-LOGGER: BoundLogger = structlog.stdlib.get_logger()
-
+from ._instrumentation import instrument_task
+from ._manifest import build_package_manifest, split_doc
 
-try:
-    from importlib import resources
+LOGGER: BoundLogger = structlog.stdlib.get_logger()
 
-except ImportError:  # pragma: nocover
-    import importlib_resources as resources  # type: ignore
-
-try:
-    from prefect import task
-
-except ImportError:  # pragma: nocover
-    LOGGER.warn(
-        "Unable to import one or more optional packages, functionality may be reduced",
-        package="prefect",
-    )
+prefect = lazy_import("prefect")
 
 try:
     from typing import Protocol
@@ -140,9 +133,72 @@ class PluginInfo(NamedTuple):
 # Dictionary with information about all registered plug-ins
 _PLUGINS: Dict[str, Dict[str, Dict[str, PluginInfo]]] = {}
 
+# Dictionary with information about plug-ins found by parsing, but not importing, the
+# modules in a package
+_MANIFESTS: Dict[str, Dict[str, Dict[str, PluginInfo]]] = {}
+
+# Plug-in names of each package, sorted by their sort values
+_SORTED_NAMES: Dict[str, List[str]] = {}
+
+# Modules that have been fully imported, and the errors raised by modules and packages
+# that failed to import. Failed imports are not retried until invalidate_caches() is
+# called.
+_IMPORTED: Set[str] = set()
+_FAILED_IMPORTS: Dict[Tuple[str, str], ImportError] = {}
+
+# The registry lock guards the dictionaries above. The per-module locks ensure that
+# each module is imported, and each package manifest is built, only once.
+_REGISTRY_LOCK = threading.RLock()
+_MODULE_LOCKS: Dict[str, threading.RLock] = {}
+
+
+class LazyPlugin(object):
+    """Stand-in for a plug-in function whose module has not been imported yet
+
+    The module is imported the first time the plug-in is called or one of the
+    function's attributes is accessed.
+    """
+
+    def __init__(
+        self,
+        package_name: str,
+        plugin_name: str,
+        func_name: str,
+        doc: str,
+        task_nout: Optional[int],
+    ) -> None:
+        self._package_name = package_name
+        self._plugin_name = plugin_name
+        self.__name__ = self.__qualname__ = func_name
+        self.__module__ = f"{package_name}.{plugin_name}"
+        self.__doc__ = doc
+
+        if task_nout is not None:
+            self._task_nout = task_nout
+
+    def resolve(self) -> Plugin:
+        """Import the plug-in's module and return the registered function"""
+        _import(self._package_name, self._plugin_name)
+
+        return _PLUGINS[self._package_name][self._plugin_name][self.__name__].func
+
+    def __call__(self, *args: Any, **kwargs: Any) -> Any:
+        return self.resolve()(*args, **kwargs)
+
+    def __getattr__(self, name: str) -> Any:
+        if name.startswith("_"):
+            raise AttributeError(name)
+
+        return getattr(self.resolve(), name)
+
+    def __repr__(self) -> str:
+        return f"<lazy plug-in {self.__module__}.{self.__name__}>"
+
 
 @overload
-def register(func: None, *, sort_value: float) -> Callable[[Plugin], Plugin]:
+def register(
+    func: None, *, sort_value: float = 0, cpu_bound: bool = False
+) -> Callable[[Plugin], Plugin]:
     """Signature for using decorator with parameters"""
     ...  # pragma: nocover
 
@@ -155,29 +211,42 @@ def register(func: Plugin) -> Plugin:
 
 @expose
 def register(
-    _func: Optional[Plugin] = None, *, sort_value: float = 0
+    _func: Optional[Plugin] = None, *, sort_value: float = 0, cpu_bound: bool = False
 ) -> Callable[..., Any]:
-    """Decorator for registering a new plug-in"""
+    """Decorator for registering a new plug-in
+
+    Set `cpu_bound` for plug-ins that spend most of their time running Python code
+    while holding the GIL. It is a hint only: :py:func:`~._flows.run_flow` still runs
+    flows containing such plug-ins in threads, and logs that the flow may run faster
+    with ``scheduler="processes"``. That scheduler runs every task of the flow in a
+    worker process, so the arguments and return values of all its tasks must then be
+    picklable.
+    """
 
     def decorator_register(func: Callable[..., T]) -> Callable[..., T]:
         """Store information about the given function"""
         package_name, _, plugin_name = func.__module__.rpartition(".")
-        description, _, doc = (func.__doc__ or "").partition("\n\n")
+        description, doc = split_doc(func.__doc__)
         func_name = func.__name__
         module_doc = sys.modules[func.__module__].__doc__ or ""
 
-        pkg_info = _PLUGINS.setdefault(package_name, {})
-        plugin_info = pkg_info.setdefault(plugin_name, {})
-        plugin_info[func_name] = PluginInfo(
-            package_name=package_name,
-            plugin_name=plugin_name,
-            func_name=func_name,
-            func=func,
-            description=description,
-            doc=textwrap.dedent(doc).strip(),
-            module_doc=module_doc,
-            sort_value=sort_value,
-        )
+        if cpu_bound:
+            func._task_cpu_bound = True  # type: ignore[attr-defined]
+
+        with _REGISTRY_LOCK:
+            pkg_info = _PLUGINS.setdefault(package_name, {})
+            plugin_info = pkg_info.setdefault(plugin_name, {})
+            plugin_info[func_name] = PluginInfo(
+                package_name=package_name,
+                plugin_name=plugin_name,
+                func_name=func_name,
+                func=func,
+                description=description,
+                doc=doc,
+                module_doc=module_doc,
+                sort_value=sort_value,
+            )
+            _SORTED_NAMES.pop(package_name, None)
 
         return func
 
@@ -200,28 +269,44 @@ def task_nout(nout: int) -> Callable[[F], F]:
 
 @expose
 def names(package: str) -> List[str]:
-    """List all plug-ins in one package"""
-    _import_all(package)
+    """List all plug-ins in one package
+
+    The plug-in modules are not imported, see :py:func:`_load_manifest`.
+    """
+    sorted_names = _SORTED_NAMES.get(package)
+
+    if sorted_names is None:
+        _load_manifest(package)
+
+        with _REGISTRY_LOCK:
+            plugins = {**_MANIFESTS[package], **_PLUGINS.get(package, {})}
+            sorted_names = sorted(
+                (p for p, plugin_info in plugins.items() if plugin_info),
+                key=lambda p: next(iter(plugins[p].values())).sort_value,
+            )
+            _SORTED_NAMES[package] = sorted_names
 
-    return sorted(_PLUGINS[package].keys(), key=lambda p: info(package, p).sort_value)
+    return list(sorted_names)
 
 
 @expose
 def funcs(package: str, plugin: str) -> List[str]:
     """List all functions in one plug-in"""
-    _import(package, plugin)
-    plugin_info = _PLUGINS[package][plugin]
+    plugin_info = _get_plugin_info(package, plugin)
 
     return list(plugin_info.keys())
 
 
 @expose
 def info(package: str, plugin: str, func: Optional[str] = None) -> PluginInfo:
-    """Get information about a plug-in"""
-    _import(package, plugin)
+    """Get information about a plug-in
 
+    If the plug-in's module has not been imported yet, the returned information is
+    read from the package's manifest and the `func` field holds a
+    :py:class:`LazyPlugin`. Use :py:func:`get` to obtain the function itself.
+    """
     try:
-        plugin_info = _PLUGINS[package][plugin]
+        plugin_info = _get_plugin_info(package, plugin)
 
     except KeyError as exc:
         raise UnknownPluginError(
@@ -244,23 +329,33 @@ def info(package: str, plugin: str, func: Optional[str] = None) -> PluginInfo:
 @expose
 def exists(package: str, plugin: str) -> bool:
     """Check if a given plugin exists"""
-    if package in _PLUGINS and plugin in _PLUGINS[package]:
-        return True
+    if f"{package}.{plugin}" in _IMPORTED:
+        return plugin in _PLUGINS.get(package, {})
 
     try:
+        _load_manifest(package)
+
+        if _MANIFESTS[package].get(plugin):
+            return True
+
         _import(package, plugin)
 
     except (UnknownPluginError, UnknownPackageError):
         return False
 
     else:
-        return package in _PLUGINS and plugin in _PLUGINS[package]
+        return plugin in _PLUGINS.get(package, {})
 
 
 @expose
 def get(package: str, plugin: str, func: Optional[str] = None) -> Plugin:
-    """Get a given plugin"""
-    return info(package, plugin, func).func
+    """Get a given plugin, importing its module if necessary"""
+    plugin_func = info(package, plugin, func).func
+
+    if isinstance(plugin_func, LazyPlugin):
+        return plugin_func.resolve()
+
+    return plugin_func
 
 
 @expose
@@ -276,11 +371,17 @@ def call(
 @expose
 @require_package("prefect", exc_type=PrefectDependencyError)
 def get_task(package: str, plugin: str, func: Optional[str] = None) -> Task:
-    """Get a given plugin wrapped as a prefect task"""
-    plugin_func: Union[Plugin, NoutPlugin] = info(package, plugin, func).func
+    """Get a given plugin wrapped as a prefect task
+
+    Each run of the task is measured, see :py:mod:`._instrumentation`.
+    """
+    plugin_func: Union[Plugin, NoutPlugin] = get(package, plugin, func)
     nout: Optional[int] = getattr(plugin_func, "_task_nout", None)
+    task_name = f"{plugin}.{plugin_func.__name__}"
 
-    return task(plugin_func, nout=nout)  # type: ignore
+    return prefect.task(  # type: ignore
+        instrument_task(plugin_func, task_name), nout=nout
+    )
 
 
 @expose
@@ -294,50 +395,165 @@ def call_task(
     return plugin_task(*args, **kwargs)
 
 
+@expose
+def invalidate_caches() -> None:
+    """Forget failed imports and package manifests
+
+    Call this after plug-in files have been added or changed while the process is
+    running. Plug-ins that have already been imported are kept.
+    """
+    with _REGISTRY_LOCK:
+        _FAILED_IMPORTS.clear()
+        _MANIFESTS.clear()
+        _SORTED_NAMES.clear()
+
+    importlib.invalidate_caches()
+
+
 def _import(package: str, plugin: str) -> None:
-    """Import the given plugin file from a package"""
-    if package in _PLUGINS and plugin in _PLUGINS[package]:
-        return None
+    """Import the given plugin file from a package
 
+    Each module is imported at most once. If the import fails, the error is cached and
+    raised again by later calls.
+    """
     plugin_module = f"{package}.{plugin}"
 
-    try:
-        importlib.import_module(plugin_module)
+    if plugin_module in _IMPORTED:
+        return None
+
+    with _module_lock(plugin_module):
+        if plugin_module in _IMPORTED:
+            return None
 
-    except ImportError as err:
-        if repr(plugin_module) in err.msg:
-            raise UnknownPluginError(
-                f"Plugin {plugin!r} not found in {package!r}"
-            ) from None
+        _raise_failed_import("module", plugin_module)
 
-        elif repr(package) in err.msg:
-            raise UnknownPackageError(f"Package {package!r} does not exist") from None
+        try:
+            importlib.import_module(plugin_module)
 
-        raise
+        except ImportError as err:
+            if err.msg is not None and repr(plugin_module) in err.msg:
+                error: ImportError = UnknownPluginError(
+                    f"Plugin {plugin!r} not found in {package!r}"
+                )
 
+            elif err.msg is not None and repr(package) in err.msg:
+                error = UnknownPackageError(f"Package {package!r} does not exist")
 
-def _import_all(package: str) -> None:
-    """Import all plugins in a package"""
-    try:
-        all_resources = resources.contents(package)
+            else:
+                error = err
+
+            with _REGISTRY_LOCK:
+                _FAILED_IMPORTS["module", plugin_module] = error
+
+            if error is err:
+                raise
 
-    except ImportError as err:
-        raise UnknownPackageError(err) from None
+            raise copy.copy(error) from None
 
-    # Note that we have tried to import the package by adding it to _PLUGINS
-    _PLUGINS.setdefault(package, {})
+        with _REGISTRY_LOCK:
+            _IMPORTED.add(plugin_module)
+            _SORTED_NAMES.pop(package, None)
 
-    # Loop through all Python files in the directories of the package
-    plugins = [
-        r[:-3] for r in all_resources if r.endswith(".py") and not r.startswith("_")
-    ]
 
-    for plugin in plugins:
+def _raise_failed_import(kind: str, name: str) -> None:
+    """Raise the cached error if the given plug-in module or package failed to import"""
+    error = _FAILED_IMPORTS.get((kind, name))
+
+    if error is not None:
+        # A copy keeps tracebacks from piling up on the cached error.
+        raise copy.copy(error) from None
+
+
+def _module_lock(module: str) -> threading.RLock:
+    """Get the lock that serializes imports of the given module"""
+    with _REGISTRY_LOCK:
+        return _MODULE_LOCKS.setdefault(module, threading.RLock())
+
+
+def _get_plugin_info(package: str, plugin: str) -> Dict[str, PluginInfo]:
+    """Get the registered functions of a plug-in, preferring imported modules"""
+    if f"{package}.{plugin}" not in sys.modules:
         try:
-            _import(package, plugin)
+            _load_manifest(package)
+
+        except UnknownPackageError:
+            pass
+
+        else:
+            if _MANIFESTS[package].get(plugin):
+                return _MANIFESTS[package][plugin]
+
+    # Also waits for imports that are still in progress on other threads
+    _import(package, plugin)
 
-        except ImportError:
-            pass  # Don't let errors in one plugin, affect the others
+    return _PLUGINS[package][plugin]
+
+
+def _load_manifest(package: str) -> None:
+    """Find the plug-ins in a package without importing the plug-in modules
+
+    Only the package itself is imported. Its modules are parsed, see
+    :py:func:`~dioptra.pyplugs._manifest.build_package_manifest`, and modules that
+    register plug-ins dynamically are imported as before.
+    """
+    if package in _MANIFESTS:
+        return None
+
+    with _module_lock(package):
+        if package in _MANIFESTS:
+            return None
+
+        _raise_failed_import("package", package)
+
+        try:
+            package_paths = list(importlib.import_module(package).__path__)
+
+        except (ImportError, AttributeError) as err:
+            error = UnknownPackageError(
+                err if isinstance(err, ImportError) else f"{package!r} is not a package"
+            )
+
+            with _REGISTRY_LOCK:
+                _FAILED_IMPORTS["package", package] = error
+
+            raise copy.copy(error) from None
+
+        manifest: Dict[str, Dict[str, PluginInfo]] = {}
+
+        for plugin, module_manifest in build_package_manifest(package_paths).items():
+            if module_manifest.dynamic:
+                try:
+                    _import(package, plugin)
+
+                except ImportError:
+                    pass  # Don't let errors in one plugin, affect the others
+
+                continue
+
+            manifest[plugin] = {
+                x.func_name: PluginInfo(
+                    package_name=package,
+                    plugin_name=plugin,
+                    func_name=x.func_name,
+                    func=LazyPlugin(
+                        package_name=package,
+                        plugin_name=plugin,
+                        func_name=x.func_name,
+                        doc="\n\n".join(y for y in (x.description, x.doc) if y),
+                        task_nout=x.task_nout,
+                    ),
+                    description=x.description,
+                    doc=x.doc,
+                    module_doc=module_manifest.module_doc,
+                    sort_value=x.sort_value,
+                )
+                for x in module_manifest.plugins
+            }
+
+        with _REGISTRY_LOCK:
+            _PLUGINS.setdefault(package, {})
+            _MANIFESTS[package] = manifest
+            _SORTED_NAMES.pop(package, None)
 
 
 @expose
@@ -22,13 +22,11 @@ dependencies.
 """
 from __future__ import annotations
 
-import uuid
 from typing import Any, Callable, List, Optional
 
 import structlog
 from flask import Flask, jsonify
 from flask_injector import FlaskInjector
-from flask_migrate import Migrate
 from flask_restx import Api
 from flask_sqlalchemy import SQLAlchemy
 from flask_wtf import CSRFProtect
@@ -36,10 +34,12 @@ from sqlalchemy import MetaData
 from structlog.stdlib import BoundLogger
 
 from .__version__ import __version__ as API_VERSION
+from .instrumentation import RequestInstrumentation
 
 LOGGER: BoundLogger = structlog.stdlib.get_logger()
 
 csrf: CSRFProtect = CSRFProtect()
+instrumentation: RequestInstrumentation = RequestInstrumentation()
 db: SQLAlchemy = SQLAlchemy(
     metadata=MetaData(
         naming_convention={
@@ -51,7 +51,6 @@ db: SQLAlchemy = SQLAlchemy(
         }
     )
 )
-migrate: Migrate = Migrate()
 
 
 def create_app(env: Optional[str] = None, inject_dependencies: bool = True):
@@ -70,10 +69,13 @@ def create_app(env: Optional[str] = None, inject_dependencies: bool = True):
     Returns:
         An initialized and configured :py:class:`~flask.Flask` object.
     """
+    from flask_migrate import Migrate
+
     from .config import config_by_name
     from .dependencies import bind_dependencies, register_providers
     from .errors import register_error_handlers
     from .routes import register_routes
+    from .shared.request_scope.logger import get_request_logger
 
     if env is None:
         env = "test"
@@ -93,14 +95,15 @@ def create_app(env: Optional[str] = None, inject_dependencies: bool = True):
     register_providers(modules)
     csrf.init_app(app)
     db.init_app(app)
+    instrumentation.init_app(app)
 
     with app.app_context():
-        migrate.init_app(app, db, render_as_batch=True)
+        Migrate(app, db, render_as_batch=True)
 
     @app.route("/health")
     def health():
         """An endpoint for monitoring if the REST API is responding to requests."""
-        log = LOGGER.new(request_id=str(uuid.uuid4()))  # noqa: F841
+        log = get_request_logger()  # noqa: F841
         return jsonify("healthy")
 
     if not inject_dependencies:
@@ -25,6 +25,7 @@ from gunicorn.app.wsgiapp import run as gunicorn_cli
 from dioptra.sdk.utilities.logging import (
     attach_stdout_stream_handler,
     configure_structlog,
+    parse_sample_rates,
     set_logging_level,
 )
 
@@ -33,5 +34,7 @@ if __name__ == "__main__":
         True if os.getenv("DIOPTRA_RESTAPI_LOG_AS_JSON") else False,
     )
     set_logging_level(os.getenv("DIOPTRA_RESTAPI_LOG_LEVEL", default="INFO"))
-    configure_structlog()
+    configure_structlog(
+        sample_rates=parse_sample_rates(os.getenv("DIOPTRA_RESTAPI_LOG_SAMPLE_RATES"))
+    )
     gunicorn_cli()
@@ -25,6 +25,7 @@ There are three configuration environments available,
 from __future__ import annotations
 
 import os
+import tempfile
 from typing import List, Type
 
 
@@ -35,6 +36,18 @@ class BaseConfig(object):
     SQLALCHEMY_TRACK_MODIFICATIONS = False
     WTF_CSRF_ENABLED = False
     DIOPTRA_PLUGINS_BUCKET = os.getenv("DIOPTRA_PLUGINS_BUCKET", "plugins")
+    DIOPTRA_METRICS_ENABLED = True if os.getenv("DIOPTRA_METRICS_ENABLED") else False
+    DIOPTRA_PROFILING_ENABLED = (
+        True if os.getenv("DIOPTRA_PROFILING_ENABLED") else False
+    )
+    DIOPTRA_PROFILING_BACKEND = os.getenv("DIOPTRA_PROFILING_BACKEND")
+    DIOPTRA_PROFILING_DIR = os.getenv(
+        "DIOPTRA_PROFILING_DIR", os.path.join(tempfile.gettempdir(), "dioptra-profiles")
+    )
+    DIOPTRA_PROFILING_HEADER = "X-Dioptra-Profile"
+    DIOPTRA_PROFILING_SAMPLE_RATE = float(
+        os.getenv("DIOPTRA_PROFILING_SAMPLE_RATE", "0")
+    )
 
 
 class DevelopmentConfig(BaseConfig):
@@ -17,7 +17,6 @@
 """The module defining the experiment endpoints."""
 from __future__ import annotations
 
-import uuid
 from typing import List, Optional
 
 import structlog
@@ -28,6 +27,7 @@ from flask_restx import Namespace, Resource
 from injector import inject
 from structlog.stdlib import BoundLogger
 
+from dioptra.restapi.shared.request_scope.logger import get_request_logger
 from dioptra.restapi.utils import as_api_parser
 
 from .errors import ExperimentDoesNotExistError, ExperimentRegistrationError
@@ -64,8 +64,8 @@ class ExperimentResource(Resource):
     @responds(schema=ExperimentSchema(many=True), api=api)
     def get(self) -> List[Experiment]:
         """Gets a list of all registered experiments."""
-        log: BoundLogger = LOGGER.new(
-            request_id=str(uuid.uuid4()), resource="experiment", request_type="GET"
+        log: BoundLogger = get_request_logger().bind(
+            resource="experiment", request_type="GET"
         )  # noqa: F841
         log.info("Request received")
         return self._experiment_service.get_all(log=log)
@@ -75,8 +75,8 @@ class ExperimentResource(Resource):
     @responds(schema=ExperimentSchema, api=api)
     def post(self) -> Experiment:
         """Creates a new experiment via an experiment registration form."""
-        log: BoundLogger = LOGGER.new(
-            request_id=str(uuid.uuid4()), resource="experiment", request_type="POST"
+        log: BoundLogger = get_request_logger().bind(
+            resource="experiment", request_type="POST"
         )  # noqa: F841
         experiment_registration_form: ExperimentRegistrationForm = (
             ExperimentRegistrationForm()
@@ -112,8 +112,8 @@ class ExperimentIdResource(Resource):
     @responds(schema=ExperimentSchema, api=api)
     def get(self, experimentId: int) -> Experiment:
         """Gets an experiment by its unique identifier."""
-        log: BoundLogger = LOGGER.new(
-            request_id=str(uuid.uuid4()), resource="experimentId", request_type="GET"
+        log: BoundLogger = get_request_logger().bind(
+            resource="experimentId", request_type="GET"
         )  # noqa: F841
         log.info("Request received", experiment_id=experimentId)
         experiment: Optional[Experiment] = self._experiment_service.get_by_id(
@@ -128,8 +128,8 @@ class ExperimentIdResource(Resource):
 
     def delete(self, experimentId: int) -> Response:
         """Deletes an experiment by its unique identifier."""
-        log: BoundLogger = LOGGER.new(
-            request_id=str(uuid.uuid4()), resource="experimentId", request_type="DELETE"
+        log: BoundLogger = get_request_logger().bind(
+            resource="experimentId", request_type="DELETE"
         )  # noqa: F841
         log.info("Request received", experiment_id=experimentId)
         id: List[int] = self._experiment_service.delete_experiment(
@@ -142,8 +142,8 @@ class ExperimentIdResource(Resource):
     @responds(schema=ExperimentSchema, api=api)
     def put(self, experimentId: int) -> Experiment:
         """Modifies an experiment by its unique identifier."""
-        log: BoundLogger = LOGGER.new(
-            request_id=str(uuid.uuid4()), resource="experimentId", request_type="PUT"
+        log: BoundLogger = get_request_logger().bind(
+            resource="experimentId", request_type="PUT"
         )  # noqa: F841
         changes: ExperimentUpdateInterface = request.parsed_obj  # type: ignore
         experiment: Optional[Experiment] = self._experiment_service.get_by_id(
@@ -174,8 +174,8 @@ class ExperimentNameResource(Resource):
     @responds(schema=ExperimentSchema, api=api)
     def get(self, experimentName: str) -> Experiment:
         """Gets an experiment by its unique name."""
-        log: BoundLogger = LOGGER.new(
-            request_id=str(uuid.uuid4()), resource="experimentName", request_type="GET"
+        log: BoundLogger = get_request_logger().bind(
+            resource="experimentName", request_type="GET"
         )  # noqa: F841
         log.info("Request received", experiment_name=experimentName)
         experiment: Optional[Experiment] = self._experiment_service.get_by_name(
@@ -190,8 +190,7 @@ class ExperimentNameResource(Resource):
 
     def delete(self, experimentName: str) -> Response:
         """Deletes an experiment by its unique name."""
-        log: BoundLogger = LOGGER.new(
-            request_id=str(uuid.uuid4()),
+        log: BoundLogger = get_request_logger().bind(
             resource="experimentName",
             experiment_name=experimentName,
             request_type="DELETE",
@@ -214,8 +213,8 @@ class ExperimentNameResource(Resource):
     @responds(schema=ExperimentSchema, api=api)
     def put(self, experimentName: str) -> Experiment:
         """Modifies an experiment by its unique name."""
-        log: BoundLogger = LOGGER.new(
-            request_id=str(uuid.uuid4()), resource="experimentName", request_type="PUT"
+        log: BoundLogger = get_request_logger().bind(
+            resource="experimentName", request_type="PUT"
         )  # noqa: F841
         changes: ExperimentUpdateInterface = request.parsed_obj  # type: ignore
         experiment: Optional[Experiment] = self._experiment_service.get_by_name(
@@ -27,6 +27,7 @@ from structlog.stdlib import BoundLogger
 
 from dioptra.restapi.app import db
 from dioptra.restapi.shared.mlflow_tracking.service import MLFlowTrackingService
+from dioptra.restapi.shared.request_scope.logger import get_request_logger
 
 from .errors import (
     ExperimentAlreadyExistsError,
@@ -59,7 +60,7 @@ class ExperimentService(object):
         experiment_registration_form_data: ExperimentRegistrationFormData,
         **kwargs,
     ) -> Experiment:
-        log: BoundLogger = kwargs.get("log", LOGGER.new())
+        log: BoundLogger = kwargs.get("log") or get_request_logger()
         experiment_name: str = experiment_registration_form_data["name"]
 
         if self.get_by_name(experiment_name, log=log) is not None:
@@ -98,7 +99,7 @@ class ExperimentService(object):
         return int(experiment_id)
 
     def delete_experiment(self, experiment_id: int, **kwargs) -> List[int]:
-        log: BoundLogger = kwargs.get("log", LOGGER.new())  # noqa: F841
+        log: BoundLogger = kwargs.get("log") or get_request_logger()  # noqa: F841
         experiment: Optional[Experiment] = self.get_by_id(experiment_id=experiment_id)
 
         if experiment is None:
@@ -119,7 +120,7 @@ class ExperimentService(object):
     def rename_experiment(
         self, experiment: Experiment, new_name: str, **kwargs
     ) -> Experiment:
-        log: BoundLogger = kwargs.get("log", LOGGER.new())  # noqa: F841
+        log: BoundLogger = kwargs.get("log") or get_request_logger()  # noqa: F841
         reply: Optional[bool] = self._mlflow_tracking_service.rename_experiment(
             experiment_id=experiment.experiment_id, new_name=new_name
         )
@@ -134,13 +135,13 @@ class ExperimentService(object):
 
     @staticmethod
     def get_all(**kwargs) -> List[Experiment]:
-        log: BoundLogger = kwargs.get("log", LOGGER.new())  # noqa: F841
+        log: BoundLogger = kwargs.get("log") or get_request_logger()  # noqa: F841
 
         return Experiment.query.filter_by(is_deleted=False).all()  # type: ignore
 
     @staticmethod
     def get_by_id(experiment_id: int, **kwargs) -> Optional[Experiment]:
-        log: BoundLogger = kwargs.get("log", LOGGER.new())  # noqa: F841
+        log: BoundLogger = kwargs.get("log") or get_request_logger()  # noqa: F841
 
         return Experiment.query.filter_by(  # type: ignore
             experiment_id=experiment_id, is_deleted=False
@@ -148,7 +149,7 @@ class ExperimentService(object):
 
     @staticmethod
     def get_by_name(experiment_name: str, **kwargs) -> Optional[Experiment]:
-        log: BoundLogger = kwargs.get("log", LOGGER.new())
+        log: BoundLogger = kwargs.get("log") or get_request_logger()
         log.info("Lookup experiment by unique name", experiment_name=experiment_name)
 
         return Experiment.query.filter_by(  # type: ignore
@@ -158,7 +159,7 @@ class ExperimentService(object):
     def extract_data_from_form(
         self, experiment_registration_form: ExperimentRegistrationForm, **kwargs
     ) -> ExperimentRegistrationFormData:
-        log: BoundLogger = kwargs.get("log", LOGGER.new())  # noqa: F841
+        log: BoundLogger = kwargs.get("log") or get_request_logger()  # noqa: F841
 
         data: ExperimentRegistrationFormData = (
             self._experiment_registration_form_schema.dump(experiment_registration_form)
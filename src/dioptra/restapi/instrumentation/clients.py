@@ -0,0 +1,138 @@
+# This Software (Dioptra) is being made available as a public service by the
+# National Institute of Standards and Technology (NIST), an Agency of the United
+# States Department of Commerce. This software was developed in part by employees of
+# NIST and in part by NIST contractors. Copyright in portions of this software that
+# were developed by NIST contractors has been licensed or assigned to NIST. Pursuant
+# to Title 17 United States Code Section 105, works of NIST employees are not
+# subject to copyright protection in the United States. However, NIST may hold
+# international copyright in software created by its employees and domestic
+# copyright (or licensing rights) in portions of software that were assigned or
+# licensed to NIST. To the extent that NIST holds copyright in this software, it is
+# being made available under the Creative Commons Attribution 4.0 International
+# license (CC BY 4.0). The disclaimers of the CC BY 4.0 license apply to all parts
+# of the software developed or licensed by NIST.
+#
+# ACCESS THE FULL CC BY 4.0 LICENSE HERE:
+# https://creativecommons.org/licenses/by/4.0/legalcode
+"""Timings of the calls that the REST API makes to S3 and Redis."""
+from __future__ import annotations
+
+import functools
+import time
+from typing import Any, Callable, MutableMapping, Optional
+
+from botocore.client import BaseClient
+from redis import Redis
+
+from .metrics import REGISTRY, Histogram, MetricsRegistry
+
+OUTBOUND_CALL_DURATION = "dioptra_restapi_outbound_call_duration_seconds"
+
+_BOTO3_CONTEXT_KEY = "dioptra_outbound_call"
+_INSTRUMENTED_ATTRIBUTE = "_dioptra_instrumented"
+
+
+def instrument_boto3_client(
+    client: BaseClient,
+    service: Optional[str] = None,
+    registry: MetricsRegistry = REGISTRY,
+) -> BaseClient:
+    """Times every API call made with a boto3 client.
+
+    The timings are recorded through the client's event system, so calls made from
+    the worker threads of a managed transfer, such as
+    :py:meth:`~S3.Client.upload_fileobj`, are included.
+
+    Args:
+        client: A boto3 client.
+        service: The value of the `service` label. If `None`, the name of the
+            client's service is used. The default is `None`.
+        registry: The registry to record the timings in.
+
+    Returns:
+        The same client, for convenience.
+    """
+    if getattr(client, _INSTRUMENTED_ATTRIBUTE, False):
+        return client
+
+    histogram = _get_outbound_call_histogram(registry)
+    service = service or client.meta.service_model.service_name
+
+    def start_timer(model: Any, context: MutableMapping[str, Any], **kwargs) -> None:
+        context[_BOTO3_CONTEXT_KEY] = (model.name, time.perf_counter())
+
+    def stop_timer(context: MutableMapping[str, Any], **kwargs) -> None:
+        started = context.pop(_BOTO3_CONTEXT_KEY, None)
+
+        if started is not None:
+            operation, start = started
+            histogram.observe(time.perf_counter() - start, service, operation)
+
+    client.meta.events.register_first("before-call.*.*", start_timer)
+    client.meta.events.register("after-call", stop_timer)
+    client.meta.events.register("after-call-error", stop_timer)
+    setattr(client, _INSTRUMENTED_ATTRIBUTE, True)
+
+    return client
+
+
+def instrument_redis_client(
+    redis: Redis, registry: MetricsRegistry = REGISTRY
+) -> Redis:
+    """Times every command and pipeline sent with a Redis client.
+
+    Args:
+        redis: A :py:class:`~redis.Redis` client.
+        registry: The registry to record the timings in.
+
+    Returns:
+        The same client, for convenience.
+    """
+    if getattr(redis, _INSTRUMENTED_ATTRIBUTE, False):
+        return redis
+
+    histogram = _get_outbound_call_histogram(registry)
+    pipeline = redis.pipeline
+
+    @functools.wraps(pipeline)
+    def timed_pipeline(*args, **kwargs) -> Any:
+        pipe = pipeline(*args, **kwargs)
+        pipe.execute = _time_call(pipe.execute, histogram, "PIPELINE")
+
+        return pipe
+
+    redis.execute_command = _time_call(  # type: ignore[assignment]
+        redis.execute_command, histogram
+    )
+    redis.pipeline = timed_pipeline  # type: ignore[assignment]
+    setattr(redis, _INSTRUMENTED_ATTRIBUTE, True)
+
+    return redis
+
+
+def _get_outbound_call_histogram(registry: MetricsRegistry) -> Histogram:
+    return registry.histogram(
+        OUTBOUND_CALL_DURATION,
+        "Duration of the calls made to external services in seconds.",
+        labelnames=("service", "operation"),
+    )
+
+
+def _time_call(
+    func: Callable[..., Any], histogram: Histogram, operation: Optional[str] = None
+) -> Callable[..., Any]:
+    @functools.wraps(func)
+    def wrapper(*args, **kwargs) -> Any:
+        start = time.perf_counter()
+
+        try:
+            return func(*args, **kwargs)
+
+        finally:
+            histogram.observe(
+                time.perf_counter() - start,
+                "redis",
+                operation or str(args[0] if args else "").upper(),
+            )
+
+    return wrapper
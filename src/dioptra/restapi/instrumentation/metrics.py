@@ -0,0 +1,188 @@
+# This Software (Dioptra) is being made available as a public service by the
+# National Institute of Standards and Technology (NIST), an Agency of the United
+# States Department of Commerce. This software was developed in part by employees of
+# NIST and in part by NIST contractors. Copyright in portions of this software that
+# were developed by NIST contractors has been licensed or assigned to NIST. Pursuant
+# to Title 17 United States Code Section 105, works of NIST employees are not
+# subject to copyright protection in the United States. However, NIST may hold
+# international copyright in software created by its employees and domestic
+# copyright (or licensing rights) in portions of software that were assigned or
+# licensed to NIST. To the extent that NIST holds copyright in this software, it is
+# being made available under the Creative Commons Attribution 4.0 International
+# license (CC BY 4.0). The disclaimers of the CC BY 4.0 license apply to all parts
+# of the software developed or licensed by NIST.
+#
+# ACCESS THE FULL CC BY 4.0 LICENSE HERE:
+# https://creativecommons.org/licenses/by/4.0/legalcode
+"""Latency histograms that are rendered in the Prometheus text exposition format.
+
+Only the small subset of the format needed by the REST API is implemented here, so
+that exposing metrics does not add a dependency. The metrics are kept in the memory of
+each process, so every gunicorn worker reports its own values.
+"""
+from __future__ import annotations
+
+import bisect
+import math
+import threading
+from typing import Dict, Iterator, List, Optional, Sequence, Tuple
+
+CONTENT_TYPE = "text/plain; version=0.0.4; charset=utf-8"
+DEFAULT_BUCKETS: Tuple[float, ...] = (
+    0.005,
+    0.01,
+    0.025,
+    0.05,
+    0.075,
+    0.1,
+    0.25,
+    0.5,
+    0.75,
+    1.0,
+    2.5,
+    5.0,
+    7.5,
+    10.0,
+)
+
+
+class Histogram(object):
+    """A histogram of observed values partitioned by a fixed set of labels.
+
+    Args:
+        name: The name of the metric.
+        documentation: A short description of the metric.
+        labelnames: The names of the labels that partition the observations.
+        buckets: The upper bounds of the histogram buckets. A `+Inf` bucket is always
+            added. The default is :py:data:`DEFAULT_BUCKETS`.
+    """
+
+    def __init__(
+        self,
+        name: str,
+        documentation: str,
+        labelnames: Sequence[str] = (),
+        buckets: Sequence[float] = DEFAULT_BUCKETS,
+    ) -> None:
+        self.name = name
+        self.documentation = documentation
+        self.labelnames: Tuple[str, ...] = tuple(labelnames)
+        self.buckets: Tuple[float, ...] = tuple(sorted(buckets))
+        self._series: Dict[Tuple[str, ...], List[float]] = {}
+        self._lock = threading.Lock()
+
+    def observe(self, value: float, *labelvalues: str) -> None:
+        """Records an observation.
+
+        Args:
+            value: The observed value.
+            *labelvalues: The label values, in the same order as `labelnames`.
+        """
+        index = bisect.bisect_left(self.buckets, value)
+
+        with self._lock:
+            series = self._series.get(labelvalues)
+
+            if series is None:
+                series = self._series[labelvalues] = [0.0] * (len(self.buckets) + 3)
+
+            series[index] += 1
+            series[-2] += 1
+            series[-1] += value
+
+    def count(self, *labelvalues: str) -> int:
+        """Returns the number of observations recorded for a set of label values."""
+        with self._lock:
+            series: Optional[List[float]] = self._series.get(labelvalues)
+
+        return 0 if series is None else int(series[-2])
+
+    def collect(self) -> Iterator[str]:
+        """Yields the lines of the histogram in the Prometheus text format."""
+        with self._lock:
+            snapshot = {key: list(value) for key, value in self._series.items()}
+
+        yield f"# HELP {self.name} {self.documentation}"
+        yield f"# TYPE {self.name} histogram"
+
+        for labelvalues, series in sorted(snapshot.items()):
+            labels = list(zip(self.labelnames, labelvalues))
+            cumulative = 0.0
+
+            for bound, observations in zip(self.buckets + (math.inf,), series):
+                cumulative += observations
+                bucket_labels = _format_labels(labels + [("le", _format_value(bound))])
+                yield f"{self.name}_bucket{bucket_labels} {_format_value(cumulative)}"
+
+            yield f"{self.name}_count{_format_labels(labels)} {_format_value(series[-2])}"
+            yield f"{self.name}_sum{_format_labels(labels)} {_format_value(series[-1])}"
+
+
+class MetricsRegistry(object):
+    """A collection of histograms that are rendered together."""
+
+    def __init__(self) -> None:
+        self._metrics: Dict[str, Histogram] = {}
+        self._lock = threading.Lock()
+
+    def histogram(
+        self,
+        name: str,
+        documentation: str,
+        labelnames: Sequence[str] = (),
+        buckets: Sequence[float] = DEFAULT_BUCKETS,
+    ) -> Histogram:
+        """Gets a registered histogram or registers a new one.
+
+        Args:
+            name: The name of the metric.
+            documentation: A short description of the metric.
+            labelnames: The names of the labels that partition the observations.
+            buckets: The upper bounds of the histogram buckets.
+
+        Returns:
+            A :py:class:`Histogram` object.
+        """
+        with self._lock:
+            metric = self._metrics.get(name)
+
+            if metric is None:
+                metric = self._metrics[name] = Histogram(
+                    name, documentation, labelnames=labelnames, buckets=buckets
+                )
+
+        return metric
+
+    def render(self) -> str:
+        """Renders all of the registered metrics in the Prometheus text format."""
+        with self._lock:
+            metrics = [self._metrics[name] for name in sorted(self._metrics)]
+
+        return "".join(f"{line}\n" for metric in metrics for line in metric.collect())
+
+
+REGISTRY: MetricsRegistry = MetricsRegistry()
+"""The registry shared by everything that is instrumented in this process."""
+
+
+def _format_labels(labels: Sequence[Tuple[str, str]]) -> str:
+    if not labels:
+        return ""
+
+    formatted = ",".join(f'{name}="{_escape(value)}"' for name, value in labels)
+
+    return f"{{{formatted}}}"
+
+
+def _format_value(value: float) -> str:
+    if value == math.inf:
+        return "+Inf"
+
+    if float(value).is_integer():
+        return str(int(value))
+
+    return repr(float(value))
+
+
+def _escape(value: str) -> str:
+    return str(value).replace("\\", r"\\").replace("\n", r"\n").replace('"', r"\"")
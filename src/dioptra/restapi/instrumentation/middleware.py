@@ -0,0 +1,248 @@
+# This Software (Dioptra) is being made available as a public service by the
+# National Institute of Standards and Technology (NIST), an Agency of the United
+# States Department of Commerce. This software was developed in part by employees of
+# NIST and in part by NIST contractors. Copyright in portions of this software that
+# were developed by NIST contractors has been licensed or assigned to NIST. Pursuant
+# to Title 17 United States Code Section 105, works of NIST employees are not
+# subject to copyright protection in the United States. However, NIST may hold
+# international copyright in software created by its employees and domestic
+# copyright (or licensing rights) in portions of software that were assigned or
+# licensed to NIST. To the extent that NIST holds copyright in this software, it is
+# being made available under the Creative Commons Attribution 4.0 International
+# license (CC BY 4.0). The disclaimers of the CC BY 4.0 license apply to all parts
+# of the software developed or licensed by NIST.
+#
+# ACCESS THE FULL CC BY 4.0 LICENSE HERE:
+# https://creativecommons.org/licenses/by/4.0/legalcode
+"""Opt-in request timing and profiling for the Flask application.
+
+.. |Flask| replace:: :py:class:`~flask.Flask`
+"""
+from __future__ import annotations
+
+import random
+import threading
+import time
+from dataclasses import dataclass
+from typing import Any, List, Optional
+
+import structlog
+from flask import Flask, Response, current_app, has_request_context, request
+from sqlalchemy import event
+from sqlalchemy.engine import Engine
+from structlog.stdlib import BoundLogger
+
+from .metrics import CONTENT_TYPE, REGISTRY, MetricsRegistry
+from .profiling import RequestProfiler, create_profiler, save_profile
+
+LOGGER: BoundLogger = structlog.stdlib.get_logger()
+
+REQUEST_DURATION = "dioptra_restapi_request_duration_seconds"
+REQUEST_SQL_QUERIES = "dioptra_restapi_request_sql_queries"
+REQUEST_SQL_DURATION = "dioptra_restapi_request_sql_duration_seconds"
+SQL_QUERY_BUCKETS = (0, 1, 2, 5, 10, 25, 50, 100, 250)
+UNMATCHED_ROUTE = "<unmatched>"
+
+_ENVIRON_KEY = "dioptra.instrumentation"
+_QUERY_START_KEY = "dioptra_query_start"
+_SQL_LISTENERS_LOCK = threading.Lock()
+_sql_listeners_registered = False
+
+
+@dataclass
+class _RequestState(object):
+    start: float
+    sql_queries: int = 0
+    sql_duration: float = 0.0
+    profiler: Optional[RequestProfiler] = None
+
+
+class RequestInstrumentation(object):
+    """A Flask extension that times requests and optionally profiles them.
+
+    Nothing is registered unless at least one of the following configuration values
+    is set on the |Flask| application,
+
+    - **DIOPTRA_METRICS_ENABLED:** Records a latency histogram for each route, along
+      with the number and total duration of the SQL statements executed by each
+      request, and serves them on the `/metrics` endpoint in the Prometheus text
+      format. The timings of S3 and Redis calls made with instrumented clients, see
+      :py:mod:`~.clients`, are served on the same endpoint.
+    - **DIOPTRA_PROFILING_ENABLED:** Profiles the requests that carry the header
+      named by `DIOPTRA_PROFILING_HEADER`, and a random
+      `DIOPTRA_PROFILING_SAMPLE_RATE` fraction of all other requests. The profiles
+      are saved in `DIOPTRA_PROFILING_DIR` and the name of the saved file is returned
+      in the same header of the response.
+
+    Args:
+        app: A |Flask| application to initialize. The default is `None`.
+        registry: The registry to record the metrics in. The default is the registry
+            shared by the whole process.
+    """
+
+    def __init__(
+        self, app: Optional[Flask] = None, registry: MetricsRegistry = REGISTRY
+    ) -> None:
+        self._registry = registry
+        self._request_duration = registry.histogram(
+            REQUEST_DURATION,
+            "Duration of the requests in seconds.",
+            labelnames=("method", "route", "status"),
+        )
+        self._request_sql_queries = registry.histogram(
+            REQUEST_SQL_QUERIES,
+            "Number of SQL statements executed by the requests.",
+            labelnames=("method", "route"),
+            buckets=SQL_QUERY_BUCKETS,
+        )
+        self._request_sql_duration = registry.histogram(
+            REQUEST_SQL_DURATION,
+            "Total duration of the SQL statements executed by the requests in seconds.",
+            labelnames=("method", "route"),
+        )
+
+        if app is not None:
+            self.init_app(app)
+
+    def init_app(self, app: Flask) -> None:
+        """Registers the request hooks and the `/metrics` endpoint on an application.
+
+        Args:
+            app: A |Flask| application.
+        """
+        metrics_enabled: bool = app.config.get("DIOPTRA_METRICS_ENABLED", False)
+        profiling_enabled: bool = app.config.get("DIOPTRA_PROFILING_ENABLED", False)
+
+        if not metrics_enabled and not profiling_enabled:
+            return None
+
+        app.extensions["dioptra_instrumentation"] = self
+        app.before_request(self._before_request)
+        app.after_request(self._after_request)
+
+        if metrics_enabled:
+            _register_sql_listeners()
+            app.add_url_rule("/metrics", "metrics", self.metrics)
+
+    def metrics(self) -> Response:
+        """Serves the recorded metrics in the Prometheus text format."""
+        return Response(self._registry.render(), content_type=CONTENT_TYPE)
+
+    def _before_request(self) -> None:
+        state = _RequestState(start=time.perf_counter())
+        request.environ[_ENVIRON_KEY] = state
+
+        if self._should_profile():
+            state.profiler = create_profiler(
+                _current_config("DIOPTRA_PROFILING_BACKEND")
+            )
+            state.profiler.start()
+
+    def _after_request(self, response: Response) -> Response:
+        state: Optional[_RequestState] = request.environ.pop(_ENVIRON_KEY, None)
+
+        if state is None:
+            return response
+
+        elapsed = time.perf_counter() - state.start
+        route = request.url_rule.rule if request.url_rule else UNMATCHED_ROUTE
+
+        if state.profiler is not None:
+            state.profiler.stop()
+            self._save_profile(state.profiler, route, response)
+
+        if _current_config("DIOPTRA_METRICS_ENABLED"):
+            self._request_duration.observe(
+                elapsed, request.method, route, str(response.status_code)
+            )
+            self._request_sql_queries.observe(state.sql_queries, request.method, route)
+            self._request_sql_duration.observe(
+                state.sql_duration, request.method, route
+            )
+
+        return response
+
+    def _should_profile(self) -> bool:
+        if not _current_config("DIOPTRA_PROFILING_ENABLED"):
+            return False
+
+        if request.endpoint == "metrics":
+            return False
+
+        if _current_config("DIOPTRA_PROFILING_HEADER") in request.headers:
+            return True
+
+        sample_rate: float = _current_config("DIOPTRA_PROFILING_SAMPLE_RATE") or 0.0
+
+        return sample_rate > 0 and random.random() < sample_rate
+
+    @staticmethod
+    def _save_profile(
+        profiler: RequestProfiler, route: str, response: Response
+    ) -> None:
+        try:
+            filepath = save_profile(
+                profiler,
+                output_dir=_current_config("DIOPTRA_PROFILING_DIR"),
+                method=request.method,
+                route=route,
+            )
+
+        except OSError:
+            LOGGER.exception("Unable to save request profile", route=route)
+            return None
+
+        response.headers[_current_config("DIOPTRA_PROFILING_HEADER")] = filepath.name
+        LOGGER.info("Request profile saved", route=route, filepath=str(filepath))
+
+
+def _current_config(key: str) -> Any:
+    return current_app.config.get(key)
+
+
+def _register_sql_listeners() -> None:
+    global _sql_listeners_registered
+
+    with _SQL_LISTENERS_LOCK:
+        if _sql_listeners_registered:
+            return None
+
+        event.listen(Engine, "before_cursor_execute", _before_cursor_execute)
+        event.listen(Engine, "after_cursor_execute", _after_cursor_execute)
+        event.listen(Engine, "handle_error", _handle_error)
+        _sql_listeners_registered = True
+
+
+def _before_cursor_execute(conn, cursor, statement, parameters, context, executemany):
+    conn.info.setdefault(_QUERY_START_KEY, []).append(time.perf_counter())
+
+
+def _after_cursor_execute(conn, cursor, statement, parameters, context, executemany):
+    starts: Optional[List[float]] = conn.info.get(_QUERY_START_KEY)
+
+    if not starts:
+        return None
+
+    elapsed = time.perf_counter() - starts.pop()
+    state = _get_request_state()
+
+    if state is not None:
+        state.sql_queries += 1
+        state.sql_duration += elapsed
+
+
+def _handle_error(exception_context) -> None:
+    connection = exception_context.connection
+    starts: Optional[List[float]] = (
+        None if connection is None else connection.info.get(_QUERY_START_KEY)
+    )
+
+    if starts:
+        starts.pop()
+
+
+def _get_request_state() -> Optional[_RequestState]:
+    if not has_request_context():
+        return None
+
+    return request.environ.get(_ENVIRON_KEY)
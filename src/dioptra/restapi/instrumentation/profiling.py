@@ -0,0 +1,119 @@
+# This Software (Dioptra) is being made available as a public service by the
+# National Institute of Standards and Technology (NIST), an Agency of the United
+# States Department of Commerce. This software was developed in part by employees of
+# NIST and in part by NIST contractors. Copyright in portions of this software that
+# were developed by NIST contractors has been licensed or assigned to NIST. Pursuant
+# to Title 17 United States Code Section 105, works of NIST employees are not
+# subject to copyright protection in the United States. However, NIST may hold
+# international copyright in software created by its employees and domestic
+# copyright (or licensing rights) in portions of software that were assigned or
+# licensed to NIST. To the extent that NIST holds copyright in this software, it is
+# being made available under the Creative Commons Attribution 4.0 International
+# license (CC BY 4.0). The disclaimers of the CC BY 4.0 license apply to all parts
+# of the software developed or licensed by NIST.
+#
+# ACCESS THE FULL CC BY 4.0 LICENSE HERE:
+# https://creativecommons.org/licenses/by/4.0/legalcode
+"""Profilers used to record individual requests.
+
+`pyinstrument <https://pyinstrument.readthedocs.io>`_ is used when it is installed,
+otherwise the profile is recorded with :py:mod:`cProfile`.
+"""
+from __future__ import annotations
+
+import cProfile
+import datetime
+import re
+import uuid
+from pathlib import Path
+from typing import Any, Optional, Union
+
+
+class CProfileRequestProfiler(object):
+    """Records a request with :py:mod:`cProfile` and saves it as a `.prof` file."""
+
+    suffix = ".prof"
+
+    def __init__(self) -> None:
+        self._profiler = cProfile.Profile()
+
+    def start(self) -> None:
+        self._profiler.enable()
+
+    def stop(self) -> None:
+        self._profiler.disable()
+
+    def save(self, filepath: Path) -> None:
+        self._profiler.dump_stats(str(filepath))
+
+
+class PyinstrumentRequestProfiler(object):
+    """Records a request with pyinstrument and saves it as an `.html` file."""
+
+    suffix = ".html"
+
+    def __init__(self) -> None:
+        from pyinstrument import Profiler
+
+        self._profiler: Any = Profiler()
+
+    def start(self) -> None:
+        self._profiler.start()
+
+    def stop(self) -> None:
+        self._profiler.stop()
+
+    def save(self, filepath: Path) -> None:
+        filepath.write_text(self._profiler.output_html(), encoding="utf-8")
+
+
+RequestProfiler = Union[CProfileRequestProfiler, PyinstrumentRequestProfiler]
+
+
+def create_profiler(backend: Optional[str] = None) -> RequestProfiler:
+    """Creates a profiler for a single request.
+
+    Args:
+        backend: Either `"pyinstrument"` or `"cprofile"`. If `None`, pyinstrument is
+            used when it is installed and cProfile otherwise. The default is `None`.
+
+    Returns:
+        A profiler that has not been started yet.
+    """
+    if backend == "cprofile":
+        return CProfileRequestProfiler()
+
+    try:
+        return PyinstrumentRequestProfiler()
+
+    except ImportError:
+        if backend == "pyinstrument":
+            raise
+
+        return CProfileRequestProfiler()
+
+
+def save_profile(
+    profiler: RequestProfiler, output_dir: Union[str, Path], method: str, route: str
+) -> Path:
+    """Saves a request's profile to a uniquely named file.
+
+    Args:
+        profiler: A profiler that has been stopped.
+        output_dir: The directory to save the profile in. It is created if it does
+            not exist.
+        method: The HTTP method of the request.
+        route: The URL rule that matched the request.
+
+    Returns:
+        The path to the saved profile.
+    """
+    timestamp = datetime.datetime.now().strftime("%Y%m%dT%H%M%S")
+    slug = re.sub(r"[^A-Za-z0-9]+", "-", route).strip("-") or "root"
+    filepath = Path(output_dir) / (
+        f"{timestamp}-{method.lower()}-{slug}-{uuid.uuid4().hex[:8]}{profiler.suffix}"
+    )
+    filepath.parent.mkdir(parents=True, exist_ok=True)
+    profiler.save(filepath)
+
+    return filepath
@@ -17,7 +17,6 @@
 """The module defining the job endpoints."""
 from __future__ import annotations
 
-import uuid
 from typing import List, Optional
 
 import structlog
@@ -26,6 +25,7 @@ from flask_restx import Namespace, Resource
 from injector import inject
 from structlog.stdlib import BoundLogger
 
+from dioptra.restapi.shared.request_scope.logger import get_request_logger
 from dioptra.restapi.utils import as_api_parser
 
 from .errors import JobDoesNotExistError, JobSubmissionError
@@ -58,8 +58,8 @@ class JobResource(Resource):
     @responds(schema=JobSchema(many=True), api=api)
     def get(self) -> List[Job]:
         """Gets a list of all submitted jobs."""
-        log: BoundLogger = LOGGER.new(
-            request_id=str(uuid.uuid4()), resource="job", request_type="GET"
+        log: BoundLogger = get_request_logger().bind(
+            resource="job", request_type="GET"
         )  # noqa: F841
         log.info("Request received")
         return self._job_service.get_all(log=log)
@@ -69,8 +69,8 @@ class JobResource(Resource):
     @responds(schema=JobSchema, api=api)
     def post(self) -> Job:
         """Creates a new job via a job submission form with an attached file."""
-        log: BoundLogger = LOGGER.new(
-            request_id=str(uuid.uuid4()), resource="job", request_type="POST"
+        log: BoundLogger = get_request_logger().bind(
+            resource="job", request_type="POST"
         )  # noqa: F841
         job_form: JobForm = JobForm()
 
@@ -101,8 +101,8 @@ class JobIdResource(Resource):
     @responds(schema=JobSchema, api=api)
     def get(self, jobId: str) -> Job:
         """Gets a job by its unique identifier."""
-        log: BoundLogger = LOGGER.new(
-            request_id=str(uuid.uuid4()), resource="jobId", request_type="GET"
+        log: BoundLogger = get_request_logger().bind(
+            resource="jobId", request_type="GET"
         )  # noqa: F841
         log.info("Request received", job_id=jobId)
         job: Optional[Job] = self._job_service.get_by_id(jobId, log=log)
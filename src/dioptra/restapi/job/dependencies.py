@@ -27,6 +27,10 @@ from flask_injector import request
 from injector import Binder, Module, provider
 from redis import Redis
 
+from dioptra.restapi.instrumentation import (
+    instrument_boto3_client,
+    instrument_redis_client,
+)
 from dioptra.restapi.shared.rq.service import RQService
 
 from .schema import JobFormSchema
@@ -54,7 +58,9 @@ class RQServiceModule(Module):
 
 
 def _bind_rq_service_configuration(binder: Binder):
-    redis_conn: Redis = Redis.from_url(os.getenv("RQ_REDIS_URI", "redis://"))
+    redis_conn: Redis = instrument_redis_client(
+        Redis.from_url(os.getenv("RQ_REDIS_URI", "redis://"))
+    )
     run_mlflow: str = "dioptra.rq.tasks.run_mlflow_task"
 
     configuration: RQServiceConfiguration = RQServiceConfiguration(
@@ -69,7 +75,9 @@ def _bind_s3_service_configuration(binder: Binder) -> None:
     s3_endpoint_url: Optional[str] = os.getenv("MLFLOW_S3_ENDPOINT_URL")
 
     s3_session: Session = Session()
-    s3_client: BaseClient = s3_session.client("s3", endpoint_url=s3_endpoint_url)
+    s3_client: BaseClient = instrument_boto3_client(
+        s3_session.client("s3", endpoint_url=s3_endpoint_url)
+    )
 
     binder.bind(Session, to=s3_session, scope=request)
     binder.bind(BaseClient, to=s3_client, scope=request)
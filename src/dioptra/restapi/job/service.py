@@ -31,6 +31,7 @@ from werkzeug.utils import secure_filename
 from dioptra.restapi.app import db
 from dioptra.restapi.experiment.service import ExperimentService
 from dioptra.restapi.queue.service import QueueService
+from dioptra.restapi.shared.request_scope.logger import get_request_logger
 from dioptra.restapi.shared.rq.service import RQService
 from dioptra.restapi.shared.s3.service import S3Service
 
@@ -59,7 +60,7 @@ class JobService(object):
 
     @staticmethod
     def create(job_form_data: JobFormData, **kwargs) -> Job:
-        log: BoundLogger = kwargs.get("log", LOGGER.new())  # noqa: F841
+        log: BoundLogger = kwargs.get("log") or get_request_logger()  # noqa: F841
         timestamp = datetime.datetime.now()
 
         return Job(
@@ -75,20 +76,20 @@ class JobService(object):
 
     @staticmethod
     def get_all(**kwargs) -> List[Job]:
-        log: BoundLogger = kwargs.get("log", LOGGER.new())  # noqa: F841
+        log: BoundLogger = kwargs.get("log") or get_request_logger()  # noqa: F841
 
         return Job.query.all()  # type: ignore
 
     @staticmethod
     def get_by_id(job_id: str, **kwargs) -> Job:
-        log: BoundLogger = kwargs.get("log", LOGGER.new())  # noqa: F841
+        log: BoundLogger = kwargs.get("log") or get_request_logger()  # noqa: F841
 
         return Job.query.get(job_id)  # type: ignore
 
     def extract_data_from_form(self, job_form: JobForm, **kwargs) -> JobFormData:
         from dioptra.restapi.models import Experiment, Queue
 
-        log: BoundLogger = kwargs.get("log", LOGGER.new())
+        log: BoundLogger = kwargs.get("log") or get_request_logger()
 
         job_form_data: JobFormData = self._job_form_schema.dump(job_form)
 
@@ -105,7 +106,7 @@ class JobService(object):
         return job_form_data
 
     def submit(self, job_form_data: JobFormData, **kwargs) -> Job:
-        log: BoundLogger = kwargs.get("log", LOGGER.new())
+        log: BoundLogger = kwargs.get("log") or get_request_logger()
 
         workflow_uri: Optional[str] = self._upload_workflow(job_form_data, log=log)
 
@@ -142,7 +143,7 @@ class JobService(object):
         return new_job
 
     def _upload_workflow(self, job_form_data: JobFormData, **kwargs) -> Optional[str]:
-        log: BoundLogger = kwargs.get("log", LOGGER.new())
+        log: BoundLogger = kwargs.get("log") or get_request_logger()
 
         upload_dir = Path(uuid.uuid4().hex)
         workflow_filename = upload_dir / secure_filename(
@@ -17,7 +17,6 @@
 """The module defining the queue endpoints."""
 from __future__ import annotations
 
-import uuid
 from typing import List, Optional
 
 import structlog
@@ -28,6 +27,7 @@ from flask_restx import Namespace, Resource
 from injector import inject
 from structlog.stdlib import BoundLogger
 
+from dioptra.restapi.shared.request_scope.logger import get_request_logger
 from dioptra.restapi.utils import as_api_parser
 
 from .errors import QueueDoesNotExistError, QueueRegistrationError
@@ -56,8 +56,8 @@ class QueueResource(Resource):
     @responds(schema=QueueSchema(many=True), api=api)
     def get(self) -> List[Queue]:
         """Gets a list of all registered queues."""
-        log: BoundLogger = LOGGER.new(
-            request_id=str(uuid.uuid4()), resource="queue", request_type="GET"
+        log: BoundLogger = get_request_logger().bind(
+            resource="queue", request_type="GET"
         )  # noqa: F841
         log.info("Request received")
         return self._queue_service.get_all_unlocked(log=log)
@@ -67,8 +67,8 @@ class QueueResource(Resource):
     @responds(schema=QueueSchema, api=api)
     def post(self) -> Queue:
         """Creates a new queue via a queue registration form."""
-        log: BoundLogger = LOGGER.new(
-            request_id=str(uuid.uuid4()), resource="queue", request_type="POST"
+        log: BoundLogger = get_request_logger().bind(
+            resource="queue", request_type="POST"
         )  # noqa: F841
         queue_registration_form: QueueRegistrationForm = QueueRegistrationForm()
 
@@ -102,8 +102,8 @@ class QueueIdResource(Resource):
     @responds(schema=QueueSchema, api=api)
     def get(self, queueId: int) -> Queue:
         """Gets a queue by its unique identifier."""
-        log: BoundLogger = LOGGER.new(
-            request_id=str(uuid.uuid4()), resource="queueId", request_type="GET"
+        log: BoundLogger = get_request_logger().bind(
+            resource="queueId", request_type="GET"
         )  # noqa: F841
         log.info("Request received", queue_id=queueId)
         queue: Optional[Queue] = self._queue_service.get_by_id(queueId, log=log)
@@ -116,8 +116,8 @@ class QueueIdResource(Resource):
 
     def delete(self, queueId: int) -> Response:
         """Deletes a queue by its unique identifier."""
-        log: BoundLogger = LOGGER.new(
-            request_id=str(uuid.uuid4()), resource="queueId", request_type="DELETE"
+        log: BoundLogger = get_request_logger().bind(
+            resource="queueId", request_type="DELETE"
         )  # noqa: F841
         log.info("Request received", queue_id=queueId)
         id: List[int] = self._queue_service.delete_queue(queueId, log=log)
@@ -128,8 +128,8 @@ class QueueIdResource(Resource):
     @responds(schema=QueueSchema, api=api)
     def put(self, queueId: int) -> Queue:
         """Modifies a queue by its unique identifier."""
-        log: BoundLogger = LOGGER.new(
-            request_id=str(uuid.uuid4()), resource="queueId", request_type="PUT"
+        log: BoundLogger = get_request_logger().bind(
+            resource="queueId", request_type="PUT"
         )  # noqa: F841
         changes: QueueUpdateInterface = request.parsed_obj  # type: ignore
         queue: Optional[Queue] = self._queue_service.get_by_id(queueId, log=log)
@@ -157,8 +157,8 @@ class QueueIdLockResource(Resource):
 
     def delete(self, queueId: int) -> Response:
         """Removes the lock from the queue (id reference) if it exists."""
-        log: BoundLogger = LOGGER.new(
-            request_id=str(uuid.uuid4()), resource="QueueIdLock", request_type="DELETE"
+        log: BoundLogger = get_request_logger().bind(
+            resource="QueueIdLock", request_type="DELETE"
         )  # noqa: F841
         log.info("Request received", queue_id=queueId)
         queue: Optional[Queue] = self._queue_service.get_by_id(queueId, log=log)
@@ -173,8 +173,8 @@ class QueueIdLockResource(Resource):
 
     def put(self, queueId: int) -> Queue:
         """Locks the queue (id reference) if it is unlocked."""
-        log: BoundLogger = LOGGER.new(
-            request_id=str(uuid.uuid4()), resource="QueueIdLock", request_type="PUT"
+        log: BoundLogger = get_request_logger().bind(
+            resource="QueueIdLock", request_type="PUT"
         )  # noqa: F841
         log.info("Request received", queue_id=queueId)
         queue: Optional[Queue] = self._queue_service.get_by_id(queueId, log=log)
@@ -201,8 +201,8 @@ class QueueNameResource(Resource):
     @responds(schema=QueueSchema, api=api)
     def get(self, queueName: str) -> Queue:
         """Gets a queue by its unique name."""
-        log: BoundLogger = LOGGER.new(
-            request_id=str(uuid.uuid4()), resource="queueName", request_type="GET"
+        log: BoundLogger = get_request_logger().bind(
+            resource="queueName", request_type="GET"
         )  # noqa: F841
         log.info("Request received", queue_name=queueName)
         queue: Optional[Queue] = self._queue_service.get_by_name(
@@ -217,8 +217,7 @@ class QueueNameResource(Resource):
 
     def delete(self, queueName: str) -> Response:
         """Deletes a queue by its unique name."""
-        log: BoundLogger = LOGGER.new(
-            request_id=str(uuid.uuid4()),
+        log: BoundLogger = get_request_logger().bind(
             resource="queueName",
             queue_name=queueName,
             request_type="DELETE",
@@ -239,8 +238,8 @@ class QueueNameResource(Resource):
     @responds(schema=QueueSchema, api=api)
     def put(self, queueName: str) -> Queue:
         """Modifies a queue by its unique name."""
-        log: BoundLogger = LOGGER.new(
-            request_id=str(uuid.uuid4()), resource="queueName", request_type="PUT"
+        log: BoundLogger = get_request_logger().bind(
+            resource="queueName", request_type="PUT"
         )  # noqa: F841
         changes: QueueUpdateInterface = request.parsed_obj  # type: ignore
         queue: Optional[Queue] = self._queue_service.get_by_name(
@@ -270,8 +269,7 @@ class QueueNameLockResource(Resource):
 
     def delete(self, queueName: str) -> Response:
         """Removes the lock from the queue (name reference) if it exists."""
-        log: BoundLogger = LOGGER.new(
-            request_id=str(uuid.uuid4()),
+        log: BoundLogger = get_request_logger().bind(
             resource="QueueNameLock",
             request_type="DELETE",
         )  # noqa: F841
@@ -289,8 +287,8 @@ class QueueNameLockResource(Resource):
 
     def put(self, queueName: str) -> Queue:
         """Locks the queue (name reference) if it is unlocked."""
-        log: BoundLogger = LOGGER.new(
-            request_id=str(uuid.uuid4()), resource="QueueNameLock", request_type="PUT"
+        log: BoundLogger = get_request_logger().bind(
+            resource="QueueNameLock", request_type="PUT"
         )  # noqa: F841
         log.info("Request received", queue_name=queueName)
         queue: Optional[Queue] = self._queue_service.get_by_name(queueName, log=log)
@@ -25,6 +25,7 @@ from injector import inject
 from structlog.stdlib import BoundLogger
 
 from dioptra.restapi.app import db
+from dioptra.restapi.shared.request_scope.logger import get_request_logger
 
 from .errors import QueueAlreadyExistsError
 from .model import Queue, QueueLock, QueueRegistrationForm, QueueRegistrationFormData
@@ -46,7 +47,7 @@ class QueueService(object):
         queue_registration_form_data: QueueRegistrationFormData,
         **kwargs,
     ) -> Queue:
-        log: BoundLogger = kwargs.get("log", LOGGER.new())
+        log: BoundLogger = kwargs.get("log") or get_request_logger()
         queue_name: str = queue_registration_form_data["name"]
 
         if self.get_by_name(queue_name, log=log) is not None:
@@ -72,7 +73,7 @@ class QueueService(object):
 
     @staticmethod
     def lock_queue(queue: Queue, **kwargs) -> List[int]:
-        log: BoundLogger = kwargs.get("log", LOGGER.new())
+        log: BoundLogger = kwargs.get("log") or get_request_logger()
 
         if queue.lock:
             return []
@@ -86,7 +87,7 @@ class QueueService(object):
 
     @staticmethod
     def unlock_queue(queue: Queue, **kwargs) -> List[int]:
-        log: BoundLogger = kwargs.get("log", LOGGER.new())
+        log: BoundLogger = kwargs.get("log") or get_request_logger()
 
         if not queue.lock:
             return []
@@ -99,7 +100,7 @@ class QueueService(object):
         return [queue.queue_id]
 
     def delete_queue(self, queue_id: int, **kwargs) -> List[int]:
-        log: BoundLogger = kwargs.get("log", LOGGER.new())
+        log: BoundLogger = kwargs.get("log") or get_request_logger()
         queue: Optional[Queue] = self.get_by_id(queue_id=queue_id)
 
         if queue is None:
@@ -113,7 +114,7 @@ class QueueService(object):
         return [queue_id]
 
     def rename_queue(self, queue: Queue, new_name: str, **kwargs) -> Queue:
-        log: BoundLogger = kwargs.get("log", LOGGER.new())
+        log: BoundLogger = kwargs.get("log") or get_request_logger()
 
         queue.update(changes={"name": new_name})
         db.session.commit()
@@ -124,7 +125,7 @@ class QueueService(object):
 
     @staticmethod
     def get_all(**kwargs) -> List[Queue]:
-        log: BoundLogger = kwargs.get("log", LOGGER.new())
+        log: BoundLogger = kwargs.get("log") or get_request_logger()
 
         log.info("Get full list of queues")
 
@@ -132,7 +133,7 @@ class QueueService(object):
 
     @staticmethod
     def get_all_unlocked(**kwargs) -> List[Queue]:
-        log: BoundLogger = kwargs.get("log", LOGGER.new())
+        log: BoundLogger = kwargs.get("log") or get_request_logger()
 
         log.info("Get full list of unlocked queues")
 
@@ -147,7 +148,7 @@ class QueueService(object):
 
     @staticmethod
     def get_all_locked(**kwargs) -> List[Queue]:
-        log: BoundLogger = kwargs.get("log", LOGGER.new())
+        log: BoundLogger = kwargs.get("log") or get_request_logger()
 
         log.info("Get full list of locked queues")
 
@@ -159,7 +160,7 @@ class QueueService(object):
 
     @staticmethod
     def get_by_id(queue_id: int, **kwargs) -> Optional[Queue]:
-        log: BoundLogger = kwargs.get("log", LOGGER.new())
+        log: BoundLogger = kwargs.get("log") or get_request_logger()
 
         log.info("Get queue by id", queue_id=queue_id)
 
@@ -169,7 +170,7 @@ class QueueService(object):
 
     @staticmethod
     def get_by_name(queue_name: str, **kwargs) -> Optional[Queue]:
-        log: BoundLogger = kwargs.get("log", LOGGER.new())
+        log: BoundLogger = kwargs.get("log") or get_request_logger()
 
         log.info("Get queue by name", queue_name=queue_name)
 
@@ -179,7 +180,7 @@ class QueueService(object):
 
     @staticmethod
     def get_unlocked_by_id(queue_id: int, **kwargs) -> Optional[Queue]:
-        log: BoundLogger = kwargs.get("log", LOGGER.new())
+        log: BoundLogger = kwargs.get("log") or get_request_logger()
 
         log.info("Get unlocked queue by id", queue_id=queue_id)
 
@@ -195,7 +196,7 @@ class QueueService(object):
 
     @staticmethod
     def get_unlocked_by_name(queue_name: str, **kwargs) -> Optional[Queue]:
-        log: BoundLogger = kwargs.get("log", LOGGER.new())
+        log: BoundLogger = kwargs.get("log") or get_request_logger()
 
         log.info("Get unlocked queue by name", queue_name=queue_name)
 
@@ -212,7 +213,7 @@ class QueueService(object):
     def extract_data_from_form(
         self, queue_registration_form: QueueRegistrationForm, **kwargs
     ) -> QueueRegistrationFormData:
-        log: BoundLogger = kwargs.get("log", LOGGER.new())
+        log: BoundLogger = kwargs.get("log") or get_request_logger()
 
         log.info("Extract data from queue registration form")
         data: QueueRegistrationFormData = self._queue_registration_form_schema.dump(
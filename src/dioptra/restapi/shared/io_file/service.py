@@ -24,6 +24,8 @@ from typing import BinaryIO, List, Optional, Union
 import structlog
 from structlog.stdlib import BoundLogger
 
+from dioptra.restapi.shared.request_scope.logger import get_request_logger
+
 LOGGER: BoundLogger = structlog.stdlib.get_logger()
 
 
@@ -35,7 +37,7 @@ class IOFileService(object):
         archive_fileobj: Optional[BinaryIO] = None,
         **kwargs,
     ) -> List[str]:
-        log: BoundLogger = kwargs.get("log", LOGGER.new())
+        log: BoundLogger = kwargs.get("log") or get_request_logger()
         extracted_files: List[str] = []
 
         with self._tarfile_open(
@@ -67,7 +69,7 @@ class IOFileService(object):
         archive_file_info: TarInfo,
         **kwargs,
     ) -> Optional[str]:
-        log: BoundLogger = kwargs.get("log", LOGGER.new())
+        log: BoundLogger = kwargs.get("log") or get_request_logger()
 
         if not archive_file_info.isfile():
             return None
@@ -90,7 +92,7 @@ class IOFileService(object):
         path_prefix: Optional[Union[str, Path]] = None,
         **kwargs,
     ) -> Path:
-        log: BoundLogger = kwargs.get("log", LOGGER.new())  # noqa: F841
+        log: BoundLogger = kwargs.get("log") or get_request_logger()  # noqa: F841
 
         path_prefix = path_prefix or Path.cwd()
 
@@ -102,7 +104,7 @@ class IOFileService(object):
         fileobj: Optional[BinaryIO] = None,
         **kwargs,
     ) -> TarFile:
-        log: BoundLogger = kwargs.get("log", LOGGER.new())  # noqa: F841
+        log: BoundLogger = kwargs.get("log") or get_request_logger()  # noqa: F841
 
         def open_file_path() -> TarFile:
             return tarfile.open(name=file_path, mode="r:*")
@@ -24,6 +24,8 @@ from mlflow.exceptions import RestException
 from mlflow.tracking import MlflowClient
 from structlog.stdlib import BoundLogger
 
+from dioptra.restapi.shared.request_scope.logger import get_request_logger
+
 LOGGER: BoundLogger = structlog.stdlib.get_logger()
 
 
@@ -33,7 +35,7 @@ class MLFlowTrackingService(object):
         self._client = client
 
     def create_experiment(self, experiment_name: str, **kwargs) -> Optional[str]:
-        log: BoundLogger = kwargs.get("log", LOGGER.new())
+        log: BoundLogger = kwargs.get("log") or get_request_logger()
 
         try:
             experiment_id: str = self._client.create_experiment(name=experiment_name)
@@ -49,7 +51,7 @@ class MLFlowTrackingService(object):
             raise e
 
     def delete_experiment(self, experiment_id: int, **kwargs) -> Optional[bool]:
-        log: BoundLogger = kwargs.get("log", LOGGER.new())
+        log: BoundLogger = kwargs.get("log") or get_request_logger()
 
         try:
             self._client.delete_experiment(experiment_id=experiment_id)
@@ -68,7 +70,7 @@ class MLFlowTrackingService(object):
     def rename_experiment(
         self, experiment_id: int, new_name: str, **kwargs
     ) -> Optional[bool]:
-        log: BoundLogger = kwargs.get("log", LOGGER.new())
+        log: BoundLogger = kwargs.get("log") or get_request_logger()
 
         try:
             self._client.rename_experiment(
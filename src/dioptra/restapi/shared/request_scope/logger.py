@@ -0,0 +1,53 @@
+# This Software (Dioptra) is being made available as a public service by the
+# National Institute of Standards and Technology (NIST), an Agency of the United
+# States Department of Commerce. This software was developed in part by employees of
+# NIST and in part by NIST contractors. Copyright in portions of this software that
+# were developed by NIST contractors has been licensed or assigned to NIST. Pursuant
+# to Title 17 United States Code Section 105, works of NIST employees are not
+# subject to copyright protection in the United States. However, NIST may hold
+# international copyright in software created by its employees and domestic
+# copyright (or licensing rights) in portions of software that were assigned or
+# licensed to NIST. To the extent that NIST holds copyright in this software, it is
+# being made available under the Creative Commons Attribution 4.0 International
+# license (CC BY 4.0). The disclaimers of the CC BY 4.0 license apply to all parts
+# of the software developed or licensed by NIST.
+#
+# ACCESS THE FULL CC BY 4.0 LICENSE HERE:
+# https://creativecommons.org/licenses/by/4.0/legalcode
+"""A logger that is shared by everything that handles the same request."""
+from __future__ import annotations
+
+import uuid
+from typing import Optional
+
+import structlog
+from flask import has_request_context, request
+from structlog.stdlib import BoundLogger
+
+LOGGER: BoundLogger = structlog.stdlib.get_logger()
+
+_REQUEST_LOGGER_KEY = "dioptra.request_logger"
+
+
+def get_request_logger() -> BoundLogger:
+    """Gets the logger bound to the current request.
+
+    The logger is created with a new request id the first time it is requested during
+    a request and is stored in the request's WSGI environment, so that it is reused
+    for the rest of that request. Outside of a request, a new
+    logger without any bound context is returned.
+
+    Returns:
+        A :py:class:`~structlog.stdlib.BoundLogger` object.
+    """
+    if not has_request_context():
+        return LOGGER.new()
+
+    log: Optional[BoundLogger] = request.environ.get(_REQUEST_LOGGER_KEY)
+
+    if log is None:
+        log = request.environ[_REQUEST_LOGGER_KEY] = LOGGER.new(
+            request_id=str(uuid.uuid4())
+        )
+
+    return log
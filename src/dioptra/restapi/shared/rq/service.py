@@ -27,6 +27,7 @@ from rq.queue import Queue as RQQueue
 from structlog.stdlib import BoundLogger
 
 from dioptra.restapi.job.model import Job
+from dioptra.restapi.shared.request_scope.logger import get_request_logger
 
 LOGGER: BoundLogger = structlog.stdlib.get_logger()
 
@@ -37,7 +38,7 @@ class RQService(object):
         self._run_mlflow = run_mlflow
 
     def get_job_status(self, job: Job, **kwargs) -> str:
-        log: BoundLogger = kwargs.get("log", LOGGER.new())
+        log: BoundLogger = kwargs.get("log") or get_request_logger()
 
         rq_job: Optional[RQJob] = self.get_rq_job(job=job, log=log)
 
@@ -49,7 +50,7 @@ class RQService(object):
         return str(rq_job.get_status())
 
     def get_rq_job(self, job: Union[Job, str], **kwargs) -> Optional[RQJob]:
-        log: BoundLogger = kwargs.get("log", LOGGER.new())
+        log: BoundLogger = kwargs.get("log") or get_request_logger()
 
         job_id: str = job.job_id if isinstance(job, Job) else job
         log.info("Fetching RQ job", job_id=job_id)
@@ -74,7 +75,7 @@ class RQService(object):
         timeout: Optional[str] = None,
         **kwargs,
     ) -> RQJob:
-        log: BoundLogger = kwargs.get("log", LOGGER.new())
+        log: BoundLogger = kwargs.get("log") or get_request_logger()
 
         q: RQQueue = RQQueue(queue, default_timeout="24h", connection=self._redis)
         cmd_kwargs = {
@@ -29,6 +29,8 @@ from injector import inject
 from structlog.stdlib import BoundLogger
 from werkzeug.datastructures import FileStorage
 
+from dioptra.restapi.shared.request_scope.logger import get_request_logger
+
 LOGGER: BoundLogger = structlog.stdlib.get_logger()
 
 
@@ -39,7 +41,7 @@ class S3Service(object):
         self._client = client
 
     def delete_prefix(self, bucket: str, prefix: str, **kwargs):
-        log: BoundLogger = kwargs.get("log", LOGGER.new())
+        log: BoundLogger = kwargs.get("log") or get_request_logger()
 
         log.info(
             "Deleting prefix from S3",
@@ -60,7 +62,7 @@ class S3Service(object):
         return [x["Key"] for x in response.get("Deleted", [])]
 
     def list_directories(self, bucket: str, prefix: str, **kwargs) -> List[str]:
-        log: BoundLogger = kwargs.get("log", LOGGER.new())
+        log: BoundLogger = kwargs.get("log") or get_request_logger()
 
         log.info("Listing directories in S3 bucket", bucket=bucket, prefix=prefix)
 
@@ -76,7 +78,7 @@ class S3Service(object):
         return self.extract_directories(response=response, prefix=prefix, log=log)
 
     def list_objects(self, bucket: str, prefix: str, **kwargs) -> List[str]:
-        log: BoundLogger = kwargs.get("log", LOGGER.new())
+        log: BoundLogger = kwargs.get("log") or get_request_logger()
 
         log.info("Listing objects in S3 bucket", bucket=bucket, prefix=prefix)
 
@@ -94,15 +96,15 @@ class S3Service(object):
     def upload(
         self, fileobj: Union[IO[bytes], FileStorage], bucket: str, key: str, **kwargs
     ) -> Optional[str]:
-        log: BoundLogger = kwargs.get("log", LOGGER.new())
+        log: BoundLogger = kwargs.get("log") or get_request_logger()
 
-        log.info("Uploading data to S3", fileobj=fileobj, bucket=bucket, key=key)
+        log.info("Uploading data to S3", bucket=bucket, key=key)
 
         try:
             self._client.upload_fileobj(Fileobj=fileobj, Bucket=bucket, Key=key)
 
         except ClientError:
-            log.exception("S3 upload failed", fileobj=fileobj, bucket=bucket, key=key)
+            log.exception("S3 upload failed", bucket=bucket, key=key)
             return None
 
         uri: str = self.as_uri(bucket=bucket, key=key)
@@ -118,7 +120,7 @@ class S3Service(object):
         include_suffixes: Optional[List[str]],
         **kwargs,
     ) -> Optional[List[str]]:
-        log: BoundLogger = kwargs.get("log", LOGGER.new())
+        log: BoundLogger = kwargs.get("log") or get_request_logger()
 
         log.info(
             "Uploading directory to S3",
@@ -174,7 +176,7 @@ class S3Service(object):
         include_suffixes: Optional[List[str]],
         **kwargs,
     ) -> List[Dict[str, str]]:
-        log: BoundLogger = kwargs.get("log", LOGGER.new())  # noqa: F841
+        log: BoundLogger = kwargs.get("log") or get_request_logger()  # noqa: F841
 
         if include_suffixes is None:
             return [
@@ -196,7 +198,7 @@ class S3Service(object):
 
     @staticmethod
     def as_uri(bucket: Optional[str], key: Optional[str], **kwargs) -> str:
-        log: BoundLogger = kwargs.get("log", LOGGER.new())  # noqa: F841
+        log: BoundLogger = kwargs.get("log") or get_request_logger()  # noqa: F841
 
         return urlunparse(("s3", bucket or "", key or "", "", "", ""))
 
@@ -204,7 +206,7 @@ class S3Service(object):
     def extract_directories(
         response: Dict[str, Any], prefix: str, **kwargs
     ) -> List[str]:
-        log: BoundLogger = kwargs.get("log", LOGGER.new())  # noqa: F841
+        log: BoundLogger = kwargs.get("log") or get_request_logger()  # noqa: F841
 
         return [
             "".join(x["Prefix"].rstrip("/").split(prefix))
@@ -213,13 +215,13 @@ class S3Service(object):
 
     @staticmethod
     def extract_keys(response: Dict[str, Any], **kwargs) -> List[str]:
-        log: BoundLogger = kwargs.get("log", LOGGER.new())  # noqa: F841
+        log: BoundLogger = kwargs.get("log") or get_request_logger()  # noqa: F841
 
         return [x["Key"] for x in response.get("Contents", [])]
 
     @staticmethod
     def normalize_prefix(prefix: str, **kwargs) -> str:
-        log: BoundLogger = kwargs.get("log", LOGGER.new())  # noqa: F841
+        log: BoundLogger = kwargs.get("log") or get_request_logger()  # noqa: F841
         prefix = prefix.strip()
 
         if prefix == "/":
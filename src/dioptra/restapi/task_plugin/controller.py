@@ -17,7 +17,6 @@
 """The module defining the task plugin endpoints."""
 from __future__ import annotations
 
-import uuid
 from typing import List, Optional
 
 import structlog
@@ -28,6 +27,7 @@ from flask_restx import Namespace, Resource
 from injector import inject
 from structlog.stdlib import BoundLogger
 
+from dioptra.restapi.shared.request_scope.logger import get_request_logger
 from dioptra.restapi.utils import as_api_parser
 
 from .errors import TaskPluginDoesNotExistError, TaskPluginUploadError
@@ -55,8 +55,8 @@ class TaskPluginResource(Resource):
     @responds(schema=TaskPluginSchema(many=True), api=api)
     def get(self) -> List[TaskPlugin]:
         """Gets a list of all registered task plugins."""
-        log: BoundLogger = LOGGER.new(
-            request_id=str(uuid.uuid4()), resource="taskPlugin", request_type="GET"
+        log: BoundLogger = get_request_logger().bind(
+            resource="taskPlugin", request_type="GET"
         )
         log.info("Request received")
         return self._task_plugin_service.get_all(
@@ -70,8 +70,8 @@ class TaskPluginResource(Resource):
     @responds(schema=TaskPluginSchema, api=api)
     def post(self) -> TaskPlugin:
         """Registers a new task plugin uploaded via the task plugin upload form."""
-        log: BoundLogger = LOGGER.new(
-            request_id=str(uuid.uuid4()), resource="taskPlugin", request_type="POST"
+        log: BoundLogger = get_request_logger().bind(
+            resource="taskPlugin", request_type="POST"
         )
         task_plugin_upload_form: TaskPluginUploadForm = TaskPluginUploadForm()
 
@@ -106,8 +106,7 @@ class TaskPluginBuiltinsCollectionResource(Resource):
     @responds(schema=TaskPluginSchema(many=True), api=api)
     def get(self) -> List[TaskPlugin]:
         """Gets a list of all available builtin task plugins."""
-        log: BoundLogger = LOGGER.new(
-            request_id=str(uuid.uuid4()),
+        log: BoundLogger = get_request_logger().bind(
             resource="taskPluginBuiltinCollection",
             request_type="GET",
         )
@@ -136,8 +135,7 @@ class TaskPluginBuiltinCollectionNameResource(Resource):
     @responds(schema=TaskPluginSchema, api=api)
     def get(self, taskPluginName: str) -> TaskPlugin:
         """Gets a builtin task plugin by its unique name."""
-        log: BoundLogger = LOGGER.new(
-            request_id=str(uuid.uuid4()),
+        log: BoundLogger = get_request_logger().bind(
             resource="taskPluginBuiltinCollectionName",
             request_type="GET",
         )
@@ -175,8 +173,7 @@ class TaskPluginCustomCollectionResource(Resource):
     @responds(schema=TaskPluginSchema(many=True), api=api)
     def get(self) -> List[TaskPlugin]:
         """Gets a list of all registered custom task plugins."""
-        log: BoundLogger = LOGGER.new(
-            request_id=str(uuid.uuid4()),
+        log: BoundLogger = get_request_logger().bind(
             resource="taskPluginCustomCollection",
             request_type="GET",
         )
@@ -205,8 +202,7 @@ class TaskPluginCustomCollectionNameResource(Resource):
     @responds(schema=TaskPluginSchema, api=api)
     def get(self, taskPluginName: str) -> TaskPlugin:
         """Gets a custom task plugin by its unique name."""
-        log: BoundLogger = LOGGER.new(
-            request_id=str(uuid.uuid4()),
+        log: BoundLogger = get_request_logger().bind(
             resource="taskPluginCustomCollectionName",
             request_type="GET",
         )
@@ -233,8 +229,7 @@ class TaskPluginCustomCollectionNameResource(Resource):
 
     def delete(self, taskPluginName: str) -> Response:
         """Deletes a custom task plugin by its unique name."""
-        log: BoundLogger = LOGGER.new(
-            request_id=str(uuid.uuid4()),
+        log: BoundLogger = get_request_logger().bind(
             resource="taskPluginCustomCollectionName",
             task_plugin_name=taskPluginName,
             request_type="DELETE",
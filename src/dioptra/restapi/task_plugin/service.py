@@ -27,6 +27,7 @@ from structlog.stdlib import BoundLogger
 from werkzeug.datastructures import FileStorage
 
 from dioptra.restapi.shared.io_file.service import IOFileService
+from dioptra.restapi.shared.request_scope.logger import get_request_logger
 from dioptra.restapi.shared.s3.service import S3Service
 
 from .errors import TaskPluginAlreadyExistsError
@@ -54,7 +55,7 @@ class TaskPluginService(object):
         bucket: str = "plugins",
         **kwargs,
     ) -> TaskPlugin:
-        log: BoundLogger = kwargs.get("log", LOGGER.new())
+        log: BoundLogger = kwargs.get("log") or get_request_logger()
 
         task_plugin_name: str = task_plugin_upload_form_data["task_plugin_name"]
         task_plugin_file: FileStorage = task_plugin_upload_form_data["task_plugin_file"]
@@ -96,7 +97,7 @@ class TaskPluginService(object):
     def delete(
         self, collection: str, task_plugin_name: str, bucket: str = "plugins", **kwargs
     ) -> List[TaskPlugin]:
-        log: BoundLogger = kwargs.get("log", LOGGER.new())
+        log: BoundLogger = kwargs.get("log") or get_request_logger()
 
         task_plugin: Optional[TaskPlugin] = self.get_by_name_in_collection(
             collection=collection, task_plugin_name=task_plugin_name, log=log
@@ -119,7 +120,7 @@ class TaskPluginService(object):
     def get_all(
         self, s3_collections_list: List[str], bucket: str = "plugins", **kwargs
     ) -> List[TaskPlugin]:
-        log: BoundLogger = kwargs.get("log", LOGGER.new())
+        log: BoundLogger = kwargs.get("log") or get_request_logger()
 
         log.info("Get all task plugins")
 
@@ -135,7 +136,7 @@ class TaskPluginService(object):
     def get_all_in_collection(
         self, collection: str, bucket: str = "plugins", **kwargs
     ) -> List[TaskPlugin]:
-        log: BoundLogger = kwargs.get("log", LOGGER.new())
+        log: BoundLogger = kwargs.get("log") or get_request_logger()
 
         log.info("Get all task plugins in collection", collection=collection)
 
@@ -159,7 +160,7 @@ class TaskPluginService(object):
     def get_by_name_in_collection(
         self, collection: str, task_plugin_name: str, bucket: str = "plugins", **kwargs
     ) -> Optional[TaskPlugin]:
-        log: BoundLogger = kwargs.get("log", LOGGER.new())
+        log: BoundLogger = kwargs.get("log") or get_request_logger()
 
         log.info(
             "Get task plugin in collection",
@@ -186,7 +187,7 @@ class TaskPluginService(object):
     def extract_data_from_form(
         self, task_plugin_upload_form: TaskPluginUploadForm, **kwargs
     ) -> TaskPluginUploadFormData:
-        log: BoundLogger = kwargs.get("log", LOGGER.new())
+        log: BoundLogger = kwargs.get("log") or get_request_logger()
 
         log.info("Extract data from task plugin upload form")
         data: TaskPluginUploadFormData = self._task_plugin_upload_form_schema.dump(
@@ -198,7 +199,7 @@ class TaskPluginService(object):
     def _validate_task_plugin_does_not_exist(
         self, collection, task_plugin_name, **kwargs
     ) -> None:
-        log: BoundLogger = kwargs.get("log", LOGGER.new())
+        log: BoundLogger = kwargs.get("log") or get_request_logger()
 
         response: Optional[TaskPlugin] = self.get_by_name_in_collection(
             collection=collection, task_plugin_name=task_plugin_name, log=log
@@ -27,6 +27,11 @@ from dioptra.sdk.utilities.logging import (
 if __name__ == "__main__":
     attach_stdout_stream_handler(
         True if os.getenv("DIOPTRA_RQ_WORKER_LOG_AS_JSON") else False,
+        asynchronous=True if os.getenv("DIOPTRA_RQ_WORKER_LOG_ASYNC") else False,
+        max_queue_size=int(
+            os.getenv("DIOPTRA_RQ_WORKER_LOG_QUEUE_SIZE", default="10000")
+        ),
+        overflow=os.getenv("DIOPTRA_RQ_WORKER_LOG_QUEUE_OVERFLOW", default="block"),
     )
     set_logging_level(os.getenv("DIOPTRA_RQ_WORKER_LOG_LEVEL", default="INFO"))
     rq_cli()
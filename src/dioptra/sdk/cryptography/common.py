@@ -23,6 +23,10 @@
 
 from __future__ import annotations
 
+import hashlib
+
+DEFAULT_CHUNK_SIZE: int = 1024 * 1024
+
 
 def load_payload(filepath: str) -> bytes:
     """Load the payload contents"""
@@ -30,3 +34,26 @@ def load_payload(filepath: str) -> bytes:
         payload: bytes = f.read()
 
     return payload
+
+
+def hash_payload(filepath: str, chunk_size: int = DEFAULT_CHUNK_SIZE) -> bytes:
+    """Compute the SHA-256 digest of the payload contents in fixed-size chunks
+
+    Only one chunk of the payload is held in memory at a time, so payloads of any size
+    can be signed and verified by passing the digest to
+    :py:func:`~.sign.sign_payload_digest` and :py:func:`~.verify.verify_payload_digest`.
+    """
+    digest = hashlib.sha256()
+    buffer: bytearray = bytearray(chunk_size)
+    view: memoryview = memoryview(buffer)
+
+    with open(filepath, "rb", buffering=0) as f:
+        while True:
+            num_bytes: int = f.readinto(buffer)
+
+            if not num_bytes:
+                break
+
+            digest.update(view[:num_bytes])
+
+    return digest.digest()
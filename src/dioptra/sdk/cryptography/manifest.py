@@ -0,0 +1,393 @@
+# This Software (Dioptra) is being made available as a public service by the
+# National Institute of Standards and Technology (NIST), an Agency of the United
+# States Department of Commerce. This software was developed in part by employees of
+# NIST and in part by NIST contractors. Copyright in portions of this software that
+# were developed by NIST contractors has been licensed or assigned to NIST. Pursuant
+# to Title 17 United States Code Section 105, works of NIST employees are not
+# subject to copyright protection in the United States. However, NIST may hold
+# international copyright in software created by its employees and domestic
+# copyright (or licensing rights) in portions of software that were assigned or
+# licensed to NIST. To the extent that NIST holds copyright in this software, it is
+# being made available under the Creative Commons Attribution 4.0 International
+# license (CC BY 4.0). The disclaimers of the CC BY 4.0 license apply to all parts
+# of the software developed or licensed by NIST.
+#
+# ACCESS THE FULL CC BY 4.0 LICENSE HERE:
+# https://creativecommons.org/licenses/by/4.0/legalcode
+"""Sign and verify manifests that list the SHA-256 digests of many files.
+
+A manifest is a JSON file with the relative path, size, and SHA-256 digest of every
+file in a set of payloads, such as an artifact directory. The files are hashed in
+parallel in a process pool, and only the manifest itself is signed, so a directory of
+any size is signed with a single RSA operation. Verification checks the manifest's
+signature and then hashes the listed files again.
+
+The commands are run as::
+
+    python -m dioptra.sdk.cryptography.manifest sign --manifest-file MANIFEST.json dir
+    python -m dioptra.sdk.cryptography.manifest verify --manifest-file MANIFEST.json
+"""
+from __future__ import annotations
+
+import hashlib
+import json
+import os
+from concurrent.futures import ProcessPoolExecutor
+from itertools import repeat
+from pathlib import Path
+from typing import Any, Dict, Iterable, List, Optional, Tuple
+
+import click
+import structlog
+from structlog.stdlib import BoundLogger
+
+from dioptra.sdk.exceptions import CryptographyDependencyError
+from dioptra.sdk.utilities.decorators import require_package
+
+from .common import DEFAULT_CHUNK_SIZE, hash_payload
+from .sign import load_private_key, sign_payload_digest
+from .verify import load_public_key, load_signature, verify_payload_digest
+
+LOGGER: BoundLogger = structlog.stdlib.get_logger()
+
+
+try:
+    from cryptography.exceptions import InvalidSignature
+    from cryptography.hazmat.primitives.asymmetric.rsa import (
+        RSAPrivateKeyWithSerialization,
+        RSAPublicKey,
+    )
+
+except ImportError:  # pragma: nocover
+    LOGGER.warn(
+        "Unable to import one or more optional packages, functionality may be reduced",
+        package="cryptography",
+    )
+
+MANIFEST_VERSION: int = 1
+
+
+def collect_files(
+    paths: Iterable[str], root_dir: str = ".", exclude: Iterable[str] = ()
+) -> List[str]:
+    """Collect the files in the payload paths, searching directories recursively
+
+    Returns:
+        The sorted file paths relative to `root_dir`, using forward slashes.
+
+    Raises:
+        ValueError: If a file is not inside `root_dir`.
+    """
+    root: Path = Path(root_dir).resolve()
+    excluded = {Path(x).resolve() for x in exclude}
+    filepaths = set()
+
+    for path in (Path(x).resolve() for x in paths):
+        candidates = sorted(path.rglob("*")) if path.is_dir() else [path]
+
+        for filepath in candidates:
+            if not filepath.is_file() or filepath in excluded:
+                continue
+
+            try:
+                filepaths.add(filepath.relative_to(root).as_posix())
+
+            except ValueError:
+                raise ValueError(
+                    f"The file {filepath} is not inside the root directory {root}"
+                ) from None
+
+    return sorted(filepaths)
+
+
+def hash_files(
+    filepaths: List[str],
+    max_workers: Optional[int] = None,
+    chunk_size: int = DEFAULT_CHUNK_SIZE,
+) -> List[Tuple[int, str]]:
+    """Compute the size and hex-encoded SHA-256 digest of each file in a process pool
+
+    The largest files are submitted first so that one large file does not leave the
+    other workers idle at the end. A single worker hashes the files in this process.
+    """
+    max_workers = min(max_workers or os.cpu_count() or 1, max(len(filepaths), 1))
+
+    if max_workers == 1:
+        return [_hash_file(x, chunk_size) for x in filepaths]
+
+    order: List[int] = sorted(
+        range(len(filepaths)), key=lambda i: os.path.getsize(filepaths[i]), reverse=True
+    )
+    results: List[Tuple[int, str]] = [(0, "")] * len(filepaths)
+
+    with ProcessPoolExecutor(max_workers=max_workers) as executor:
+        hashes = executor.map(
+            _hash_file, [filepaths[i] for i in order], repeat(chunk_size)
+        )
+
+        for index, result in zip(order, hashes):
+            results[index] = result
+
+    return results
+
+
+def create_manifest(
+    paths: Iterable[str],
+    root_dir: str = ".",
+    max_workers: Optional[int] = None,
+    chunk_size: int = DEFAULT_CHUNK_SIZE,
+    exclude: Iterable[str] = (),
+) -> Dict[str, Any]:
+    """Create a manifest of the files in the payload paths"""
+    relpaths: List[str] = collect_files(paths, root_dir=root_dir, exclude=exclude)
+    hashes: List[Tuple[int, str]] = hash_files(
+        [str(Path(root_dir) / x) for x in relpaths],
+        max_workers=max_workers,
+        chunk_size=chunk_size,
+    )
+
+    return {
+        "version": MANIFEST_VERSION,
+        "hash_algorithm": "sha256",
+        "files": [
+            {"path": path, "size": size, "sha256": digest}
+            for path, (size, digest) in zip(relpaths, hashes)
+        ],
+    }
+
+
+def dump_manifest(manifest: Dict[str, Any]) -> bytes:
+    """Serialize the manifest as JSON"""
+    return (json.dumps(manifest, indent=2, sort_keys=True) + "\n").encode("utf-8")
+
+
+@require_package("cryptography", exc_type=CryptographyDependencyError)
+def sign_manifest(
+    manifest: Dict[str, Any],
+    private_key: RSAPrivateKeyWithSerialization,
+    filepath: str,
+    signature_filepath: Optional[str] = None,
+) -> bytes:
+    """Save the manifest to a file and sign it"""
+    payload: bytes = dump_manifest(manifest)
+
+    with open(filepath, "wb") as f:
+        f.write(payload)
+
+    return sign_payload_digest(
+        digest=hashlib.sha256(payload).digest(),
+        private_key=private_key,
+        filepath=signature_filepath or f"{filepath}.sig",
+    )
+
+
+@require_package("cryptography", exc_type=CryptographyDependencyError)
+def verify_manifest(
+    filepath: str,
+    signature: bytes,
+    public_key: RSAPublicKey,
+    root_dir: str = ".",
+    max_workers: Optional[int] = None,
+    chunk_size: int = DEFAULT_CHUNK_SIZE,
+) -> Dict[str, str]:
+    """Verify the manifest signature and the files listed in the manifest
+
+    Returns:
+        A dictionary that maps the path of each file that failed verification to the
+        reason, either `"missing"` or `"modified"`. It is empty if all files passed.
+
+    Raises:
+        InvalidSignature: If the manifest failed verification.
+    """
+    with open(filepath, "rb") as f:
+        payload: bytes = f.read()
+
+    verify_payload_digest(
+        digest=hashlib.sha256(payload).digest(),
+        signature=signature,
+        public_key=public_key,
+    )
+    entries: List[Dict[str, Any]] = json.loads(payload)["files"]
+    failures: Dict[str, str] = {
+        x["path"]: "missing"
+        for x in entries
+        if not (Path(root_dir) / x["path"]).is_file()
+    }
+    entries = [x for x in entries if x["path"] not in failures]
+    hashes: List[Tuple[int, str]] = hash_files(
+        [str(Path(root_dir) / x["path"]) for x in entries],
+        max_workers=max_workers,
+        chunk_size=chunk_size,
+    )
+
+    for entry, (size, digest) in zip(entries, hashes):
+        if size != entry["size"] or digest != entry["sha256"]:
+            failures[entry["path"]] = "modified"
+
+    return failures
+
+
+def _hash_file(filepath: str, chunk_size: int) -> Tuple[int, str]:
+    return os.path.getsize(filepath), hash_payload(filepath, chunk_size).hex()
+
+
+@click.group()
+def manifest() -> None:
+    """Sign and verify manifests of many files"""
+
+
+@manifest.command(name="sign")
+@click.option(
+    "--private-key-file",
+    type=click.Path(
+        exists=True, file_okay=True, dir_okay=False, resolve_path=True, readable=True
+    ),
+    required=True,
+    show_default=True,
+    default="private.key",
+    help="File with private key to use for signing",
+)
+@click.option(
+    "--manifest-file",
+    type=click.Path(
+        exists=False, file_okay=True, dir_okay=False, resolve_path=True, readable=True
+    ),
+    required=True,
+    help="Output path for the manifest",
+)
+@click.option(
+    "--signature-file",
+    type=click.Path(
+        exists=False, file_okay=True, dir_okay=False, resolve_path=True, readable=True
+    ),
+    required=False,
+    help=(
+        "Output path for the manifest signature. Default is to use manifest filename "
+        "with .sig appended."
+    ),
+)
+@click.option(
+    "--root-dir",
+    type=click.Path(exists=True, file_okay=False, dir_okay=True, resolve_path=True),
+    show_default=True,
+    default=".",
+    help="Directory that the file paths in the manifest are relative to",
+)
+@click.option(
+    "--max-workers",
+    type=click.IntRange(min=1, max=None),
+    required=False,
+    help="Number of processes to use for hashing. Default is the number of CPUs.",
+)
+@click.argument(
+    "paths",
+    nargs=-1,
+    required=True,
+    type=click.Path(exists=True, file_okay=True, dir_okay=True, readable=True),
+)
+def sign_command(
+    private_key_file: str,
+    manifest_file: str,
+    signature_file: Optional[str],
+    root_dir: str,
+    max_workers: Optional[int],
+    paths: Tuple[str, ...],
+) -> bytes:
+    private_key: RSAPrivateKeyWithSerialization = load_private_key(
+        filepath=private_key_file
+    )
+    signature_file = signature_file or f"{manifest_file}.sig"
+    payload_manifest: Dict[str, Any] = create_manifest(
+        paths,
+        root_dir=root_dir,
+        max_workers=max_workers,
+        exclude=[manifest_file, signature_file],
+    )
+    signature: bytes = sign_manifest(
+        manifest=payload_manifest,
+        private_key=private_key,
+        filepath=manifest_file,
+        signature_filepath=signature_file,
+    )
+    click.echo(f"Signed {len(payload_manifest['files'])} files")
+
+    return signature
+
+
+@manifest.command(name="verify")
+@click.option(
+    "--public-key-file",
+    type=click.Path(
+        exists=True, file_okay=True, dir_okay=False, resolve_path=True, readable=True
+    ),
+    required=True,
+    help="File with public key to use for verification",
+)
+@click.option(
+    "--manifest-file",
+    type=click.Path(
+        exists=True, file_okay=True, dir_okay=False, resolve_path=True, readable=True
+    ),
+    required=True,
+    help="Manifest to verify with signature file",
+)
+@click.option(
+    "--signature-file",
+    type=click.Path(
+        exists=True, file_okay=True, dir_okay=False, resolve_path=True, readable=True
+    ),
+    required=False,
+    help=(
+        "File with the manifest signature. Default is to use manifest filename with "
+        ".sig appended."
+    ),
+)
+@click.option(
+    "--root-dir",
+    type=click.Path(exists=True, file_okay=False, dir_okay=True, resolve_path=True),
+    show_default=True,
+    default=".",
+    help="Directory that the file paths in the manifest are relative to",
+)
+@click.option(
+    "--max-workers",
+    type=click.IntRange(min=1, max=None),
+    required=False,
+    help="Number of processes to use for hashing. Default is the number of CPUs.",
+)
+def verify_command(
+    public_key_file: str,
+    manifest_file: str,
+    signature_file: Optional[str],
+    root_dir: str,
+    max_workers: Optional[int],
+) -> bool:
+    public_key: RSAPublicKey = load_public_key(filepath=public_key_file)
+    signature: bytes = load_signature(filepath=signature_file or f"{manifest_file}.sig")
+
+    try:
+        failures: Dict[str, str] = verify_manifest(
+            filepath=manifest_file,
+            signature=signature,
+            public_key=public_key,
+            root_dir=root_dir,
+            max_workers=max_workers,
+        )
+
+    except InvalidSignature:
+        click.echo("ERROR - Manifest and/or signature files failed verification")
+        return False
+
+    for path, reason in failures.items():
+        click.echo(f"ERROR - {path} is {reason}")
+
+    if failures:
+        return False
+
+    click.echo("OK")
+
+    return True
+
+
+if __name__ == "__main__":
+    _ = manifest()
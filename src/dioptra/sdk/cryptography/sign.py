@@ -33,7 +33,7 @@ from structlog.stdlib import BoundLogger
 from dioptra.sdk.exceptions import CryptographyDependencyError
 from dioptra.sdk.utilities.decorators import require_package
 
-from .common import load_payload
+from .common import hash_payload
 
 LOGGER: BoundLogger = structlog.stdlib.get_logger()
 
@@ -41,7 +41,7 @@ LOGGER: BoundLogger = structlog.stdlib.get_logger()
 try:
     from cryptography.hazmat.backends import default_backend
     from cryptography.hazmat.primitives import hashes
-    from cryptography.hazmat.primitives.asymmetric import padding
+    from cryptography.hazmat.primitives.asymmetric import padding, utils
     from cryptography.hazmat.primitives.asymmetric.rsa import (
         RSAPrivateKeyWithSerialization,
     )
@@ -89,6 +89,33 @@ def sign_payload(
     return signature
 
 
+@require_package("cryptography", exc_type=CryptographyDependencyError)
+def sign_payload_digest(
+    digest: bytes, private_key: RSAPrivateKeyWithSerialization, filepath: str
+) -> bytes:
+    """Sign the SHA-256 digest of the payload
+
+    The signature is identical to the one :py:func:`sign_payload` creates for the full
+    payload, so either one can be verified with :py:func:`~.verify.verify_payload` or
+    :py:func:`~.verify.verify_payload_digest`.
+    """
+    signature: bytes = base64.b64encode(
+        private_key.sign(
+            digest,
+            padding.PSS(
+                mgf=padding.MGF1(hashes.SHA256()),
+                salt_length=padding.PSS.MAX_LENGTH,
+            ),
+            utils.Prehashed(hashes.SHA256()),
+        )
+    )
+
+    with open(filepath, "wb") as f:
+        f.write(signature)
+
+    return signature
+
+
 @click.command()
 @click.option(
     "--private-key-file",
@@ -125,9 +152,9 @@ def sign(
     private_key: RSAPrivateKeyWithSerialization = load_private_key(
         filepath=private_key_file
     )
-    payload: bytes = load_payload(filepath=payload_file)
-    signature: bytes = sign_payload(
-        payload=payload,
+    digest: bytes = hash_payload(filepath=payload_file)
+    signature: bytes = sign_payload_digest(
+        digest=digest,
         private_key=private_key,
         filepath=signature_file or f"{payload_file}.sig",
     )
@@ -33,7 +33,7 @@ from structlog.stdlib import BoundLogger
 from dioptra.sdk.exceptions import CryptographyDependencyError
 from dioptra.sdk.utilities.decorators import require_package
 
-from .common import load_payload
+from .common import hash_payload
 
 LOGGER: BoundLogger = structlog.stdlib.get_logger()
 
@@ -42,7 +42,7 @@ try:
     from cryptography.exceptions import InvalidSignature
     from cryptography.hazmat.backends import default_backend
     from cryptography.hazmat.primitives import hashes
-    from cryptography.hazmat.primitives.asymmetric import padding
+    from cryptography.hazmat.primitives.asymmetric import padding, utils
     from cryptography.hazmat.primitives.asymmetric.rsa import RSAPublicKey
     from cryptography.hazmat.primitives.serialization import load_pem_public_key
 
@@ -92,6 +92,30 @@ def verify_payload(payload: bytes, signature: bytes, public_key: RSAPublicKey) -
     return True
 
 
+@require_package("cryptography", exc_type=CryptographyDependencyError)
+def verify_payload_digest(
+    digest: bytes, signature: bytes, public_key: RSAPublicKey
+) -> bool:
+    """Verify the payload signature against the SHA-256 digest of the payload"""
+    try:
+        public_key.verify(
+            signature,
+            digest,
+            padding.PSS(
+                mgf=padding.MGF1(hashes.SHA256()),
+                salt_length=padding.PSS.MAX_LENGTH,
+            ),
+            utils.Prehashed(hashes.SHA256()),
+        )
+
+    except InvalidSignature:
+        raise InvalidSignature(
+            "Payload and/or signature files failed verification"
+        ) from None
+
+    return True
+
+
 @click.command()
 @click.option(
     "--public-key-file",
@@ -119,12 +143,12 @@ def verify_payload(payload: bytes, signature: bytes, public_key: RSAPublicKey) -
 )
 def verify(public_key_file: str, payload_file: str, signature_file: str) -> bool:
     public_key: RSAPublicKey = load_public_key(filepath=public_key_file)
-    payload: bytes = load_payload(filepath=payload_file)
+    digest: bytes = hash_payload(filepath=payload_file)
     signature: bytes = load_signature(filepath=signature_file)
 
     try:
-        verification: bool = verify_payload(
-            payload=payload, signature=signature, public_key=public_key
+        verification: bool = verify_payload_digest(
+            digest=digest, signature=signature, public_key=public_key
         )
         click.echo("OK")
 
@@ -19,6 +19,7 @@ from .optional_dependencies import (
     ARTDependencyError,
     CryptographyDependencyError,
     PrefectDependencyError,
+    PyArrowDependencyError,
     TensorflowDependencyError,
 )
 from .pyplugs import UnknownPackageError, UnknownPluginError, UnknownPluginFunctionError
@@ -28,6 +29,7 @@ __all__ = [
     "CryptographyDependencyError",
     "EstimatorPredictGenericPredTypeError",
     "PrefectDependencyError",
+    "PyArrowDependencyError",
     "TensorflowDependencyError",
     "UnknownPackageError",
     "UnknownPluginError",
@@ -31,5 +31,9 @@ class PrefectDependencyError(BaseOptionalDependencyError):
     """Method/function depends on the "prefect" package."""
 
 
+class PyArrowDependencyError(BaseOptionalDependencyError):
+    """Method/function depends on the "pyarrow" package."""
+
+
 class TensorflowDependencyError(BaseOptionalDependencyError):
     """Method/function depends on the "tensorflow" package."""
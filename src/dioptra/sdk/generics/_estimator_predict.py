@@ -19,13 +19,14 @@ from __future__ import annotations
 from typing import Any
 
 import structlog
-from multimethod import multimethod
 from structlog.stdlib import BoundLogger
 
+from ._multimethod import LazyMultimethod
+
 LOGGER: BoundLogger = structlog.stdlib.get_logger()
 
 
-@multimethod
+@LazyMultimethod
 def estimator_predict(estimator: Any, x: Any, **kwargs) -> Any:
     LOGGER.info(
         "Dispatching to generic function",
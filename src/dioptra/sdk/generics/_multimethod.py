@@ -0,0 +1,128 @@
+# This Software (Dioptra) is being made available as a public service by the
+# National Institute of Standards and Technology (NIST), an Agency of the United
+# States Department of Commerce. This software was developed in part by employees of
+# NIST and in part by NIST contractors. Copyright in portions of this software that
+# were developed by NIST contractors has been licensed or assigned to NIST. Pursuant
+# to Title 17 United States Code Section 105, works of NIST employees are not
+# subject to copyright protection in the United States. However, NIST may hold
+# international copyright in software created by its employees and domestic
+# copyright (or licensing rights) in portions of software that were assigned or
+# licensed to NIST. To the extent that NIST holds copyright in this software, it is
+# being made available under the Creative Commons Attribution 4.0 International
+# license (CC BY 4.0). The disclaimers of the CC BY 4.0 license apply to all parts
+# of the software developed or licensed by NIST.
+#
+# ACCESS THE FULL CC BY 4.0 LICENSE HERE:
+# https://creativecommons.org/licenses/by/4.0/legalcode
+"""A multimethod that can load its implementations on demand."""
+from __future__ import annotations
+
+import threading
+from typing import Any, Callable, Dict, Iterable, List, Optional, Tuple
+
+from multimethod import DispatchError, multimethod
+
+Loader = Callable[[], Any]
+Types = Tuple[type, ...]
+
+
+class LazyMultimethod(multimethod):
+    """A :py:class:`~multimethod.multimethod` with lazy registration and a fast path.
+
+    Implementations for types from an optional backend, such as Tensorflow, can be
+    declared with :py:meth:`register_lazy` instead of being imported up front. The
+    first time the multimethod is called with an argument whose type, or one of its
+    base classes, is defined in that backend's top-level package, the loader is called
+    so that it can register its implementations. Types from a package that is never
+    used therefore never trigger an import of that package.
+
+    Resolved implementations are cached by the types of the positional arguments,
+    which skips the lazy registration check and the multimethod's own signature
+    lookup on repeated calls, such as in per-batch loops. The cache is cleared
+    whenever an implementation is registered. Dispatching on parametrized generic
+    types depends on argument values, not just their types, so such multimethods
+    bypass the cache.
+    """
+
+    def __init__(self, func: Callable[..., Any]) -> None:
+        if "_dispatch_cache" not in self.__dict__:
+            self._dispatch_cache: Dict[Types, Callable[..., Any]] = {}
+            self._lazy_loaders: Dict[str, List[Loader]] = {}
+            self._lazy_lock = threading.RLock()
+
+        super().__init__(func)
+
+    def register_lazy(self, packages: Iterable[str], loader: Loader) -> None:
+        """Registers a loader to call when dispatching on types from `packages`.
+
+        Args:
+            packages: The top-level package names of the types that the loader's
+                implementations dispatch on, for example `["tensorflow", "keras"]`.
+            loader: A callable with no arguments that registers one or more
+                implementations on this multimethod, usually by importing a module.
+                It is called at most once.
+        """
+        with self._lazy_lock:
+            for package in packages:
+                self._lazy_loaders.setdefault(package, []).append(loader)
+
+            self._dispatch_cache.clear()
+
+    def clean(self) -> None:
+        """Empty the caches."""
+        super().clean()
+        self._dispatch_cache.clear()
+
+    def __call__(self, *args, **kwargs) -> Any:
+        types: Types = tuple(map(type, args))
+        func: Optional[Callable[..., Any]] = self._dispatch_cache.get(types)
+
+        if func is None:
+            func = self._resolve(args, types)
+
+        try:
+            return func(*args, **kwargs)
+
+        except TypeError as ex:
+            raise DispatchError(f"Function {func.__code__}") from ex
+
+    def _resolve(self, args: Tuple[Any, ...], types: Types) -> Callable[..., Any]:
+        if self._lazy_loaders:
+            self._load_lazy(types)
+
+        if self.pending:
+            self.evaluate()
+
+        type_checkers: Optional[List[Callable[[Any], Any]]] = getattr(
+            self, "type_checkers", None
+        )
+
+        if type_checkers is None:
+            return self._dispatch_cache.setdefault(types, self[types])
+
+        key = tuple(checker(arg) for checker, arg in zip(type_checkers, args))
+        func: Callable[..., Any] = self[key]
+
+        if all(checker is type for checker in type_checkers):
+            self._dispatch_cache[types] = func
+
+        return func
+
+    def _load_lazy(self, types: Types) -> None:
+        with self._lazy_lock:
+            packages = {
+                getattr(base, "__module__", "").partition(".")[0]
+                for cls in types
+                for base in cls.__mro__
+            }
+
+            for package in packages & set(self._lazy_loaders):
+                for loader in self._lazy_loaders.pop(package, []):
+                    for loaders in self._lazy_loaders.values():
+                        if loader in loaders:
+                            loaders.remove(loader)
+
+                    loader()
+
+            for package in [k for k, v in self._lazy_loaders.items() if not v]:
+                del self._lazy_loaders[package]
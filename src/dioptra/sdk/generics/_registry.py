@@ -14,18 +14,51 @@
 #
 # ACCESS THE FULL CC BY 4.0 LICENSE HERE:
 # https://creativecommons.org/licenses/by/4.0/legalcode
-from typing import Dict, List
+"""Registers the implementations of the generic functions from entry points.
+
+Implementations are advertised by installed packages in the
+``dioptra.generics.<generic>`` entry point groups, where ``<generic>`` is one of
+the generic functions in :py:mod:`dioptra.sdk.generics`, for example::
+
+    [options.entry_points]
+    dioptra.generics.estimator_predict =
+        tf_keras_model = my_package.estimator_predict.tf_keras_model
+
+The same package can declare the top-level packages of the types that an entry
+point's implementations dispatch on in the ``dioptra.generics.dispatch_packages``
+group. Each package gets its own entry point, named after the generic function, the
+entry point and the package, and pointing at the package::
+
+    dioptra.generics.dispatch_packages =
+        estimator_predict.tf_keras_model.keras = keras
+        estimator_predict.tf_keras_model.tensorflow = tensorflow
+
+These entry points are only read, never loaded. An entry point with dispatch
+packages is loaded the first time its generic function is called with an argument
+whose type comes from one of those packages. Any other entry point is loaded when
+:py:mod:`dioptra.sdk.generics` is imported.
+"""
+from functools import partial
+from typing import Any, Dict, List, Tuple
 
 import entrypoints
 import structlog
 from entrypoints import EntryPoint
 from structlog.stdlib import BoundLogger
 
+from ._estimator_predict import estimator_predict
+from ._fit_estimator import fit_estimator
+from ._multimethod import LazyMultimethod
+
 LOGGER: BoundLogger = structlog.stdlib.get_logger()
 
 
-_GENERICS: List[str] = ["estimator_predict", "fit_estimator"]
-_GENERICS_ENTRYPOINTS: Dict[str, Dict[str, EntryPoint]] = {}
+_GENERICS: Dict[str, LazyMultimethod] = {
+    "estimator_predict": estimator_predict,
+    "fit_estimator": fit_estimator,
+}
+_GENERICS_ENTRYPOINTS: Dict[str, Dict[str, Any]] = {}
+_DISPATCH_PACKAGES_GROUP = "dioptra.generics.dispatch_packages"
 
 
 def _register(generic: str, entrypoint: EntryPoint) -> None:
@@ -40,7 +73,28 @@ def _register(generic: str, entrypoint: EntryPoint) -> None:
         )
 
 
+def _dispatch_packages(
+    generic: str, entrypoint: EntryPoint, declarations: List[EntryPoint]
+) -> Tuple[str, ...]:
+    prefix = f"{generic}.{entrypoint.name}."
+
+    return tuple(
+        sorted({x.module_name for x in declarations if x.name.startswith(prefix)})
+    )
+
+
 def register_entrypoints() -> None:
-    for generic in _GENERICS:
+    declarations = entrypoints.get_group_all(_DISPATCH_PACKAGES_GROUP)
+
+    for generic, generic_func in _GENERICS.items():
         for entrypoint in entrypoints.get_group_all(f"dioptra.generics.{generic}"):
+            dispatch_packages = _dispatch_packages(generic, entrypoint, declarations)
+
+            if dispatch_packages:
+                generic_func.register_lazy(
+                    dispatch_packages,
+                    partial(_register, generic=generic, entrypoint=entrypoint),
+                )
+                continue
+
             _register(generic=generic, entrypoint=entrypoint)
@@ -57,7 +57,7 @@ class EfficientNetBackbone(Model):
         self,
         flavor: str = "B4",
         input_shape: Optional[Tuple[int, int, int]] = None,
-        weights: str = "imagenet",
+        weights: Optional[str] = "imagenet",
         input_tensor: Optional[InputLayer] = None,
         pooling: Optional[str] = None,
         **kwargs,
@@ -101,7 +101,7 @@ class MobileNetV2Backbone(Model):
         self,
         input_shape: Optional[Tuple[int, int, int]] = None,
         alpha: float = 1.0,
-        weights: str = "imagenet",
+        weights: Optional[str] = "imagenet",
         input_tensor: Optional[InputLayer] = None,
         pooling: Optional[str] = None,
         **kwargs,
@@ -70,15 +70,18 @@ class YOLOV1BoundingBoxCoordinates(Layer):
                 4,
             ),
             name=f"{name}_reshape",
+            dtype=self.dtype,
         )
-        self.concatenate = Concatenate(axis=-1)
+        self.concatenate = Concatenate(axis=-1, dtype=self.dtype)
         self.xy_activation = Activation(
             "sigmoid",
             name=f"{name}_xy_activation",
+            dtype=self.dtype,
         )
         self.wh_activation = Activation(
             "exponential",
             name=f"{name}_wh_activation",
+            dtype=self.dtype,
         )
 
     def call(self, inputs):
@@ -116,10 +119,12 @@ class YOLOV1BoundingBoxConfidences(Layer):
                 n_bounding_boxes,
             ),
             name=f"{name}_reshape",
+            dtype=self.dtype,
         )
         self.activation = Activation(
             "sigmoid",
             name=f"{name}_activation",
+            dtype=self.dtype,
         )
 
     def call(self, inputs):
@@ -156,10 +161,12 @@ class YOLOV1ClassProbabilities(Layer):
                 n_classes,
             ),
             name=f"{name}_reshape",
+            dtype=self.dtype,
         )
         self.activation = Activation(
-            Softmax(),
+            Softmax(dtype=self.dtype),
             name=f"{name}_activation",
+            dtype=self.dtype,
         )
 
     def call(self, inputs):
@@ -260,17 +267,20 @@ class YOLOV1Detector(Layer):
             grid_shape=grid_shape,
             n_bounding_boxes=n_bounding_boxes,
             name=f"{name}_bbox_coordinates",
+            dtype="float32",
         )
         self.bbox_confidences = YOLOV1BoundingBoxConfidences(
             grid_shape=grid_shape,
             n_bounding_boxes=n_bounding_boxes,
             name=f"{name}_bbox_confidences",
+            dtype="float32",
         )
         self.class_probabilities = YOLOV1ClassProbabilities(
             grid_shape=grid_shape,
             n_bounding_boxes=n_bounding_boxes,
             n_classes=n_classes,
             name=f"{name}_class_probabilities",
+            dtype="float32",
         )
 
     def call(self, inputs, training=None):
@@ -336,17 +346,20 @@ class SimpleYOLOV1Detector(Layer):
             grid_shape=grid_shape,
             n_bounding_boxes=n_bounding_boxes,
             name=f"{name}_bbox_coordinates",
+            dtype="float32",
         )
         self.bbox_confidences = YOLOV1BoundingBoxConfidences(
             grid_shape=grid_shape,
             n_bounding_boxes=n_bounding_boxes,
             name=f"{name}_bbox_confidences",
+            dtype="float32",
         )
         self.class_probabilities = YOLOV1ClassProbabilities(
             grid_shape=grid_shape,
             n_bounding_boxes=n_bounding_boxes,
             n_classes=n_classes,
             name=f"{name}_class_probabilities",
+            dtype="float32",
         )
 
         self._grid_shape = grid_shape
@@ -542,17 +555,20 @@ class TwoHeadedYOLOV1Detector(Layer):
             grid_shape=grid_shape,
             n_bounding_boxes=n_bounding_boxes,
             name=f"{name}_bbox_coordinates",
+            dtype="float32",
         )
         self.bbox_confidences = YOLOV1BoundingBoxConfidences(
             grid_shape=grid_shape,
             n_bounding_boxes=n_bounding_boxes,
             name=f"{name}_bbox_confidences",
+            dtype="float32",
         )
         self.class_probabilities = YOLOV1ClassProbabilities(
             grid_shape=grid_shape,
             n_bounding_boxes=n_bounding_boxes,
             n_classes=n_classes,
             name=f"{name}_class_probabilities",
+            dtype="float32",
         )
 
     def call(self, inputs):
@@ -17,7 +17,21 @@
 from __future__ import annotations
 
 import math
-from typing import Any, Callable, Dict, List, Optional, Tuple, Union, cast
+from contextlib import contextmanager
+from pathlib import Path
+from typing import (
+    Any,
+    Callable,
+    Dict,
+    Iterable,
+    Iterator,
+    List,
+    Optional,
+    Sized,
+    Tuple,
+    Union,
+    cast,
+)
 
 import numpy as np
 import structlog
@@ -45,6 +59,7 @@ try:
     from tensorflow import GradientTape, Tensor
     from tensorflow.keras import Model
     from tensorflow.keras.layers import Layer
+    from tensorflow.keras.mixed_precision import LossScaleOptimizer
 
 except ImportError:  # pragma: nocover
     LOGGER.warn(
@@ -68,6 +83,32 @@ except ImportError:  # pragma: nocover
     )
 
 
+PRECISION_POLICIES: Tuple[str, ...] = ("float32", "mixed_float16", "mixed_bfloat16")
+
+
+@contextmanager
+def precision_policy_scope(precision_policy: Optional[str]) -> Iterator[None]:
+    """Temporarily sets the global Keras dtype policy while layers are built."""
+    if precision_policy is None:
+        yield None
+        return None
+
+    if precision_policy not in PRECISION_POLICIES:
+        raise ValueError(
+            f"The precision policy '{precision_policy}' is not supported. The "
+            f"following policies are currently available: {list(PRECISION_POLICIES)}"
+        )
+
+    previous_policy = tf.keras.mixed_precision.global_policy()
+    tf.keras.mixed_precision.set_global_policy(precision_policy)
+
+    try:
+        yield None
+
+    finally:
+        tf.keras.mixed_precision.set_global_policy(previous_policy)
+
+
 class YOLOV1ObjectDetector(Model):
     def __init__(
         self,
@@ -77,18 +118,27 @@ class YOLOV1ObjectDetector(Model):
         backbone: str = "efficientnetb4",
         detector: str = "two_headed",
         name: str = "yolo_v1_object_detector",
+        precision_policy: Optional[str] = None,
+        jit_compile: bool = False,
+        backbone_weights: Optional[str] = "imagenet",
     ) -> None:
-        super().__init__(name=name)
-        self.backbone = self._set_backbone(backbone=backbone, input_shape=input_shape)
-        self.detector = self._set_detector(
-            detector=detector,
-            grid_shape=self.backbone.output_grid_shape,
-            n_bounding_boxes=n_bounding_boxes,
-            n_classes=n_classes,
-        )
+        with precision_policy_scope(precision_policy):
+            super().__init__(name=name, dtype=precision_policy)
+            self.backbone = self._set_backbone(
+                backbone=backbone, input_shape=input_shape, weights=backbone_weights
+            )
+            self.detector = self._set_detector(
+                detector=detector,
+                grid_shape=self.backbone.output_grid_shape,
+                n_bounding_boxes=n_bounding_boxes,
+                n_classes=n_classes,
+            )
+
         self.loss_tracker = tf.keras.metrics.Mean(name="loss")
         self.val_loss_tracker = tf.keras.metrics.Mean(name="loss")
         self._image_input_shape = input_shape
+        self._precision_policy = precision_policy
+        self._jit_compile_default = jit_compile
 
     @property
     def image_input_shape(self) -> tuple[int, int, int]:
@@ -102,6 +152,14 @@ class YOLOV1ObjectDetector(Model):
     def metrics(self):
         return [self.loss_tracker, self.val_loss_tracker]
 
+    @property
+    def precision_policy(self) -> Optional[str]:
+        return self._precision_policy
+
+    def compile(self, *args, **kwargs) -> None:
+        kwargs.setdefault("jit_compile", self._jit_compile_default)
+        super().compile(*args, **kwargs)
+
     def call(self, inputs, training=None):
         x = self.backbone(inputs)
 
@@ -109,13 +167,20 @@ class YOLOV1ObjectDetector(Model):
 
     def train_step(self, data):
         x, y = data
+        use_loss_scaling = isinstance(self.optimizer, LossScaleOptimizer)
 
         with GradientTape() as tape:
             y_pred = self(x, training=True)
             loss = self.loss(y, y_pred)
+            scaled_loss = (
+                self.optimizer.get_scaled_loss(loss) if use_loss_scaling else loss
+            )
 
         trainable_vars = self.trainable_variables
-        gradients = tape.gradient(loss, trainable_vars)
+        gradients = tape.gradient(scaled_loss, trainable_vars)
+
+        if use_loss_scaling:
+            gradients = self.optimizer.get_unscaled_gradients(gradients)
 
         self.optimizer.apply_gradients(zip(gradients, trainable_vars))
         self.loss_tracker.update_state(loss)
@@ -134,34 +199,38 @@ class YOLOV1ObjectDetector(Model):
 
     @staticmethod
     def _set_backbone(
-        backbone: str, input_shape: Optional[Tuple[int, int, int]]
+        backbone: str,
+        input_shape: Optional[Tuple[int, int, int]],
+        weights: Optional[str] = "imagenet",
     ) -> Model:
-        backbone_registry: dict[str, Callable[[], EfficientNetBackbone]] = dict(
+        backbone_registry: dict[str, Callable[[], Model]] = dict(
             efficientnetb0=lambda: EfficientNetBackbone(
-                flavor="b0", input_shape=input_shape
+                flavor="b0", input_shape=input_shape, weights=weights
             ),
             efficientnetb1=lambda: EfficientNetBackbone(
-                flavor="b1", input_shape=input_shape
+                flavor="b1", input_shape=input_shape, weights=weights
             ),
             efficientnetb2=lambda: EfficientNetBackbone(
-                flavor="b2", input_shape=input_shape
+                flavor="b2", input_shape=input_shape, weights=weights
             ),
             efficientnetb3=lambda: EfficientNetBackbone(
-                flavor="b3", input_shape=input_shape
+                flavor="b3", input_shape=input_shape, weights=weights
             ),
             efficientnetb4=lambda: EfficientNetBackbone(
-                flavor="b4", input_shape=input_shape
+                flavor="b4", input_shape=input_shape, weights=weights
             ),
             efficientnetb5=lambda: EfficientNetBackbone(
-                flavor="b5", input_shape=input_shape
+                flavor="b5", input_shape=input_shape, weights=weights
             ),
             efficientnetb6=lambda: EfficientNetBackbone(
-                flavor="b6", input_shape=input_shape
+                flavor="b6", input_shape=input_shape, weights=weights
             ),
             efficientnetb7=lambda: EfficientNetBackbone(
-                flavor="b7", input_shape=input_shape
+                flavor="b7", input_shape=input_shape, weights=weights
+            ),
+            mobilenetv2=lambda: MobileNetV2Backbone(
+                input_shape=input_shape, weights=weights
             ),
-            mobilenetv2=lambda: MobileNetV2Backbone(input_shape=input_shape),
         )
 
         return backbone_registry[backbone.strip().lower()]()
@@ -194,6 +263,95 @@ class YOLOV1ObjectDetector(Model):
         return detector_registry[detector.strip().lower()]()
 
 
+def _as_micro_batch(element: Any) -> Tuple[np.ndarray, Optional[List[Dict]]]:
+    x, y = element if isinstance(element, tuple) else (element, None)
+    x = np.asarray(x)
+
+    if x.ndim == 3:
+        return x[np.newaxis], None if y is None else [y]
+
+    if isinstance(y, dict):
+        y = [{k: np.asarray(v[i]) for k, v in y.items()} for i in range(x.shape[0])]
+
+    return x, y
+
+
+def _iter_micro_batches(
+    data: Union[tf.data.Dataset, Iterable[Any]], batch_size: int
+) -> Iterator[Tuple[np.ndarray, Optional[List[Dict]]]]:
+    """Re-chunks a stream of samples or batches into micro-batches of `batch_size`.
+
+    Only the current micro-batch and one input element are held in memory at a time.
+    """
+    if isinstance(data, tf.data.Dataset):
+        data = data.as_numpy_iterator()
+
+    pending_x: List[np.ndarray] = []
+    pending_y: List[Dict] = []
+    num_pending = 0
+
+    for element in data:
+        x, y = _as_micro_batch(element)
+        pending_x.append(x)
+        pending_y.extend(y or [])
+        num_pending += x.shape[0]
+
+        if num_pending < batch_size:
+            continue
+
+        x = np.concatenate(pending_x, axis=0)
+
+        for start in range(0, num_pending - batch_size + 1, batch_size):
+            yield (
+                x[start : start + batch_size],
+                pending_y[start : start + batch_size] or None,
+            )
+
+        start = num_pending - num_pending % batch_size
+        pending_x = [x[start:]] if start < num_pending else []
+        pending_y = pending_y[start:]
+        num_pending -= start
+
+    if num_pending > 0:
+        yield np.concatenate(pending_x, axis=0), pending_y or None
+
+
+def _infer_num_samples(
+    data: Union[tf.data.Dataset, Iterable[Any]], num_samples: Optional[int]
+) -> int:
+    if num_samples is not None:
+        return num_samples
+
+    if isinstance(data, tf.data.Dataset):
+        x_spec = data.element_spec
+        x_spec = x_spec[0] if isinstance(x_spec, tuple) else x_spec
+        cardinality = int(data.cardinality())
+
+        if cardinality >= 0 and x_spec.shape.rank == 3:
+            return cardinality
+
+    elif isinstance(data, Sized):
+        return len(data)
+
+    raise ValueError(
+        "Unable to infer the number of samples in the stream, pass num_samples "
+        "explicitly when streaming batched datasets or generators."
+    )
+
+
+def _allocate_output(
+    shape: Tuple[int, ...], dtype: str, output_dir: Optional[Path], name: str
+) -> np.ndarray:
+    if output_dir is None:
+        return np.zeros(shape, dtype=dtype)
+
+    output_dir.mkdir(parents=True, exist_ok=True)
+
+    return np.lib.format.open_memmap(
+        output_dir / f"{name}.npy", mode="w+", dtype=dtype, shape=shape
+    )
+
+
 class ARTYOLOV1ObjectDetector(ARTObjectDetector):
     def __init__(
         self,
@@ -328,18 +486,159 @@ class ARTYOLOV1ObjectDetector(ARTObjectDetector):
         x_tensor, y_tensor = self._decode_loss_gradient_input(
             x=x_preprocessed, y=y, standardise_output=standardise_output
         )
-        input_var = tf.Variable(x_tensor)
 
         with GradientTape() as tape:
-            tape.watch(input_var)
-            y_pred = self._model(input_var, training=False)
+            tape.watch(x_tensor)
+            y_pred = self._model(x_tensor, training=False)
             loss = self._model.loss(y_tensor, y_pred)
 
-        grads = tape.gradient(loss, input_var).numpy()
+        grads = tape.gradient(loss, x_tensor).numpy()
         grads = self._apply_preprocessing_gradient(x, grads)
 
         return grads
 
+    def predict_stream(
+        self,
+        data: Union[tf.data.Dataset, Iterable[Any]],
+        num_samples: Optional[int] = None,
+        batch_size: int = 16,
+        max_detections: Optional[int] = None,
+        standardise_output: bool = False,
+        output_dir: Optional[Union[str, Path]] = None,
+    ) -> Dict[str, np.ndarray]:
+        """Perform prediction over a stream of inputs in fixed-size micro-batches.
+
+        Args:
+            data: A :py:class:`tf.data.Dataset` or iterable that yields either single
+                images of shape (height, width, nb_channels) or batches of shape
+                (nb_samples, height, width, nb_channels). Elements may also be tuples
+                whose first item is the image or batch of images.
+            num_samples: The total number of samples in the stream. Only required if
+                it cannot be inferred from `data`.
+            batch_size: The number of samples passed to the model at a time.
+            max_detections: The number of detections kept for each image. If None,
+                one detection per grid cell is kept.
+            standardise_output: True if output should be standardised to PyTorch format.
+            output_dir: If provided, the outputs are written to memory-mapped `.npy`
+                files in this directory instead of being held in memory.
+
+        Returns:
+            A dictionary with the arrays `boxes` (nb_samples, max_detections, 4),
+            `labels` (nb_samples, max_detections), `scores`
+            (nb_samples, max_detections), and `num_detections` (nb_samples,), in the
+            same format as the outputs of :py:meth:`predict`.
+        """
+        num_samples = _infer_num_samples(data, num_samples=num_samples)
+        max_detections = max_detections or math.prod(
+            cast(YOLOV1ObjectDetector, self._model).output_grid_shape
+        )
+        output_dir = Path(output_dir) if output_dir is not None else None
+        outputs = {
+            "boxes": _allocate_output(
+                (num_samples, max_detections, 4), "float32", output_dir, "boxes"
+            ),
+            "labels": _allocate_output(
+                (num_samples, max_detections), "int64", output_dir, "labels"
+            ),
+            "scores": _allocate_output(
+                (num_samples, max_detections), "float32", output_dir, "scores"
+            ),
+            "num_detections": _allocate_output(
+                (num_samples,), "int32", output_dir, "num_detections"
+            ),
+        }
+        num_processed = 0
+
+        for x_batch, _ in _iter_micro_batches(data, batch_size=batch_size):
+            if num_processed + x_batch.shape[0] > num_samples:
+                raise ValueError(
+                    f"The stream yielded more than num_samples={num_samples} samples."
+                )
+
+            x_batch, _ = self._apply_preprocessing(x_batch, y=None, fit=False)
+            coord, conf, prob = self._model(
+                tf.convert_to_tensor(x_batch), training=False
+            )
+            boxes, scores, labels, num_detections = (
+                np.asarray(x)
+                for x in self._bounding_boxes_postprocessing.postprocess(
+                    bboxes_cell_xywh=coord, bboxes_conf=conf, bboxes_labels=prob
+                )
+            )
+            num_kept = min(boxes.shape[1], max_detections)
+            batch_slice = slice(num_processed, num_processed + x_batch.shape[0])
+
+            if standardise_output:
+                height, width = self.input_shape[:2]
+                boxes = boxes[..., [1, 0, 3, 2]] * np.array(
+                    [width, height, width, height], dtype="float32"
+                )
+                labels = labels + 1
+
+            outputs["boxes"][batch_slice, :num_kept] = boxes[:, :num_kept]
+            outputs["labels"][batch_slice, :num_kept] = labels[:, :num_kept]
+            outputs["scores"][batch_slice, :num_kept] = scores[:, :num_kept]
+            outputs["num_detections"][batch_slice] = np.minimum(
+                num_detections, max_detections
+            )
+            num_processed += x_batch.shape[0]
+
+        return {k: v[:num_processed] for k, v in outputs.items()}
+
+    def loss_gradient_stream(
+        self,
+        data: Union[tf.data.Dataset, Iterable[Any]],
+        num_samples: Optional[int] = None,
+        batch_size: int = 16,
+        standardise_output: bool = False,
+        output_dir: Optional[Union[str, Path]] = None,
+    ) -> np.ndarray:
+        """Compute the loss gradients over a stream of inputs in micro-batches.
+
+        The gradients of each micro-batch are rescaled so that the result matches a
+        single call to :py:meth:`loss_gradient` on the whole stream.
+
+        Args:
+            data: A :py:class:`tf.data.Dataset` or iterable that yields `(x, y)`
+                tuples, where `x` is a single image and `y` its target dictionary, or
+                `x` is a batch of images and `y` a list of target dictionaries or a
+                dictionary of batched arrays. The target dictionaries use the format
+                described in :py:meth:`loss_gradient`.
+            num_samples: The total number of samples in the stream. Only required if
+                it cannot be inferred from `data`.
+            batch_size: The number of samples passed to the model at a time.
+            standardise_output: True if `y` is provided in standardised PyTorch format.
+            output_dir: If provided, the gradients are written to a memory-mapped
+                `loss_gradients.npy` file in this directory instead of being held in
+                memory.
+
+        Returns:
+            Loss gradients of shape (nb_samples, height, width, nb_channels).
+        """
+        num_samples = _infer_num_samples(data, num_samples=num_samples)
+        output_dir = Path(output_dir) if output_dir is not None else None
+        grads = _allocate_output(
+            (num_samples, *self.input_shape), "float32", output_dir, "loss_gradients"
+        )
+        num_processed = 0
+
+        for x_batch, y_batch in _iter_micro_batches(data, batch_size=batch_size):
+            if y_batch is None:
+                raise ValueError("The stream must yield (x, y) tuples.")
+
+            if num_processed + x_batch.shape[0] > num_samples:
+                raise ValueError(
+                    f"The stream yielded more than num_samples={num_samples} samples."
+                )
+
+            batch_slice = slice(num_processed, num_processed + x_batch.shape[0])
+            grads[batch_slice] = self.loss_gradient(
+                x=x_batch, y=y_batch, standardise_output=standardise_output
+            ) * (x_batch.shape[0] / num_samples)
+            num_processed += x_batch.shape[0]
+
+        return grads[:num_processed]
+
     def _decode_loss_gradient_input(
         self, x: np.ndarray, y: List[Dict[str, np.ndarray]], standardise_output: bool
     ) -> Tuple[Tensor, Tuple[Tensor, Tensor, Tensor, Tensor]]:
@@ -14,12 +14,18 @@
 #
 # ACCESS THE FULL CC BY 4.0 LICENSE HERE:
 # https://creativecommons.org/licenses/by/4.0/legalcode
-from .augmentations import ObjectDetectionAugmentations
+from .augmentations import (
+    BatchedObjectDetectionAugmentations,
+    ObjectDetectionAugmentations,
+)
 from .imgaug_backend import ImgAugObjectDetectionAugmentations
+from .numpy_backend import NumpyObjectDetectionAugmentations
 from .passthrough import PassthroughObjectDetectionAugmentations
 
 __all__ = [
+    "BatchedObjectDetectionAugmentations",
     "ObjectDetectionAugmentations",
     "ImgAugObjectDetectionAugmentations",
+    "NumpyObjectDetectionAugmentations",
     "PassthroughObjectDetectionAugmentations",
 ]
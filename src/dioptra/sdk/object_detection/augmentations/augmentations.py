@@ -23,3 +23,9 @@ class ObjectDetectionAugmentations(metaclass=ABCMeta):
     @abstractmethod
     def augment(self, image, bounding_boxes, labels):
         raise NotImplementedError
+
+
+class BatchedObjectDetectionAugmentations(ObjectDetectionAugmentations):
+    @abstractmethod
+    def augment_batch(self, images, bounding_boxes, labels, seeds=None):
+        raise NotImplementedError
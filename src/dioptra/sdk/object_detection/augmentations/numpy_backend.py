@@ -0,0 +1,407 @@
+# This Software (Dioptra) is being made available as a public service by the
+# National Institute of Standards and Technology (NIST), an Agency of the United
+# States Department of Commerce. This software was developed in part by employees of
+# NIST and in part by NIST contractors. Copyright in portions of this software that
+# were developed by NIST contractors has been licensed or assigned to NIST. Pursuant
+# to Title 17 United States Code Section 105, works of NIST employees are not
+# subject to copyright protection in the United States. However, NIST may hold
+# international copyright in software created by its employees and domestic
+# copyright (or licensing rights) in portions of software that were assigned or
+# licensed to NIST. To the extent that NIST holds copyright in this software, it is
+# being made available under the Creative Commons Attribution 4.0 International
+# license (CC BY 4.0). The disclaimers of the CC BY 4.0 license apply to all parts
+# of the software developed or licensed by NIST.
+#
+# ACCESS THE FULL CC BY 4.0 LICENSE HERE:
+# https://creativecommons.org/licenses/by/4.0/legalcode
+from __future__ import annotations
+
+from typing import List, Optional, Tuple
+
+import numpy as np
+import numpy.typing as npt
+import structlog
+from structlog.stdlib import BoundLogger
+
+from .augmentations import BatchedObjectDetectionAugmentations
+
+LOGGER: BoundLogger = structlog.stdlib.get_logger()
+
+_NUM_GEOMETRIC_PARAMS: int = 6
+_NUM_PHOTOMETRIC_PARAMS: int = 3
+
+
+class NumpyObjectDetectionAugmentations(BatchedObjectDetectionAugmentations):
+    """Batch-level image and bounding box augmentations implemented with NumPy.
+
+    Geometric transforms (flips, scaling and translation) are restricted to
+    axis-aligned affine maps, which lets the boxes of a whole batch be transformed
+    as a single array operation and the images be resampled with one fancy-indexing
+    gather. Bounding boxes are passed as padded arrays of shape
+    `(batch_size, max_boxes, 4)` in normalized corner coordinates, and padding is
+    marked with a label of `-1`.
+
+    Every sample draws its parameters from its own random generator. The generators
+    are spawned from `seed`, or derived from the `seeds` passed to
+    :py:meth:`augment_batch`, so a sample's augmentation does not depend on the
+    other samples in its batch. Samples that lose all of their bounding boxes are
+    re-drawn at most `max_retries` times before falling back to the original,
+    unaugmented sample.
+    """
+
+    def __init__(
+        self,
+        image_dimensions: Tuple[int, int],
+        fliplr: float = 0.5,
+        flipud: float = 0.0,
+        scale: Tuple[float, float] = (1.0, 1.0),
+        translate_percent: Tuple[float, float] = (0.0, 0.0),
+        brightness: Tuple[float, float] = (1.0, 1.0),
+        contrast: Tuple[float, float] = (1.0, 1.0),
+        noise_scale: Tuple[float, float] = (0.0, 0.0),
+        min_visibility: float = 0.0,
+        max_retries: int = 10,
+        seed: Optional[int] = None,
+    ) -> None:
+        self._image_dimensions = image_dimensions
+        self._fliplr = fliplr
+        self._flipud = flipud
+        self._scale = scale
+        self._translate_percent = translate_percent
+        self._brightness = brightness
+        self._contrast = contrast
+        self._noise_scale = noise_scale
+        self._min_visibility = min_visibility
+        self._max_retries = max_retries
+        self._seed_sequence = np.random.SeedSequence(seed)
+
+    @classmethod
+    def use_minimal_augmenters(
+        cls, image_dimensions: Tuple[int, int], seed: Optional[int] = None
+    ) -> NumpyObjectDetectionAugmentations:
+        return cls(
+            image_dimensions=image_dimensions,
+            fliplr=0.5,
+            flipud=0.2,
+            brightness=(0.8, 1.2),
+            contrast=(0.75, 1.5),
+            seed=seed,
+        )
+
+    @classmethod
+    def use_light_augmenters(
+        cls, image_dimensions: Tuple[int, int], seed: Optional[int] = None
+    ) -> NumpyObjectDetectionAugmentations:
+        return cls(
+            image_dimensions=image_dimensions,
+            fliplr=0.5,
+            flipud=0.2,
+            scale=(0.8, 1.2),
+            translate_percent=(-0.2, 0.2),
+            brightness=(0.75, 1.5),
+            contrast=(0.75, 1.5),
+            noise_scale=(0.0, 0.05 * 255),
+            seed=seed,
+        )
+
+    @classmethod
+    def use_heavy_augmenters(
+        cls, image_dimensions: Tuple[int, int], seed: Optional[int] = None
+    ) -> NumpyObjectDetectionAugmentations:
+        return cls(
+            image_dimensions=image_dimensions,
+            fliplr=0.5,
+            flipud=0.2,
+            scale=(0.7, 1.3),
+            translate_percent=(-0.3, 0.3),
+            brightness=(0.5, 1.5),
+            contrast=(0.5, 2.0),
+            noise_scale=(0.0, 0.1 * 255),
+            min_visibility=0.1,
+            seed=seed,
+        )
+
+    @property
+    def image_height(self) -> int:
+        return self._image_dimensions[0]
+
+    @property
+    def image_width(self) -> int:
+        return self._image_dimensions[1]
+
+    @property
+    def max_retries(self) -> int:
+        return self._max_retries
+
+    def augment(
+        self, image: np.ndarray, bounding_boxes: np.ndarray, labels: np.ndarray
+    ):
+        augmented_images, augmented_bboxes, augmented_labels = self.augment_batch(
+            images=np.expand_dims(image, axis=0),
+            bounding_boxes=np.reshape(bounding_boxes, (1, -1, 4)),
+            labels=np.reshape(labels, (1, -1)),
+        )
+        keep: npt.NDArray = augmented_labels[0] >= 0
+
+        return (
+            augmented_images[0],
+            augmented_bboxes[0][keep],
+            augmented_labels[0][keep],
+        )
+
+    def augment_batch(
+        self,
+        images: np.ndarray,
+        bounding_boxes: np.ndarray,
+        labels: np.ndarray,
+        seeds: Optional[np.ndarray] = None,
+    ) -> tuple[npt.NDArray, npt.NDArray, npt.NDArray]:
+        images = np.asarray(images, dtype="float32")
+        bounding_boxes = np.asarray(bounding_boxes, dtype="float32")
+        labels = np.asarray(labels, dtype="int32")
+        rngs = self._create_generators(batch_size=len(images), seeds=seeds)
+
+        uniforms: npt.NDArray = np.stack(
+            [
+                rng.random(_NUM_GEOMETRIC_PARAMS + _NUM_PHOTOMETRIC_PARAMS)
+                for rng in rngs
+            ]
+        )
+        geometric_uniforms = uniforms[:, :_NUM_GEOMETRIC_PARAMS]
+        photometric_uniforms = uniforms[:, _NUM_GEOMETRIC_PARAMS:]
+
+        valid: npt.NDArray = labels >= 0
+        has_boxes: npt.NDArray = np.any(valid, axis=1)
+        geometric_params = self._to_geometric_params(geometric_uniforms)
+        bboxes, keep = self._prune_bounding_boxes(
+            self._transform_bounding_boxes(bounding_boxes, *geometric_params), valid
+        )
+
+        # Only the boxes are recomputed on retries, images are warped once at the end
+        retry = has_boxes & ~np.any(keep, axis=1)
+        num_retries = 0
+
+        while np.any(retry) and num_retries < self._max_retries:
+            retry_indices = np.flatnonzero(retry)
+            geometric_uniforms[retry_indices] = np.stack(
+                [rngs[idx].random(_NUM_GEOMETRIC_PARAMS) for idx in retry_indices]
+            )
+            geometric_params = self._to_geometric_params(geometric_uniforms)
+            retry_bboxes, retry_keep = self._prune_bounding_boxes(
+                self._transform_bounding_boxes(
+                    bounding_boxes[retry_indices],
+                    *(x[retry_indices] for x in geometric_params),
+                ),
+                valid[retry_indices],
+            )
+            bboxes[retry_indices] = retry_bboxes
+            keep[retry_indices] = retry_keep
+            retry = has_boxes & ~np.any(keep, axis=1)
+            num_retries += 1
+
+        photometric_params = self._to_photometric_params(photometric_uniforms)
+
+        if np.any(retry):
+            fallback_indices = np.flatnonzero(retry)
+            LOGGER.debug(
+                "Augmentation retries exhausted, using original samples",
+                num_samples=len(fallback_indices),
+                max_retries=self._max_retries,
+            )
+            geometric_params, photometric_params = self._set_identity_params(
+                indices=fallback_indices,
+                geometric_params=geometric_params,
+                photometric_params=photometric_params,
+            )
+            bboxes[fallback_indices] = bounding_boxes[fallback_indices]
+            keep[fallback_indices] = valid[fallback_indices]
+
+        augmented_images = self._warp_images(images, *geometric_params)
+        augmented_images = self._adjust_photometrics(
+            augmented_images, rngs, *photometric_params
+        )
+
+        return (
+            augmented_images.astype("float32"),
+            np.where(keep[..., None], bboxes, 0.0).astype("float32"),
+            np.where(keep, labels, -1).astype("int32"),
+        )
+
+    def _create_generators(
+        self, batch_size: int, seeds: Optional[np.ndarray] = None
+    ) -> List[np.random.Generator]:
+        if seeds is None:
+            return [
+                np.random.default_rng(x) for x in self._seed_sequence.spawn(batch_size)
+            ]
+
+        return [
+            np.random.default_rng([self._seed_sequence.entropy, int(x)])
+            for x in np.asarray(seeds).tolist()
+        ]
+
+    def _to_geometric_params(
+        self, uniforms: npt.NDArray
+    ) -> tuple[
+        npt.NDArray, npt.NDArray, npt.NDArray, npt.NDArray, npt.NDArray, npt.NDArray
+    ]:
+        flip_lr = uniforms[:, 0] < self._fliplr
+        flip_ud = uniforms[:, 1] < self._flipud
+        scale_x = self._scale_uniforms(uniforms[:, 2], self._scale)
+        scale_y = self._scale_uniforms(uniforms[:, 3], self._scale)
+        translate_x = self._scale_uniforms(uniforms[:, 4], self._translate_percent)
+        translate_y = self._scale_uniforms(uniforms[:, 5], self._translate_percent)
+
+        return flip_lr, flip_ud, scale_x, scale_y, translate_x, translate_y
+
+    def _to_photometric_params(
+        self, uniforms: npt.NDArray
+    ) -> tuple[npt.NDArray, npt.NDArray, npt.NDArray]:
+        brightness = self._scale_uniforms(uniforms[:, 0], self._brightness)
+        contrast = self._scale_uniforms(uniforms[:, 1], self._contrast)
+        noise_scale = self._scale_uniforms(uniforms[:, 2], self._noise_scale)
+
+        return brightness, contrast, noise_scale
+
+    def _transform_bounding_boxes(
+        self,
+        bboxes_corner: npt.NDArray,
+        flip_lr: npt.NDArray,
+        flip_ud: npt.NDArray,
+        scale_x: npt.NDArray,
+        scale_y: npt.NDArray,
+        translate_x: npt.NDArray,
+        translate_y: npt.NDArray,
+    ) -> npt.NDArray:
+        x = self._transform_coordinates(
+            bboxes_corner[..., 0::2], flip=flip_lr, scale=scale_x, translate=translate_x
+        )
+        y = self._transform_coordinates(
+            bboxes_corner[..., 1::2], flip=flip_ud, scale=scale_y, translate=translate_y
+        )
+
+        return np.stack(
+            [x.min(axis=-1), y.min(axis=-1), x.max(axis=-1), y.max(axis=-1)], axis=-1
+        )
+
+    def _prune_bounding_boxes(
+        self, bboxes_corner: npt.NDArray, valid: npt.NDArray
+    ) -> tuple[npt.NDArray, npt.NDArray]:
+        clipped_bboxes = np.clip(bboxes_corner, 0.0, 1.0)
+        area = (bboxes_corner[..., 2] - bboxes_corner[..., 0]) * (
+            bboxes_corner[..., 3] - bboxes_corner[..., 1]
+        )
+        clipped_width = clipped_bboxes[..., 2] - clipped_bboxes[..., 0]
+        clipped_height = clipped_bboxes[..., 3] - clipped_bboxes[..., 1]
+        keep = (
+            valid
+            & (clipped_width > 0)
+            & (clipped_height > 0)
+            & (clipped_width * clipped_height >= self._min_visibility * area)
+        )
+
+        return clipped_bboxes, keep
+
+    def _warp_images(
+        self,
+        images: npt.NDArray,
+        flip_lr: npt.NDArray,
+        flip_ud: npt.NDArray,
+        scale_x: npt.NDArray,
+        scale_y: npt.NDArray,
+        translate_x: npt.NDArray,
+        translate_y: npt.NDArray,
+    ) -> npt.NDArray:
+        batch_size, height, width = images.shape[:3]
+        rows, rows_valid = self._find_source_indices(
+            size=height, flip=flip_ud, scale=scale_y, translate=translate_y
+        )
+        cols, cols_valid = self._find_source_indices(
+            size=width, flip=flip_lr, scale=scale_x, translate=translate_x
+        )
+        warped_images: npt.NDArray = images[
+            np.arange(batch_size)[:, None, None], rows[:, :, None], cols[:, None, :]
+        ]
+        in_image = rows_valid[:, :, None] & cols_valid[:, None, :]
+
+        return np.where(
+            np.reshape(in_image, in_image.shape + (1,) * (images.ndim - 3)),
+            warped_images,
+            0.0,
+        )
+
+    def _adjust_photometrics(
+        self,
+        images: npt.NDArray,
+        rngs: List[np.random.Generator],
+        brightness: npt.NDArray,
+        contrast: npt.NDArray,
+        noise_scale: npt.NDArray,
+    ) -> npt.NDArray:
+        broadcast_shape = (-1,) + (1,) * (images.ndim - 1)
+        images = (images - 128.0) * np.reshape(contrast, broadcast_shape) + 128.0
+        images = images * np.reshape(brightness, broadcast_shape)
+
+        for idx in np.flatnonzero(noise_scale > 0).tolist():
+            images[idx] += noise_scale[idx] * rngs[idx].standard_normal(
+                images.shape[1:], dtype="float32"
+            )
+
+        return np.clip(images, 0.0, 255.0)
+
+    @staticmethod
+    def _find_source_indices(
+        size: int, flip: npt.NDArray, scale: npt.NDArray, translate: npt.NDArray
+    ) -> tuple[npt.NDArray, npt.NDArray]:
+        target = (np.arange(size, dtype="float32") + 0.5) / size
+        target = np.where(flip[:, None], 1.0 - target, target)
+        source = (target - 0.5) / scale[:, None] + 0.5 - translate[:, None]
+        indices = np.floor(source * size).astype("int64")
+        valid = (indices >= 0) & (indices < size)
+
+        return np.clip(indices, 0, size - 1), valid
+
+    @staticmethod
+    def _transform_coordinates(
+        coords: npt.NDArray,
+        flip: npt.NDArray,
+        scale: npt.NDArray,
+        translate: npt.NDArray,
+    ) -> npt.NDArray:
+        coords = (coords - 0.5 + translate[:, None, None]) * scale[:, None, None] + 0.5
+
+        return np.where(flip[:, None, None], 1.0 - coords, coords)
+
+    @staticmethod
+    def _scale_uniforms(
+        uniforms: npt.NDArray, value_range: Tuple[float, float]
+    ) -> npt.NDArray:
+        low, high = value_range
+
+        return (low + uniforms * (high - low)).astype("float32")
+
+    @staticmethod
+    def _set_identity_params(
+        indices: npt.NDArray,
+        geometric_params: tuple[npt.NDArray, ...],
+        photometric_params: tuple[npt.NDArray, ...],
+    ) -> tuple[tuple[npt.NDArray, ...], tuple[npt.NDArray, ...]]:
+        flip_lr, flip_ud, scale_x, scale_y, translate_x, translate_y = (
+            x.copy() for x in geometric_params
+        )
+        brightness, contrast, noise_scale = (x.copy() for x in photometric_params)
+
+        flip_lr[indices] = False
+        flip_ud[indices] = False
+        scale_x[indices] = 1.0
+        scale_y[indices] = 1.0
+        translate_x[indices] = 0.0
+        translate_y[indices] = 0.0
+        brightness[indices] = 1.0
+        contrast[indices] = 1.0
+        noise_scale[indices] = 0.0
+
+        return (
+            (flip_lr, flip_ud, scale_x, scale_y, translate_x, translate_y),
+            (brightness, contrast, noise_scale),
+        )
@@ -61,76 +61,38 @@ class NumpyBoundingBoxCoordinates(BoundingBoxCoordinates):
         )
 
     def find_no_obj_cell_ij(self, bboxes_cell_ij: npt.NDArray) -> npt.NDArray:
-        cell_ij_set: set[tuple[int, int]] = set(
-            [(i, j) for i in range(self.cell_nrow) for j in range(self.cell_ncol)]
+        bboxes_cell_ij = np.reshape(bboxes_cell_ij, (-1, 2))
+        cell_occupied: npt.NDArray = np.zeros(
+            shape=(self.cell_nrow, self.cell_ncol), dtype="bool"
         )
-        cell_ij_seen: set[tuple[int, int]] = set(
-            [(int(x[0]), int(x[1])) for x in bboxes_cell_ij.tolist()]
-        )
-        no_obj_cell_ij = sorted(list(cell_ij_set - cell_ij_seen))
+        cell_occupied[bboxes_cell_ij[:, 0], bboxes_cell_ij[:, 1]] = True
 
-        return np.array(no_obj_cell_ij, dtype="int32")
+        return np.argwhere(~cell_occupied).astype("int32")
 
     def find_bbox_cell_ij(
         self, x_center: npt.NDArray, y_center: npt.NDArray
     ) -> npt.NDArray:
-        cell_h: float = self.cell_height
-        cell_w: float = self.cell_width
-        max_i: int = self.cell_nrow
-        max_j: int = self.cell_ncol
-
-        i: npt.NDArray = np.min(
-            np.stack(
-                [
-                    (y_center / cell_h).astype("int32"),
-                    np.full(shape=y_center.shape, fill_value=max_i, dtype="int32"),
-                ],
-                axis=-1,
-            ),
-            axis=-1,
+        i: npt.NDArray = np.minimum(
+            (y_center / self.cell_height).astype("int32"), self.cell_nrow - 1
         )
-        j: npt.NDArray = np.min(
-            np.stack(
-                [
-                    (x_center / cell_w).astype("int32"),
-                    np.full(shape=x_center.shape, fill_value=max_j, dtype="int32"),
-                ],
-                axis=-1,
-            ),
-            axis=-1,
+        j: npt.NDArray = np.minimum(
+            (x_center / self.cell_width).astype("int32"), self.cell_ncol - 1
         )
 
-        bbox_cell_ij: npt.NDArray = np.stack([i, j], axis=-1).astype("int32")
-
-        return bbox_cell_ij
+        return np.stack([i, j], axis=-1).astype("int32")
 
     def find_bbox_cell_xy(
         self, x_center: npt.NDArray, y_center: npt.NDArray, bboxes_cell_ij: npt.NDArray
     ) -> tuple[npt.NDArray, npt.NDArray]:
-        cell_h: float = self.cell_height
-        cell_w: float = self.cell_width
-
-        cell_x: npt.NDArray = np.min(
-            np.stack(
-                [
-                    (x_center / cell_w).astype("float32")
-                    - bboxes_cell_ij[..., 1].astype("float32"),
-                    np.full(shape=x_center.shape, fill_value=1.0, dtype="float32"),
-                ],
-                axis=-1,
-            ),
-            axis=-1,
+        cell_x: npt.NDArray = np.minimum(
+            (x_center / self.cell_width).astype("float32")
+            - bboxes_cell_ij[..., 1].astype("float32"),
+            1.0,
         )
-        cell_y: npt.NDArray = np.min(
-            np.stack(
-                [
-                    (y_center / cell_h).astype("float32")
-                    - bboxes_cell_ij[..., 0].astype("float32"),
-                    np.full(shape=y_center.shape, fill_value=1.0, dtype="float32"),
-                ],
-                axis=-1,
-            ),
-            axis=-1,
+        cell_y: npt.NDArray = np.minimum(
+            (y_center / self.cell_height).astype("float32")
+            - bboxes_cell_ij[..., 0].astype("float32"),
+            1.0,
         )
 
         return cell_x, cell_y
@@ -262,49 +224,90 @@ class NumpyBoundingBoxesBatchedGrid(BoundingBoxesBatchedGrid):
     def embed(
         self, bboxes_corner: npt.NDArray, bboxes_labels: npt.NDArray, n_classes: int
     ) -> tuple[npt.NDArray, npt.NDArray, npt.NDArray, npt.NDArray]:
-        bboxes_cell_xywh_grid: npt.NDArray = np.zeros(
-            shape=(self.cell_nrow, self.cell_ncol, 4),
-            dtype="float32",
-        )
-        bboxes_labels_grid: npt.NDArray = np.zeros(
-            shape=(self.cell_nrow, self.cell_ncol, n_classes),
-            dtype="float32",
-        )
-        bboxes_object_mask: npt.NDArray = np.zeros(
-            shape=(self.cell_nrow, self.cell_ncol),
-            dtype="float32",
+        (
+            bboxes_cell_xywh_grid,
+            bboxes_labels_grid,
+            bboxes_object_mask,
+            bboxes_no_object_mask,
+        ) = self.embed_batch(
+            bboxes_corner=np.reshape(bboxes_corner, (1, -1, 4)),
+            bboxes_labels=np.reshape(bboxes_labels, (1, -1)),
+            n_classes=n_classes,
         )
-        bboxes_no_object_mask: npt.NDArray = np.ones(
-            shape=(self.cell_nrow, self.cell_ncol),
-            dtype="float32",
+
+        return (
+            bboxes_cell_xywh_grid[0],
+            bboxes_labels_grid[0],
+            bboxes_object_mask[0],
+            bboxes_no_object_mask[0],
         )
 
+    def embed_batch(
+        self,
+        bboxes_corner: npt.NDArray,
+        bboxes_labels: npt.NDArray,
+        n_classes: int,
+        bboxes_mask: npt.NDArray | None = None,
+    ) -> tuple[npt.NDArray, npt.NDArray, npt.NDArray, npt.NDArray]:
+        batch_size: int = int(np.shape(bboxes_corner)[0])
+        num_cells: int = self.cell_nrow * self.cell_ncol
+        bboxes_mask = bboxes_labels >= 0 if bboxes_mask is None else bboxes_mask
+
         bboxes_cell_xywh, bboxes_cell_ij = self._bbox_coord.from_corner_to_cell_xywh(
             bboxes_corner=bboxes_corner
         )
-        xywh, ij, labels = self._bbox_coord.apply_constraint_one_object_per_cell(
-            bboxes_cell_xywh=bboxes_cell_xywh,
-            bboxes_cell_ij=bboxes_cell_ij,
-            bboxes_labels=bboxes_labels,
+
+        # Flatten (batch, i, j) into a single cell index so that the one object per
+        # cell constraint is applied to the whole batch with one np.unique call
+        batch_indices = np.broadcast_to(
+            np.arange(batch_size, dtype="int64")[:, None], bboxes_mask.shape
+        )
+        cell_indices = (
+            batch_indices * num_cells
+            + bboxes_cell_ij[..., 0].astype("int64") * self.cell_ncol
+            + bboxes_cell_ij[..., 1].astype("int64")
         )
+        cell_indices, pruning_indices = np.unique(
+            cell_indices[bboxes_mask], return_index=True
+        )
+        xywh = bboxes_cell_xywh[bboxes_mask][pruning_indices]
+        labels = bboxes_labels[bboxes_mask][pruning_indices].astype("int64")
 
-        grid_i = np.transpose(ij)[0]
-        grid_j = np.transpose(ij)[1]
+        bboxes_cell_xywh_grid: npt.NDArray = np.zeros(
+            shape=(batch_size * num_cells, 4), dtype="float32"
+        )
+        bboxes_labels_grid: npt.NDArray = np.zeros(
+            shape=(batch_size * num_cells, n_classes), dtype="float32"
+        )
+        bboxes_object_mask: npt.NDArray = np.zeros(
+            shape=(batch_size * num_cells,), dtype="float32"
+        )
 
-        bboxes_cell_xywh_grid[grid_i, grid_j] = xywh
-        bboxes_labels_grid[grid_i, grid_j, labels] = 1.0
-        bboxes_object_mask[grid_i, grid_j] = 1.0
-        bboxes_no_object_mask[grid_i, grid_j] = 0.0
+        bboxes_cell_xywh_grid[cell_indices] = xywh
+        bboxes_labels_grid[cell_indices, labels] = 1.0
+        bboxes_object_mask[cell_indices] = 1.0
 
-        bboxes_cell_xywh_grid = np.expand_dims(bboxes_cell_xywh_grid, axis=-2)
+        grid_shape = (batch_size, self.cell_nrow, self.cell_ncol)
+        bboxes_object_mask = np.reshape(bboxes_object_mask, grid_shape)
 
         return (
-            bboxes_cell_xywh_grid,
-            bboxes_labels_grid,
+            np.reshape(bboxes_cell_xywh_grid, grid_shape + (1, 4)),
+            np.reshape(bboxes_labels_grid, grid_shape + (n_classes,)),
             bboxes_object_mask,
-            bboxes_no_object_mask,
+            1.0 - bboxes_object_mask,
         )
 
+    def extract_using_mask(
+        self,
+        bboxes_grid: npt.NDArray,
+        labels_grid: npt.NDArray,
+        cell_mask: npt.NDArray,
+    ) -> tuple[npt.NDArray, npt.NDArray, npt.NDArray]:
+        bboxes_cell_ij = np.argwhere(cell_mask)
+        cell_mask = cell_mask.astype("bool")
+
+        return bboxes_grid[cell_mask], bboxes_cell_ij, labels_grid[cell_mask]
+
     def from_corner_to_image_xywh(self, bboxes_corner: npt.NDArray) -> npt.NDArray:
         return self._bbox_coord.from_corner_to_image_xywh(bboxes_corner=bboxes_corner)
 
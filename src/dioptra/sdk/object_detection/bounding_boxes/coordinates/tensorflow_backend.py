@@ -106,33 +106,9 @@ class TensorflowBoundingBoxCoordinates(BoundingBoxCoordinates):
     def find_bbox_cell_ij(self, x_center: Tensor, y_center: Tensor) -> Tensor:
         cell_h = tf.cast(self.cell_height, tf.float32)
         cell_w = tf.cast(self.cell_width, tf.float32)
-        max_i = tf.cast(
-            tf.fill(dims=tf.shape(y_center), value=self.cell_nrow), tf.int32
-        )
-        max_j = tf.cast(
-            tf.fill(dims=tf.shape(x_center), value=self.cell_ncol), tf.int32
-        )
 
-        i = tf.reduce_min(
-            tf.stack(
-                [
-                    tf.cast(y_center / cell_h, tf.int32),
-                    max_i,
-                ],
-                axis=-1,
-            ),
-            axis=-1,
-        )
-        j = tf.reduce_min(
-            tf.stack(
-                [
-                    tf.cast(x_center / cell_w, tf.int32),
-                    max_j,
-                ],
-                axis=-1,
-            ),
-            axis=-1,
-        )
+        i = tf.minimum(tf.cast(y_center / cell_h, tf.int32), self.cell_nrow - 1)
+        j = tf.minimum(tf.cast(x_center / cell_w, tf.int32), self.cell_ncol - 1)
 
         return tf.cast(tf.stack([i, j], axis=-1), tf.int32)
 
@@ -149,30 +125,15 @@ class TensorflowBoundingBoxCoordinates(BoundingBoxCoordinates):
         cell_h = tf.cast(self.cell_height, tf.float32)
         cell_w = tf.cast(self.cell_width, tf.float32)
 
-        x_center_shape = tf.shape(x_center)
-        y_center_shape = tf.shape(y_center)
-
-        cell_x = tf.reduce_min(
-            tf.stack(
-                [
-                    tf.cast(x_center / cell_w, tf.float32)
-                    - tf.cast(bboxes_cell_ij[..., 1], tf.float32),
-                    tf.ones(shape=x_center_shape, dtype=tf.float32),
-                ],
-                axis=-1,
-            ),
-            axis=-1,
+        cell_x = tf.minimum(
+            tf.cast(x_center / cell_w, tf.float32)
+            - tf.cast(bboxes_cell_ij[..., 1], tf.float32),
+            1.0,
         )
-        cell_y = tf.reduce_min(
-            tf.stack(
-                [
-                    tf.cast(y_center / cell_h, tf.float32)
-                    - tf.cast(bboxes_cell_ij[..., 0], tf.float32),
-                    tf.ones(shape=y_center_shape, dtype=tf.float32),
-                ],
-                axis=-1,
-            ),
-            axis=-1,
+        cell_y = tf.minimum(
+            tf.cast(y_center / cell_h, tf.float32)
+            - tf.cast(bboxes_cell_ij[..., 0], tf.float32),
+            1.0,
         )
 
         return cell_x, cell_y
@@ -308,17 +269,13 @@ class TensorflowBoundingBoxCoordinates(BoundingBoxCoordinates):
     def _find_no_obj_cell_ij(
         self, bboxes_cell_ij: npt.NDArray, i_range: npt.NDArray, j_range: npt.NDArray
     ) -> npt.NDArray:
-        cell_ij_set: set[tuple[npt.ArrayLike, npt.ArrayLike]] = set(
-            [(i, j) for i in i_range for j in j_range]
-        )
-        cell_ij_seen: set[tuple[npt.ArrayLike, npt.ArrayLike]] = set(
-            [(x[0], x[1]) for x in bboxes_cell_ij.tolist()]
-        )
-        no_obj_cell_ij: list[tuple[npt.ArrayLike, npt.ArrayLike]] = sorted(
-            list(cell_ij_set - cell_ij_seen)
+        bboxes_cell_ij = np.reshape(bboxes_cell_ij, (-1, 2))
+        cell_occupied: npt.NDArray = np.zeros(
+            shape=(len(i_range), len(j_range)), dtype="bool"
         )
+        cell_occupied[bboxes_cell_ij[:, 0], bboxes_cell_ij[:, 1]] = True
 
-        return np.array(no_obj_cell_ij, dtype="int32")
+        return np.argwhere(~cell_occupied).astype("int32")
 
 
 class TensorflowBoundingBoxesBatchedGrid(BoundingBoxesBatchedGrid):
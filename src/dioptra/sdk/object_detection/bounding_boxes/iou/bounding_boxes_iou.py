@@ -34,6 +34,10 @@ class BoundingBoxesBatchedGridIOU(metaclass=ABCMeta):
     def max_iou(self, bboxes_cell_xywh1, bbox_cell_xywh2):
         raise NotImplementedError
 
+    @abstractmethod
+    def max_iou_mask(self, bboxes_cell_xywh, bboxes_cell_xywh_ground_truth):
+        raise NotImplementedError
+
     @abstractmethod
     def select_max_iou_bboxes(
         self, bboxes_cell_xywh, bboxes_conf, bboxes_cell_xywh_ground_truth
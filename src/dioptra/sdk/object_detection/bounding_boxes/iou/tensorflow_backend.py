@@ -16,8 +16,11 @@
 # https://creativecommons.org/licenses/by/4.0/legalcode
 from __future__ import annotations
 
+from functools import lru_cache
 from typing import Tuple
 
+import numpy as np
+import numpy.typing as npt
 import structlog
 from structlog.stdlib import BoundLogger
 
@@ -65,6 +68,38 @@ class TensorflowBoundingBoxesIOU(BoundingBoxesIOU):
         return intersection_area / union_area
 
 
+@lru_cache(maxsize=None)
+def _generate_grid_ij_indices(
+    grid_shape: Tuple[int, int]
+) -> Tuple[npt.NDArray, npt.NDArray]:
+    dim_i_indices, dim_j_indices = np.meshgrid(
+        np.arange(grid_shape[0], dtype="int32"),
+        np.arange(grid_shape[1], dtype="int32"),
+        indexing="ij",
+    )
+    dim_i_indices = dim_i_indices.reshape(-1, 1)
+    dim_j_indices = dim_j_indices.reshape(-1, 1)
+    dim_i_indices.flags.writeable = False
+    dim_j_indices.flags.writeable = False
+
+    return dim_i_indices, dim_j_indices
+
+
+@lru_cache(maxsize=None)
+def _generate_grid_cell_xy_offsets(
+    grid_shape: Tuple[int, int]
+) -> Tuple[npt.NDArray, npt.NDArray]:
+    dim_i_indices, dim_j_indices = _generate_grid_ij_indices(grid_shape)
+    cell_xy_offsets = np.concatenate([dim_j_indices, dim_i_indices], axis=-1)
+    cell_xy_offsets = cell_xy_offsets.reshape(1, grid_shape[0], grid_shape[1], 1, 2)
+    cell_xy_offsets = cell_xy_offsets.astype("float32")
+    num_cells_xy = np.array([grid_shape[1], grid_shape[0]], dtype="float32")
+    cell_xy_offsets.flags.writeable = False
+    num_cells_xy.flags.writeable = False
+
+    return cell_xy_offsets, num_cells_xy
+
+
 class TensorflowBoundingBoxesBatchedGridIOU(BoundingBoxesBatchedGridIOU):
     def __init__(
         self,
@@ -73,6 +108,10 @@ class TensorflowBoundingBoxesBatchedGridIOU(BoundingBoxesBatchedGridIOU):
     ) -> None:
         self._bounding_boxes_iou = bounding_boxes_iou
         self._bbox_batched_grid = bounding_boxes_batched_grid
+        self._grid_shape = (
+            bounding_boxes_batched_grid.cell_nrow,
+            bounding_boxes_batched_grid.cell_ncol,
+        )
 
     @classmethod
     def on_grid_shape(
@@ -94,7 +133,6 @@ class TensorflowBoundingBoxesBatchedGridIOU(BoundingBoxesBatchedGridIOU):
     def iou(self, bboxes_cell_xywh1: Tensor, bboxes_cell_xywh2: Tensor) -> Tensor:
         n_bounding_boxes1 = tf.cast(tf.shape(bboxes_cell_xywh1)[-2], tf.int32)
         n_bounding_boxes2 = tf.cast(tf.shape(bboxes_cell_xywh2)[-2], tf.int32)
-        max_n_bounding_boxes = tf.cast(n_bounding_boxes1 * n_bounding_boxes2, tf.int32)
 
         bboxes_corner1 = self._bbox_batched_grid.from_cell_xywh_to_corner(
             bboxes_cell_xywh=bboxes_cell_xywh1, n_bounding_boxes=n_bounding_boxes1
@@ -103,19 +141,14 @@ class TensorflowBoundingBoxesBatchedGridIOU(BoundingBoxesBatchedGridIOU):
             bboxes_cell_xywh=bboxes_cell_xywh2, n_bounding_boxes=n_bounding_boxes2
         )
 
-        tiled_bboxes_corner1 = tf.cond(
-            pred=tf.math.greater(max_n_bounding_boxes, n_bounding_boxes1),
-            true_fn=lambda: tf.tile(
-                bboxes_corner1, multiples=(1, 1, 1, n_bounding_boxes2, 1)
-            ),
-            false_fn=lambda: bboxes_corner1,
+        # Tiling by a multiple of 1 is a no-op, so the tiles are applied
+        # unconditionally. This avoids data-dependent control flow, which XLA cannot
+        # differentiate through.
+        tiled_bboxes_corner1 = tf.tile(
+            bboxes_corner1, multiples=(1, 1, 1, n_bounding_boxes2, 1)
         )
-        tiled_bboxes_corner2 = tf.cond(
-            pred=tf.math.greater(max_n_bounding_boxes, n_bounding_boxes2),
-            true_fn=lambda: tf.tile(
-                bboxes_corner2, multiples=(1, 1, 1, n_bounding_boxes1, 1)
-            ),
-            false_fn=lambda: bboxes_corner2,
+        tiled_bboxes_corner2 = tf.tile(
+            bboxes_corner2, multiples=(1, 1, 1, n_bounding_boxes1, 1)
         )
 
         return self._bounding_boxes_iou.iou(tiled_bboxes_corner1, tiled_bboxes_corner2)
@@ -131,6 +164,40 @@ class TensorflowBoundingBoxesBatchedGridIOU(BoundingBoxesBatchedGridIOU):
 
         return tf.reduce_max(iou_areas, axis=-1)
 
+    def max_iou_mask(
+        self, bboxes_cell_xywh: Tensor, bboxes_cell_xywh_ground_truth: Tensor
+    ) -> Tuple[Tensor, Tensor]:
+        # Broadcasts the ground truth against the predicted bounding boxes of each
+        # cell and returns the responsible bounding box as a one-hot mask, so unlike
+        # select_max_iou_bboxes no gather index tensors need to be built.
+        bboxes_corner = self._from_cell_xywh_to_corner(bboxes_cell_xywh)
+        bboxes_corner_ground_truth = self._from_cell_xywh_to_corner(
+            bboxes_cell_xywh_ground_truth
+        )
+
+        x1 = tf.maximum(bboxes_corner[..., 0], bboxes_corner_ground_truth[..., 0])
+        y1 = tf.maximum(bboxes_corner[..., 1], bboxes_corner_ground_truth[..., 1])
+        x2 = tf.minimum(bboxes_corner[..., 2], bboxes_corner_ground_truth[..., 2])
+        y2 = tf.minimum(bboxes_corner[..., 3], bboxes_corner_ground_truth[..., 3])
+
+        intersection_area = tf.maximum(0.0, (x2 - x1)) * tf.maximum(0.0, (y2 - y1))
+        bboxes_area = bboxes_cell_xywh[..., 2] * bboxes_cell_xywh[..., 3]
+        bboxes_area_ground_truth = (
+            bboxes_cell_xywh_ground_truth[..., 2]
+            * bboxes_cell_xywh_ground_truth[..., 3]
+        )
+        iou_areas = intersection_area / (
+            bboxes_area + bboxes_area_ground_truth - intersection_area
+        )
+
+        max_iou_mask = tf.one_hot(
+            tf.argmax(iou_areas, axis=-1, output_type=tf.int32),
+            depth=tf.shape(iou_areas)[-1],
+            dtype=iou_areas.dtype,
+        )
+
+        return tf.reduce_max(iou_areas, axis=-1), max_iou_mask
+
     @tf.function(
         input_signature=[
             tf.TensorSpec(None, tf.float32),
@@ -153,7 +220,9 @@ class TensorflowBoundingBoxesBatchedGridIOU(BoundingBoxesBatchedGridIOU):
             bboxes_cell_xywh=bboxes_cell_xywh_ground_truth, n_bounding_boxes=1
         )
 
-        iou_areas = self.iou(bboxes_corner, bboxes_corner_ground_truth)
+        iou_areas = self._bounding_boxes_iou.iou(
+            bboxes_corner, bboxes_corner_ground_truth
+        )
 
         batch_indices = self._generate_flattened_batch_indices(batch_size=batch_size)
         dim_i_indices = self._generate_flattened_dim_i_indices(batch_size=batch_size)
@@ -253,19 +322,9 @@ class TensorflowBoundingBoxesBatchedGridIOU(BoundingBoxesBatchedGridIOU):
         ]
     )
     def _generate_flattened_dim_i_indices(self, batch_size: Tensor) -> Tensor:
-        dim_i_indices = tf.transpose(
-            tf.tile(
-                tf.expand_dims(
-                    tf.range(self._bbox_batched_grid.cell_nrow, dtype=tf.int32), axis=0
-                ),
-                multiples=[self._bbox_batched_grid.cell_ncol, 1],
-            )
-        )
-        dim_i_indices = tf.reshape(
-            dim_i_indices,
-            (self._bbox_batched_grid.cell_nrow * self._bbox_batched_grid.cell_ncol, 1),
-        )
-        dim_i_indices = tf.broadcast_to(
+        dim_i_indices, _ = _generate_grid_ij_indices(self._grid_shape)
+
+        return tf.broadcast_to(
             dim_i_indices,
             shape=(
                 batch_size,
@@ -274,25 +333,15 @@ class TensorflowBoundingBoxesBatchedGridIOU(BoundingBoxesBatchedGridIOU):
             ),
         )
 
-        return tf.cast(dim_i_indices, tf.int32)
-
     @tf.function(
         input_signature=[
             tf.TensorSpec(None, tf.int32),
         ]
     )
     def _generate_flattened_dim_j_indices(self, batch_size: Tensor) -> Tensor:
-        dim_j_indices = tf.tile(
-            tf.expand_dims(
-                tf.range(self._bbox_batched_grid.cell_ncol, dtype=tf.int32), axis=0
-            ),
-            multiples=[self._bbox_batched_grid.cell_nrow, 1],
-        )
-        dim_j_indices = tf.reshape(
-            dim_j_indices,
-            (self._bbox_batched_grid.cell_nrow * self._bbox_batched_grid.cell_ncol, 1),
-        )
-        dim_j_indices = tf.broadcast_to(
+        _, dim_j_indices = _generate_grid_ij_indices(self._grid_shape)
+
+        return tf.broadcast_to(
             dim_j_indices,
             shape=(
                 batch_size,
@@ -301,8 +350,6 @@ class TensorflowBoundingBoxesBatchedGridIOU(BoundingBoxesBatchedGridIOU):
             ),
         )
 
-        return tf.cast(dim_j_indices, tf.int32)
-
     @tf.function(
         input_signature=[
             tf.TensorSpec(None, tf.int32),
@@ -356,3 +403,13 @@ class TensorflowBoundingBoxesBatchedGridIOU(BoundingBoxesBatchedGridIOU):
         return tf.concat(
             [batch_indices, dim_i_indices, dim_j_indices, bbox_indices], axis=2
         )
+
+    def _from_cell_xywh_to_corner(self, bboxes_cell_xywh: Tensor) -> Tensor:
+        cell_xy_offsets, num_cells_xy = _generate_grid_cell_xy_offsets(self._grid_shape)
+        bboxes_image_xy = (bboxes_cell_xywh[..., :2] + cell_xy_offsets) / num_cells_xy
+        bboxes_half_wh = bboxes_cell_xywh[..., 2:4] / 2
+
+        return tf.concat(
+            [bboxes_image_xy - bboxes_half_wh, bboxes_image_xy + bboxes_half_wh],
+            axis=-1,
+        )
@@ -19,15 +19,19 @@ from __future__ import annotations
 from pathlib import Path
 from typing import Callable, Iterable, List, Optional, Sequence, Tuple, cast
 
+import numpy.typing as npt
 import structlog
 from structlog.stdlib import BoundLogger
 
 from dioptra.sdk.object_detection.augmentations import (
+    BatchedObjectDetectionAugmentations,
     ImgAugObjectDetectionAugmentations,
+    NumpyObjectDetectionAugmentations,
     ObjectDetectionAugmentations,
     PassthroughObjectDetectionAugmentations,
 )
 from dioptra.sdk.object_detection.bounding_boxes import (
+    NumpyBoundingBoxesBatchedGrid,
     TensorflowBoundingBoxesBatchedGrid,
 )
 
@@ -96,6 +100,7 @@ class TensorflowObjectDetectionData(ObjectDetectionData):
         self._validation_images_filepaths: list[str] | None = None
         self._testing_annotations_filepaths: list[str] | None = None
         self._testing_images_filepaths: list[str] | None = None
+        self._numpy_batched_grid: NumpyBoundingBoxesBatchedGrid | None = None
 
     @classmethod
     def create(
@@ -126,7 +131,7 @@ class TensorflowObjectDetectionData(ObjectDetectionData):
             ),
         )
         augmentations_registry: dict[
-            str, Callable[[], ImgAugObjectDetectionAugmentations]
+            str, Callable[[], ObjectDetectionAugmentations]
         ] = dict(
             imgaug_heavy=(
                 lambda: ImgAugObjectDetectionAugmentations.use_heavy_augmenters(
@@ -143,6 +148,21 @@ class TensorflowObjectDetectionData(ObjectDetectionData):
                     image_dimensions=image_dimensions[:2], seed=augmentations_seed
                 )
             ),
+            numpy_heavy=(
+                lambda: NumpyObjectDetectionAugmentations.use_heavy_augmenters(
+                    image_dimensions=image_dimensions[:2], seed=augmentations_seed
+                )
+            ),
+            numpy_light=(
+                lambda: NumpyObjectDetectionAugmentations.use_light_augmenters(
+                    image_dimensions=image_dimensions[:2], seed=augmentations_seed
+                )
+            ),
+            numpy_minimal=(
+                lambda: NumpyObjectDetectionAugmentations.use_minimal_augmenters(
+                    image_dimensions=image_dimensions[:2], seed=augmentations_seed
+                )
+            ),
         )
 
         annotation_data_object = annotation_data_registry[annotation_format]()
@@ -208,10 +228,21 @@ class TensorflowObjectDetectionData(ObjectDetectionData):
             seed=self._seed,
             skip=not self._shuffle_training_data,
         )
-        dataset = self.map_apply(
-            dataset, map_fn=self.load_xy_data_factory(training=True)
-        )
-        dataset = self.batch(dataset, batch_size=self._batch_size)
+
+        if self._batch_size is not None and isinstance(
+            self.augmentations, BatchedObjectDetectionAugmentations
+        ):
+            dataset = self.map_apply(dataset, map_fn=self.load_xyl_data)
+            dataset = self.padded_batch(dataset, batch_size=self._batch_size)
+            dataset = self.map_apply(dataset, map_fn=self.augment_batch_data)
+            dataset = self.map_apply(dataset, map_fn=self.embed_padded_bounding_boxes)
+
+        else:
+            dataset = self.map_apply(
+                dataset, map_fn=self.load_xy_data_factory(training=True)
+            )
+            dataset = self.batch(dataset, batch_size=self._batch_size)
+
         dataset = self.map_apply(dataset, map_fn=self._pack_y_elements)
         dataset = self.prefetch(dataset)
 
@@ -383,6 +414,20 @@ class TensorflowObjectDetectionData(ObjectDetectionData):
             ),
         )
 
+    def augment_batch_data(
+        self, images: Tensor, bboxes: Tensor, labels: Tensor
+    ) -> tuple[Tensor, Tensor, Tensor]:
+        augmented_images, augmented_bboxes, augmented_labels = tf.numpy_function(
+            cast(BatchedObjectDetectionAugmentations, self.augmentations).augment_batch,
+            [images, bboxes, labels],
+            [tf.float32, tf.float32, tf.int32],
+        )
+        augmented_images.set_shape(images.shape)
+        augmented_bboxes.set_shape(bboxes.shape)
+        augmented_labels.set_shape(labels.shape)
+
+        return augmented_images, augmented_bboxes, augmented_labels
+
     @tf.function(
         input_signature=[
             tf.TensorSpec(None, tf.float32),
@@ -420,6 +465,40 @@ class TensorflowObjectDetectionData(ObjectDetectionData):
             tf.numpy_function(self._annotation_data.get, [y], [tf.float32, tf.int32]),
         )
 
+    def embed_padded_bounding_boxes(
+        self, images: Tensor, bboxes: Tensor, labels: Tensor
+    ) -> tuple[Tensor, Tensor, Tensor, Tensor, Tensor]:
+        (
+            bboxes_cell_xywh_grid,
+            bboxes_labels_grid,
+            bboxes_object_mask,
+            bboxes_no_object_mask,
+        ) = tf.numpy_function(
+            self._embed_padded_bounding_boxes,
+            [bboxes, labels],
+            [tf.float32, tf.float32, tf.float32, tf.float32],
+        )
+
+        return (
+            images,
+            bboxes_cell_xywh_grid,
+            bboxes_labels_grid,
+            bboxes_object_mask,
+            bboxes_no_object_mask,
+        )
+
+    @tf.function(
+        input_signature=[
+            tf.TensorSpec(None, tf.string),
+            tf.TensorSpec(None, tf.string),
+        ]
+    )
+    def load_xyl_data(self, x: Tensor, y: Tensor) -> tuple[Tensor, Tensor, Tensor]:
+        image = tf.ensure_shape(self.load_image(x), self._image_dimensions)
+        bboxes, labels = self.load_annotations(y)
+
+        return image, tf.reshape(bboxes, (-1, 4)), tf.reshape(labels, (-1,))
+
     def load_xy_data_factory(
         self, training: bool = False
     ) -> Callable[[Tensor, Tensor], tuple[Tensor, Tensor, Tensor, Tensor, Tensor]]:
@@ -446,6 +525,18 @@ class TensorflowObjectDetectionData(ObjectDetectionData):
             load_xy_data,
         )
 
+    def _embed_padded_bounding_boxes(
+        self, bboxes: npt.NDArray, labels: npt.NDArray
+    ) -> tuple[npt.NDArray, npt.NDArray, npt.NDArray, npt.NDArray]:
+        if self._numpy_batched_grid is None:
+            self._numpy_batched_grid = NumpyBoundingBoxesBatchedGrid.on_grid_shape(
+                grid_shape=self._grid_shape
+            )
+
+        return self._numpy_batched_grid.embed_batch(
+            bboxes_corner=bboxes, bboxes_labels=labels, n_classes=self.n_classes
+        )
+
     def _load_xy_data(
         self, x: Tensor, y: Tensor, training: bool = False
     ) -> Tuple[Tensor, Tensor, Tensor, Tensor, Tensor]:
@@ -524,6 +615,21 @@ class TensorflowObjectDetectionData(ObjectDetectionData):
     ) -> Dataset:
         return dataset.map(map_fn)
 
+    @staticmethod
+    def padded_batch(dataset: Dataset, batch_size: Optional[int] = None) -> Dataset:
+        if batch_size is None:
+            return dataset
+
+        return dataset.padded_batch(
+            batch_size,
+            padded_shapes=([None, None, None], [None, 4], [None]),
+            padding_values=(
+                tf.constant(0, dtype=tf.float32),
+                tf.constant(0, dtype=tf.float32),
+                tf.constant(-1, dtype=tf.int32),
+            ),
+        )
+
     @staticmethod
     def prefetch(dataset: Dataset) -> Dataset:
         autotune = tf.data.AUTOTUNE
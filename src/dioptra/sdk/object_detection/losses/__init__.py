@@ -14,6 +14,6 @@
 #
 # ACCESS THE FULL CC BY 4.0 LICENSE HERE:
 # https://creativecommons.org/licenses/by/4.0/legalcode
-from .yolov1 import YOLOV1Loss
+from .yolov1 import YOLOV1FusedLoss, YOLOV1Loss
 
-__all__ = ["YOLOV1Loss"]
+__all__ = ["YOLOV1FusedLoss", "YOLOV1Loss"]
@@ -15,7 +15,13 @@
 # ACCESS THE FULL CC BY 4.0 LICENSE HERE:
 # https://creativecommons.org/licenses/by/4.0/legalcode
 from .classification import YOLOV1ClassificationLoss
+from .fused import YOLOV1FusedLoss
 from .localization import YOLOV1LocalizationLoss
 from .yolov1 import YOLOV1Loss
 
-__all__ = ["YOLOV1ClassificationLoss", "YOLOV1LocalizationLoss", "YOLOV1Loss"]
+__all__ = [
+    "YOLOV1ClassificationLoss",
+    "YOLOV1FusedLoss",
+    "YOLOV1LocalizationLoss",
+    "YOLOV1Loss",
+]
@@ -26,7 +26,7 @@ LOGGER: BoundLogger = structlog.stdlib.get_logger()
 try:
     import tensorflow as tf
     from tensorflow import Tensor
-    from tensorflow.keras.losses import BinaryCrossentropy, CategoricalCrossentropy
+    from tensorflow.keras.losses import binary_crossentropy, categorical_crossentropy
 
 except ImportError:  # pragma: nocover
     LOGGER.warn(
@@ -54,12 +54,11 @@ class YOLOV1ClassificationLoss(object):
         self._labels_weight = labels_weight
         self._loss_type = loss_type
         self._compute_labels_loss = self._get_loss_fn(loss_type=loss_type)
-        self._binary_crossentropy = BinaryCrossentropy(
-            reduction=tf.keras.losses.Reduction.NONE
-        )
-        self._categorical_crossentropy = CategoricalCrossentropy(
-            reduction=tf.keras.losses.Reduction.NONE
-        )
+        # The functional forms are used instead of the Loss classes because the
+        # classes insert rank-dependent conditionals that XLA cannot compile when
+        # the input ranks are unknown.
+        self._binary_crossentropy = binary_crossentropy
+        self._categorical_crossentropy = categorical_crossentropy
 
     def __call__(self, *args, **kwargs) -> Tensor:
         return self.call(*args, **kwargs)
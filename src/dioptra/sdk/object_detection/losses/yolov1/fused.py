@@ -0,0 +1,246 @@
+# This Software (Dioptra) is being made available as a public service by the
+# National Institute of Standards and Technology (NIST), an Agency of the United
+# States Department of Commerce. This software was developed in part by employees of
+# NIST and in part by NIST contractors. Copyright in portions of this software that
+# were developed by NIST contractors has been licensed or assigned to NIST. Pursuant
+# to Title 17 United States Code Section 105, works of NIST employees are not
+# subject to copyright protection in the United States. However, NIST may hold
+# international copyright in software created by its employees and domestic
+# copyright (or licensing rights) in portions of software that were assigned or
+# licensed to NIST. To the extent that NIST holds copyright in this software, it is
+# being made available under the Creative Commons Attribution 4.0 International
+# license (CC BY 4.0). The disclaimers of the CC BY 4.0 license apply to all parts
+# of the software developed or licensed by NIST.
+#
+# ACCESS THE FULL CC BY 4.0 LICENSE HERE:
+# https://creativecommons.org/licenses/by/4.0/legalcode
+from __future__ import annotations
+
+from typing import Callable
+
+import structlog
+from structlog.stdlib import BoundLogger
+
+from dioptra.sdk.object_detection.bounding_boxes.iou import (
+    TensorflowBoundingBoxesBatchedGridIOU,
+)
+
+LOGGER: BoundLogger = structlog.stdlib.get_logger()
+
+try:
+    import tensorflow as tf
+    from tensorflow import Tensor
+    from tensorflow.keras.losses import (
+        Loss,
+        binary_crossentropy,
+        categorical_crossentropy,
+    )
+
+except ImportError:  # pragma: nocover
+    LOGGER.warn(
+        "Unable to import one or more optional packages, functionality may be reduced",
+        package="tensorflow",
+    )
+
+GRID_AXES = (1, 2)
+GRID_BBOXES_AXES = (1, 2, 3)
+
+
+class YOLOV1FusedLoss(Loss):
+    """A single-pass implementation of :py:class:`~.YOLOV1Loss`.
+
+    The responsible bounding boxes are selected with a one-hot mask computed by
+    :py:meth:`~TensorflowBoundingBoxesBatchedGridIOU.max_iou_mask` and all of the
+    loss terms are reduced with broadcast masks, so no gather indices are built and
+    the object counts are computed once per step. The arguments and the computed
+    loss are the same as for :py:class:`~.YOLOV1Loss`.
+    """
+
+    def __init__(
+        self,
+        bbox_grid_iou: TensorflowBoundingBoxesBatchedGridIOU,
+        coord_weight: float = 5.0,
+        object_weight: float = 5.0,
+        no_object_weight: float = 1.0,
+        labels_weight: float = 1.0,
+        wh_loss_type: str = "sq_relative_diff",
+        classification_loss_type: str = "categorical_crossentropy",
+        name: str = "yolov1_fused_loss",
+        **kwargs,
+    ) -> None:
+        super().__init__(name=name, **kwargs)
+        self._bbox_grid_iou = bbox_grid_iou
+        self._coord_weight = coord_weight
+        self._object_weight = object_weight
+        self._no_object_weight = no_object_weight
+        self._labels_weight = labels_weight
+        self._wh_loss_type = wh_loss_type
+        self._classification_loss_type = classification_loss_type
+        self._compute_wh_sse = self._get_wh_sse_fn(wh_loss_type=wh_loss_type)
+        self._compute_labels_loss = self._get_labels_loss_fn(
+            loss_type=classification_loss_type
+        )
+
+    def call(self, y_true, y_pred):
+        true_bboxes_cell_xywh = tf.cast(y_true[0], tf.float32)
+        true_labels = tf.cast(y_true[1], tf.float32)
+        true_object = tf.cast(y_true[2], tf.float32)
+        true_no_object = tf.cast(y_true[3], tf.float32)
+
+        pred_bboxes_cell_xywh = tf.cast(y_pred[0], tf.float32)
+        pred_object_conf = tf.cast(y_pred[1], tf.float32)
+        pred_labels = tf.cast(y_pred[2], tf.float32)
+
+        max_iou, responsible_mask = self._bbox_grid_iou.max_iou_mask(
+            bboxes_cell_xywh=pred_bboxes_cell_xywh,
+            bboxes_cell_xywh_ground_truth=true_bboxes_cell_xywh,
+        )
+        n_bounding_boxes = tf.cast(tf.shape(pred_object_conf)[-1], tf.float32)
+        num_obj = tf.reduce_sum(tf.cast(true_object > 0, tf.float32), axis=GRID_AXES)
+        num_no_obj = tf.reduce_sum(
+            tf.cast(true_no_object > 0, tf.float32), axis=GRID_AXES
+        )
+
+        # Reduce the predictions of the responsible bounding boxes to one per cell
+        responsible_pred_bboxes_cell_xywh = tf.reduce_sum(
+            tf.expand_dims(responsible_mask, axis=-1) * pred_bboxes_cell_xywh,
+            axis=-2,
+        )
+        responsible_pred_object_conf = tf.reduce_sum(
+            responsible_mask * pred_object_conf, axis=-1
+        )
+        true_bboxes_cell_xywh = tf.squeeze(true_bboxes_cell_xywh, axis=-2)
+
+        # Compute xy and wh losses
+        sse_xy = tf.reduce_sum(
+            tf.square(
+                true_bboxes_cell_xywh[..., :2]
+                - responsible_pred_bboxes_cell_xywh[..., :2]
+            ),
+            axis=-1,
+        )
+        sse_wh = self._compute_wh_sse(
+            true_bboxes_cell_wh=true_bboxes_cell_xywh[..., 2:],
+            pred_bboxes_cell_wh=responsible_pred_bboxes_cell_xywh[..., 2:],
+        )
+        coord_loss = (
+            tf.reduce_sum(true_object * (sse_xy + sse_wh), axis=GRID_AXES)
+            / (num_obj + 1e-6)
+            / 2
+        )
+
+        # Compute obj. loss
+        obj_loss = (
+            tf.reduce_sum(
+                true_object
+                * tf.square(max_iou * true_object - responsible_pred_object_conf),
+                axis=GRID_AXES,
+            )
+            / (num_obj + 1e-6)
+            / 2
+        )
+
+        # Compute no obj. loss over the bounding boxes in cells without an object
+        # and the bounding boxes in cells with an object that are not responsible
+        # for prediction
+        sq_pred_object_conf = tf.square(pred_object_conf)
+        no_obj_loss = (
+            tf.reduce_sum(
+                (
+                    tf.expand_dims(true_no_object, axis=-1)
+                    + tf.expand_dims(true_object, axis=-1) * (1.0 - responsible_mask)
+                )
+                * sq_pred_object_conf,
+                axis=GRID_BBOXES_AXES,
+            )
+            / ((n_bounding_boxes - 1) * num_obj + n_bounding_boxes * num_no_obj + 1e-6)
+            / 2
+        )
+
+        # Compute classification loss
+        labels_loss = tf.reduce_sum(
+            true_object
+            * self._compute_labels_loss(
+                true_labels=true_labels, pred_labels=pred_labels
+            ),
+            axis=GRID_AXES,
+        ) / (num_obj + 1e-6)
+
+        return (
+            self._coord_weight * coord_loss
+            + self._object_weight * obj_loss
+            + self._no_object_weight * no_obj_loss
+            + self._labels_weight * labels_loss
+        )
+
+    @staticmethod
+    def _compute_wh_square_relative_diff_sse(
+        true_bboxes_cell_wh: Tensor, pred_bboxes_cell_wh: Tensor
+    ) -> Tensor:
+        return tf.reduce_sum(
+            tf.square(
+                (true_bboxes_cell_wh - pred_bboxes_cell_wh)
+                / (true_bboxes_cell_wh + 1e-6)
+            ),
+            axis=-1,
+        )
+
+    @staticmethod
+    def _compute_wh_square_diff_sqrt_sse(
+        true_bboxes_cell_wh: Tensor, pred_bboxes_cell_wh: Tensor
+    ) -> Tensor:
+        return tf.reduce_sum(
+            tf.square(tf.sqrt(true_bboxes_cell_wh) - tf.sqrt(pred_bboxes_cell_wh)),
+            axis=-1,
+        )
+
+    @staticmethod
+    def _compute_original_labels_loss(
+        true_labels: Tensor, pred_labels: Tensor
+    ) -> Tensor:
+        return tf.reduce_sum(tf.square(true_labels - pred_labels), axis=-1)
+
+    @staticmethod
+    def _compute_categorical_crossentropy_labels_loss(
+        true_labels: Tensor, pred_labels: Tensor
+    ) -> Tensor:
+        return categorical_crossentropy(y_true=true_labels, y_pred=pred_labels)
+
+    @staticmethod
+    def _compute_binary_crossentropy_labels_loss(
+        true_labels: Tensor, pred_labels: Tensor
+    ) -> Tensor:
+        return binary_crossentropy(y_true=true_labels, y_pred=pred_labels)
+
+    def _get_wh_sse_fn(self, wh_loss_type: str) -> Callable[..., Tensor]:
+        wh_sse_fn_registry: dict[str, Callable[..., Tensor]] = {
+            "sq_relative_diff": self._compute_wh_square_relative_diff_sse,
+            "sq_diff_sqrt": self._compute_wh_square_diff_sqrt_sse,
+        }
+        wh_sse_fn: Callable[..., Tensor] | None = wh_sse_fn_registry.get(wh_loss_type)
+
+        if wh_sse_fn is None:
+            raise KeyError(
+                f"The wh loss type '{wh_loss_type}' is not supported. The following "
+                f"types are currently available: {list(wh_sse_fn_registry.keys())}"
+            )
+
+        return wh_sse_fn
+
+    def _get_labels_loss_fn(self, loss_type: str) -> Callable[..., Tensor]:
+        loss_fn_registry: dict[str, Callable[..., Tensor]] = {
+            "categorical_crossentropy": (
+                self._compute_categorical_crossentropy_labels_loss
+            ),
+            "binary_crossentropy": self._compute_binary_crossentropy_labels_loss,
+            "original": self._compute_original_labels_loss,
+        }
+        loss_fn: Callable[..., Tensor] | None = loss_fn_registry.get(loss_type)
+
+        if loss_fn is None:
+            raise KeyError(
+                f"The loss type '{loss_type}' is not supported. The following types "
+                f"are currently available: {list(loss_fn_registry.keys())}"
+            )
+
+        return loss_fn
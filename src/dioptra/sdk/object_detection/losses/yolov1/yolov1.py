@@ -80,9 +80,11 @@ class YOLOV1Loss(Loss):
         true_object = y_true[2]
         true_no_object = y_true[3]
 
-        pred_bboxes_cell_xywh = y_pred[0]
-        pred_object_conf = y_pred[1]
-        pred_labels = y_pred[2]
+        # Mixed precision models emit float32 outputs, but cast anyway so that the
+        # loss is always reduced in full precision.
+        pred_bboxes_cell_xywh = tf.cast(y_pred[0], tf.float32)
+        pred_object_conf = tf.cast(y_pred[1], tf.float32)
+        pred_labels = tf.cast(y_pred[2], tf.float32)
 
         (
             responsible_pred_bboxes_cell_xywh,
@@ -0,0 +1,164 @@
+# This Software (Dioptra) is being made available as a public service by the
+# National Institute of Standards and Technology (NIST), an Agency of the United
+# States Department of Commerce. This software was developed in part by employees of
+# NIST and in part by NIST contractors. Copyright in portions of this software that
+# were developed by NIST contractors has been licensed or assigned to NIST. Pursuant
+# to Title 17 United States Code Section 105, works of NIST employees are not
+# subject to copyright protection in the United States. However, NIST may hold
+# international copyright in software created by its employees and domestic
+# copyright (or licensing rights) in portions of software that were assigned or
+# licensed to NIST. To the extent that NIST holds copyright in this software, it is
+# being made available under the Creative Commons Attribution 4.0 International
+# license (CC BY 4.0). The disclaimers of the CC BY 4.0 license apply to all parts
+# of the software developed or licensed by NIST.
+#
+# ACCESS THE FULL CC BY 4.0 LICENSE HERE:
+# https://creativecommons.org/licenses/by/4.0/legalcode
+"""A gzip writer that compresses blocks of the output stream in parallel."""
+from __future__ import annotations
+
+import gzip
+import os
+from collections import deque
+from concurrent.futures import Future, ThreadPoolExecutor
+from pathlib import Path
+from types import TracebackType
+from typing import IO, Deque, Optional, Type, Union
+
+DEFAULT_BLOCK_SIZE = 1 << 20
+
+
+class ParallelGzipWriter(object):
+    """A writable binary stream that gzip-compresses its data using multiple threads.
+
+    Written data is split into fixed-size blocks, and each block is compressed into a
+    separate gzip member on a thread pool. The compressed members are written to the
+    output in order. A concatenation of gzip members is itself a valid gzip file, so the
+    output can be read by :py:mod:`gzip`, :py:mod:`tarfile`, and the command line
+    `gunzip` utility without any changes. :py:mod:`zlib` releases the GIL while it
+    compresses, so the blocks are compressed concurrently.
+
+    Args:
+        file: A path or a writable binary file object for the compressed output. A file
+            object is not closed when the writer is closed.
+        compresslevel: The gzip compression level, from `0` (no compression) to `9`
+            (best compression). The default is `9`.
+        num_threads: The number of compression threads. If `None`, the number of CPUs
+            is used. If `1`, the blocks are compressed on the calling thread.
+        block_size: The number of uncompressed bytes in each gzip member. The default
+            is 1 MiB.
+    """
+
+    def __init__(
+        self,
+        file: Union[str, Path, IO[bytes]],
+        compresslevel: int = 9,
+        num_threads: Optional[int] = None,
+        block_size: int = DEFAULT_BLOCK_SIZE,
+    ) -> None:
+        if num_threads is None:
+            num_threads = os.cpu_count() or 1
+
+        if num_threads < 1:
+            raise ValueError(f"num_threads must be at least 1, got {num_threads!r}.")
+
+        if block_size < 1:
+            raise ValueError(f"block_size must be positive, got {block_size!r}.")
+
+        self._owns_file = isinstance(file, (str, Path))
+        self._file: IO[bytes] = (
+            open(file, "wb") if isinstance(file, (str, Path)) else file
+        )
+        self._compresslevel = compresslevel
+        self._block_size = block_size
+        self._max_pending = 2 * num_threads
+        self._executor: Optional[ThreadPoolExecutor] = (
+            ThreadPoolExecutor(max_workers=num_threads) if num_threads > 1 else None
+        )
+        self._pending: Deque[Future] = deque()
+        self._buffer = bytearray()
+        self._closed = False
+
+    @property
+    def closed(self) -> bool:
+        """Whether the writer has been closed."""
+        return self._closed
+
+    def writable(self) -> bool:
+        return True
+
+    def write(self, data: bytes) -> int:
+        """Writes uncompressed data to the stream.
+
+        Args:
+            data: The bytes to compress.
+
+        Returns:
+            The number of bytes written.
+        """
+        if self._closed:
+            raise ValueError("I/O operation on closed ParallelGzipWriter.")
+
+        self._buffer += data
+
+        while len(self._buffer) >= self._block_size:
+            block = bytes(self._buffer[: self._block_size])
+            del self._buffer[: self._block_size]
+            self._submit(block)
+
+        return len(data)
+
+    def flush(self) -> None:
+        """Compresses any buffered data and writes all pending blocks to the output."""
+        if self._buffer:
+            self._submit(bytes(self._buffer))
+            self._buffer.clear()
+
+        while self._pending:
+            self._file.write(self._pending.popleft().result())
+
+        self._file.flush()
+
+    def close(self) -> None:
+        """Flushes the stream and releases the compression threads."""
+        if self._closed:
+            return None
+
+        try:
+            self.flush()
+
+        finally:
+            self._closed = True
+
+            if self._executor is not None:
+                self._executor.shutdown(wait=True)
+
+            if self._owns_file:
+                self._file.close()
+
+    def _submit(self, block: bytes) -> None:
+        if self._executor is None:
+            self._file.write(_compress(block, self._compresslevel))
+            return None
+
+        self._pending.append(
+            self._executor.submit(_compress, block, self._compresslevel)
+        )
+
+        while len(self._pending) > self._max_pending:
+            self._file.write(self._pending.popleft().result())
+
+    def __enter__(self) -> ParallelGzipWriter:
+        return self
+
+    def __exit__(
+        self,
+        exc_type: Optional[Type[BaseException]],
+        exc_value: Optional[BaseException],
+        traceback: Optional[TracebackType],
+    ) -> None:
+        self.close()
+
+
+def _compress(block: bytes, compresslevel: int) -> bytes:
+    return gzip.compress(block, compresslevel=compresslevel, mtime=0)
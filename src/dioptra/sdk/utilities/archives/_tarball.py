@@ -0,0 +1,282 @@
+# This Software (Dioptra) is being made available as a public service by the
+# National Institute of Standards and Technology (NIST), an Agency of the United
+# States Department of Commerce. This software was developed in part by employees of
+# NIST and in part by NIST contractors. Copyright in portions of this software that
+# were developed by NIST contractors has been licensed or assigned to NIST. Pursuant
+# to Title 17 United States Code Section 105, works of NIST employees are not
+# subject to copyright protection in the United States. However, NIST may hold
+# international copyright in software created by its employees and domestic
+# copyright (or licensing rights) in portions of software that were assigned or
+# licensed to NIST. To the extent that NIST holds copyright in this software, it is
+# being made available under the Creative Commons Attribution 4.0 International
+# license (CC BY 4.0). The disclaimers of the CC BY 4.0 license apply to all parts
+# of the software developed or licensed by NIST.
+#
+# ACCESS THE FULL CC BY 4.0 LICENSE HERE:
+# https://creativecommons.org/licenses/by/4.0/legalcode
+"""Multi-threaded creation and extraction of tarball archives."""
+from __future__ import annotations
+
+import bz2
+import gzip
+import lzma
+import os
+import queue
+import tarfile
+import threading
+from collections import deque
+from concurrent.futures import Future, ThreadPoolExecutor
+from pathlib import Path
+from typing import IO, Callable, Deque, Dict, Optional, Tuple, Union
+
+from ._parallel_gzip import DEFAULT_BLOCK_SIZE, ParallelGzipWriter
+
+MAX_PENDING_BYTES = 64 << 20
+
+_DECOMPRESSORS: Dict[str, Callable[[IO[bytes]], IO[bytes]]] = {
+    "gz": lambda fileobj: gzip.GzipFile(fileobj=fileobj, mode="rb"),
+    "bz2": lambda fileobj: bz2.BZ2File(fileobj, mode="rb"),
+    "xz": lambda fileobj: lzma.LZMAFile(fileobj, mode="rb"),
+}
+
+
+def create_tarball(
+    source_dir: Union[str, Path],
+    tarball_path: Union[str, Path],
+    arcname: Optional[str] = None,
+    compresslevel: int = 9,
+    num_threads: Optional[int] = None,
+) -> Path:
+    """Archives a directory into a gzip-compressed tarball using multiple threads.
+
+    The archive is written as a single stream, so the uncompressed tarball is never
+    stored on disk or held in memory. See :py:class:`ParallelGzipWriter` for details
+    on the compression.
+
+    Args:
+        source_dir: The directory to archive.
+        tarball_path: The location of the tarball archive to create.
+        arcname: The name of the directory within the archive. If `None`, the name of
+            `source_dir` is used. The default is `None`.
+        compresslevel: The gzip compression level, from `0` (no compression) to `9`
+            (best compression). The default is `9`.
+        num_threads: The number of compression threads. If `None`, the number of CPUs
+            is used.
+
+    Returns:
+        The location of the tarball archive.
+    """
+    source_dir = Path(source_dir)
+    tarball_path = Path(tarball_path)
+
+    with ParallelGzipWriter(
+        tarball_path, compresslevel=compresslevel, num_threads=num_threads
+    ) as f, tarfile.open(fileobj=f, mode="w|") as tar:
+        tar.add(source_dir, arcname=source_dir.name if arcname is None else arcname)
+
+    return tarball_path
+
+
+def extract_tarball(
+    tarball_path: Union[str, Path],
+    output_dir: Union[str, Path],
+    tarball_read_mode: str = "r:gz",
+    num_threads: Optional[int] = None,
+) -> Path:
+    """Extracts a tarball archive using multiple threads.
+
+    Decompression, parsing the archive, and writing the extracted files overlap. The
+    archive is decompressed on a background thread, while the contents of regular files
+    are written to disk on a thread pool. This speeds up archives containing many small
+    files, where creating and writing each file dominates the extraction time.
+
+    Args:
+        tarball_path: The location of the tarball archive file.
+        output_dir: The directory to extract the archive into.
+        tarball_read_mode: The read mode for the tarball, see :py:func:`tarfile.open`
+            for the full list of compression options. The default is `"r:gz"` (gzip
+            compression).
+        num_threads: The number of threads used to write the extracted files. If
+            `None`, the number of CPUs is used. If `1`, the archive is extracted
+            sequentially on the calling thread.
+
+    Returns:
+        The directory the archive was extracted into.
+
+    Raises:
+        ValueError: If `tarball_read_mode` is not a read mode, or if a member of the
+            archive would be extracted outside of `output_dir`.
+    """
+    tarball_path = Path(tarball_path)
+    output_dir = Path(output_dir).resolve()
+    compression = _parse_read_mode(tarball_read_mode)
+
+    if num_threads is None:
+        num_threads = os.cpu_count() or 1
+
+    if num_threads == 1:
+        # Threads only add overhead without a second core to run them on.
+        with tarfile.open(tarball_path, tarball_read_mode) as tar:
+            for member in tar:
+                _resolve_member_path(member, output_dir)
+                tar.extract(member, path=output_dir)
+
+        return output_dir
+
+    executor = ThreadPoolExecutor(max_workers=num_threads)
+    pending: Deque[Tuple[Future, int]] = deque()
+    pending_bytes = 0
+
+    try:
+        with open(tarball_path, "rb") as raw, _open_stream(
+            raw, compression
+        ) as stream, tarfile.open(
+            fileobj=stream, mode="r|" if compression is not None else "r|*"
+        ) as tar:
+            for member in tar:
+                target = _resolve_member_path(member, output_dir)
+
+                if member.isdir():
+                    target.mkdir(parents=True, exist_ok=True)
+                    continue
+
+                if not member.isfile():
+                    # Links may point to files that are still being written.
+                    pending_bytes = _wait(pending, 0)
+                    tar.extract(member, path=output_dir)
+                    continue
+
+                data = tar.extractfile(member).read()  # type: ignore[union-attr]
+                pending.append(
+                    (executor.submit(_write_file, target, data, member), len(data))
+                )
+                pending_bytes += len(data)
+
+                if pending_bytes > MAX_PENDING_BYTES:
+                    pending_bytes = _wait(pending, MAX_PENDING_BYTES // 2)
+
+            _wait(pending, 0)
+
+    finally:
+        executor.shutdown(wait=True)
+
+    return output_dir
+
+
+class _PrefetchingReader(object):
+    """Decompresses a stream on a background thread, ahead of the reader."""
+
+    def __init__(self, stream: IO[bytes], max_chunks: int = 16) -> None:
+        self._stream = stream
+        self._chunks: queue.Queue = queue.Queue(maxsize=max_chunks)
+        self._buffer = bytearray()
+        self._eof = False
+        self._stop = threading.Event()
+        self._thread = threading.Thread(target=self._produce, daemon=True)
+        self._thread.start()
+
+    def read(self, size: int = -1) -> bytes:
+        while not self._eof and (size < 0 or len(self._buffer) < size):
+            chunk = self._chunks.get()
+
+            if isinstance(chunk, BaseException):
+                raise chunk
+
+            if not chunk:
+                self._eof = True
+                break
+
+            self._buffer += chunk
+
+        if size < 0:
+            size = len(self._buffer)
+
+        data = bytes(self._buffer[:size])
+        del self._buffer[:size]
+
+        return data
+
+    def close(self) -> None:
+        self._stop.set()
+
+        while self._thread.is_alive():
+            try:
+                self._chunks.get(timeout=0.1)
+
+            except queue.Empty:
+                pass
+
+        self._stream.close()
+
+    def _produce(self) -> None:
+        try:
+            while not self._stop.is_set():
+                chunk = self._stream.read(DEFAULT_BLOCK_SIZE)
+                self._chunks.put(chunk)
+
+                if not chunk:
+                    break
+
+        except BaseException as err:
+            self._chunks.put(err)
+
+    def __enter__(self) -> _PrefetchingReader:
+        return self
+
+    def __exit__(self, *args) -> None:
+        self.close()
+
+
+def _open_stream(raw: IO[bytes], compression: Optional[str]) -> _PrefetchingReader:
+    if compression is None:
+        return _PrefetchingReader(raw)
+
+    return _PrefetchingReader(_DECOMPRESSORS[compression](raw))
+
+
+def _parse_read_mode(mode: str) -> Optional[str]:
+    filemode, _, compression = mode.replace("|", ":").partition(":")
+
+    if filemode != "r":
+        raise ValueError(f"Invalid tarball read mode {mode!r}.")
+
+    if compression in {"", "*"}:
+        return None
+
+    if compression not in _DECOMPRESSORS:
+        raise ValueError(f"Unsupported tarball compression {compression!r}.")
+
+    return compression
+
+
+def _resolve_member_path(member: tarfile.TarInfo, output_dir: Path) -> Path:
+    root = str(output_dir)
+    target = os.path.normpath(os.path.join(root, member.name))
+
+    if target != root and not target.startswith(root + os.sep):
+        raise ValueError(
+            f"Refusing to extract {member.name!r} outside of the output directory."
+        )
+
+    return Path(target)
+
+
+def _write_file(target: Path, data: bytes, member: tarfile.TarInfo) -> None:
+    target.parent.mkdir(parents=True, exist_ok=True)
+    target.write_bytes(data)
+    os.chmod(target, member.mode)
+    os.utime(target, (member.mtime, member.mtime))
+
+
+def _wait(pending: Deque[Tuple[Future, int]], max_pending_bytes: int) -> int:
+    if not pending:
+        return 0
+
+    pending_bytes = sum(num_bytes for _, num_bytes in pending)
+
+    while pending and pending_bytes > max_pending_bytes:
+        future, num_bytes = pending.popleft()
+        future.result()
+        pending_bytes -= num_bytes
+
+    return pending_bytes
@@ -15,8 +15,9 @@
 # ACCESS THE FULL CC BY 4.0 LICENSE HERE:
 # https://creativecommons.org/licenses/by/4.0/legalcode
 import importlib
+import sys
 from functools import wraps
-from typing import Any, Callable, Optional, Type, TypeVar, cast
+from typing import Any, Callable, Optional, Set, Type, TypeVar, cast
 
 import structlog
 from structlog.stdlib import BoundLogger
@@ -29,6 +30,32 @@ Exc = Type[BaseOptionalDependencyError]
 Function = Callable[..., Any]
 T = TypeVar("T", bound=Function)
 
+_MISSING_PACKAGES: Set[str] = set()
+
+
+def _is_package_available(name: str) -> bool:
+    """Checks if a package can be imported, remembering packages that cannot.
+
+    Packages that are already imported are found in :py:data:`sys.modules` without
+    going through the import system, and a package that failed to import is not
+    searched for again. A `None` entry in :py:data:`sys.modules` blocks the import,
+    as it does for the import statement.
+    """
+    if name in sys.modules:
+        return sys.modules[name] is not None
+
+    if name in _MISSING_PACKAGES:
+        return False
+
+    try:
+        importlib.import_module(name=name)
+
+    except ModuleNotFoundError:
+        _MISSING_PACKAGES.add(name)
+        return False
+
+    return True
+
 
 def require_package(
     name: str,
@@ -43,11 +70,8 @@ def require_package(
 
         @wraps(func)
         def wrapper(*args, **kwargs):
-            try:
-                importlib.import_module(name=name)
-
-            except ModuleNotFoundError:
-                LOGGER.exception(error_msg, args=args, kwargs=kwargs)
+            if not _is_package_available(name):
+                LOGGER.error(error_msg, args=args, kwargs=kwargs)
                 raise exc
 
             return func(*args, **kwargs)
@@ -0,0 +1,108 @@
+# This Software (Dioptra) is being made available as a public service by the
+# National Institute of Standards and Technology (NIST), an Agency of the United
+# States Department of Commerce. This software was developed in part by employees of
+# NIST and in part by NIST contractors. Copyright in portions of this software that
+# were developed by NIST contractors has been licensed or assigned to NIST. Pursuant
+# to Title 17 United States Code Section 105, works of NIST employees are not
+# subject to copyright protection in the United States. However, NIST may hold
+# international copyright in software created by its employees and domestic
+# copyright (or licensing rights) in portions of software that were assigned or
+# licensed to NIST. To the extent that NIST holds copyright in this software, it is
+# being made available under the Creative Commons Attribution 4.0 International
+# license (CC BY 4.0). The disclaimers of the CC BY 4.0 license apply to all parts
+# of the software developed or licensed by NIST.
+#
+# ACCESS THE FULL CC BY 4.0 LICENSE HERE:
+# https://creativecommons.org/licenses/by/4.0/legalcode
+"""A module proxy that defers importing heavy optional dependencies."""
+from __future__ import annotations
+
+import importlib
+import importlib.util
+import threading
+from types import ModuleType
+from typing import Any, List, Optional
+
+import structlog
+from structlog.stdlib import BoundLogger
+
+LOGGER: BoundLogger = structlog.stdlib.get_logger()
+
+
+class LazyModule(ModuleType):
+    """Imports a module the first time one of its attributes is accessed.
+
+    Packages such as Tensorflow and the Adversarial Robustness Toolbox take seconds to
+    import, so importing them at the top of a plugin module makes every process that
+    discovers the plugin pay that cost, even if the plugin is never called. A
+    :py:class:`LazyModule` stands in for the module until it is actually used.
+    Attribute lookups are forwarded to the imported module and are not cached on the
+    proxy, so patches applied to the real module remain visible.
+
+    If the module cannot be imported, the :py:exc:`ImportError` is raised on first
+    attribute access.
+
+    Args:
+        name: The fully qualified name of the module to import.
+    """
+
+    def __init__(self, name: str) -> None:
+        super().__init__(name)
+        self.__dict__["_lazy_module"] = None
+        self.__dict__["_lazy_lock"] = threading.Lock()
+
+    def __getattr__(self, name: str) -> Any:
+        return getattr(self._load(), name)
+
+    def __dir__(self) -> List[str]:
+        return dir(self._load())
+
+    def __repr__(self) -> str:
+        state = "loaded" if self.is_loaded else "not loaded"
+        return f"<lazy module {self.__name__!r} ({state})>"
+
+    @property
+    def is_loaded(self) -> bool:
+        """`True` if the underlying module has been imported."""
+        return self.__dict__["_lazy_module"] is not None
+
+    def _load(self) -> ModuleType:
+        module: Optional[ModuleType] = self.__dict__["_lazy_module"]
+
+        if module is not None:
+            return module
+
+        with self.__dict__["_lazy_lock"]:
+            if self.__dict__["_lazy_module"] is None:
+                self.__dict__["_lazy_module"] = importlib.import_module(self.__name__)
+
+            return self.__dict__["_lazy_module"]
+
+
+def lazy_import(name: str) -> LazyModule:
+    """Returns a :py:class:`LazyModule` proxy for the named module.
+
+    The top-level package is located without importing it, so a missing optional
+    dependency is still reported when the calling module is imported.
+
+    Args:
+        name: The fully qualified name of the module to import.
+
+    Returns:
+        A :py:class:`LazyModule` that imports `name` on first attribute access.
+    """
+    package: str = name.partition(".")[0]
+
+    try:
+        spec = importlib.util.find_spec(package)
+
+    except (ImportError, ValueError):
+        spec = None
+
+    if spec is None:
+        LOGGER.warn(
+            "Unable to import one or more optional packages, functionality may be reduced",
+            package=package,
+        )
+
+    return LazyModule(name)
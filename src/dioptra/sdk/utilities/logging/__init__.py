@@ -14,6 +14,7 @@
 #
 # ACCESS THE FULL CC BY 4.0 LICENSE HERE:
 # https://creativecommons.org/licenses/by/4.0/legalcode
+from .async_handler import AsyncLogHandler
 from .config import (
     attach_stdout_stream_handler,
     clear_logger_handlers,
@@ -21,11 +22,15 @@ from .config import (
     set_logging_level,
 )
 from .log_stream import StderrLogStream, StdoutLogStream
+from .sampling import SamplingProcessor, parse_sample_rates
 
 __all__ = [
+    "AsyncLogHandler",
     "attach_stdout_stream_handler",
     "clear_logger_handlers",
     "configure_structlog",
+    "parse_sample_rates",
+    "SamplingProcessor",
     "set_logging_level",
     "StderrLogStream",
     "StdoutLogStream",
@@ -0,0 +1,232 @@
+# This Software (Dioptra) is being made available as a public service by the
+# National Institute of Standards and Technology (NIST), an Agency of the United
+# States Department of Commerce. This software was developed in part by employees of
+# NIST and in part by NIST contractors. Copyright in portions of this software that
+# were developed by NIST contractors has been licensed or assigned to NIST. Pursuant
+# to Title 17 United States Code Section 105, works of NIST employees are not
+# subject to copyright protection in the United States. However, NIST may hold
+# international copyright in software created by its employees and domestic
+# copyright (or licensing rights) in portions of software that were assigned or
+# licensed to NIST. To the extent that NIST holds copyright in this software, it is
+# being made available under the Creative Commons Attribution 4.0 International
+# license (CC BY 4.0). The disclaimers of the CC BY 4.0 license apply to all parts
+# of the software developed or licensed by NIST.
+#
+# ACCESS THE FULL CC BY 4.0 LICENSE HERE:
+# https://creativecommons.org/licenses/by/4.0/legalcode
+"""A logging handler that formats and writes log records on a background thread."""
+import logging
+import os
+import queue
+import sys
+import threading
+import traceback
+import weakref
+from logging.handlers import QueueHandler
+from typing import List, Optional
+
+DEFAULT_MAX_QUEUE_SIZE = 10000
+DEFAULT_BATCH_SIZE = 256
+OVERFLOW_POLICIES = {"block", "drop"}
+
+_SENTINEL = None
+
+
+class AsyncLogHandler(QueueHandler):
+    """Hands log records to another handler through a bounded queue.
+
+    Calls to the logger only put the record on a queue. A background thread takes the
+    records off of the queue in batches, formats them with the wrapped handler, and,
+    if the wrapped handler is a :py:class:`logging.StreamHandler`, writes each batch to
+    its stream with a single write and flush.
+
+    When the queue is full, the `"block"` overflow policy makes the logging thread wait
+    for room, so no records are lost. The `"drop"` policy discards the record instead,
+    so logging never stalls the caller, and the number of dropped records is reported
+    in the log once there is room again.
+
+    Child processes created with :py:func:`os.fork`, such as the work horses of an
+    RQ worker, write their records synchronously instead. Such children often exit
+    with :py:func:`os._exit`, which skips :py:mod:`atexit` and
+    :py:func:`logging.shutdown`, so records still on a queue would be lost. The
+    parent writes the records it queued before the fork.
+
+    Args:
+        handler: The handler that formats and writes the records.
+        max_queue_size: The maximum number of records waiting to be written. The
+            default is `10000`.
+        overflow: Either `"block"` or `"drop"`. The default is `"block"`.
+        batch_size: The maximum number of records written at once. The default is
+            `256`.
+    """
+
+    def __init__(
+        self,
+        handler: logging.Handler,
+        max_queue_size: int = DEFAULT_MAX_QUEUE_SIZE,
+        overflow: str = "block",
+        batch_size: int = DEFAULT_BATCH_SIZE,
+    ) -> None:
+        if overflow not in OVERFLOW_POLICIES:
+            raise ValueError(
+                f"Unknown overflow policy {overflow!r}, expected one of "
+                f"{sorted(OVERFLOW_POLICIES)}"
+            )
+
+        super().__init__(queue.Queue(maxsize=max(max_queue_size, 1)))
+        self.handler = handler
+        self.overflow = overflow
+        self.batch_size = max(batch_size, 1)
+        self.dropped = 0
+        self._reported_dropped = 0
+        self._thread: Optional[threading.Thread] = None
+        self._start()
+
+        if hasattr(os, "register_at_fork"):
+            handler_ref = weakref.ref(self)
+            os.register_at_fork(
+                before=lambda: _call_if_alive(handler_ref, "_before_fork"),
+                after_in_child=lambda: _call_if_alive(handler_ref, "_after_fork"),
+            )
+
+    def prepare(self, record: logging.LogRecord) -> logging.LogRecord:
+        # Formatting is left to the background thread. Only %-style arguments are
+        # merged into the message, because they could be mutated after this call.
+        if record.args and isinstance(record.msg, str):
+            record.msg = record.getMessage()
+            record.args = None
+
+        return record
+
+    def enqueue(self, record: logging.LogRecord) -> None:
+        if self._thread is None or threading.current_thread() is self._thread:
+            self.handler.handle(record)
+            return
+
+        if self.overflow == "block":
+            self.queue.put(record)
+            return
+
+        try:
+            self.queue.put_nowait(record)
+
+        except queue.Full:
+            self.dropped += 1
+
+    def flush(self) -> None:
+        """Waits until the queued records are written and flushes the handler."""
+        if self._thread is not None and threading.current_thread() is not self._thread:
+            self.queue.join()
+
+        self.handler.flush()
+
+    def close(self) -> None:
+        """Writes the queued records and stops the background thread."""
+        thread, self._thread = self._thread, None
+
+        if thread is not None and thread.is_alive():
+            self.queue.put(_SENTINEL)
+            thread.join()
+
+        self.handler.flush()
+        super().close()
+
+    def _start(self) -> None:
+        self._thread = threading.Thread(
+            target=self._monitor, name="dioptra-async-log-handler", daemon=True
+        )
+        self._thread.start()
+
+    def _before_fork(self) -> None:
+        if self._thread is not None:
+            self.flush()
+
+    def _after_fork(self) -> None:
+        # Without a background thread, enqueue() hands records straight to the handler
+        self._thread = None
+        self.queue = queue.Queue(maxsize=self.queue.maxsize)
+        self.dropped = self._reported_dropped = 0
+
+    def _monitor(self) -> None:
+        records_queue = self.queue
+
+        while True:
+            batch: List[Optional[logging.LogRecord]] = [records_queue.get()]
+
+            while len(batch) < self.batch_size:
+                try:
+                    batch.append(records_queue.get_nowait())
+
+                except queue.Empty:
+                    break
+
+            stop: bool = _SENTINEL in batch
+
+            try:
+                self._write([x for x in batch if x is not _SENTINEL])
+
+            except Exception:  # pragma: nocover
+                traceback.print_exc(file=sys.__stderr__)
+
+            for _ in batch:
+                records_queue.task_done()
+
+            if stop:
+                return
+
+    def _write(self, records: List[logging.LogRecord]) -> None:
+        dropped = self.dropped - self._reported_dropped
+
+        if dropped > 0:
+            self._reported_dropped += dropped
+            records.append(
+                logging.makeLogRecord(
+                    dict(
+                        name=__name__,
+                        levelno=logging.WARNING,
+                        levelname="WARNING",
+                        msg=f"Dropped {dropped} log records because the queue was full",
+                    )
+                )
+            )
+
+        if not isinstance(self.handler, logging.StreamHandler):
+            for record in records:
+                self.handler.handle(record)
+
+            return
+
+        handler: logging.StreamHandler = self.handler
+        chunks: List[str] = []
+
+        for record in records:
+            if record.levelno < handler.level or not handler.filter(record):
+                continue
+
+            try:
+                chunks.append(handler.format(record) + handler.terminator)
+
+            except Exception:
+                handler.handleError(record)
+
+        if not chunks:
+            return
+
+        handler.acquire()
+
+        try:
+            handler.stream.write("".join(chunks))
+            handler.flush()
+
+        except Exception:
+            handler.handleError(records[-1])
+
+        finally:
+            handler.release()
+
+
+def _call_if_alive(handler_ref: "weakref.ref[AsyncLogHandler]", method: str) -> None:
+    handler: Optional[AsyncLogHandler] = handler_ref()
+
+    if handler is not None:
+        getattr(handler, method)()
@@ -21,6 +21,9 @@ from typing import Any, Callable, List, Mapping, MutableMapping, Optional, Tuple
 
 import structlog
 
+from .async_handler import DEFAULT_MAX_QUEUE_SIZE, AsyncLogHandler
+from .sampling import SamplingProcessor
+
 ProcessorType = Callable[
     [Any, str, MutableMapping[str, Any]],
     Union[Mapping[str, Any], str, bytes, Tuple[Any, ...]],
@@ -28,12 +31,28 @@ ProcessorType = Callable[
 
 
 def attach_stdout_stream_handler(
-    as_json: bool, logger: Optional[logging.Logger] = None
+    as_json: bool,
+    logger: Optional[logging.Logger] = None,
+    asynchronous: bool = False,
+    max_queue_size: int = DEFAULT_MAX_QUEUE_SIZE,
+    overflow: str = "block",
 ) -> None:
+    """Attaches a handler that renders log records to stdout.
+
+    Args:
+        as_json: If `True`, render the log records as JSON.
+        logger: The logger to attach the handler to. The default is the root logger.
+        asynchronous: If `True`, wrap the handler in an
+            :py:class:`~.async_handler.AsyncLogHandler` so that log records are
+            formatted and written on a background thread. The default is `False`.
+        max_queue_size: The maximum number of records waiting to be written when
+            `asynchronous` is `True`.
+        overflow: What to do when the queue is full, either `"block"` or `"drop"`.
+    """
     logger = logger or getLogger()
     log_processor: ProcessorType = _get_structlog_processor(as_json)
 
-    handler = logging.StreamHandler(sys.stdout)
+    handler: logging.Handler = logging.StreamHandler(sys.stdout)
     formatter = structlog.stdlib.ProcessorFormatter(
         processor=log_processor,
         foreign_pre_chain=[
@@ -46,6 +65,12 @@ def attach_stdout_stream_handler(
         ],
     )
     handler.setFormatter(formatter)
+
+    if asynchronous:
+        handler = AsyncLogHandler(
+            handler, max_queue_size=max_queue_size, overflow=overflow
+        )
+
     logging.captureWarnings(True)
     logger.addHandler(handler)
 
@@ -58,9 +83,22 @@ def clear_logger_handlers(logger: Optional[logging.Logger]) -> None:
         logger.removeHandler(handler)
 
 
-def configure_structlog() -> None:
-    processors: List[Any] = [
-        structlog.stdlib.filter_by_level,
+def configure_structlog(sample_rates: Optional[Mapping[str, int]] = None) -> None:
+    """Configures structlog to hand log events to the standard library loggers.
+
+    Args:
+        sample_rates: An optional mapping of event names to sampling rates for
+            high-frequency DEBUG and INFO events, see
+            :py:class:`~.sampling.SamplingProcessor`. The sampling happens right after
+            events below the logger's level are filtered out, so that dropped events
+            are never rendered.
+    """
+    processors: List[Any] = [structlog.stdlib.filter_by_level]
+
+    if sample_rates:
+        processors.append(SamplingProcessor(sample_rates))
+
+    processors += [
         structlog.stdlib.add_logger_name,
         structlog.stdlib.add_log_level,
         structlog.stdlib.PositionalArgumentsFormatter(),
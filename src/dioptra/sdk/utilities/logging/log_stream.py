@@ -23,20 +23,46 @@
 
 import contextlib
 import logging
+import os
+import time
 from abc import ABCMeta, abstractmethod
+from typing import Optional
+
+ENVVAR_PROGRESS_INTERVAL = "DIOPTRA_LOG_PROGRESS_INTERVAL"
+DEFAULT_PROGRESS_INTERVAL = 1.0
 
 
 class LogStream(metaclass=ABCMeta):
+    """Redirects a standard stream to a logger.
+
+    Progress bars, such as the ones printed by Keras and tqdm, redraw the same line
+    by writing carriage returns or backspaces. These progress updates are coalesced:
+    at most one is logged every `progress_interval` seconds, and the latest update is
+    logged before the next regular message and when the redirection ends. The
+    interval can be set with the ``DIOPTRA_LOG_PROGRESS_INTERVAL`` environment
+    variable. An interval of `0` logs every update.
+    """
+
+    _pending_progress: Optional[str] = None
+    _last_progress_time: float = float("-inf")
+
     @abstractmethod
-    def __init__(self, as_json: bool) -> None:
+    def __init__(self, as_json: bool, progress_interval: Optional[float]) -> None:
         pass
 
     def write(self, msg):
-        if msg and not msg.isspace():
-            self.logger.log(self.level, self._format_newlines(msg))
+        if not msg or msg.isspace():
+            return
+
+        if "\r" in msg or "\b" in msg:
+            self._write_progress(msg)
+            return
+
+        self._flush_progress()
+        self.logger.log(self.level, self._format_newlines(msg))
 
     def close(self):
-        pass
+        self._flush_progress()
 
     def flush(self):
         pass
@@ -47,27 +73,59 @@ class LogStream(metaclass=ABCMeta):
 
         return "||".join([x.rstrip() for x in msg.rstrip().splitlines()])
 
+    def _write_progress(self, msg):
+        lines = [x.replace("\b", "").strip() for x in msg.split("\r")]
+        lines = [x for x in lines if x]
+
+        if not lines:
+            return
+
+        self._pending_progress = lines[-1]
+        now: float = time.monotonic()
+
+        if now - self._last_progress_time >= self._progress_interval:
+            self._last_progress_time = now
+            self._flush_progress()
+
+    def _flush_progress(self):
+        msg, self._pending_progress = self._pending_progress, None
+
+        if msg is not None:
+            self.logger.log(self.level, self._format_newlines(msg))
+
     def __enter__(self):
         self._redirector.__enter__()
         return self
 
     def __exit__(self, exc_type, exc_value, traceback):
         self._redirector.__exit__(exc_type, exc_value, traceback)
+        self._flush_progress()
+
+
+def _get_progress_interval(progress_interval: Optional[float]) -> float:
+    if progress_interval is not None:
+        return progress_interval
+
+    return float(
+        os.getenv(ENVVAR_PROGRESS_INTERVAL, default=str(DEFAULT_PROGRESS_INTERVAL))
+    )
 
 
 class StdoutLogStream(LogStream):
-    def __init__(self, as_json: bool):
+    def __init__(self, as_json: bool, progress_interval: Optional[float] = None):
         self.logger = logging.getLogger("STDOUT")
         self.name = self.logger.name
         self.level = logging.INFO
         self._as_json = as_json
+        self._progress_interval = _get_progress_interval(progress_interval)
         self._redirector = contextlib.redirect_stdout(self)  # type: ignore
 
 
 class StderrLogStream(LogStream):
-    def __init__(self, as_json: bool):
+    def __init__(self, as_json: bool, progress_interval: Optional[float] = None):
         self.logger = logging.getLogger("STDERR")
         self.name = self.logger.name
         self.level = logging.INFO
         self._as_json = as_json
+        self._progress_interval = _get_progress_interval(progress_interval)
         self._redirector = contextlib.redirect_stderr(self)  # type: ignore
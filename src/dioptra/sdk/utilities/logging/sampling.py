@@ -0,0 +1,99 @@
+# This Software (Dioptra) is being made available as a public service by the
+# National Institute of Standards and Technology (NIST), an Agency of the United
+# States Department of Commerce. This software was developed in part by employees of
+# NIST and in part by NIST contractors. Copyright in portions of this software that
+# were developed by NIST contractors has been licensed or assigned to NIST. Pursuant
+# to Title 17 United States Code Section 105, works of NIST employees are not
+# subject to copyright protection in the United States. However, NIST may hold
+# international copyright in software created by its employees and domestic
+# copyright (or licensing rights) in portions of software that were assigned or
+# licensed to NIST. To the extent that NIST holds copyright in this software, it is
+# being made available under the Creative Commons Attribution 4.0 International
+# license (CC BY 4.0). The disclaimers of the CC BY 4.0 license apply to all parts
+# of the software developed or licensed by NIST.
+#
+# ACCESS THE FULL CC BY 4.0 LICENSE HERE:
+# https://creativecommons.org/licenses/by/4.0/legalcode
+"""A structlog processor that samples high-frequency log events."""
+import itertools
+import json
+import threading
+from typing import Any, Dict, Iterator, Mapping, MutableMapping, Optional
+
+from structlog.exceptions import DropEvent
+
+SAMPLED_METHODS = frozenset({"debug", "info"})
+
+
+class SamplingProcessor(object):
+    """Keeps only every n-th occurrence of selected DEBUG and INFO events.
+
+    Events are matched by their name, i.e. the first argument passed to the logger
+    method. An event that is kept has a `sample_rate` key added to it so that the
+    number of occurrences can be recovered downstream. Events logged at the WARNING
+    level and above are never sampled.
+
+    Args:
+        sample_rates: A mapping of event names to sampling rates. A rate of `n` keeps
+            one out of every `n` occurrences of the event. Rates of `1` or lower keep
+            every occurrence.
+    """
+
+    def __init__(self, sample_rates: Mapping[str, int]) -> None:
+        self._sample_rates: Dict[str, int] = {
+            event: int(rate) for event, rate in sample_rates.items() if int(rate) > 1
+        }
+        self._counters: Dict[str, Iterator[int]] = {}
+        self._lock = threading.Lock()
+
+    def __call__(
+        self, logger: Any, method_name: str, event_dict: MutableMapping[str, Any]
+    ) -> MutableMapping[str, Any]:
+        if method_name not in SAMPLED_METHODS:
+            return event_dict
+
+        event = event_dict.get("event")
+        rate: Optional[int] = self._sample_rates.get(event)  # type: ignore[arg-type]
+
+        if rate is None:
+            return event_dict
+
+        if next(self._get_counter(event)) % rate != 0:  # type: ignore[arg-type]
+            raise DropEvent
+
+        event_dict["sample_rate"] = rate
+
+        return event_dict
+
+    def _get_counter(self, event: str) -> Iterator[int]:
+        counter: Optional[Iterator[int]] = self._counters.get(event)
+
+        if counter is None:
+            with self._lock:
+                counter = self._counters.setdefault(event, itertools.count())
+
+        return counter
+
+
+def parse_sample_rates(value: Optional[str]) -> Dict[str, int]:
+    """Parses a JSON object of event names and sampling rates.
+
+    Args:
+        value: A JSON string such as `'{"Request received": 10}'`. An empty string or
+            `None` disables sampling.
+
+    Returns:
+        A dictionary of event names and sampling rates.
+
+    Raises:
+        ValueError: If the value is not a JSON object of integer rates.
+    """
+    if not value:
+        return {}
+
+    sample_rates = json.loads(value)
+
+    if not isinstance(sample_rates, dict):
+        raise ValueError("Log sample rates must be a JSON object.")
+
+    return {str(event): int(rate) for event, rate in sample_rates.items()}
@@ -0,0 +1,104 @@
+# This Software (Dioptra) is being made available as a public service by the
+# National Institute of Standards and Technology (NIST), an Agency of the United
+# States Department of Commerce. This software was developed in part by employees of
+# NIST and in part by NIST contractors. Copyright in portions of this software that
+# were developed by NIST contractors has been licensed or assigned to NIST. Pursuant
+# to Title 17 United States Code Section 105, works of NIST employees are not
+# subject to copyright protection in the United States. However, NIST may hold
+# international copyright in software created by its employees and domestic
+# copyright (or licensing rights) in portions of software that were assigned or
+# licensed to NIST. To the extent that NIST holds copyright in this software, it is
+# being made available under the Creative Commons Attribution 4.0 International
+# license (CC BY 4.0). The disclaimers of the CC BY 4.0 license apply to all parts
+# of the software developed or licensed by NIST.
+#
+# ACCESS THE FULL CC BY 4.0 LICENSE HERE:
+# https://creativecommons.org/licenses/by/4.0/legalcode
+"""Incremental on-disk storage for per-sample metric values."""
+from __future__ import annotations
+
+from pathlib import Path
+from types import TracebackType
+from typing import Any, Dict, Optional, Sequence, Type, Union
+
+import structlog
+from structlog.stdlib import BoundLogger
+
+from dioptra.sdk.exceptions import PyArrowDependencyError
+from dioptra.sdk.utilities.decorators import require_package
+
+LOGGER: BoundLogger = structlog.stdlib.get_logger()
+
+try:
+    import pyarrow as pa
+    import pyarrow.parquet as pq
+
+except ImportError:  # pragma: nocover
+    LOGGER.warn(
+        "Unable to import one or more optional packages, functionality may be reduced",
+        package="pyarrow",
+    )
+
+
+class ParquetSpillWriter(object):
+    """Appends batches of column values to a Parquet file.
+
+    Each call to :py:meth:`write_batch` is written out as a row group, so only the
+    current batch is held in memory. The schema is inferred from the first batch. The
+    file is complete once :py:meth:`close` has been called, which happens automatically
+    when the writer is used as a context manager.
+
+    Args:
+        path: The path of the Parquet file to create. Missing parent directories are
+            created.
+    """
+
+    @require_package("pyarrow", exc_type=PyArrowDependencyError)
+    def __init__(self, path: Union[str, Path]) -> None:
+        self._path = Path(path)
+        self._writer: Optional[pq.ParquetWriter] = None
+        self._num_rows = 0
+
+    @property
+    def path(self) -> Path:
+        """The path of the Parquet file."""
+        return self._path
+
+    @property
+    def num_rows(self) -> int:
+        """The number of rows written so far."""
+        return self._num_rows
+
+    def write_batch(self, columns: Dict[str, Sequence[Any]]) -> None:
+        """Writes a batch of rows.
+
+        Args:
+            columns: A dictionary mapping each column name to the column's values for
+                the batch. Every batch must have the same columns.
+        """
+        table = pa.table({name: list(values) for name, values in columns.items()})
+
+        if self._writer is None:
+            self._path.parent.mkdir(parents=True, exist_ok=True)
+            self._writer = pq.ParquetWriter(str(self._path), table.schema)
+            LOGGER.debug("Opened spill file", path=str(self._path))
+
+        self._writer.write_table(table)
+        self._num_rows += table.num_rows
+
+    def close(self) -> None:
+        """Finishes writing the Parquet file."""
+        if self._writer is not None:
+            self._writer.close()
+            self._writer = None
+
+    def __enter__(self) -> ParquetSpillWriter:
+        return self
+
+    def __exit__(
+        self,
+        exc_type: Optional[Type[BaseException]],
+        exc_value: Optional[BaseException],
+        traceback: Optional[TracebackType],
+    ) -> None:
+        self.close()
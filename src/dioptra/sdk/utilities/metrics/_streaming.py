@@ -0,0 +1,341 @@
+# This Software (Dioptra) is being made available as a public service by the
+# National Institute of Standards and Technology (NIST), an Agency of the United
+# States Department of Commerce. This software was developed in part by employees of
+# NIST and in part by NIST contractors. Copyright in portions of this software that
+# were developed by NIST contractors has been licensed or assigned to NIST. Pursuant
+# to Title 17 United States Code Section 105, works of NIST employees are not
+# subject to copyright protection in the United States. However, NIST may hold
+# international copyright in software created by its employees and domestic
+# copyright (or licensing rights) in portions of software that were assigned or
+# licensed to NIST. To the extent that NIST holds copyright in this software, it is
+# being made available under the Creative Commons Attribution 4.0 International
+# license (CC BY 4.0). The disclaimers of the CC BY 4.0 license apply to all parts
+# of the software developed or licensed by NIST.
+#
+# ACCESS THE FULL CC BY 4.0 LICENSE HERE:
+# https://creativecommons.org/licenses/by/4.0/legalcode
+"""Constant-memory summary statistics for streams of metric values."""
+from __future__ import annotations
+
+import math
+from typing import Any, Dict, List, Optional, Union
+
+import numpy as np
+
+ArrayLike = Union[np.ndarray, List[float], float]
+
+
+class KLLSketch(object):
+    """A mergeable quantile sketch.
+
+    The sketch implements the KLL streaming quantiles algorithm [karnin2016]_. Values
+    are added to a hierarchy of compactors. When a compactor exceeds its capacity, its
+    values are sorted and every other value is promoted to the next level, where each
+    value stands in for twice as many inputs. The memory used by the sketch grows with
+    the logarithm of the number of values added, and quantile queries are exact until
+    the first compaction.
+
+    Args:
+        k: The capacity of the top compactor, which controls the accuracy of the sketch.
+            The rank error is roughly `1.7 / k`. The default is `200`.
+        seed: The seed for the random number generator used during compaction.
+
+    References:
+        .. [karnin2016] Z. Karnin, K. Lang, and E. Liberty, "Optimal Quantile
+           Approximation in Streams," 2016 IEEE 57th Annual Symposium on Foundations
+           of Computer Science (FOCS), 2016, pp. 71-78.
+    """
+
+    def __init__(self, k: int = 200, seed: Optional[int] = None) -> None:
+        if k < 8:
+            raise ValueError(f"The sketch capacity k must be at least 8, got {k!r}.")
+
+        self._k = k
+        self._rng = np.random.default_rng(seed)
+        self._levels: List[np.ndarray] = [np.empty(0, dtype="float64")]
+        self._count = 0
+
+    @property
+    def count(self) -> int:
+        """The number of values added to the sketch."""
+        return self._count
+
+    @property
+    def k(self) -> int:
+        """The capacity of the top compactor."""
+        return self._k
+
+    def update(self, values: ArrayLike) -> None:
+        """Adds values to the sketch.
+
+        Args:
+            values: A scalar or array of values.
+        """
+        values = np.asarray(values, dtype="float64").ravel()
+
+        if values.size == 0:
+            return None
+
+        self._levels[0] = np.concatenate([self._levels[0], values])
+        self._count += values.size
+        self._compress()
+
+    def merge(self, other: KLLSketch) -> KLLSketch:
+        """Merges another sketch into this one.
+
+        Args:
+            other: The sketch to merge.
+
+        Returns:
+            This sketch, updated in place.
+        """
+        while len(self._levels) < len(other._levels):
+            self._levels.append(np.empty(0, dtype="float64"))
+
+        for level, values in enumerate(other._levels):
+            self._levels[level] = np.concatenate([self._levels[level], values])
+
+        self._count += other._count
+        self._compress()
+
+        return self
+
+    def quantile(self, q: ArrayLike) -> Union[float, np.ndarray]:
+        """Estimates the quantiles of the values added to the sketch.
+
+        Args:
+            q: A quantile or array of quantiles in the range `[0, 1]`.
+
+        Returns:
+            The estimated quantiles, with the same shape as `q`. If the sketch is empty,
+            the estimates are `nan`.
+        """
+        q = np.asarray(q, dtype="float64")
+
+        if self._count == 0:
+            return float("nan") if q.ndim == 0 else np.full(q.shape, np.nan)
+
+        values = np.concatenate(self._levels)
+        weights = np.concatenate(
+            [np.full(len(x), 2**level) for level, x in enumerate(self._levels)]
+        )
+        order = np.argsort(values, kind="stable")
+        values, cumulative_weights = values[order], np.cumsum(weights[order])
+        positions = np.searchsorted(
+            cumulative_weights, q * cumulative_weights[-1], side="left"
+        )
+        result = values[np.clip(positions, 0, len(values) - 1)]
+
+        return float(result) if q.ndim == 0 else result
+
+    def to_dict(self) -> Dict[str, Any]:
+        """Serializes the sketch to a JSON-compatible dictionary."""
+        return {
+            "k": self._k,
+            "count": self._count,
+            "levels": [x.tolist() for x in self._levels],
+        }
+
+    @classmethod
+    def from_dict(cls, data: Dict[str, Any], seed: Optional[int] = None) -> KLLSketch:
+        """Restores a sketch serialized with :py:meth:`to_dict`.
+
+        Args:
+            data: The serialized sketch.
+            seed: The seed for the random number generator used during compaction.
+
+        Returns:
+            The restored sketch.
+        """
+        sketch = cls(k=data["k"], seed=seed)
+        sketch._levels = [np.asarray(x, dtype="float64") for x in data["levels"]]
+        sketch._count = data["count"]
+
+        return sketch
+
+    def _capacity(self, level: int) -> int:
+        depth = len(self._levels) - level - 1
+        return max(2, math.ceil(self._k * (2.0 / 3.0) ** depth))
+
+    def _compress(self) -> None:
+        level = 0
+
+        while level < len(self._levels):
+            if len(self._levels[level]) > self._capacity(level):
+                if level + 1 == len(self._levels):
+                    self._levels.append(np.empty(0, dtype="float64"))
+
+                values = np.sort(self._levels[level])
+                kept = values[-1:] if len(values) % 2 else values[:0]
+                values = values[: len(values) - len(kept)]
+                promoted = values[self._rng.integers(2) :: 2]  # noqa: E203
+                self._levels[level] = kept
+                self._levels[level + 1] = np.concatenate(
+                    [self._levels[level + 1], promoted]
+                )
+
+            level += 1
+
+
+class StreamingStatistics(object):
+    """Accumulates summary statistics over a stream of values in constant memory.
+
+    The mean and variance are updated with Welford's algorithm, using the pairwise
+    update of Chan et al. to add whole batches at once, the minimum and maximum are
+    tracked directly, and the median and interquartile range are estimated with a
+    :py:class:`KLLSketch`. Accumulators built over separate shards of a dataset can be
+    combined with :py:meth:`merge`.
+
+    Args:
+        k: The capacity of the quantile sketch. The default is `200`.
+        seed: The seed for the random number generator used by the quantile sketch.
+    """
+
+    def __init__(self, k: int = 200, seed: Optional[int] = None) -> None:
+        self._count = 0
+        self._mean = 0.0
+        self._m2 = 0.0
+        self._min = math.inf
+        self._max = -math.inf
+        self._sketch = KLLSketch(k=k, seed=seed)
+
+    @property
+    def count(self) -> int:
+        """The number of values accumulated."""
+        return self._count
+
+    @property
+    def mean(self) -> float:
+        """The mean of the values."""
+        return self._mean if self._count > 0 else float("nan")
+
+    @property
+    def variance(self) -> float:
+        """The population variance of the values."""
+        return self._m2 / self._count if self._count > 0 else float("nan")
+
+    @property
+    def std(self) -> float:
+        """The population standard deviation of the values."""
+        return math.sqrt(self.variance)
+
+    @property
+    def min(self) -> float:
+        """The smallest value."""
+        return self._min if self._count > 0 else float("nan")
+
+    @property
+    def max(self) -> float:
+        """The largest value."""
+        return self._max if self._count > 0 else float("nan")
+
+    @property
+    def median(self) -> float:
+        """The estimated median of the values."""
+        return self.quantile(0.5)
+
+    @property
+    def iqr(self) -> float:
+        """The estimated interquartile range of the values."""
+        q25, q75 = self._sketch.quantile([0.25, 0.75])
+        return float(q75 - q25)
+
+    def quantile(self, q: float) -> float:
+        """Estimates a quantile of the values.
+
+        Args:
+            q: The quantile to estimate, in the range `[0, 1]`.
+
+        Returns:
+            The estimated quantile.
+        """
+        return float(self._sketch.quantile(q))
+
+    def update(self, values: ArrayLike) -> None:
+        """Adds values to the accumulator.
+
+        Args:
+            values: A scalar or array of values.
+        """
+        values = np.asarray(values, dtype="float64").ravel()
+
+        if values.size == 0:
+            return None
+
+        batch_mean = float(values.mean())
+        batch_m2 = float(np.square(values - batch_mean).sum())
+        self._combine(values.size, batch_mean, batch_m2)
+        self._min = min(self._min, float(values.min()))
+        self._max = max(self._max, float(values.max()))
+        self._sketch.update(values)
+
+    def merge(self, other: StreamingStatistics) -> StreamingStatistics:
+        """Merges another accumulator into this one.
+
+        Args:
+            other: The accumulator to merge.
+
+        Returns:
+            This accumulator, updated in place.
+        """
+        if other._count == 0:
+            return self
+
+        self._combine(other._count, other._mean, other._m2)
+        self._min = min(self._min, other._min)
+        self._max = max(self._max, other._max)
+        self._sketch.merge(other._sketch)
+
+        return self
+
+    def summary(self) -> Dict[str, float]:
+        """Returns the mean, median, standard deviation, IQR, minimum and maximum."""
+        return {
+            "mean": self.mean,
+            "median": self.median,
+            "stdev": self.std,
+            "iqr": self.iqr,
+            "min": self.min,
+            "max": self.max,
+        }
+
+    def to_dict(self) -> Dict[str, Any]:
+        """Serializes the accumulator to a JSON-compatible dictionary."""
+        return {
+            "count": self._count,
+            "mean": self._mean,
+            "m2": self._m2,
+            "min": self._min,
+            "max": self._max,
+            "sketch": self._sketch.to_dict(),
+        }
+
+    @classmethod
+    def from_dict(
+        cls, data: Dict[str, Any], seed: Optional[int] = None
+    ) -> StreamingStatistics:
+        """Restores an accumulator serialized with :py:meth:`to_dict`.
+
+        Args:
+            data: The serialized accumulator.
+            seed: The seed for the random number generator used by the quantile sketch.
+
+        Returns:
+            The restored accumulator.
+        """
+        statistics = cls(k=data["sketch"]["k"], seed=seed)
+        statistics._count = data["count"]
+        statistics._mean = data["mean"]
+        statistics._m2 = data["m2"]
+        statistics._min = data["min"]
+        statistics._max = data["max"]
+        statistics._sketch = KLLSketch.from_dict(data["sketch"], seed=seed)
+
+        return statistics
+
+    def _combine(self, count: int, mean: float, m2: float) -> None:
+        total = self._count + count
+        delta = mean - self._mean
+        self._mean += delta * count / total
+        self._m2 += m2 + delta * delta * self._count * count / total
+        self._count = total
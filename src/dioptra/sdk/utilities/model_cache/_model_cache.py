@@ -0,0 +1,346 @@
+# This Software (Dioptra) is being made available as a public service by the
+# National Institute of Standards and Technology (NIST), an Agency of the United
+# States Department of Commerce. This software was developed in part by employees of
+# NIST and in part by NIST contractors. Copyright in portions of this software that
+# were developed by NIST contractors has been licensed or assigned to NIST. Pursuant
+# to Title 17 United States Code Section 105, works of NIST employees are not
+# subject to copyright protection in the United States. However, NIST may hold
+# international copyright in software created by its employees and domestic
+# copyright (or licensing rights) in portions of software that were assigned or
+# licensed to NIST. To the extent that NIST holds copyright in this software, it is
+# being made available under the Creative Commons Attribution 4.0 International
+# license (CC BY 4.0). The disclaimers of the CC BY 4.0 license apply to all parts
+# of the software developed or licensed by NIST.
+#
+# ACCESS THE FULL CC BY 4.0 LICENSE HERE:
+# https://creativecommons.org/licenses/by/4.0/legalcode
+"""A process-local cache for models loaded from the MLFlow model registry."""
+from __future__ import annotations
+
+import hashlib
+import json
+import os
+import shutil
+import tempfile
+import threading
+import time
+from collections import OrderedDict
+from pathlib import Path
+from typing import Any, Callable, Dict, Hashable, List, Optional, Tuple, Union
+
+import structlog
+from mlflow.store.artifact.models_artifact_repo import ModelsArtifactRepository
+from mlflow.tracking import MlflowClient
+from structlog.stdlib import BoundLogger
+
+LOGGER: BoundLogger = structlog.stdlib.get_logger()
+
+ENVVAR_MODEL_CACHE_DIR = "DIOPTRA_MODEL_CACHE_DIR"
+ENVVAR_MODEL_CACHE_SIZE = "DIOPTRA_MODEL_CACHE_SIZE"
+DEFAULT_MODEL_CACHE_DIR = Path.home() / ".cache" / "dioptra" / "models"
+DEFAULT_MODEL_CACHE_SIZE = 4
+MANIFEST_FILENAME = "manifest.json"
+MODEL_DIRNAME = "model"
+
+_MODEL_CACHE: Optional[ModelCache] = None
+_MODEL_CACHE_LOCK = threading.Lock()
+
+
+class ModelCache(object):
+    """Caches registered models on disk and in memory.
+
+    A registered model is downloaded once into a versioned directory under
+    `cache_dir`. The directory is keyed by the registered model's name, its version,
+    and a fingerprint of the version's registry entry, so a version that is deleted
+    and registered again is downloaded anew. A SHA-256 checksum of the downloaded files
+    is recorded in the directory's manifest along with the size and modification time
+    of each file. When the model is loaded from disk, the checksum is only recomputed
+    if a file's size or modification time no longer matches the manifest. Repeated
+    loads within the same process are served from an in-memory LRU of deserialized
+    models.
+
+    Each model version has its own lock, so concurrent loads of the same model
+    download and deserialize it once, while loads of different models proceed in
+    parallel.
+
+    Models served from memory are shared between callers, so they should be treated as
+    read-only.
+
+    Args:
+        cache_dir: The root directory of the on-disk cache. If `None`, the
+            `DIOPTRA_MODEL_CACHE_DIR` environment variable is used, falling back to
+            `~/.cache/dioptra/models`.
+        max_models: The number of deserialized models to keep in memory. If `None`,
+            the `DIOPTRA_MODEL_CACHE_SIZE` environment variable is used, falling back
+            to `4`. Set to `0` to disable the in-memory cache.
+    """
+
+    def __init__(
+        self,
+        cache_dir: Optional[Union[str, Path]] = None,
+        max_models: Optional[int] = None,
+    ) -> None:
+        if cache_dir is None:
+            cache_dir = os.getenv(ENVVAR_MODEL_CACHE_DIR, DEFAULT_MODEL_CACHE_DIR)
+
+        if max_models is None:
+            max_models = int(
+                os.getenv(ENVVAR_MODEL_CACHE_SIZE, DEFAULT_MODEL_CACHE_SIZE)
+            )
+
+        if max_models < 0:
+            raise ValueError(f"max_models must be non-negative, got {max_models!r}.")
+
+        self._cache_dir = Path(cache_dir)
+        self._max_models = max_models
+        self._models: OrderedDict[Hashable, Tuple[Any, float]] = OrderedDict()
+        self._lock = threading.Lock()
+        self._model_locks: Dict[Hashable, threading.Lock] = {}
+        self._stats: Dict[str, float] = dict(
+            memory_hits=0,
+            disk_hits=0,
+            misses=0,
+            load_seconds=0.0,
+            load_seconds_saved=0.0,
+        )
+
+    @property
+    def cache_dir(self) -> Path:
+        """The root directory of the on-disk cache."""
+        return self._cache_dir
+
+    def load(
+        self,
+        name: str,
+        version: Union[int, str],
+        loader: Callable[[str], Any],
+        flavor: str = "default",
+    ) -> Any:
+        """Loads a registered model, using the cache where possible.
+
+        Args:
+            name: The name of the registered model in the MLFlow model registry.
+            version: The version number of the registered model in the MLFlow registry.
+            loader: A function that deserializes the model from a local directory.
+            flavor: A label that distinguishes models deserialized with different
+                loaders or runtime settings in the in-memory cache.
+
+        Returns:
+            The deserialized model.
+        """
+        start_time = time.perf_counter()
+        version = str(version)
+        fingerprint = self._fingerprint(name, version)
+        memory_key = (name, version, fingerprint, flavor)
+
+        cached = self._recall(memory_key)
+
+        if cached is None:
+            with self._model_lock((name, version, fingerprint)):
+                cached = self._recall(memory_key)
+
+                if cached is None:
+                    return self._load_from_disk(
+                        name, version, fingerprint, memory_key, loader, start_time
+                    )
+
+        model, cold_seconds = cached
+
+        return self._record(
+            "memory_hits", model, cold_seconds, start_time, name, version
+        )
+
+    def stats(self) -> Dict[str, float]:
+        """Returns the cache's hit counts, hit rate, and load-time savings.
+
+        The load-time savings are estimated by comparing each cache hit with the time
+        it originally took to download and deserialize the same model.
+        """
+        with self._lock:
+            stats = dict(self._stats)
+
+        hits = stats["memory_hits"] + stats["disk_hits"]
+        num_loads = hits + stats["misses"]
+        stats["hit_rate"] = hits / num_loads if num_loads else 0.0
+
+        return stats
+
+    def clear(self) -> None:
+        """Evicts all models from the in-memory cache.
+
+        The on-disk cache is left untouched.
+        """
+        with self._lock:
+            self._models.clear()
+
+    def _load_from_disk(
+        self,
+        name: str,
+        version: str,
+        fingerprint: str,
+        memory_key: Hashable,
+        loader: Callable[[str], Any],
+        start_time: float,
+    ) -> Any:
+        model_dir = self._cache_dir / name / version / fingerprint
+        manifest = self._read_manifest(model_dir)
+        cache_event = "disk_hits"
+
+        if manifest is None:
+            manifest = self._download(name, version, model_dir)
+            cache_event = "misses"
+
+        loader_start_time = time.perf_counter()
+        model = loader(str(model_dir / MODEL_DIRNAME))
+        cold_seconds = float(manifest["download_seconds"]) + (
+            time.perf_counter() - loader_start_time
+        )
+        self._remember(memory_key, model, cold_seconds)
+
+        return self._record(cache_event, model, cold_seconds, start_time, name, version)
+
+    def _record(
+        self,
+        kind: str,
+        model: Any,
+        cold_seconds: float,
+        start_time: float,
+        name: str,
+        version: str,
+    ) -> Any:
+        elapsed = time.perf_counter() - start_time
+
+        with self._lock:
+            self._stats[kind] += 1
+            self._stats["load_seconds"] += elapsed
+            self._stats["load_seconds_saved"] += max(cold_seconds - elapsed, 0.0)
+
+        LOGGER.info(
+            "Loaded registered model",
+            name=name,
+            version=version,
+            cache=kind,
+            load_seconds=elapsed,
+        )
+
+        return model
+
+    def _model_lock(self, key: Hashable) -> threading.Lock:
+        with self._lock:
+            return self._model_locks.setdefault(key, threading.Lock())
+
+    def _recall(self, key: Hashable) -> Optional[Tuple[Any, float]]:
+        with self._lock:
+            if key not in self._models:
+                return None
+
+            self._models.move_to_end(key)
+
+            return self._models[key]
+
+    def _remember(self, key: Hashable, model: Any, cold_seconds: float) -> None:
+        if self._max_models == 0:
+            return None
+
+        with self._lock:
+            self._models[key] = (model, cold_seconds)
+            self._models.move_to_end(key)
+
+            while len(self._models) > self._max_models:
+                self._models.popitem(last=False)
+
+    def _fingerprint(self, name: str, version: str) -> str:
+        model_version = MlflowClient().get_model_version(name=name, version=version)
+        registry_entry = json.dumps(
+            [
+                model_version.source,
+                model_version.run_id,
+                model_version.creation_timestamp,
+            ]
+        )
+
+        return hashlib.sha256(registry_entry.encode("utf-8")).hexdigest()[:16]
+
+    def _download(self, name: str, version: str, model_dir: Path) -> Dict[str, Any]:
+        model_dir.parent.mkdir(parents=True, exist_ok=True)
+        staging_dir = Path(tempfile.mkdtemp(dir=model_dir.parent, prefix=".download-"))
+
+        try:
+            start_time = time.perf_counter()
+            ModelsArtifactRepository(f"models:/{name}/{version}").download_artifacts(
+                artifact_path="", dst_path=str(staging_dir / MODEL_DIRNAME)
+            )
+            manifest = dict(
+                sha256=_checksum(staging_dir / MODEL_DIRNAME),
+                files=_file_stats(staging_dir / MODEL_DIRNAME),
+                download_seconds=time.perf_counter() - start_time,
+            )
+            (staging_dir / MANIFEST_FILENAME).write_text(json.dumps(manifest))
+
+            try:
+                os.replace(staging_dir, model_dir)
+
+            except OSError:
+                # Another process finished downloading the same model first.
+                if self._read_manifest(model_dir) is None:
+                    raise
+
+        finally:
+            shutil.rmtree(staging_dir, ignore_errors=True)
+
+        return manifest
+
+    def _read_manifest(self, model_dir: Path) -> Optional[Dict[str, Any]]:
+        manifest_path = model_dir / MANIFEST_FILENAME
+
+        if not manifest_path.exists():
+            return None
+
+        try:
+            manifest = json.loads(manifest_path.read_text())
+
+        except ValueError:
+            manifest = {}
+
+        if manifest.get("files") == _file_stats(model_dir / MODEL_DIRNAME):
+            return manifest
+
+        if manifest.get("sha256") != _checksum(model_dir / MODEL_DIRNAME):
+            LOGGER.warn("Discarding corrupted model cache entry", path=str(model_dir))
+            shutil.rmtree(model_dir, ignore_errors=True)
+            return None
+
+        return manifest
+
+
+def get_model_cache() -> ModelCache:
+    """Returns the process-wide model cache, creating it on first use."""
+    global _MODEL_CACHE
+
+    with _MODEL_CACHE_LOCK:
+        if _MODEL_CACHE is None:
+            _MODEL_CACHE = ModelCache()
+
+        return _MODEL_CACHE
+
+
+def _file_stats(directory: Path) -> Dict[str, List[int]]:
+    return {
+        path.relative_to(directory).as_posix(): [stat.st_size, stat.st_mtime_ns]
+        for path, stat in (
+            (x, x.stat()) for x in sorted(directory.rglob("*")) if x.is_file()
+        )
+    }
+
+
+def _checksum(directory: Path) -> str:
+    digest = hashlib.sha256()
+
+    for path in sorted(x for x in directory.rglob("*") if x.is_file()):
+        digest.update(path.relative_to(directory).as_posix().encode("utf-8"))
+
+        with path.open("rb") as f:
+            for chunk in iter(lambda: f.read(1 << 20), b""):
+                digest.update(chunk)
+
+    return digest.hexdigest()
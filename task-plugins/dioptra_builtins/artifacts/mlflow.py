@@ -31,6 +31,7 @@ from mlflow.tracking import MlflowClient
 from structlog.stdlib import BoundLogger
 
 from dioptra import pyplugs
+from dioptra.sdk.utilities.archives import create_tarball
 from dioptra.sdk.utilities.paths import set_path_ext
 
 from .exceptions import UnsupportedDataFrameFileFormatError
@@ -185,9 +186,15 @@ def upload_directory_as_tarball_artifact(
     tarball_filename: str,
     tarball_write_mode: str = "w:gz",
     working_dir: Optional[Union[str, Path]] = None,
+    num_threads: Optional[int] = None,
+    compresslevel: int = 9,
 ) -> None:
     """Archives a directory and uploads it as an artifact of the active MLFlow run.
 
+    Gzip-compressed tarballs are compressed in blocks on multiple threads, see
+    :py:func:`~dioptra.sdk.utilities.archives.create_tarball`. The result is a standard
+    gzip file that can be extracted with any tar utility.
+
     Args:
         source_dir: The directory which should be uploaded.
         tarball_filename: The filename to use for the archived directory tarball.
@@ -196,9 +203,17 @@ def upload_directory_as_tarball_artifact(
             compression).
         working_dir: The location where the file should be saved. If `None`, then the
             current working directory is used. The default is `None`.
+        num_threads: The number of threads to use for gzip compression. If `None`, the
+            number of CPUs is used. Ignored for other compression options. The default
+            is `None`.
+        compresslevel: The gzip compression level, from `0` (no compression) to `9`
+            (best compression). Lower levels are much faster and lose little for
+            directories of already-compressed files, such as PNG images. Ignored for
+            other compression options. The default is `9`.
 
     See Also:
         - :py:func:`tarfile.open`
+        - :py:func:`dioptra.sdk.utilities.archives.create_tarball`
     """
     if working_dir is None:
         working_dir = Path.cwd()
@@ -207,8 +222,17 @@ def upload_directory_as_tarball_artifact(
     working_dir = Path(working_dir)
     tarball_path = working_dir / tarball_filename
 
-    with tarfile.open(tarball_path, tarball_write_mode) as f:
-        f.add(source_dir, arcname=source_dir.name)
+    if tarball_write_mode in {"w:gz", "w|gz"}:
+        create_tarball(
+            source_dir=source_dir,
+            tarball_path=tarball_path,
+            compresslevel=compresslevel,
+            num_threads=num_threads,
+        )
+
+    else:
+        with tarfile.open(tarball_path, tarball_write_mode) as f:
+            f.add(source_dir, arcname=source_dir.name)
 
     LOGGER.info(
         "Directory added to tar archive",
@@ -18,37 +18,50 @@
 
 from __future__ import annotations
 
-import tarfile
 from pathlib import Path
-from typing import List, Union
+from typing import List, Optional, Union
 
 import structlog
 from structlog.stdlib import BoundLogger
 
 from dioptra import pyplugs
+from dioptra.sdk.utilities.archives import extract_tarball
 
 LOGGER: BoundLogger = structlog.stdlib.get_logger()
 
 
 @pyplugs.register
 def extract_tarfile(
-    filepath: Union[str, Path], tarball_read_mode: str = "r:gz"
+    filepath: Union[str, Path],
+    tarball_read_mode: str = "r:gz",
+    num_threads: Optional[int] = None,
 ) -> None:
     """Extracts a tarball archive into the current working directory.
 
+    The archive is decompressed on a background thread while the extracted files are
+    written on a thread pool, see
+    :py:func:`~dioptra.sdk.utilities.archives.extract_tarball`.
+
     Args:
         filepath: The location of the tarball archive file provided as a string or a
             :py:class:`~pathlib.Path` object.
         tarball_read_mode: The read mode for the tarball, see :py:func:`tarfile.open`
             for the full list of compression options. The default is `"r:gz"` (gzip
             compression).
+        num_threads: The number of threads to use for writing the extracted files. If
+            `None`, the number of CPUs is used. The default is `None`.
 
     See Also:
         - :py:func:`tarfile.open`
+        - :py:func:`dioptra.sdk.utilities.archives.extract_tarball`
     """
     filepath = Path(filepath)
-    with tarfile.open(filepath, tarball_read_mode) as f:
-        f.extractall(path=Path.cwd())
+    extract_tarball(
+        tarball_path=filepath,
+        output_dir=Path.cwd(),
+        tarball_read_mode=tarball_read_mode,
+        num_threads=num_threads,
+    )
 
 
 @pyplugs.register
@@ -37,8 +37,20 @@ References:
 
 from __future__ import annotations
 
+from collections import deque
+from concurrent.futures import Future, ThreadPoolExecutor
 from pathlib import Path
-from typing import Callable, Dict, List, Optional, Tuple, Union
+from typing import (
+    TYPE_CHECKING,
+    Any,
+    Callable,
+    Deque,
+    Dict,
+    List,
+    Optional,
+    Tuple,
+    Union,
+)
 
 import mlflow
 import numpy as np
@@ -50,28 +62,20 @@ from structlog.stdlib import BoundLogger
 from dioptra import pyplugs
 from dioptra.sdk.exceptions import ARTDependencyError, TensorflowDependencyError
 from dioptra.sdk.utilities.decorators import require_package
+from dioptra.sdk.utilities.imports import lazy_import
+from dioptra.sdk.utilities.metrics import ParquetSpillWriter, StreamingStatistics
+
+from ..metrics.distance import evaluate_distance_metrics
 
 LOGGER: BoundLogger = structlog.stdlib.get_logger()
 
-try:
+art_evasion = lazy_import("art.attacks.evasion")
+keras_image = lazy_import("tensorflow.keras.preprocessing.image")
+
+if TYPE_CHECKING:
     from art.attacks.evasion import FastGradientMethod
     from art.estimators.classification import KerasClassifier
-
-except ImportError:  # pragma: nocover
-    LOGGER.warn(
-        "Unable to import one or more optional packages, functionality may be reduced",
-        package="art",
-    )
-
-
-try:
-    from tensorflow.keras.preprocessing.image import ImageDataGenerator, save_img
-
-except ImportError:  # pragma: nocover
-    LOGGER.warn(
-        "Unable to import one or more optional packages, functionality may be reduced",
-        package="tensorflow",
-    )
+    from tensorflow.keras.preprocessing.image import ImageDataGenerator
 
 
 @pyplugs.register
@@ -90,6 +94,11 @@ def create_adversarial_fgm_dataset(
     eps_step: float = 0.1,
     minimal: bool = False,
     norm: Union[int, float, str] = np.inf,
+    num_workers: int = 4,
+    prefetch: int = 2,
+    shard_index: int = 0,
+    num_shards: int = 1,
+    spill_path: Optional[Union[str, Path]] = None,
 ) -> pd.DataFrame:
     """Generates an adversarial dataset using the Fast Gradient Method attack.
 
@@ -98,6 +107,31 @@ def create_adversarial_fgm_dataset(
     `distance_metrics_list` are used to quantify the size of the perturbation applied to
     each image.
 
+    Generation is pipelined: up to `prefetch` batches are loaded and preprocessed on
+    a background thread while the attack runs on the calling thread, and a pool of
+    `num_workers` threads encodes and writes the adversarial images and computes the
+    distance metrics for completed batches. The output directories for each class are
+    created once before generation starts.
+
+    Every image in `data_dir` is attacked, including the images in a final partial
+    batch. Setting `num_shards` greater than `1` splits the batches of the
+    deterministic (unshuffled) file ordering into `num_shards` contiguous blocks and
+    only generates the block at `shard_index`, so that a large dataset can be
+    generated by several independent jobs. Concatenating the returned
+    :py:class:`~pandas.DataFrame` objects in shard order gives the same result as a
+    single unsharded job.
+
+    The summary statistics of each distance metric are accumulated in constant memory
+    as batches complete and are logged to the MLFlow Tracking service at the end. If
+    `spill_path` is set, the per-image distance metrics are appended to a Parquet file
+    batch by batch instead of being held in memory, and the median and interquartile
+    range are estimated using a quantile sketch. Otherwise, the exact median and
+    interquartile range are computed from the per-image values. When generation is
+    sharded, the serialized accumulators are also logged as the artifact
+    `distance_metrics_statistics_shard{shard_index}.json` so that the statistics of
+    all shards can be merged with
+    :py:meth:`~dioptra.sdk.utilities.metrics.StreamingStatistics.merge`.
+
     Args:
         data_dir: The directory containing the clean test images.
         adv_data_dir: The directory to use when saving the generated adversarial images.
@@ -127,10 +161,25 @@ def create_adversarial_fgm_dataset(
             step size and `eps` for the maximum perturbation. The default is `False`.
         norm: The norm of the adversarial perturbation. Can be `"inf"`,
             :py:data:`numpy.inf`, `1`, or `2`. The default is :py:data:`numpy.inf`.
+        num_workers: The number of threads used to write the adversarial images and
+            compute the distance metrics. If `0`, this work is done serially on the
+            calling thread. The default is `4`.
+        prefetch: The number of batches to load ahead of the attack. If `0`, batches
+            are loaded on the calling thread. The default is `2`.
+        shard_index: The index of the shard of batches to generate, starting from
+            `0`. The default is `0`.
+        num_shards: The total number of shards the batches are split into. The
+            default is `1`.
+        spill_path: The path of a Parquet file used to store the per-image distance
+            metrics. If `None`, the per-image distance metrics are kept in memory and
+            returned. The default is `None`.
 
     Returns:
         A :py:class:`~pandas.DataFrame` containing the full distribution of the
-        calculated distance metrics.
+        calculated distance metrics. If `spill_path` is set, the full distribution is
+        stored in the Parquet file instead and the returned
+        :py:class:`~pandas.DataFrame` contains one row of summary statistics per
+        distance metric.
 
     See Also:
         - |flow_from_directory|
@@ -138,6 +187,8 @@ def create_adversarial_fgm_dataset(
     .. |flow_from_directory| replace:: :py:meth:`tf.keras.preprocessing.image\\
        .ImageDataGenerator.flow_from_directory`
     """
+    _validate_shard(shard_index=shard_index, num_shards=num_shards)
+
     distance_metrics_list = distance_metrics_list or []
     color_mode: str = "color" if image_size[2] == 3 else "grayscale"
     target_size: Tuple[int, int] = image_size[:2]
@@ -152,7 +203,7 @@ def create_adversarial_fgm_dataset(
         norm=norm,
     )
 
-    data_generator: ImageDataGenerator = ImageDataGenerator(rescale=rescale)
+    data_generator: ImageDataGenerator = keras_image.ImageDataGenerator(rescale=rescale)
 
     data_flow = data_generator.flow_from_directory(
         directory=data_dir,
@@ -163,48 +214,129 @@ def create_adversarial_fgm_dataset(
         shuffle=False,
     )
     num_images = data_flow.n
+    shard_batches = _shard_batches(
+        num_batches=-(-num_images // batch_size),
+        shard_index=shard_index,
+        num_shards=num_shards,
+    )
     img_filenames = [Path(x) for x in data_flow.filenames]
 
     distance_metrics_: Dict[str, List[List[float]]] = {"image": [], "label": []}
+    distance_metrics_statistics: Dict[str, StreamingStatistics] = {}
     for metric_name, _ in distance_metrics_list:
         distance_metrics_[metric_name] = []
+        distance_metrics_statistics[metric_name] = StreamingStatistics()
+
+    spill_writer: Optional[ParquetSpillWriter] = (
+        ParquetSpillWriter(spill_path) if spill_path is not None else None
+    )
+
+    for class_index in data_flow.class_indices.values():
+        (adv_data_dir / f"{class_index}").mkdir(parents=True, exist_ok=True)
 
     LOGGER.info(
         "Generate adversarial images",
         attack="fgm",
-        num_batches=num_images // batch_size,
+        num_batches=len(shard_batches),
+        shard_index=shard_index,
+        num_shards=num_shards,
+        num_workers=num_workers,
+        prefetch=prefetch,
     )
 
-    for batch_num, (x, y) in enumerate(data_flow):
-        if batch_num >= num_images // batch_size:
-            break
+    loader = ThreadPoolExecutor(max_workers=1) if prefetch > 0 else None
+    writer = ThreadPoolExecutor(max_workers=num_workers) if num_workers > 0 else None
+    loaded_batches: Deque[Future] = deque()
+    pending_batches: Deque[List[Future]] = deque()
+
+    try:
+        for batch_num in shard_batches[:prefetch]:
+            loaded_batches.append(_submit(loader, data_flow.__getitem__, batch_num))
+
+        for position, batch_num in enumerate(shard_batches):
+            if position + prefetch < len(shard_batches):
+                loaded_batches.append(
+                    _submit(
+                        loader,
+                        data_flow.__getitem__,
+                        shard_batches[position + prefetch],
+                    )
+                )
+
+            x, y = loaded_batches.popleft().result()
+            clean_filenames = img_filenames[
+                batch_num * batch_size : (batch_num + 1) * batch_size  # noqa: E203
+            ]
+
+            LOGGER.info(
+                "Generate adversarial image batch",
+                attack="fgm",
+                batch_num=batch_num,
+            )
+
+            y_int = np.argmax(y, axis=1)
+            adv_batch = attack.generate(x=x)
+
+            pending_batches.append(
+                _save_adv_batch(writer, adv_batch, adv_data_dir, y_int, clean_filenames)
+                + [
+                    _submit(
+                        writer,
+                        _evaluate_distance_metrics,
+                        clean_filenames=clean_filenames,
+                        clean_batch=x,
+                        adv_batch=adv_batch,
+                        distance_metrics_list=distance_metrics_list,
+                    )
+                ]
+            )
+
+            while len(pending_batches) > max(num_workers, 1):
+                _collect_batch(
+                    pending_batches.popleft(),
+                    distance_metrics_,
+                    distance_metrics_statistics,
+                    spill_writer,
+                )
+
+        while pending_batches:
+            _collect_batch(
+                pending_batches.popleft(),
+                distance_metrics_,
+                distance_metrics_statistics,
+                spill_writer,
+            )
+
+    finally:
+        _cancel_pending(loaded_batches, pending_batches)
+
+        for executor in (loader, writer):
+            if executor is not None:
+                executor.shutdown(wait=True)
+
+        if spill_writer is not None:
+            spill_writer.close()
 
-        clean_filenames = img_filenames[
-            batch_num * batch_size : (batch_num + 1) * batch_size  # noqa: E203
-        ]
+    LOGGER.info("Adversarial image generation complete", attack="fgm")
+    _log_distance_metrics(
+        distance_metrics_statistics,
+        distance_metrics_=distance_metrics_ if spill_writer is None else None,
+    )
 
-        LOGGER.info(
-            "Generate adversarial image batch",
-            attack="fgm",
-            batch_num=batch_num,
+    if num_shards > 1:
+        mlflow.log_dict(
+            {k: v.to_dict() for k, v in distance_metrics_statistics.items()},
+            f"distance_metrics_statistics_shard{shard_index}.json",
         )
 
-        y_int = np.argmax(y, axis=1)
-        adv_batch = attack.generate(x=x)
-
-        _save_adv_batch(adv_batch, adv_data_dir, y_int, clean_filenames)
-
-        _evaluate_distance_metrics(
-            clean_filenames=clean_filenames,
-            distance_metrics_=distance_metrics_,
-            clean_batch=x,
-            adv_batch=adv_batch,
-            distance_metrics_list=distance_metrics_list,
+    if spill_writer is not None:
+        return pd.DataFrame(
+            [
+                {"metric": metric_name, **statistics.summary()}
+                for metric_name, statistics in distance_metrics_statistics.items()
+            ]
         )
 
-    LOGGER.info("Adversarial image generation complete", attack="fgm")
-    _log_distance_metrics(distance_metrics_)
-
     return pd.DataFrame(distance_metrics_)
 
 
@@ -221,62 +353,213 @@ def _init_fgm(
     Returns:
         A :py:class:`~art.attacks.evasion.FastGradientMethod` object.
     """
-    attack: FastGradientMethod = FastGradientMethod(
+    attack: FastGradientMethod = art_evasion.FastGradientMethod(
         estimator=keras_classifier, batch_size=batch_size, **kwargs
     )
     return attack
 
 
-def _save_adv_batch(adv_batch, adv_data_dir, y, clean_filenames) -> None:
+def _validate_shard(shard_index: int, num_shards: int) -> None:
+    """Checks that `shard_index` identifies one of `num_shards` shards.
+
+    Args:
+        shard_index: The index of the shard of batches to generate.
+        num_shards: The total number of shards the batches are split into.
+
+    Raises:
+        ValueError: If `num_shards` is less than `1` or `shard_index` is not in the
+            range `[0, num_shards)`.
+    """
+    if num_shards < 1 or not 0 <= shard_index < num_shards:
+        raise ValueError(
+            f"Invalid shard: shard_index={shard_index!r}, num_shards={num_shards!r}. "
+            "The shard_index must satisfy 0 <= shard_index < num_shards."
+        )
+
+
+def _shard_batches(num_batches: int, shard_index: int, num_shards: int) -> range:
+    """Returns the contiguous block of batch numbers that belongs to a shard.
+
+    The blocks of all `num_shards` shards cover every batch exactly once and their
+    sizes differ by at most one batch. If `num_shards` is greater than `num_batches`,
+    some of the blocks are empty.
+
+    Args:
+        num_batches: The total number of batches.
+        shard_index: The index of the shard of batches to generate.
+        num_shards: The total number of shards the batches are split into.
+
+    Returns:
+        The batch numbers of the shard.
+
+    Raises:
+        ValueError: If the shard is invalid.
+    """
+    _validate_shard(shard_index=shard_index, num_shards=num_shards)
+
+    return range(
+        num_batches * shard_index // num_shards,
+        num_batches * (shard_index + 1) // num_shards,
+    )
+
+
+def _submit(
+    executor: Optional[ThreadPoolExecutor], fn: Callable[..., Any], *args, **kwargs
+) -> Future:
+    """Submits a callable to an executor, or runs it immediately if there is none.
+
+    Args:
+        executor: The executor to submit `fn` to. If `None`, `fn` is called on the
+            calling thread and its outcome is wrapped in a completed future.
+        fn: The callable to run.
+
+    Returns:
+        A :py:class:`~concurrent.futures.Future` holding the outcome of `fn`.
+    """
+    if executor is not None:
+        return executor.submit(fn, *args, **kwargs)
+
+    future: Future = Future()
+
+    try:
+        future.set_result(fn(*args, **kwargs))
+
+    except BaseException as exc:
+        future.set_exception(exc)
+
+    return future
+
+
+def _cancel_pending(
+    loaded_batches: Deque[Future], pending_batches: Deque[List[Future]]
+) -> None:
+    """Cancels the loads and writes that have not started yet.
+
+    This is done manually instead of with the `cancel_futures` argument of
+    :py:meth:`~concurrent.futures.Executor.shutdown`, which requires Python 3.9.
+
+    Args:
+        loaded_batches: The futures for the batches being loaded.
+        pending_batches: The futures for the image writes and distance metrics of the
+            batches that have not been collected yet.
+    """
+    for future in loaded_batches:
+        future.cancel()
+
+    for batch_futures in pending_batches:
+        for future in batch_futures:
+            future.cancel()
+
+
+def _collect_batch(
+    batch_futures: List[Future],
+    distance_metrics_: Dict[str, List[List[float]]],
+    distance_metrics_statistics: Dict[str, StreamingStatistics],
+    spill_writer: Optional[ParquetSpillWriter] = None,
+) -> None:
+    """Waits for a batch's image writes and records its distance metrics.
+
+    Args:
+        batch_futures: The futures for a batch's image writes, followed by the future
+            for its distance metrics.
+        distance_metrics_: A dictionary used to record the values of the distance
+            metrics computed for the clean/adversarial image pairs.
+        distance_metrics_statistics: A dictionary of accumulators used to compute the
+            summary statistics of each distance metric.
+        spill_writer: If not `None`, the batch's distance metrics are written to this
+            file instead of being recorded in `distance_metrics_`.
+    """
+    for future in batch_futures[:-1]:
+        future.result()
+
+    batch_metrics = batch_futures[-1].result()
+
+    for metric_name, statistics in distance_metrics_statistics.items():
+        statistics.update(batch_metrics[metric_name])
+
+    if spill_writer is not None:
+        batch_metrics["label"] = [str(x) for x in batch_metrics["label"]]
+        spill_writer.write_batch(batch_metrics)
+        return None
+
+    for key, values in batch_metrics.items():
+        distance_metrics_[key].extend(values)
+
+
+def _save_adv_batch(
+    executor, adv_batch, adv_data_dir, y, clean_filenames
+) -> List[Future]:
     """Saves a batch of adversarial images to disk.
 
+    The output directories are expected to exist already.
+
     Args:
+        executor: The executor used to encode and write the images. If `None`, the
+            images are written on the calling thread.
         adv_batch: A generated batch of adversarial images.
         adv_data_dir: The directory to use when saving the generated adversarial images.
         y: An array containing the target labels of the original images.
         clean_filenames: A list containing the filenames of the original images.
+
+    Returns:
+        A list of futures, one per image write.
     """
+    futures: List[Future] = []
+
     for batch_image_num, adv_image in enumerate(adv_batch):
         adv_image_path = (
             adv_data_dir
             / f"{y[batch_image_num]}"
             / f"adv_{clean_filenames[batch_image_num].name}"
         )
+        futures.append(
+            _submit(
+                executor, keras_image.save_img, path=str(adv_image_path), x=adv_image
+            )
+        )
 
-        if not adv_image_path.parent.exists():
-            adv_image_path.parent.mkdir(parents=True)
-
-        save_img(path=str(adv_image_path), x=adv_image)
+    return futures
 
 
 def _evaluate_distance_metrics(
-    clean_filenames, distance_metrics_, clean_batch, adv_batch, distance_metrics_list
-) -> None:
+    clean_filenames, clean_batch, adv_batch, distance_metrics_list
+) -> Dict[str, List[Any]]:
     """Calculates distance metrics for a batch of clean/adversarial image pairs.
 
     Args:
         clean_filenames: A list containing the filenames of the original images.
-        distance_metrics_: A dictionary used to record the values of the distance
-            metrics computed for the clean/adversarial image pairs.
         clean_batch: The clean images used to generate the adversarial images in
             `adv_batch`.
         adv_batch: A generated batch of adversarial images.
         distance_metrics_list: A list of distance metrics to compute after generating an
             adversarial image.
+
+    Returns:
+        A dictionary mapping the image names, labels, and each distance metric to
+        their values for the batch.
     """
     LOGGER.debug("evaluate image perturbations using distance metrics")
-    distance_metrics_["image"].extend([x.name for x in clean_filenames])
-    distance_metrics_["label"].extend([x.parent for x in clean_filenames])
-    for metric_name, metric in distance_metrics_list:
-        distance_metrics_[metric_name].extend(metric(clean_batch, adv_batch))
+    batch_metrics: Dict[str, List[Any]] = {
+        "image": [x.name for x in clean_filenames],
+        "label": [x.parent for x in clean_filenames],
+    }
+
+    for metric_name, values in evaluate_distance_metrics(
+        distance_metrics_list, clean_batch, adv_batch
+    ).items():
+        batch_metrics[metric_name] = list(values)
+
+    return batch_metrics
 
 
-def _log_distance_metrics(distance_metrics_: Dict[str, List[List[float]]]) -> None:
+def _log_distance_metrics(
+    distance_metrics_statistics: Dict[str, StreamingStatistics],
+    distance_metrics_: Optional[Dict[str, List[Any]]] = None,
+) -> None:
     """Logs the distance metrics summary statistics to the MLFlow Tracking service.
 
-    The following summary statistics are calculated and logged to the MLFlow Tracking
-    service for each of the distributions recorded in the `distance_metrics_`
-    dictionary:
+    The following summary statistics are logged to the MLFlow Tracking service for
+    each of the accumulators in the `distance_metrics_statistics` dictionary:
 
     - mean
     - median
@@ -285,21 +568,27 @@ def _log_distance_metrics(distance_metrics_: Dict[str, List[List[float]]]) -> No
     - minimum
     - maximum
 
+    The median and interquartile range are computed exactly from the values in
+    `distance_metrics_` when they are held in memory. If `distance_metrics_` is
+    `None`, as when the values have been spilled to disk, they are estimated from the
+    accumulators' quantile sketches instead.
+
     Args:
-        distance_metrics_: A dictionary used to record the values of the distance
-            metrics computed for the clean/adversarial image pairs.
+        distance_metrics_statistics: A dictionary of accumulators used to compute the
+            summary statistics of each distance metric.
+        distance_metrics_: A dictionary containing the values of the distance metrics
+            computed for the clean/adversarial image pairs, or `None` if the values
+            are not held in memory. The default is `None`.
     """
-    distance_metrics_ = distance_metrics_.copy()
-    del distance_metrics_["image"]
-    del distance_metrics_["label"]
-    for metric_name, metric_values_list in distance_metrics_.items():
-        metric_values = np.array(metric_values_list)
-        mlflow.log_metric(key=f"{metric_name}_mean", value=metric_values.mean())
-        mlflow.log_metric(key=f"{metric_name}_median", value=np.median(metric_values))
-        mlflow.log_metric(key=f"{metric_name}_stdev", value=metric_values.std())
-        mlflow.log_metric(
-            key=f"{metric_name}_iqr", value=scipy.stats.iqr(metric_values)
-        )
-        mlflow.log_metric(key=f"{metric_name}_min", value=metric_values.min())
-        mlflow.log_metric(key=f"{metric_name}_max", value=metric_values.max())
+    for metric_name, statistics in distance_metrics_statistics.items():
+        summary = statistics.summary()
+
+        if distance_metrics_ is not None and statistics.count > 0:
+            metric_values = np.asarray(distance_metrics_[metric_name], dtype="float64")
+            summary["median"] = float(np.median(metric_values))
+            summary["iqr"] = float(scipy.stats.iqr(metric_values))
+
+        for statistic_name, value in summary.items():
+            mlflow.log_metric(key=f"{metric_name}_{statistic_name}", value=value)
+
         LOGGER.info("logged distance-based metric", metric_name=metric_name)
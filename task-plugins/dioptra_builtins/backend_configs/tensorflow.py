@@ -18,38 +18,74 @@
 
 from __future__ import annotations
 
+from typing import Callable, Dict, Optional
+
 import structlog
 from structlog.stdlib import BoundLogger
 
 from dioptra import pyplugs
 from dioptra.sdk.exceptions import TensorflowDependencyError
 from dioptra.sdk.utilities.decorators import require_package
+from dioptra.sdk.utilities.imports import lazy_import
 
 LOGGER: BoundLogger = structlog.stdlib.get_logger()
 
-
-try:
-    import tensorflow as tf
-
-except ImportError:  # pragma: nocover
-    LOGGER.warn(
-        "Unable to import one or more optional packages, functionality may be reduced",
-        package="tensorflow",
-    )
+tf = lazy_import("tensorflow")
 
 
 @pyplugs.register
 @require_package("tensorflow", exc_type=TensorflowDependencyError)
-def init_tensorflow(seed: int) -> None:
+def init_tensorflow(seed: int, execution_mode: str = "graph") -> None:
     """Initializes Tensorflow to ensure compatibility and reproducibility.
 
     This task plugin **must** be run before any other features from Tensorflow are used.
-    It disables Tensorflow's eager execution, which is not compatible with Dioptra's
-    entry point structure, and sets Tensorflow's internal seed for its random number
-    generator.
+    It configures how Tensorflow executes operations and sets Tensorflow's internal
+    seed for its random number generator. The following execution modes are available,
+
+    - `"graph"` - Disables Tensorflow's eager execution so that models run in
+      Tensorflow 1.x style graphs and sessions.
+    - `"eager"` - Keeps Tensorflow 2.x eager execution enabled. The builtin plugins
+      compile their hot paths with :py:func:`tf.function` instead, which allows
+      tracing, XLA compilation and :py:mod:`tf.data` autotuning.
 
     Args:
         seed: The seed to use for Tensorflow's random number generator.
+        execution_mode: The Tensorflow execution mode, either `"graph"` or `"eager"`.
+            The default is `"graph"`.
     """
-    tf.compat.v1.disable_eager_execution()
+    configure_execution_mode: Optional[
+        Callable[[], None]
+    ] = TENSORFLOW_EXECUTION_MODES_REGISTRY.get(execution_mode)
+
+    if configure_execution_mode is None:
+        raise ValueError(
+            f"The execution mode {execution_mode!r} is not supported. The following "
+            "execution modes are currently available: "
+            f"{list(TENSORFLOW_EXECUTION_MODES_REGISTRY)}"
+        )
+
+    configure_execution_mode()
     tf.random.set_seed(seed)
+    LOGGER.info("Initialized Tensorflow", execution_mode=execution_mode)
+
+
+def _configure_graph_mode() -> None:
+    """Disables eager execution."""
+    tf.compat.v1.disable_eager_execution()
+
+
+def _configure_eager_mode() -> None:
+    """Keeps eager execution enabled and ensures that tf.function graphs are used."""
+    if not tf.executing_eagerly():
+        raise RuntimeError(
+            "Eager execution has already been disabled in this process and cannot be "
+            "re-enabled."
+        )
+
+    tf.config.run_functions_eagerly(False)
+
+
+TENSORFLOW_EXECUTION_MODES_REGISTRY: Dict[str, Callable[[], None]] = dict(
+    graph=_configure_graph_mode,
+    eager=_configure_eager_mode,
+)
@@ -24,7 +24,7 @@
 
 from __future__ import annotations
 
-from typing import Optional, Tuple
+from typing import TYPE_CHECKING, Optional, Tuple
 
 import structlog
 from structlog.stdlib import BoundLogger
@@ -32,21 +32,18 @@ from structlog.stdlib import BoundLogger
 from dioptra import pyplugs
 from dioptra.sdk.exceptions import TensorflowDependencyError
 from dioptra.sdk.utilities.decorators import require_package
+from dioptra.sdk.utilities.imports import lazy_import
 
 LOGGER: BoundLogger = structlog.stdlib.get_logger()
 
-try:
+keras_image = lazy_import("tensorflow.keras.preprocessing.image")
+
+if TYPE_CHECKING:
     from tensorflow.keras.preprocessing.image import (
         DirectoryIterator,
         ImageDataGenerator,
     )
 
-except ImportError:  # pragma: nocover
-    LOGGER.warn(
-        "Unable to import one or more optional packages, functionality may be reduced",
-        package="tensorflow",
-    )
-
 
 @pyplugs.register
 @require_package("tensorflow", exc_type=TensorflowDependencyError)
@@ -98,7 +95,7 @@ def create_image_dataset(
     )
     target_size: Tuple[int, int] = image_size[:2]
 
-    data_generator: ImageDataGenerator = ImageDataGenerator(
+    data_generator: ImageDataGenerator = keras_image.ImageDataGenerator(
         rescale=rescale,
         validation_split=validation_split,
     )
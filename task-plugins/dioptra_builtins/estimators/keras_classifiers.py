@@ -19,7 +19,7 @@
 from __future__ import annotations
 
 from types import FunctionType
-from typing import Callable, Dict, List, Tuple, Union
+from typing import TYPE_CHECKING, Any, Callable, Dict, List, Tuple, Union
 
 import structlog
 from structlog.stdlib import BoundLogger
@@ -27,28 +27,18 @@ from structlog.stdlib import BoundLogger
 from dioptra import pyplugs
 from dioptra.sdk.exceptions import TensorflowDependencyError
 from dioptra.sdk.utilities.decorators import require_package
+from dioptra.sdk.utilities.imports import lazy_import
 
 LOGGER: BoundLogger = structlog.stdlib.get_logger()
 
-try:
-    from tensorflow.keras.layers import (
-        BatchNormalization,
-        Conv2D,
-        Dense,
-        Dropout,
-        Flatten,
-        MaxPooling2D,
-    )
+keras_layers = lazy_import("tensorflow.keras.layers")
+keras_models = lazy_import("tensorflow.keras.models")
+
+if TYPE_CHECKING:
     from tensorflow.keras.metrics import Metric
     from tensorflow.keras.models import Sequential
     from tensorflow.keras.optimizers import Optimizer
 
-except ImportError:  # pragma: nocover
-    LOGGER.warn(
-        "Unable to import one or more optional packages, functionality may be reduced",
-        package="tensorflow",
-    )
-
 
 @pyplugs.register
 @require_package("tensorflow", exc_type=TensorflowDependencyError)
@@ -59,6 +49,7 @@ def init_classifier(
     input_shape: Tuple[int, int, int],
     n_classes: int,
     loss: str = "categorical_crossentropy",
+    jit_compile: bool = False,
 ) -> Sequential:
     """Initializes an untrained neural network image classifier for Tensorflow/Keras.
 
@@ -86,6 +77,10 @@ def init_classifier(
             string must match the name of one of the loss functions in the
             :py:mod:`tf.keras.losses` module. The default is
             `"categorical_crossentropy"`.
+        jit_compile: If `True`, compile the model's training and prediction steps with
+            XLA. Requires eager execution to be enabled, see
+            :py:func:`~.backend_configs.tensorflow.init_tensorflow`. The default is
+            `False`.
 
     Returns:
         A compiled :py:class:`~tf.keras.Sequential` object.
@@ -99,7 +94,10 @@ def init_classifier(
         input_shape,
         n_classes,
     )
-    classifier.compile(loss=loss, optimizer=optimizer, metrics=metrics)
+    compile_kwargs: Dict[str, Any] = dict(jit_compile=True) if jit_compile else {}
+    classifier.compile(
+        loss=loss, optimizer=optimizer, metrics=metrics, **compile_kwargs
+    )
 
     return classifier
 
@@ -119,16 +117,16 @@ def shallow_net(input_shape: Tuple[int, int, int], n_classes: int) -> Sequential
     See Also:
         - :py:class:`tf.keras.Sequential`
     """
-    model = Sequential()
+    model = keras_models.Sequential()
 
     # Flatten inputs
-    model.add(Flatten(input_shape=input_shape))
+    model.add(keras_layers.Flatten(input_shape=input_shape))
 
     # single hidden layer:
-    model.add(Dense(32, activation="sigmoid"))
+    model.add(keras_layers.Dense(32, activation="sigmoid"))
 
     # output layer:
-    model.add(Dense(n_classes, activation="softmax"))
+    model.add(keras_layers.Dense(n_classes, activation="softmax"))
 
     return model
 
@@ -148,25 +146,27 @@ def le_net(input_shape: Tuple[int, int, int], n_classes: int) -> Sequential:
     See Also:
         - :py:class:`tf.keras.Sequential`
     """
-    model = Sequential()
+    model = keras_models.Sequential()
 
     # first convolutional layer:
     model.add(
-        Conv2D(32, kernel_size=(3, 3), activation="relu", input_shape=input_shape)
+        keras_layers.Conv2D(
+            32, kernel_size=(3, 3), activation="relu", input_shape=input_shape
+        )
     )
 
     # second conv layer, with pooling and dropout:
-    model.add(Conv2D(64, kernel_size=(3, 3), activation="relu"))
-    model.add(MaxPooling2D(pool_size=(2, 2)))
-    model.add(Dropout(0.25))
-    model.add(Flatten())
+    model.add(keras_layers.Conv2D(64, kernel_size=(3, 3), activation="relu"))
+    model.add(keras_layers.MaxPooling2D(pool_size=(2, 2)))
+    model.add(keras_layers.Dropout(0.25))
+    model.add(keras_layers.Flatten())
 
     # dense hidden layer, with dropout:
-    model.add(Dense(128, activation="relu"))
-    model.add(Dropout(0.5))
+    model.add(keras_layers.Dense(128, activation="relu"))
+    model.add(keras_layers.Dropout(0.5))
 
     # output layer:
-    model.add(Dense(n_classes, activation="softmax"))
+    model.add(keras_layers.Dense(n_classes, activation="softmax"))
 
     return model
 
@@ -186,11 +186,11 @@ def alex_net(input_shape: Tuple[int, int, int], n_classes: int) -> Sequential:
     See Also:
         - :py:class:`tf.keras.Sequential`
     """
-    model = Sequential()
+    model = keras_models.Sequential()
 
     # first conv-pool block:
     model.add(
-        Conv2D(
+        keras_layers.Conv2D(
             96,
             kernel_size=(11, 11),
             strides=(4, 4),
@@ -198,30 +198,30 @@ def alex_net(input_shape: Tuple[int, int, int], n_classes: int) -> Sequential:
             input_shape=input_shape,
         )
     )
-    model.add(MaxPooling2D(pool_size=(3, 3), strides=(2, 2)))
-    model.add(BatchNormalization())
+    model.add(keras_layers.MaxPooling2D(pool_size=(3, 3), strides=(2, 2)))
+    model.add(keras_layers.BatchNormalization())
 
     # second conv-pool block:
-    model.add(Conv2D(256, kernel_size=(5, 5), activation="relu"))
-    model.add(MaxPooling2D(pool_size=(3, 3), strides=(2, 2)))
-    model.add(BatchNormalization())
+    model.add(keras_layers.Conv2D(256, kernel_size=(5, 5), activation="relu"))
+    model.add(keras_layers.MaxPooling2D(pool_size=(3, 3), strides=(2, 2)))
+    model.add(keras_layers.BatchNormalization())
 
     # third conv-pool block:
-    model.add(Conv2D(256, kernel_size=(3, 3), activation="relu"))
-    model.add(Conv2D(384, kernel_size=(3, 3), activation="relu"))
-    model.add(Conv2D(384, kernel_size=(3, 3), activation="relu"))
-    model.add(MaxPooling2D(pool_size=(3, 3), strides=(2, 2)))
-    model.add(BatchNormalization())
+    model.add(keras_layers.Conv2D(256, kernel_size=(3, 3), activation="relu"))
+    model.add(keras_layers.Conv2D(384, kernel_size=(3, 3), activation="relu"))
+    model.add(keras_layers.Conv2D(384, kernel_size=(3, 3), activation="relu"))
+    model.add(keras_layers.MaxPooling2D(pool_size=(3, 3), strides=(2, 2)))
+    model.add(keras_layers.BatchNormalization())
 
     # dense layers:
-    model.add(Flatten())
-    model.add(Dense(4096, activation="tanh"))
-    model.add(Dropout(0.5))
-    model.add(Dense(4096, activation="tanh"))
-    model.add(Dropout(0.5))
+    model.add(keras_layers.Flatten())
+    model.add(keras_layers.Dense(4096, activation="tanh"))
+    model.add(keras_layers.Dropout(0.5))
+    model.add(keras_layers.Dense(4096, activation="tanh"))
+    model.add(keras_layers.Dropout(0.5))
 
     # output layer:
-    model.add(Dense(n_classes, activation="softmax"))
+    model.add(keras_layers.Dense(n_classes, activation="softmax"))
 
     return model
 
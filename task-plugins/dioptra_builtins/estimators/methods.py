@@ -102,6 +102,15 @@ def predict(
     supported prediction methods and `predict_kwargs` arguments, refer to the
     documentation of the registered dispatch functions.
 
+    For Keras models, passing `chunk_size`, `output_dir` or `return_y_true` in
+    `predict_kwargs` predicts one chunk or batch of the input at a time into a
+    preallocated, optionally memory-mapped, output. This also works when `x` is a
+    :py:class:`~tf.keras.preprocessing.image.DirectoryIterator` or a
+    :py:class:`~tf.data.Dataset`. With `return_y_true=True`, the ground truth labels
+    are collected in the same pass and a `(y_true, y_pred)` tuple is returned, see
+    :py:func:`~dioptra.generics_plugins.estimator_predict.tf_keras_model\\
+    .keras_model_predict_chunked`.
+
     Args:
         estimator: A trained model to be used to generate predictions.
         x: The input data for which to generate predictions.
@@ -23,12 +23,11 @@
 
 from __future__ import annotations
 
-from typing import Any, Callable, Dict, List, Optional, Tuple
+import threading
+from typing import Any, Callable, Dict, FrozenSet, List, Optional, Tuple
 
 import numpy as np
 import structlog
-from scipy.stats import wasserstein_distance
-from sklearn.metrics.pairwise import paired_distances
 from structlog.stdlib import BoundLogger
 
 from dioptra import pyplugs
@@ -40,7 +39,7 @@ LOGGER: BoundLogger = structlog.stdlib.get_logger()
 
 @pyplugs.register
 def get_distance_metric_list(
-    request: List[Dict[str, str]]
+    request: List[Dict[str, str]], fused: bool = True
 ) -> List[Tuple[str, Callable[..., np.ndarray]]]:
     """Gets multiple distance metric functions from the registry.
 
@@ -59,6 +58,11 @@ def get_distance_metric_list(
             is used to lookup the metric function in the registry and must match one of
             the metric names listed above. The `name` key is human-readable label for
             the metric function.
+        fused: If `True`, the norm-based metrics and the cosine similarity share a
+            :py:class:`FusedDistanceMetrics` evaluator, so that evaluating the list
+            with :py:func:`evaluate_distance_metrics` computes the difference between
+            the batches once and each distinct metric once. Otherwise, each metric is
+            computed independently. The default is `True`.
 
     Returns:
         A list of tuples with two elements. The first element of each tuple is the label
@@ -66,12 +70,26 @@ def get_distance_metric_list(
         function.
     """
     distance_metrics_list: List[Tuple[str, Callable[..., np.ndarray]]] = []
+    fused_distance_metrics: Optional[FusedDistanceMetrics] = (
+        FusedDistanceMetrics(
+            [x["func"] for x in request if x["func"] in FUSED_DISTANCE_METRICS]
+        )
+        if fused
+        else None
+    )
 
     for metric in request:
         metric_callable: Optional[
             Callable[..., np.ndarray]
         ] = DISTANCE_METRICS_REGISTRY.get(metric["func"])
 
+        if fused_distance_metrics is not None and metric["func"] in (
+            FUSED_DISTANCE_METRICS
+        ):
+            metric_callable = _FusedDistanceMetric(
+                evaluator=fused_distance_metrics, func=metric["func"]
+            )
+
         if metric_callable is not None:
             distance_metrics_list.append((metric["name"], metric_callable))
 
@@ -123,6 +141,49 @@ def get_distance_metric(func: str) -> Callable[..., np.ndarray]:
     return metric_callable
 
 
+def evaluate_distance_metrics(
+    distance_metrics_list: List[Tuple[str, Callable[..., np.ndarray]]],
+    y_true,
+    y_pred,
+) -> Dict[str, np.ndarray]:
+    """Evaluates a list of distance metrics on a batch of two matrices.
+
+    The metrics returned by :py:func:`get_distance_metric_list` that share a
+    :py:class:`FusedDistanceMetrics` evaluator are computed together in a single call
+    to the evaluator. Every other metric is called on its own.
+
+    Args:
+        distance_metrics_list: A list of tuples with two elements, the label of a
+            metric and the callable metric function.
+        y_true: A batch of matrices containing the original or target values.
+        y_pred: A batch of matrices containing the perturbed or predicted values.
+
+    Returns:
+        A dictionary mapping each metric label to a :py:class:`numpy.ndarray`
+        containing the metric for each pair of matrices in the batch.
+    """
+    metrics: Dict[str, np.ndarray] = {}
+    fused_groups: Dict[int, Tuple[FusedDistanceMetrics, List[Tuple[str, str]]]] = {}
+
+    for metric_name, metric in distance_metrics_list:
+        if isinstance(metric, _FusedDistanceMetric):
+            _, members = fused_groups.setdefault(
+                id(metric.evaluator), (metric.evaluator, [])
+            )
+            members.append((metric_name, metric.func))
+
+        else:
+            metrics[metric_name] = metric(y_true, y_pred)
+
+    for evaluator, members in fused_groups.values():
+        fused_metrics = evaluator(y_true, y_pred, funcs=[x for _, x in members])
+
+        for metric_name, func in members:
+            metrics[metric_name] = fused_metrics[func]
+
+    return {x: metrics[x] for x, _ in distance_metrics_list}
+
+
 def l_inf_norm(y_true, y_pred) -> np.ndarray:
     """Calculates the |Linf| norm between a batch of two matrices.
 
@@ -219,12 +280,29 @@ def paired_manhattan_distances(y_true, y_pred) -> np.ndarray:
     return metric
 
 
-def paired_wasserstein_distances(y_true, y_pred, **kwargs) -> np.ndarray:
+def paired_wasserstein_distances(
+    y_true,
+    y_pred,
+    u_weights: Optional[np.ndarray] = None,
+    v_weights: Optional[np.ndarray] = None,
+) -> np.ndarray:
     """Calculates the Wasserstein distance between a batch of two matrices.
 
+    The values of each matrix are treated as a one-dimensional empirical distribution
+    and are converted to double precision before they are compared. Without weights,
+    both distributions in a pair have the same number of equally weighted values, so
+    the distance is the mean absolute difference of the sorted values. With weights,
+    the distance is the area between the cumulative distribution functions of each
+    pair, which is computed from a merged sort of the pair's values. In both cases the
+    whole batch is evaluated at once.
+
     Args:
         y_true: A batch of matrices containing the original or target values.
         y_pred: A batch of matrices containing the perturbed or predicted values.
+        u_weights: The weight of each value in the matrices of `y_true`. If `None`,
+            each value is weighted equally. The default is `None`.
+        v_weights: The weight of each value in the matrices of `y_pred`. If `None`,
+            each value is weighted equally. The default is `None`.
 
     Returns:
         A :py:class:`numpy.ndarray` containing a batch of Wasserstein distances.
@@ -232,16 +310,260 @@ def paired_wasserstein_distances(y_true, y_pred, **kwargs) -> np.ndarray:
     See Also:
         - :py:func:`scipy.stats.wasserstein_distance`
     """
+    y_true_sorted: np.ndarray = _flatten_batch(np.asarray(y_true)).astype("float64")
+    y_pred_sorted: np.ndarray = _flatten_batch(np.asarray(y_pred)).astype("float64")
+
+    if u_weights is not None or v_weights is not None:
+        return _weighted_wasserstein_distances(
+            y_true_flat=y_true_sorted,
+            y_pred_flat=y_pred_sorted,
+            u_weights=u_weights,
+            v_weights=v_weights,
+        )
+
+    y_true_sorted.sort(axis=1)
+    y_pred_sorted.sort(axis=1)
+    np.subtract(y_true_sorted, y_pred_sorted, out=y_true_sorted)
+    np.abs(y_true_sorted, out=y_true_sorted)
+    metric: np.ndarray = y_true_sorted.mean(axis=1)
+    return metric
+
+
+class FusedDistanceMetrics(object):
+    """Evaluates several distance metrics on a batch in a single fused computation.
+
+    The difference between the batches is computed once in single precision into a
+    buffer that is reused across batches of the same shape, and the |Linf|, |L1| and
+    |L2| norms are all reduced from that buffer. The cosine similarity is derived from
+    the dot products of the flattened batches. Aliased metrics, such as `l_2_norm` and
+    `paired_euclidean_distances`, are computed once and shared. Nothing is cached
+    between calls, so a batch buffer can be refilled in place and evaluated again.
+
+    The scratch buffer is kept per thread, so an evaluator can be shared by threads
+    that evaluate different batches.
+
+    Args:
+        funcs: The names of the metrics to evaluate. Each must be a key of
+            `FUSED_DISTANCE_METRICS`.
+    """
 
-    def wrapped_metric(X, Y):
-        return wasserstein_distance(u_values=X, v_values=Y, **kwargs)
+    def __init__(self, funcs: List[str]) -> None:
+        unknown = sorted(set(funcs) - set(FUSED_DISTANCE_METRICS))
+
+        if unknown:
+            raise UnknownDistanceMetricError(
+                f"The distance metrics {unknown!r} cannot be fused. The following "
+                f"metrics can be fused: {sorted(FUSED_DISTANCE_METRICS)}"
+            )
+
+        self._funcs: List[str] = list(dict.fromkeys(funcs))
+        self._local = threading.local()
+
+    @property
+    def funcs(self) -> List[str]:
+        """The names of the metrics that are evaluated."""
+        return list(self._funcs)
+
+    def __call__(
+        self, y_true, y_pred, funcs: Optional[List[str]] = None
+    ) -> Dict[str, np.ndarray]:
+        """Evaluates the metrics on a batch of two matrices.
+
+        Args:
+            y_true: A batch of matrices containing the original or target values.
+            y_pred: A batch of matrices containing the perturbed or predicted values.
+            funcs: The names of the metrics to evaluate. If `None`, all of the
+                evaluator's metrics are evaluated. The default is `None`.
+
+        Returns:
+            A dictionary mapping each metric name to a :py:class:`numpy.ndarray`
+            containing the metric for each pair of matrices in the batch.
+        """
+        funcs = self._funcs if funcs is None else list(dict.fromkeys(funcs))
+        unknown = sorted(set(funcs) - set(self._funcs))
+
+        if unknown:
+            raise UnknownDistanceMetricError(
+                f"The distance metrics {unknown!r} are not evaluated by this "
+                f"evaluator. The following metrics are evaluated: {self._funcs}"
+            )
+
+        kernels = self._evaluate_kernels(
+            y_true=y_true,
+            y_pred=y_pred,
+            kernels=frozenset(FUSED_DISTANCE_METRICS[x] for x in funcs),
+        )
+
+        return {x: kernels[FUSED_DISTANCE_METRICS[x]] for x in funcs}
+
+    def __getstate__(self) -> Dict[str, Any]:
+        state = self.__dict__.copy()
+        del state["_local"]
+        return state
+
+    def __setstate__(self, state: Dict[str, Any]) -> None:
+        self.__dict__.update(state)
+        self._local = threading.local()
+
+    def _evaluate_kernels(
+        self, y_true, y_pred, kernels: FrozenSet[str]
+    ) -> Dict[str, np.ndarray]:
+        y_true_flat: np.ndarray = _flatten_batch(np.asarray(y_true, dtype="float32"))
+        y_pred_flat: np.ndarray = _flatten_batch(np.asarray(y_pred, dtype="float32"))
+        results: Dict[str, np.ndarray] = {}
+
+        if kernels & {"l_inf", "l_1", "l_2"}:
+            y_diff = self._buffer(y_true_flat.shape)
+            np.subtract(y_true_flat, y_pred_flat, out=y_diff)
+
+            if "l_2" in kernels:
+                results["l_2"] = np.sqrt(np.einsum("ij,ij->i", y_diff, y_diff))
+
+            np.abs(y_diff, out=y_diff)
+
+            if "l_1" in kernels:
+                results["l_1"] = y_diff.sum(axis=1)
+
+            if "l_inf" in kernels:
+                results["l_inf"] = y_diff.max(axis=1)
+
+        if "cosine" in kernels:
+            dot: np.ndarray = np.einsum("ij,ij->i", y_true_flat, y_pred_flat)
+            y_true_norm: np.ndarray = np.sqrt(
+                np.einsum("ij,ij->i", y_true_flat, y_true_flat)
+            )
+            y_pred_norm: np.ndarray = np.sqrt(
+                np.einsum("ij,ij->i", y_pred_flat, y_pred_flat)
+            )
+            results["cosine"] = dot / (y_true_norm * y_pred_norm)
+
+        return results
+
+    def _buffer(self, shape: Tuple[int, ...]) -> np.ndarray:
+        buffer: Optional[np.ndarray] = getattr(self._local, "buffer", None)
+
+        if buffer is None or buffer.shape != shape:
+            buffer = np.empty(shape, dtype="float32")
+            self._local.buffer = buffer
+
+        return buffer
+
+
+class _FusedDistanceMetric(object):
+    """A single metric served by a shared :py:class:`FusedDistanceMetrics`.
+
+    Calling it evaluates only its own metric. Use :py:func:`evaluate_distance_metrics`
+    to evaluate all of the metrics that share the evaluator in one call.
+    """
+
+    def __init__(self, evaluator: FusedDistanceMetrics, func: str) -> None:
+        self.evaluator = evaluator
+        self.func = func
+        self.__name__ = func
+        self.__doc__ = DISTANCE_METRICS_REGISTRY[func].__doc__
+
+    def __call__(self, y_true, y_pred) -> np.ndarray:
+        return self.evaluator(y_true, y_pred, funcs=[self.func])[self.func]
+
+
+def _weighted_wasserstein_distances(
+    y_true_flat: np.ndarray,
+    y_pred_flat: np.ndarray,
+    u_weights: Optional[np.ndarray] = None,
+    v_weights: Optional[np.ndarray] = None,
+) -> np.ndarray:
+    """Calculates the weighted Wasserstein distance for each pair in a flattened batch.
+
+    The values of each pair are sorted together, and the distance is the sum of the
+    gaps between consecutive values weighted by the absolute difference of the two
+    cumulative distribution functions over each gap. This matches
+    :py:func:`scipy.stats.wasserstein_distance`.
+
+    Args:
+        y_true_flat: A batch of flattened matrices containing the original or target
+            values.
+        y_pred_flat: A batch of flattened matrices containing the perturbed or
+            predicted values.
+        u_weights: The weight of each value in the matrices of `y_true_flat`. If
+            `None`, each value is weighted equally.
+        v_weights: The weight of each value in the matrices of `y_pred_flat`. If
+            `None`, each value is weighted equally.
+
+    Returns:
+        A :py:class:`numpy.ndarray` containing a batch of Wasserstein distances.
+    """
+    num_samples, num_u_values = y_true_flat.shape
+    num_v_values: int = y_pred_flat.shape[1]
+    u_weights = _wasserstein_weights(u_weights, num_values=num_u_values)
+    v_weights = _wasserstein_weights(v_weights, num_values=num_v_values)
+
+    # The CDF steps of u are positive and those of v are negative, so that the
+    # running sum over the merged values is the difference of the two CDFs.
+    cdf_steps: np.ndarray = np.concatenate([u_weights, -v_weights])
+    metric: np.ndarray = np.empty(num_samples, dtype="float64")
+
+    for chunk in _chunks(num_samples, chunk_size=_WASSERSTEIN_CHUNK_SIZE):
+        values: np.ndarray = np.concatenate(
+            [y_true_flat[chunk], y_pred_flat[chunk]], axis=1
+        )
+        order: np.ndarray = np.argsort(values, axis=1, kind="stable")
+        values = np.take_along_axis(values, order, axis=1)
+        cdf_difference: np.ndarray = np.cumsum(cdf_steps[order], axis=1)[:, :-1]
+        metric[chunk] = np.sum(np.abs(cdf_difference) * np.diff(values, axis=1), axis=1)
 
-    metric: np.ndarray = paired_distances(
-        X=_flatten_batch(y_true), Y=_flatten_batch(y_pred), metric=wrapped_metric
-    )
     return metric
 
 
+def _wasserstein_weights(weights: Optional[np.ndarray], num_values: int) -> np.ndarray:
+    """Normalizes the weights of a one-dimensional empirical distribution.
+
+    Args:
+        weights: The weight of each value in the distribution. If `None`, each value
+            is weighted equally.
+        num_values: The number of values in the distribution.
+
+    Returns:
+        A :py:class:`numpy.ndarray` of weights that sum to one.
+
+    Raises:
+        ValueError: If the weights do not match the number of values, are negative,
+            or do not have a positive, finite sum.
+    """
+    if weights is None:
+        return np.full(num_values, 1.0 / num_values)
+
+    weights = np.asarray(weights, dtype="float64").ravel()
+    total_weight: float = float(weights.sum())
+
+    if weights.shape != (num_values,):
+        raise ValueError(
+            f"Expected {num_values} weights, one per value, but got {weights.size}."
+        )
+
+    if np.any(weights < 0) or not 0 < total_weight < np.inf:
+        raise ValueError(
+            "The weights must be non-negative and have a positive, finite sum."
+        )
+
+    return weights / total_weight
+
+
+def _chunks(num_samples: int, chunk_size: int) -> List[slice]:
+    """Splits the samples of a batch into contiguous chunks.
+
+    Args:
+        num_samples: The number of samples in the batch.
+        chunk_size: The maximum number of samples in a chunk.
+
+    Returns:
+        A list of slices, one per chunk.
+    """
+    return [
+        slice(start, min(start + chunk_size, num_samples))
+        for start in range(0, num_samples, chunk_size)
+    ]
+
+
 def _flatten_batch(X: np.ndarray) -> np.ndarray:
     """Flattens each of the matrices in a batch into a one-dimensional array.
 
@@ -305,3 +627,14 @@ DISTANCE_METRICS_REGISTRY: Dict[str, Callable[..., Any]] = dict(
     paired_manhattan_distances=paired_manhattan_distances,
     paired_wasserstein_distances=paired_wasserstein_distances,
 )
+
+FUSED_DISTANCE_METRICS: Dict[str, str] = dict(
+    l_inf_norm="l_inf",
+    l_1_norm="l_1",
+    l_2_norm="l_2",
+    paired_cosine_similarities="cosine",
+    paired_euclidean_distances="l_2",
+    paired_manhattan_distances="l_1",
+)
+
+_WASSERSTEIN_CHUNK_SIZE: int = 16
@@ -18,7 +18,7 @@
 
 from __future__ import annotations
 
-from typing import Any, Callable, Dict, List, Optional, Tuple
+from typing import Any, Callable, Dict, Iterable, List, Optional, Tuple
 
 import numpy as np
 import structlog
@@ -125,6 +125,316 @@ def get_performance_metric(func: str) -> Callable[..., float]:
     return metric_callable
 
 
+@pyplugs.register
+def evaluate_performance_metrics_stream(
+    classifier: Any,
+    data: Iterable[Tuple[Any, Any]],
+    request: List[Dict[str, str]],
+    num_classes: int,
+    average: str = "binary",
+    num_bins: int = 1000,
+) -> Dict[str, float]:
+    """Evaluates performance metrics over a stream of batches.
+
+    The classifier is applied to one batch at a time and each batch only updates a
+    :py:class:`StreamingPerformanceMetrics` evaluator, so the predictions for the
+    full dataset are never held in memory.
+
+    Args:
+        classifier: A trained classifier with a `predict` method that returns the
+            class scores for a batch of inputs.
+        data: The batches of `(x, y)` pairs to evaluate, such as a
+            :py:class:`~tf.keras.preprocessing.image.DirectoryIterator` or a
+            :py:class:`~tf.data.Dataset`. The labels `y` can be class indices or
+            one-hot encoded.
+        request: A list of dictionaries with the keys `name` and `func`, see
+            :py:func:`get_performance_metric_list`.
+        num_classes: The number of classes.
+        average: The averaging used for the `f1`, `precision` and `recall` metrics, see
+            :py:class:`StreamingPerformanceMetrics`. The default is `"binary"`.
+        num_bins: The number of score bins used to estimate the ROC AUC. The default
+            is `1000`.
+
+    Returns:
+        A dictionary mapping the `name` of each requested metric to its value.
+    """
+    evaluator = StreamingPerformanceMetrics(
+        funcs=[x["func"] for x in request],
+        num_classes=num_classes,
+        average=average,
+        num_bins=num_bins,
+    )
+
+    for x, y in _iter_batches(data):
+        evaluator.update(
+            y_true=np.asarray(y), y_score=np.asarray(classifier.predict(x))
+        )
+
+    metrics = evaluator.result()
+    LOGGER.info("Evaluated performance metrics", num_samples=evaluator.num_samples)
+
+    return {x["name"]: metrics[x["func"]] for x in request}
+
+
+class StreamingPerformanceMetrics(object):
+    """Accumulates classification metrics over a stream of batches.
+
+    Each batch updates a single integer confusion matrix, computed with
+    :py:func:`numpy.bincount`, from which the `accuracy`, `categorical_accuracy`,
+    `f1`, `precision`, `recall` and `mcc` metrics are all derived. The `roc_auc` metric
+    is estimated from per-class histograms of the predicted scores of the positive and
+    negative samples, which requires the scores to lie in `[0, 1]`. In the multiclass
+    case it is the unweighted mean of the one-vs-rest AUCs.
+
+    Args:
+        funcs: The names of the metrics to compute. Each must be one of the metrics in
+            the registry.
+        num_classes: The number of classes.
+        average: The averaging used for the `f1`, `precision` and `recall` metrics.
+            Can be `"binary"`, which reports the metric for `pos_label`, or `"micro"`,
+            `"macro"` or `"weighted"`, which have the same meaning as for
+            :py:func:`sklearn.metrics.f1_score`. As in scikit-learn, the `"macro"`
+            average only includes the classes that appear in the true or predicted
+            labels, and the `"binary"` average raises a :py:class:`ValueError` when
+            the labels contain more than two classes. The default is `"binary"`.
+        pos_label: The positive class when `average="binary"`. The default is `1`.
+        num_bins: The number of score bins used to estimate the ROC AUC. The default
+            is `1000`.
+    """
+
+    _AVERAGES = ("binary", "micro", "macro", "weighted")
+
+    def __init__(
+        self,
+        funcs: List[str],
+        num_classes: int,
+        average: str = "binary",
+        pos_label: int = 1,
+        num_bins: int = 1000,
+    ) -> None:
+        unknown = sorted(set(funcs) - set(PERFORMANCE_METRICS_REGISTRY))
+
+        if unknown:
+            raise UnknownPerformanceMetricError(
+                f"Could not find any performance metrics named {unknown!r} in the "
+                "metrics plugin collection. Check spelling and try again."
+            )
+
+        if average not in self._AVERAGES:
+            raise ValueError(
+                f"The average {average!r} is not supported. The following averages "
+                f"are currently available: {list(self._AVERAGES)}"
+            )
+
+        if average == "binary" and not 0 <= pos_label < num_classes:
+            raise ValueError(
+                f"The pos_label {pos_label!r} is not a valid class index for "
+                f"num_classes={num_classes!r}."
+            )
+
+        self._funcs: List[str] = list(dict.fromkeys(funcs))
+        self._num_classes = num_classes
+        self._average = average
+        self._pos_label = pos_label
+        self._num_bins = num_bins
+        self._confusion_matrix = np.zeros((num_classes, num_classes), dtype="int64")
+        self._score_histograms = (
+            np.zeros((2, num_classes, num_bins), dtype="int64")
+            if "roc_auc" in self._funcs
+            else None
+        )
+
+    @property
+    def confusion_matrix(self) -> np.ndarray:
+        """The confusion matrix, indexed by the true and then the predicted class."""
+        return self._confusion_matrix.copy()
+
+    @property
+    def num_samples(self) -> int:
+        """The number of samples accumulated."""
+        return int(self._confusion_matrix.sum())
+
+    def update(
+        self,
+        y_true: np.ndarray,
+        y_pred: Optional[np.ndarray] = None,
+        y_score: Optional[np.ndarray] = None,
+    ) -> None:
+        """Adds a batch of labels and predictions.
+
+        Args:
+            y_true: The ground truth labels, as class indices of shape `(n_samples,)`
+                or one-hot encoded with shape `(n_samples, num_classes)`.
+            y_pred: The predicted labels, in the same formats as `y_true`. If `None`,
+                the class with the highest score in `y_score` is used.
+            y_score: The predicted class scores of shape `(n_samples, num_classes)`, or
+                the score of the positive class with shape `(n_samples,)` for binary
+                classification. Required if the `roc_auc` metric was requested.
+        """
+        y_true = self._as_class_indices(y_true)
+
+        if y_score is not None:
+            y_score = np.asarray(y_score)
+
+            if y_score.ndim == 1:
+                y_score = np.stack([1.0 - y_score, y_score], axis=1)
+
+        if y_pred is None:
+            if y_score is None:
+                raise ValueError("At least one of y_pred and y_score is required.")
+
+            y_pred = np.argmax(y_score, axis=1)
+
+        y_pred = self._as_class_indices(y_pred)
+        self._confusion_matrix += np.bincount(
+            y_true * self._num_classes + y_pred, minlength=self._num_classes**2
+        ).reshape(self._num_classes, self._num_classes)
+
+        if self._score_histograms is not None:
+            if y_score is None:
+                raise ValueError("The roc_auc metric requires y_score.")
+
+            self._update_score_histograms(y_true, y_score)
+
+    def merge(self, other: StreamingPerformanceMetrics) -> StreamingPerformanceMetrics:
+        """Merges another evaluator, such as one built over another shard, into this one.
+
+        Args:
+            other: The evaluator to merge. It must have the same number of classes and
+                score bins.
+
+        Returns:
+            This evaluator, updated in place.
+        """
+        self._confusion_matrix += other._confusion_matrix
+
+        if self._score_histograms is not None and other._score_histograms is not None:
+            self._score_histograms += other._score_histograms
+
+        return self
+
+    def result(self) -> Dict[str, float]:
+        """Computes the requested metrics from the accumulated batches.
+
+        Returns:
+            A dictionary mapping each requested metric name to its value.
+        """
+        metric_funcs: Dict[str, Callable[[], float]] = {
+            "accuracy": self._accuracy,
+            "categorical_accuracy": self._accuracy,
+            "f1": lambda: self._precision_recall_f1()[2],
+            "mcc": self._mcc,
+            "precision": lambda: self._precision_recall_f1()[0],
+            "recall": lambda: self._precision_recall_f1()[1],
+            "roc_auc": self._roc_auc,
+        }
+
+        return {x: metric_funcs[x]() for x in self._funcs}
+
+    def _as_class_indices(self, y: np.ndarray) -> np.ndarray:
+        y = np.asarray(y)
+
+        if y.ndim > 1:
+            y = np.argmax(y, axis=-1)
+
+        return y.astype("int64", copy=False)
+
+    def _update_score_histograms(self, y_true: np.ndarray, y_score: np.ndarray) -> None:
+        bins = np.clip(
+            (y_score * self._num_bins).astype("int64"), 0, self._num_bins - 1
+        )
+        bins += np.arange(self._num_classes) * self._num_bins
+        is_positive = y_true[:, None] == np.arange(self._num_classes)
+        size = self._num_classes * self._num_bins
+
+        for histogram_index, mask in enumerate((~is_positive, is_positive)):
+            self._score_histograms[histogram_index] += np.bincount(
+                bins[mask], minlength=size
+            ).reshape(self._num_classes, self._num_bins)
+
+    def _accuracy(self) -> float:
+        return float(np.trace(self._confusion_matrix) / max(self.num_samples, 1))
+
+    def _precision_recall_f1(self) -> Tuple[float, float, float]:
+        true_positives = np.diag(self._confusion_matrix).astype("float64")
+        predicted = self._confusion_matrix.sum(axis=0).astype("float64")
+        actual = self._confusion_matrix.sum(axis=1).astype("float64")
+        present_labels = np.flatnonzero(actual + predicted)
+
+        if self._average == "binary":
+            self._check_binary_labels(present_labels)
+
+        elif self._average in {"macro", "weighted"}:
+            true_positives = true_positives[present_labels]
+            predicted = predicted[present_labels]
+            actual = actual[present_labels]
+
+        if self._average == "micro":
+            true_positives = true_positives.sum(keepdims=True)
+            predicted = predicted.sum(keepdims=True)
+            actual = actual.sum(keepdims=True)
+
+        precision = _safe_divide(true_positives, predicted)
+        recall = _safe_divide(true_positives, actual)
+        f1 = _safe_divide(2 * precision * recall, precision + recall)
+
+        if self._average == "binary":
+            return tuple(  # type: ignore[return-value]
+                float(x[self._pos_label]) for x in (precision, recall, f1)
+            )
+
+        weights = actual if self._average == "weighted" else None
+
+        if weights is not None and weights.sum() == 0:
+            return 0.0, 0.0, 0.0
+
+        return tuple(  # type: ignore[return-value]
+            float(np.average(x, weights=weights)) if x.size else 0.0
+            for x in (precision, recall, f1)
+        )
+
+    def _check_binary_labels(self, present_labels: np.ndarray) -> None:
+        if present_labels.size > 2:
+            raise ValueError(
+                "Target is multiclass but average='binary'. Please choose another "
+                f"average setting, one of {list(self._AVERAGES[1:])}."
+            )
+
+        if present_labels.size == 2 and self._pos_label not in present_labels:
+            raise ValueError(
+                f"pos_label={self._pos_label} is not a valid label. It should be one "
+                f"of {present_labels.tolist()}"
+            )
+
+    def _mcc(self) -> float:
+        confusion_matrix = self._confusion_matrix.astype("float64")
+        actual = confusion_matrix.sum(axis=1)
+        predicted = confusion_matrix.sum(axis=0)
+        num_samples = confusion_matrix.sum()
+        num_correct = np.trace(confusion_matrix)
+        cov_true_pred = num_correct * num_samples - np.dot(actual, predicted)
+        cov_pred_pred = num_samples**2 - np.dot(predicted, predicted)
+        cov_true_true = num_samples**2 - np.dot(actual, actual)
+
+        if cov_pred_pred * cov_true_true == 0:
+            return 0.0
+
+        return float(cov_true_pred / np.sqrt(cov_true_true * cov_pred_pred))
+
+    def _roc_auc(self) -> float:
+        negatives, positives = self._score_histograms.astype("float64")
+        negatives_below = np.cumsum(negatives, axis=1) - negatives
+        pairs = positives.sum(axis=1) * negatives.sum(axis=1)
+        auc = _safe_divide(
+            (positives * (negatives_below + 0.5 * negatives)).sum(axis=1), pairs
+        )
+
+        if self._num_classes == 2:
+            return float(auc[self._pos_label])
+
+        return float(auc[pairs > 0].mean())
+
+
 def accuracy(y_true, y_pred, **kwargs) -> float:
     """Calculates the accuracy score.
 
@@ -269,6 +579,45 @@ def recall(y_true, y_pred, **kwargs) -> float:
     return metric
 
 
+def _iter_batches(data: Iterable[Tuple[Any, Any]]) -> Iterable[Tuple[Any, Any]]:
+    """Iterates once over a finite or repeating source of batches.
+
+    Keras iterators such as
+    :py:class:`~tf.keras.preprocessing.image.DirectoryIterator` repeat forever when
+    iterated, so sources that support indexing and :py:func:`len` are indexed instead.
+
+    Args:
+        data: The source of batches.
+
+    Yields:
+        The batches of `data`, each exactly once.
+    """
+    if hasattr(data, "__getitem__") and hasattr(data, "__len__"):
+        for batch_num in range(len(data)):  # type: ignore[arg-type]
+            yield data[batch_num]  # type: ignore[index]
+
+    else:
+        yield from data
+
+
+def _safe_divide(numerator: np.ndarray, denominator: np.ndarray) -> np.ndarray:
+    """Divides two arrays elementwise, returning `0` wherever the denominator is `0`.
+
+    Args:
+        numerator: The numerator.
+        denominator: The denominator.
+
+    Returns:
+        The elementwise quotient.
+    """
+    return np.divide(
+        numerator,
+        denominator,
+        out=np.zeros(np.broadcast(numerator, denominator).shape, dtype="float64"),
+        where=denominator != 0,
+    )
+
+
 PERFORMANCE_METRICS_REGISTRY: Dict[str, Callable[..., Any]] = dict(
     accuracy=accuracy,
     roc_auc=roc_auc,
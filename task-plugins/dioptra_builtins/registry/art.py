@@ -22,62 +22,154 @@
 
 from __future__ import annotations
 
+from functools import lru_cache
+from typing import TYPE_CHECKING, Any, Type, Union
+
+import numpy as np
 import structlog
 from structlog.stdlib import BoundLogger
 
 from dioptra import pyplugs
 from dioptra.sdk.exceptions import ARTDependencyError, TensorflowDependencyError
 from dioptra.sdk.utilities.decorators import require_package
+from dioptra.sdk.utilities.imports import lazy_import
 
 from .mlflow import load_tensorflow_keras_classifier
 
 LOGGER: BoundLogger = structlog.stdlib.get_logger()
 
-try:
-    from art.estimators.classification import KerasClassifier
-
-except ImportError:  # pragma: nocover
-    LOGGER.warn(
-        "Unable to import one or more optional packages, functionality may be reduced",
-        package="art",
-    )
+art_classification = lazy_import("art.estimators.classification")
+tf = lazy_import("tensorflow")
 
-
-try:
+if TYPE_CHECKING:
+    from art.estimators.classification import KerasClassifier, TensorFlowV2Classifier
     from tensorflow.keras.models import Sequential
 
-except ImportError:  # pragma: nocover
-    LOGGER.warn(
-        "Unable to import one or more optional packages, functionality may be reduced",
-        package="tensorflow",
-    )
-
 
 @pyplugs.register
 @require_package("art", exc_type=ARTDependencyError)
 @require_package("tensorflow", exc_type=TensorflowDependencyError)
 def load_wrapped_tensorflow_keras_classifier(
-    name: str, version: int
-) -> KerasClassifier:
+    name: str, version: int, use_cache: bool = True
+) -> Union[KerasClassifier, TensorFlowV2Classifier]:
     """Loads and wraps a registered Keras classifier for compatibility with the |ART|.
 
+    If eager execution has been disabled, the classifier is wrapped in a
+    :py:class:`~art.estimators.classification.KerasClassifier`. Otherwise it is wrapped
+    in a :py:class:`~art.estimators.classification.TensorFlowV2Classifier`, and the
+    model's forward pass and loss gradient are compiled with :py:func:`tf.function` so
+    that predictions and attacks run as graphs.
+
     Args:
         name: The name of the registered model in the MLFlow model registry.
         version: The version number of the registered model in the MLFlow registry.
+        use_cache: If `True`, load the model through the process-wide model cache.
+            Cached models are shared between callers. The default is `True`.
 
     Returns:
-        A trained :py:class:`~art.estimators.classification.KerasClassifier` object.
+        A trained :py:class:`~art.estimators.classification.KerasClassifier` or
+        :py:class:`~art.estimators.classification.TensorFlowV2Classifier` object.
 
     See Also:
         - :py:class:`art.estimators.classification.KerasClassifier`
+        - :py:class:`art.estimators.classification.TensorFlowV2Classifier`
         - :py:func:`.mlflow.load_tensorflow_keras_classifier`
     """
     keras_classifier: Sequential = load_tensorflow_keras_classifier(
-        name=name, version=version
+        name=name, version=version, use_cache=use_cache
     )
-    wrapped_keras_classifier: KerasClassifier = KerasClassifier(model=keras_classifier)
+    wrapped_keras_classifier: Union[
+        KerasClassifier, TensorFlowV2Classifier
+    ] = wrap_tensorflow_keras_classifier(keras_classifier)
     LOGGER.info(
-        "Wrap Keras classifier for compatibility with Adversarial Robustness Toolbox"
+        "Wrap Keras classifier for compatibility with Adversarial Robustness Toolbox",
+        eager=tf.executing_eagerly(),
     )
 
     return wrapped_keras_classifier
+
+
+@require_package("art", exc_type=ARTDependencyError)
+@require_package("tensorflow", exc_type=TensorflowDependencyError)
+def wrap_tensorflow_keras_classifier(
+    keras_classifier: Sequential,
+) -> Union[KerasClassifier, TensorFlowV2Classifier]:
+    """Wraps a compiled Keras classifier for the current Tensorflow execution mode.
+
+    Args:
+        keras_classifier: A compiled :py:class:`tf.keras.Sequential` classifier.
+
+    Returns:
+        A :py:class:`~art.estimators.classification.KerasClassifier` if eager execution
+        has been disabled, otherwise a
+        :py:class:`~art.estimators.classification.TensorFlowV2Classifier` with a
+        :py:func:`tf.function`-compiled forward pass and loss gradient.
+    """
+    if not tf.executing_eagerly():
+        return art_classification.KerasClassifier(model=keras_classifier)
+
+    return _compiled_tensorflow_v2_classifier_class()(
+        model=_CompiledKerasModel(keras_classifier),
+        nb_classes=keras_classifier.output_shape[-1],
+        input_shape=keras_classifier.input_shape[1:],
+        loss_object=tf.keras.losses.get(keras_classifier.loss),
+    )
+
+
+@lru_cache(maxsize=None)
+def _compiled_tensorflow_v2_classifier_class() -> Type[TensorFlowV2Classifier]:
+    """Returns a TensorFlowV2Classifier whose loss gradient is a compiled graph.
+
+    The class is created on first use because it subclasses an optional dependency.
+    """
+
+    class CompiledTensorFlowV2Classifier(art_classification.TensorFlowV2Classifier):
+        def __init__(self, *args, **kwargs) -> None:
+            super().__init__(*args, **kwargs)
+            self._compiled_loss_gradient = tf.function(
+                self._framework_loss_gradient, reduce_retracing=True
+            )
+
+        def loss_gradient(self, x, y, training_mode: bool = False, **kwargs):
+            if not self.all_framework_preprocessing or self._reduce_labels:
+                return super().loss_gradient(
+                    x, y, training_mode=training_mode, **kwargs
+                )
+
+            gradients = self._compiled_loss_gradient(
+                tf.convert_to_tensor(x), tf.convert_to_tensor(y), training_mode
+            )
+
+            return gradients.numpy() if isinstance(x, np.ndarray) else gradients
+
+        def _framework_loss_gradient(self, x, y, training_mode: bool):
+            with tf.GradientTape() as tape:
+                tape.watch(x)
+                x_input, y_input = self._apply_preprocessing(x, y=y, fit=False)
+                predictions = self.model(x_input, training=training_mode)
+                loss = self._loss_object(y_input, predictions)
+
+            return tape.gradient(loss, x)
+
+    return CompiledTensorFlowV2Classifier
+
+
+class _CompiledKerasModel(object):
+    """Calls a Keras model through a :py:func:`tf.function`-compiled forward pass.
+
+    All other attribute lookups, such as `layers` and `trainable_variables`, are
+    forwarded to the wrapped model.
+    """
+
+    def __init__(self, model: Sequential) -> None:
+        self._model = model
+        self._call = tf.function(model.__call__, autograph=False, reduce_retracing=True)
+
+    def __call__(self, *args, **kwargs) -> Any:
+        return self._call(*args, **kwargs)
+
+    def __getattr__(self, name: str) -> Any:
+        if name in {"_model", "_call"}:
+            raise AttributeError(name)
+
+        return getattr(self._model, name)
@@ -18,29 +18,27 @@
 
 from __future__ import annotations
 
-from typing import Optional
+from typing import TYPE_CHECKING, Dict, Optional
 
+import mlflow
 import structlog
 from mlflow.entities import Run as MlflowRun
 from mlflow.entities.model_registry import ModelVersion
-from mlflow.keras import load_model as load_tf_keras_model
 from mlflow.tracking import MlflowClient
 from structlog.stdlib import BoundLogger
 
 from dioptra import pyplugs
 from dioptra.sdk.exceptions import TensorflowDependencyError
 from dioptra.sdk.utilities.decorators import require_package
+from dioptra.sdk.utilities.imports import lazy_import
+from dioptra.sdk.utilities.model_cache import get_model_cache
 
 LOGGER: BoundLogger = structlog.stdlib.get_logger()
 
-try:
-    from tensorflow.keras.models import Sequential
+tf = lazy_import("tensorflow")
 
-except ImportError:  # pragma: nocover
-    LOGGER.warn(
-        "Unable to import one or more optional packages, functionality may be reduced",
-        package="tensorflow",
-    )
+if TYPE_CHECKING:
+    from tensorflow.keras.models import Sequential
 
 
 @pyplugs.register
@@ -104,12 +102,23 @@ def get_experiment_name(active_run: MlflowRun) -> str:
 
 @pyplugs.register
 @require_package("tensorflow", exc_type=TensorflowDependencyError)
-def load_tensorflow_keras_classifier(name: str, version: int) -> Sequential:
+def load_tensorflow_keras_classifier(
+    name: str, version: int, use_cache: bool = True
+) -> Sequential:
     """Loads a registered Keras classifier.
 
+    By default, the model is loaded through the process-wide model cache, see
+    :py:func:`~dioptra.sdk.utilities.model_cache.get_model_cache`. The cache keeps a
+    versioned copy of the model's artifacts on disk and reuses the deserialized model
+    on repeated loads within the same process. Cached models are shared between
+    callers, so disable the cache if the returned model will be modified, for example
+    by further training.
+
     Args:
         name: The name of the registered model in the MLFlow model registry.
         version: The version number of the registered model in the MLFlow registry.
+        use_cache: If `True`, load the model through the model cache. The default is
+            `True`.
 
     Returns:
         A trained :py:class:`tf.keras.Sequential` object.
@@ -117,4 +126,33 @@ def load_tensorflow_keras_classifier(name: str, version: int) -> Sequential:
     uri: str = f"models:/{name}/{version}"
     LOGGER.info("Load Keras classifier from model registry", uri=uri)
 
-    return load_tf_keras_model(model_uri=uri)
+    if not use_cache:
+        return mlflow.keras.load_model(model_uri=uri)
+
+    execution_mode: str = "eager" if tf.executing_eagerly() else "graph"
+
+    return get_model_cache().load(
+        name=name,
+        version=version,
+        loader=lambda model_path: mlflow.keras.load_model(model_uri=model_path),
+        flavor=f"keras-{execution_mode}",
+    )
+
+
+@pyplugs.register
+def log_model_cache_metrics() -> Dict[str, float]:
+    """Logs the model cache's hit rate and load-time savings to the active MLFlow run.
+
+    The metrics are logged with the prefix `model_cache_`.
+
+    Returns:
+        A dictionary of the logged metrics.
+    """
+    metrics: Dict[str, float] = {
+        f"model_cache_{key}": float(value)
+        for key, value in get_model_cache().stats().items()
+    }
+    LOGGER.info("Logging model cache metrics", **metrics)
+    mlflow.log_metrics(metrics)
+
+    return metrics
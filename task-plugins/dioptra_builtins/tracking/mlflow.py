@@ -18,7 +18,7 @@
 
 from __future__ import annotations
 
-from typing import Dict
+from typing import TYPE_CHECKING, Dict
 
 import mlflow
 import structlog
@@ -30,15 +30,9 @@ from dioptra.sdk.utilities.decorators import require_package
 
 LOGGER: BoundLogger = structlog.stdlib.get_logger()
 
-try:
+if TYPE_CHECKING:
     from tensorflow.keras.models import Sequential
 
-except ImportError:  # pragma: nocover
-    LOGGER.warn(
-        "Unable to import one or more optional packages, functionality may be reduced",
-        package="tensorflow",
-    )
-
 
 @pyplugs.register
 def log_metrics(metrics: Dict[str, float]) -> None:
@@ -0,0 +1,136 @@
+# This Software (Dioptra) is being made available as a public service by the
+# National Institute of Standards and Technology (NIST), an Agency of the United
+# States Department of Commerce. This software was developed in part by employees of
+# NIST and in part by NIST contractors. Copyright in portions of this software that
+# were developed by NIST contractors has been licensed or assigned to NIST. Pursuant
+# to Title 17 United States Code Section 105, works of NIST employees are not
+# subject to copyright protection in the United States. However, NIST may hold
+# international copyright in software created by its employees and domestic
+# copyright (or licensing rights) in portions of software that were assigned or
+# licensed to NIST. To the extent that NIST holds copyright in this software, it is
+# being made available under the Creative Commons Attribution 4.0 International
+# license (CC BY 4.0). The disclaimers of the CC BY 4.0 license apply to all parts
+# of the software developed or licensed by NIST.
+#
+# ACCESS THE FULL CC BY 4.0 LICENSE HERE:
+# https://creativecommons.org/licenses/by/4.0/legalcode
+"""Shared fixtures for the microbenchmark suite.
+
+The benchmarks are regular pytest tests that time a callable with the
+:py:func:`benchmark` fixture. Results are collected over the session and printed
+as a table in the terminal summary, for example::
+
+    python -m pytest --import-mode=importlib -s tests/benchmarks
+"""
+from __future__ import annotations
+
+import gc
+import statistics
+import time
+from dataclasses import dataclass, field
+from typing import Any, Callable, Dict, List, Optional
+
+import pytest
+
+_RESULTS: List["BenchmarkResult"] = []
+
+
+@dataclass
+class BenchmarkResult:
+    name: str
+    timings: List[float] = field(default_factory=list)
+    items: Optional[int] = None
+    extra_info: Dict[str, Any] = field(default_factory=dict)
+
+    @property
+    def best(self) -> float:
+        return min(self.timings)
+
+    @property
+    def median(self) -> float:
+        return statistics.median(self.timings)
+
+    @property
+    def items_per_second(self) -> Optional[float]:
+        if self.items is None:
+            return None
+
+        return self.items / self.median
+
+
+class Benchmark(object):
+    def __init__(self, name: str) -> None:
+        self._name = name
+        self.extra_info: Dict[str, Any] = {}
+
+    def __call__(
+        self,
+        func: Callable[..., Any],
+        *args,
+        rounds: int = 5,
+        warmup: int = 1,
+        items: Optional[int] = None,
+        name: Optional[str] = None,
+        **kwargs,
+    ) -> Any:
+        result = BenchmarkResult(
+            name=self._name if name is None else f"{self._name}[{name}]",
+            items=items,
+            extra_info=self.extra_info,
+        )
+        output: Any = None
+
+        for _ in range(warmup):
+            output = func(*args, **kwargs)
+
+        gc.collect()
+
+        for _ in range(rounds):
+            start_time = time.perf_counter()
+            output = func(*args, **kwargs)
+            result.timings.append(time.perf_counter() - start_time)
+
+        _RESULTS.append(result)
+
+        return output
+
+    def record(
+        self,
+        timings: List[float],
+        items: Optional[int] = None,
+        name: Optional[str] = None,
+    ) -> None:
+        """Records timings measured outside of the fixture, e.g. in a subprocess."""
+        _RESULTS.append(
+            BenchmarkResult(
+                name=self._name if name is None else f"{self._name}[{name}]",
+                timings=list(timings),
+                items=items,
+                extra_info=self.extra_info,
+            )
+        )
+
+
+@pytest.fixture
+def benchmark(request) -> Benchmark:
+    return Benchmark(name=request.node.name)
+
+
+def pytest_terminal_summary(terminalreporter, exitstatus, config) -> None:
+    if not _RESULTS:
+        return None
+
+    width = max(len(x.name) for x in _RESULTS)
+    terminalreporter.write_sep("=", "benchmark results")
+    terminalreporter.write_line(
+        f"{'name':<{width}}  {'best (ms)':>12}  {'median (ms)':>12}  {'items/s':>12}"
+    )
+
+    for result in _RESULTS:
+        items_per_second = result.items_per_second
+        terminalreporter.write_line(
+            f"{result.name:<{width}}  {result.best * 1e3:>12.3f}  "
+            f"{result.median * 1e3:>12.3f}  "
+            f"{'' if items_per_second is None else f'{items_per_second:.1f}':>12}"
+            + "".join(f"  {k}={v}" for k, v in result.extra_info.items())
+        )
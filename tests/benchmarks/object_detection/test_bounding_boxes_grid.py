@@ -0,0 +1,103 @@
+# This Software (Dioptra) is being made available as a public service by the
+# National Institute of Standards and Technology (NIST), an Agency of the United
+# States Department of Commerce. This software was developed in part by employees of
+# NIST and in part by NIST contractors. Copyright in portions of this software that
+# were developed by NIST contractors has been licensed or assigned to NIST. Pursuant
+# to Title 17 United States Code Section 105, works of NIST employees are not
+# subject to copyright protection in the United States. However, NIST may hold
+# international copyright in software created by its employees and domestic
+# copyright (or licensing rights) in portions of software that were assigned or
+# licensed to NIST. To the extent that NIST holds copyright in this software, it is
+# being made available under the Creative Commons Attribution 4.0 International
+# license (CC BY 4.0). The disclaimers of the CC BY 4.0 license apply to all parts
+# of the software developed or licensed by NIST.
+#
+# ACCESS THE FULL CC BY 4.0 LICENSE HERE:
+# https://creativecommons.org/licenses/by/4.0/legalcode
+from typing import Tuple
+
+import numpy as np
+import pytest
+
+from dioptra.sdk.object_detection.bounding_boxes import (
+    NumpyBoundingBoxCoordinates,
+    NumpyBoundingBoxesBatchedGrid,
+)
+
+BATCH_SIZE = 32
+MAX_BOXES = 8
+N_CLASSES = 20
+
+
+@pytest.fixture
+def padded_bboxes() -> Tuple[np.ndarray, np.ndarray]:
+    rng = np.random.default_rng(0)
+    corner_min = rng.uniform(0.0, 0.8, size=(BATCH_SIZE, MAX_BOXES, 2))
+    corner_max = corner_min + rng.uniform(0.05, 0.2, size=(BATCH_SIZE, MAX_BOXES, 2))
+    bboxes = np.concatenate([corner_min, corner_max], axis=-1).astype("float32")
+    labels = rng.integers(0, N_CLASSES, size=(BATCH_SIZE, MAX_BOXES)).astype("int32")
+    num_boxes = rng.integers(1, MAX_BOXES + 1, size=(BATCH_SIZE, 1))
+    labels[np.arange(MAX_BOXES)[None, :] >= num_boxes] = -1
+
+    return bboxes, labels
+
+
+@pytest.mark.parametrize("grid_size", [7, 13, 19])
+def test_numpy_find_no_obj_cell_ij(benchmark, padded_bboxes, grid_size) -> None:
+    bbox_coord = NumpyBoundingBoxCoordinates(grid_shape=(grid_size, grid_size))
+    bboxes, labels = padded_bboxes
+    _, bboxes_cell_ij = bbox_coord.from_corner_to_cell_xywh(bboxes[labels >= 0])
+
+    benchmark(bbox_coord.find_no_obj_cell_ij, bboxes_cell_ij, rounds=50)
+
+
+@pytest.mark.parametrize("grid_size", [7, 13, 19])
+def test_numpy_embed_per_image(benchmark, padded_bboxes, grid_size) -> None:
+    batched_grid = NumpyBoundingBoxesBatchedGrid.on_grid_shape((grid_size, grid_size))
+    bboxes, labels = padded_bboxes
+
+    def embed_per_image():
+        return [
+            batched_grid.embed(x[y >= 0], y[y >= 0], n_classes=N_CLASSES)
+            for x, y in zip(bboxes, labels)
+        ]
+
+    benchmark(embed_per_image, rounds=20, items=BATCH_SIZE)
+
+
+@pytest.mark.parametrize("grid_size", [7, 13, 19])
+def test_numpy_embed_batch(benchmark, padded_bboxes, grid_size) -> None:
+    batched_grid = NumpyBoundingBoxesBatchedGrid.on_grid_shape((grid_size, grid_size))
+    bboxes, labels = padded_bboxes
+
+    benchmark(
+        batched_grid.embed_batch,
+        bboxes,
+        labels,
+        n_classes=N_CLASSES,
+        rounds=20,
+        items=BATCH_SIZE,
+    )
+
+
+@pytest.mark.parametrize("grid_size", [7, 13, 19])
+def test_tensorflow_embed_per_image(benchmark, padded_bboxes, grid_size) -> None:
+    tf = pytest.importorskip("tensorflow")
+
+    from dioptra.sdk.object_detection.bounding_boxes import (
+        TensorflowBoundingBoxesBatchedGrid,
+    )
+
+    batched_grid = TensorflowBoundingBoxesBatchedGrid.on_grid_shape(
+        (grid_size, grid_size)
+    )
+    bboxes, labels = padded_bboxes
+    inputs = [
+        (tf.constant(x[y >= 0]), tf.constant(y[y >= 0])) for x, y in zip(bboxes, labels)
+    ]
+    n_classes = tf.constant(N_CLASSES, dtype=tf.int32)
+
+    def embed_per_image():
+        return [batched_grid.embed(x, y, n_classes) for x, y in inputs]
+
+    benchmark(embed_per_image, rounds=5, items=BATCH_SIZE)
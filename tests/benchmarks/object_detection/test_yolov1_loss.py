@@ -0,0 +1,91 @@
+# This Software (Dioptra) is being made available as a public service by the
+# National Institute of Standards and Technology (NIST), an Agency of the United
+# States Department of Commerce. This software was developed in part by employees of
+# NIST and in part by NIST contractors. Copyright in portions of this software that
+# were developed by NIST contractors has been licensed or assigned to NIST. Pursuant
+# to Title 17 United States Code Section 105, works of NIST employees are not
+# subject to copyright protection in the United States. However, NIST may hold
+# international copyright in software created by its employees and domestic
+# copyright (or licensing rights) in portions of software that were assigned or
+# licensed to NIST. To the extent that NIST holds copyright in this software, it is
+# being made available under the Creative Commons Attribution 4.0 International
+# license (CC BY 4.0). The disclaimers of the CC BY 4.0 license apply to all parts
+# of the software developed or licensed by NIST.
+#
+# ACCESS THE FULL CC BY 4.0 LICENSE HERE:
+# https://creativecommons.org/licenses/by/4.0/legalcode
+from typing import Tuple
+
+import numpy as np
+import pytest
+
+tf = pytest.importorskip("tensorflow")
+
+from dioptra.sdk.object_detection.bounding_boxes import (  # noqa: E402
+    NumpyBoundingBoxesBatchedGrid,
+)
+from dioptra.sdk.object_detection.bounding_boxes.iou import (  # noqa: E402
+    TensorflowBoundingBoxesBatchedGridIOU,
+)
+from dioptra.sdk.object_detection.losses import (  # noqa: E402
+    YOLOV1FusedLoss,
+    YOLOV1Loss,
+)
+
+BATCH_SIZE = 256
+MAX_BOXES = 8
+N_BOUNDING_BOXES = 2
+N_CLASSES = 20
+
+
+def _make_targets_and_predictions(grid_shape: Tuple[int, int]) -> Tuple[tuple, tuple]:
+    rng = np.random.default_rng(0)
+    corner_min = rng.uniform(0.0, 0.7, size=(BATCH_SIZE, MAX_BOXES, 2))
+    corner_max = corner_min + rng.uniform(0.05, 0.3, size=(BATCH_SIZE, MAX_BOXES, 2))
+    bboxes = np.concatenate([corner_min, corner_max], axis=-1).astype("float32")
+    labels = rng.integers(0, N_CLASSES, size=(BATCH_SIZE, MAX_BOXES)).astype("int32")
+    y_true = NumpyBoundingBoxesBatchedGrid.on_grid_shape(grid_shape).embed_batch(
+        bboxes, labels, n_classes=N_CLASSES
+    )
+    logits = rng.normal(size=(BATCH_SIZE, *grid_shape, N_CLASSES))
+    y_pred = (
+        rng.uniform(0.05, 0.95, size=(BATCH_SIZE, *grid_shape, N_BOUNDING_BOXES, 4)),
+        rng.uniform(0.0, 1.0, size=(BATCH_SIZE, *grid_shape, N_BOUNDING_BOXES)),
+        np.exp(logits) / np.exp(logits).sum(axis=-1, keepdims=True),
+    )
+
+    return (
+        tuple(tf.constant(x, dtype=tf.float32) for x in y_true),
+        tuple(tf.Variable(x, dtype=tf.float32) for x in y_pred),
+    )
+
+
+@pytest.mark.parametrize("grid_size", [7, 13, 19])
+@pytest.mark.parametrize(
+    "loss_cls, jit_compile",
+    [(YOLOV1Loss, False), (YOLOV1FusedLoss, False), (YOLOV1FusedLoss, True)],
+)
+def test_yolov1_loss_step(benchmark, grid_size, loss_cls, jit_compile) -> None:
+    grid_shape = (grid_size, grid_size)
+    loss = loss_cls(
+        bbox_grid_iou=TensorflowBoundingBoxesBatchedGridIOU.on_grid_shape(grid_shape)
+    )
+    y_true, y_pred = _make_targets_and_predictions(grid_shape)
+
+    @tf.function(jit_compile=jit_compile)
+    def loss_step():
+        with tf.GradientTape() as tape:
+            loss_value = loss(y_true, y_pred)
+
+        return loss_value, tape.gradient(loss_value, y_pred)
+
+    loss_step()
+    tf.config.experimental.reset_memory_stats("CPU:0")
+    benchmark(
+        loss_step,
+        rounds=50,
+        items=BATCH_SIZE,
+        name=f"{loss_cls.__name__}-jit={jit_compile}",
+    )
+    peak_bytes = tf.config.experimental.get_memory_info("CPU:0")["peak"]
+    benchmark.extra_info["peak_mib"] = round(peak_bytes / 2**20, 2)
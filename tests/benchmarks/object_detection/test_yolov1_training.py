@@ -0,0 +1,102 @@
+# This Software (Dioptra) is being made available as a public service by the
+# National Institute of Standards and Technology (NIST), an Agency of the United
+# States Department of Commerce. This software was developed in part by employees of
+# NIST and in part by NIST contractors. Copyright in portions of this software that
+# were developed by NIST contractors has been licensed or assigned to NIST. Pursuant
+# to Title 17 United States Code Section 105, works of NIST employees are not
+# subject to copyright protection in the United States. However, NIST may hold
+# international copyright in software created by its employees and domestic
+# copyright (or licensing rights) in portions of software that were assigned or
+# licensed to NIST. To the extent that NIST holds copyright in this software, it is
+# being made available under the Creative Commons Attribution 4.0 International
+# license (CC BY 4.0). The disclaimers of the CC BY 4.0 license apply to all parts
+# of the software developed or licensed by NIST.
+#
+# ACCESS THE FULL CC BY 4.0 LICENSE HERE:
+# https://creativecommons.org/licenses/by/4.0/legalcode
+from typing import Optional, Tuple
+
+import numpy as np
+import pytest
+
+tf = pytest.importorskip("tensorflow")
+
+from dioptra.sdk.object_detection.architectures import (  # noqa: E402
+    YOLOV1ObjectDetector,
+)
+from dioptra.sdk.object_detection.bounding_boxes import (  # noqa: E402
+    NumpyBoundingBoxesBatchedGrid,
+)
+from dioptra.sdk.object_detection.bounding_boxes.iou import (  # noqa: E402
+    TensorflowBoundingBoxesBatchedGridIOU,
+)
+from dioptra.sdk.object_detection.losses import (  # noqa: E402
+    YOLOV1FusedLoss,
+    YOLOV1Loss,
+)
+
+BATCH_SIZE = 8
+IMAGE_SHAPE = (128, 128, 3)
+MAX_BOXES = 4
+N_BOUNDING_BOXES = 2
+N_CLASSES = 5
+N_STEPS = 5
+
+
+def _make_batch(grid_shape: Tuple[int, int]) -> Tuple[np.ndarray, tuple]:
+    rng = np.random.default_rng(0)
+    images = rng.uniform(0.0, 255.0, size=(BATCH_SIZE, *IMAGE_SHAPE))
+    corner_min = rng.uniform(0.0, 0.7, size=(BATCH_SIZE, MAX_BOXES, 2))
+    corner_max = corner_min + rng.uniform(0.1, 0.3, size=(BATCH_SIZE, MAX_BOXES, 2))
+    bboxes = np.concatenate([corner_min, corner_max], axis=-1).astype("float32")
+    labels = rng.integers(0, N_CLASSES, size=(BATCH_SIZE, MAX_BOXES)).astype("int32")
+    y_true = NumpyBoundingBoxesBatchedGrid.on_grid_shape(grid_shape).embed_batch(
+        bboxes, labels, n_classes=N_CLASSES
+    )
+
+    return images.astype("float32"), tuple(x.astype("float32") for x in y_true)
+
+
+@pytest.mark.parametrize(
+    "loss_cls, precision_policy, jit_compile",
+    [
+        (YOLOV1Loss, None, False),
+        (YOLOV1Loss, "mixed_bfloat16", False),
+        (YOLOV1FusedLoss, None, False),
+        (YOLOV1FusedLoss, None, True),
+        (YOLOV1FusedLoss, "mixed_bfloat16", False),
+        (YOLOV1FusedLoss, "mixed_bfloat16", True),
+    ],
+)
+def test_yolov1_train_steps(
+    benchmark, loss_cls, precision_policy: Optional[str], jit_compile: bool
+) -> None:
+    tf.keras.backend.clear_session()
+    model = YOLOV1ObjectDetector(
+        input_shape=IMAGE_SHAPE,
+        n_bounding_boxes=N_BOUNDING_BOXES,
+        n_classes=N_CLASSES,
+        backbone="mobilenetv2",
+        detector="two_headed",
+        precision_policy=precision_policy,
+        jit_compile=jit_compile,
+        backbone_weights=None,
+    )
+    loss = loss_cls(
+        bbox_grid_iou=TensorflowBoundingBoxesBatchedGridIOU.on_grid_shape(
+            model.output_grid_shape
+        )
+    )
+    model.compile(optimizer=tf.keras.optimizers.Adam(), loss=loss)
+    x, y = _make_batch(model.output_grid_shape)
+
+    def train_steps():
+        for _ in range(N_STEPS):
+            model.train_on_batch(x, y)
+
+    benchmark(
+        train_steps,
+        rounds=3,
+        items=N_STEPS,
+        name=(f"{loss_cls.__name__}-{precision_policy or 'float32'}-jit={jit_compile}"),
+    )
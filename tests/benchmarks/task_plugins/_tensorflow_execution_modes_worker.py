@@ -0,0 +1,84 @@
+# This Software (Dioptra) is being made available as a public service by the
+# National Institute of Standards and Technology (NIST), an Agency of the United
+# States Department of Commerce. This software was developed in part by employees of
+# NIST and in part by NIST contractors. Copyright in portions of this software that
+# were developed by NIST contractors has been licensed or assigned to NIST. Pursuant
+# to Title 17 United States Code Section 105, works of NIST employees are not
+# subject to copyright protection in the United States. However, NIST may hold
+# international copyright in software created by its employees and domestic
+# copyright (or licensing rights) in portions of software that were assigned or
+# licensed to NIST. To the extent that NIST holds copyright in this software, it is
+# being made available under the Creative Commons Attribution 4.0 International
+# license (CC BY 4.0). The disclaimers of the CC BY 4.0 license apply to all parts
+# of the software developed or licensed by NIST.
+#
+# ACCESS THE FULL CC BY 4.0 LICENSE HERE:
+# https://creativecommons.org/licenses/by/4.0/legalcode
+"""Measures FGM and predict throughput in one Tensorflow execution mode.
+
+The execution mode is process-wide and eager execution cannot be re-enabled once it
+has been disabled, so the benchmark runs this script once per mode in a subprocess.
+The timings are printed to stdout as JSON.
+"""
+import json
+import sys
+import time
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).parents[3] / "task-plugins"))
+
+import numpy as np  # noqa: E402
+import tensorflow as tf  # noqa: E402
+from art.attacks.evasion import FastGradientMethod  # noqa: E402
+from dioptra_builtins.backend_configs.tensorflow import init_tensorflow  # noqa: E402
+from dioptra_builtins.estimators.keras_classifiers import init_classifier  # noqa: E402
+from dioptra_builtins.registry.art import (  # noqa: E402
+    wrap_tensorflow_keras_classifier,
+)
+
+BATCH_SIZE = 64
+IMAGE_SIZE = (28, 28, 1)
+N_CLASSES = 10
+N_IMAGES = 1024
+ROUNDS = 5
+
+
+def _time_rounds(func) -> list:
+    func()
+    timings = []
+
+    for _ in range(ROUNDS):
+        start_time = time.perf_counter()
+        func()
+        timings.append(time.perf_counter() - start_time)
+
+    return timings
+
+
+def main(execution_mode: str) -> None:
+    init_tensorflow(seed=0, execution_mode=execution_mode)
+    keras_classifier = init_classifier(
+        model_architecture="le_net",
+        optimizer=tf.keras.optimizers.legacy.Adam(),
+        metrics=[],
+        input_shape=IMAGE_SIZE,
+        n_classes=N_CLASSES,
+    )
+    classifier = wrap_tensorflow_keras_classifier(keras_classifier)
+    attack = FastGradientMethod(estimator=classifier, eps=0.1, batch_size=BATCH_SIZE)
+    x = np.random.default_rng(0).random((N_IMAGES, *IMAGE_SIZE), dtype="float32")
+
+    json.dump(
+        {
+            "classifier": type(classifier).__name__,
+            "fgm": _time_rounds(lambda: attack.generate(x=x)),
+            "predict": _time_rounds(
+                lambda: classifier.predict(x, batch_size=BATCH_SIZE)
+            ),
+        },
+        sys.stdout,
+    )
+
+
+if __name__ == "__main__":
+    main(sys.argv[1])
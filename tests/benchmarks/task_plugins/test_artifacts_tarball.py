@@ -0,0 +1,123 @@
+# This Software (Dioptra) is being made available as a public service by the
+# National Institute of Standards and Technology (NIST), an Agency of the United
+# States Department of Commerce. This software was developed in part by employees of
+# NIST and in part by NIST contractors. Copyright in portions of this software that
+# were developed by NIST contractors has been licensed or assigned to NIST. Pursuant
+# to Title 17 United States Code Section 105, works of NIST employees are not
+# subject to copyright protection in the United States. However, NIST may hold
+# international copyright in software created by its employees and domestic
+# copyright (or licensing rights) in portions of software that were assigned or
+# licensed to NIST. To the extent that NIST holds copyright in this software, it is
+# being made available under the Creative Commons Attribution 4.0 International
+# license (CC BY 4.0). The disclaimers of the CC BY 4.0 license apply to all parts
+# of the software developed or licensed by NIST.
+#
+# ACCESS THE FULL CC BY 4.0 LICENSE HERE:
+# https://creativecommons.org/licenses/by/4.0/legalcode
+import shutil
+import tarfile
+import time
+from pathlib import Path
+
+import numpy as np
+import pytest
+from dioptra_builtins.artifacts.utils import extract_tarfile
+
+from dioptra.sdk.utilities.archives import create_tarball
+
+FILE_SIZE = 2048
+NUM_CLASSES = 10
+
+
+@pytest.fixture(scope="module", params=[10_000, 100_000], ids=["10k", "100k"])
+def source_dir(request, tmp_path_factory) -> Path:
+    rng = np.random.default_rng(0)
+    source_dir = tmp_path_factory.mktemp(f"files{request.param}") / "adv_testing"
+
+    for index in range(request.param):
+        class_dir = source_dir / f"class{index % NUM_CLASSES}"
+        class_dir.mkdir(parents=True, exist_ok=True)
+        # Half random and half zeros, roughly as compressible as a small PNG.
+        data = rng.integers(0, 256, size=FILE_SIZE // 2, dtype="uint8").tobytes()
+        (class_dir / f"{index}.png").write_bytes(data + bytes(FILE_SIZE // 2))
+
+    return source_dir
+
+
+def _num_files(source_dir: Path) -> int:
+    return sum(1 for x in source_dir.rglob("*.png"))
+
+
+def _tarfile_create(source_dir: Path, tarball_path: Path, compresslevel: int) -> None:
+    with tarfile.open(tarball_path, "w:gz", compresslevel=compresslevel) as f:
+        f.add(source_dir, arcname=source_dir.name)
+
+
+@pytest.mark.parametrize(
+    "num_threads", [None, 1, 4], ids=["tarfile", "parallel_1", "parallel_4"]
+)
+@pytest.mark.parametrize("compresslevel", [1, 9])
+def test_create_tarball(
+    benchmark, tmp_path, source_dir, num_threads, compresslevel
+) -> None:
+    tarball_path = tmp_path / "adv_testing.tar.gz"
+    num_files = _num_files(source_dir)
+
+    if num_threads is None:
+        benchmark(
+            _tarfile_create,
+            source_dir,
+            tarball_path,
+            compresslevel,
+            rounds=3,
+            items=num_files,
+        )
+
+    else:
+        benchmark(
+            create_tarball,
+            source_dir,
+            tarball_path,
+            compresslevel=compresslevel,
+            num_threads=num_threads,
+            rounds=3,
+            items=num_files,
+        )
+
+    benchmark.extra_info["size_mb"] = round(tarball_path.stat().st_size / 1e6, 1)
+
+    with tarfile.open(tarball_path, "r:gz") as f:
+        assert sum(1 for x in f if x.isfile()) == num_files
+
+
+@pytest.mark.parametrize(
+    "num_threads", [None, 1, 4], ids=["tarfile", "parallel_1", "parallel_4"]
+)
+def test_extract_tarfile(
+    benchmark, tmp_path, monkeypatch, source_dir, num_threads
+) -> None:
+    tarball_path = tmp_path / "adv_testing.tar.gz"
+    output_dir = tmp_path / "output"
+    num_files = _num_files(source_dir)
+    _tarfile_create(source_dir, tarball_path, compresslevel=9)
+    timings = []
+
+    # Timed by hand so that removing the extracted files is not part of each round.
+    for _ in range(3):
+        shutil.rmtree(output_dir, ignore_errors=True)
+        output_dir.mkdir()
+        monkeypatch.chdir(output_dir)
+        start_time = time.perf_counter()
+
+        if num_threads is None:
+            with tarfile.open(tarball_path, "r:gz") as f:
+                f.extractall(path=output_dir)
+
+        else:
+            extract_tarfile(tarball_path, num_threads=num_threads)
+
+        timings.append(time.perf_counter() - start_time)
+
+    benchmark.record(timings, items=num_files)
+
+    assert _num_files(output_dir / "adv_testing") == num_files
@@ -0,0 +1,90 @@
+# This Software (Dioptra) is being made available as a public service by the
+# National Institute of Standards and Technology (NIST), an Agency of the United
+# States Department of Commerce. This software was developed in part by employees of
+# NIST and in part by NIST contractors. Copyright in portions of this software that
+# were developed by NIST contractors has been licensed or assigned to NIST. Pursuant
+# to Title 17 United States Code Section 105, works of NIST employees are not
+# subject to copyright protection in the United States. However, NIST may hold
+# international copyright in software created by its employees and domestic
+# copyright (or licensing rights) in portions of software that were assigned or
+# licensed to NIST. To the extent that NIST holds copyright in this software, it is
+# being made available under the Creative Commons Attribution 4.0 International
+# license (CC BY 4.0). The disclaimers of the CC BY 4.0 license apply to all parts
+# of the software developed or licensed by NIST.
+#
+# ACCESS THE FULL CC BY 4.0 LICENSE HERE:
+# https://creativecommons.org/licenses/by/4.0/legalcode
+import numpy as np
+import pytest
+from dioptra_builtins.metrics.distance import (
+    evaluate_distance_metrics,
+    get_distance_metric_list,
+    paired_wasserstein_distances,
+)
+from scipy.stats import wasserstein_distance
+
+IMAGE_SHAPE = (224, 224, 3)
+REQUEST = [
+    {"name": "linf_norm", "func": "l_inf_norm"},
+    {"name": "l1_norm", "func": "l_1_norm"},
+    {"name": "l2_norm", "func": "l_2_norm"},
+    {"name": "cosine_similarity", "func": "paired_cosine_similarities"},
+    {"name": "euclidean_distance", "func": "paired_euclidean_distances"},
+    {"name": "manhattan_distance", "func": "paired_manhattan_distances"},
+]
+
+
+@pytest.mark.parametrize("fused", [False, True], ids=["per_callable", "fused"])
+@pytest.mark.parametrize("batch_size", [32, 128, 512, 1024])
+def test_distance_metric_list(benchmark, batch_size, fused) -> None:
+    rng = np.random.default_rng(0)
+    y_true = rng.random((batch_size, *IMAGE_SHAPE), dtype="float32")
+    y_pred = y_true + rng.uniform(-0.03, 0.03, size=y_true.shape).astype("float32")
+    distance_metrics_list = get_distance_metric_list(request=REQUEST, fused=fused)
+
+    metrics = benchmark(
+        evaluate_distance_metrics,
+        distance_metrics_list,
+        y_true,
+        y_pred,
+        rounds=3 if batch_size >= 512 else 5,
+        items=batch_size,
+    )
+
+    expected = evaluate_distance_metrics(
+        get_distance_metric_list(request=REQUEST, fused=False), y_true, y_pred
+    )
+
+    for name, values in expected.items():
+        np.testing.assert_allclose(metrics[name], values, rtol=1e-4)
+
+
+def _paired_wasserstein_distances_per_pair(y_true, y_pred):
+    return np.array(
+        [
+            wasserstein_distance(u_values=u_values, v_values=v_values)
+            for u_values, v_values in zip(
+                y_true.reshape(len(y_true), -1), y_pred.reshape(len(y_pred), -1)
+            )
+        ]
+    )
+
+
+@pytest.mark.parametrize(
+    "metric",
+    [_paired_wasserstein_distances_per_pair, paired_wasserstein_distances],
+    ids=["per_pair", "vectorized"],
+)
+@pytest.mark.parametrize("batch_size", [32, 128])
+def test_paired_wasserstein_distances(benchmark, batch_size, metric) -> None:
+    rng = np.random.default_rng(0)
+    y_true = rng.random((batch_size, *IMAGE_SHAPE), dtype="float32")
+    y_pred = y_true + rng.uniform(-0.03, 0.03, size=y_true.shape).astype("float32")
+
+    distances = benchmark(metric, y_true, y_pred, rounds=3, warmup=0, items=batch_size)
+
+    np.testing.assert_allclose(
+        distances[:4],
+        _paired_wasserstein_distances_per_pair(y_true[:4], y_pred[:4]),
+        rtol=1e-6,
+    )
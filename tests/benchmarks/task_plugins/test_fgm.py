@@ -0,0 +1,113 @@
+# This Software (Dioptra) is being made available as a public service by the
+# National Institute of Standards and Technology (NIST), an Agency of the United
+# States Department of Commerce. This software was developed in part by employees of
+# NIST and in part by NIST contractors. Copyright in portions of this software that
+# were developed by NIST contractors has been licensed or assigned to NIST. Pursuant
+# to Title 17 United States Code Section 105, works of NIST employees are not
+# subject to copyright protection in the United States. However, NIST may hold
+# international copyright in software created by its employees and domestic
+# copyright (or licensing rights) in portions of software that were assigned or
+# licensed to NIST. To the extent that NIST holds copyright in this software, it is
+# being made available under the Creative Commons Attribution 4.0 International
+# license (CC BY 4.0). The disclaimers of the CC BY 4.0 license apply to all parts
+# of the software developed or licensed by NIST.
+#
+# ACCESS THE FULL CC BY 4.0 LICENSE HERE:
+# https://creativecommons.org/licenses/by/4.0/legalcode
+from pathlib import Path
+
+import mlflow
+import numpy as np
+import pytest
+
+tf = pytest.importorskip("tensorflow")
+pytest.importorskip("art")
+
+from art.estimators.classification import TensorFlowV2Classifier  # noqa: E402
+from dioptra_builtins.attacks import fgm  # noqa: E402
+from tensorflow.keras.preprocessing.image import save_img  # noqa: E402
+
+BATCH_SIZE = 32
+IMAGE_SIZE = (28, 28, 1)
+N_CLASSES = 10
+N_IMAGES = 500
+
+
+def _l_inf_norm(y_true: np.ndarray, y_pred: np.ndarray) -> np.ndarray:
+    return np.abs(y_true - y_pred).reshape(len(y_true), -1).max(axis=1)
+
+
+@pytest.fixture(scope="module")
+def mnist_like_data_dir(tmp_path_factory) -> Path:
+    data_dir = tmp_path_factory.mktemp("mnist_like")
+    rng = np.random.default_rng(0)
+
+    for image_num in range(N_IMAGES):
+        label_dir = data_dir / f"{image_num % N_CLASSES}"
+        label_dir.mkdir(exist_ok=True)
+        save_img(
+            path=str(label_dir / f"{image_num:05d}.png"),
+            x=rng.integers(0, 256, size=IMAGE_SIZE).astype("uint8"),
+            scale=False,
+        )
+
+    return data_dir
+
+
+@pytest.fixture(scope="module")
+def classifier() -> TensorFlowV2Classifier:
+    model = tf.keras.Sequential(
+        [
+            tf.keras.layers.Conv2D(8, 3, activation="relu", input_shape=IMAGE_SIZE),
+            tf.keras.layers.MaxPooling2D(),
+            tf.keras.layers.Flatten(),
+            tf.keras.layers.Dense(N_CLASSES),
+        ]
+    )
+
+    return TensorFlowV2Classifier(
+        model=model,
+        nb_classes=N_CLASSES,
+        input_shape=IMAGE_SIZE,
+        loss_object=tf.keras.losses.CategoricalCrossentropy(from_logits=True),
+        clip_values=(0.0, 1.0),
+    )
+
+
+@pytest.fixture
+def mlflow_run(tmp_path):
+    mlflow.set_tracking_uri((tmp_path / "mlruns").as_uri())
+
+    with mlflow.start_run() as run:
+        yield run
+
+
+@pytest.mark.parametrize(
+    "num_workers, prefetch", [(0, 0), (4, 2)], ids=["serial", "pipelined"]
+)
+def test_create_adversarial_fgm_dataset(
+    benchmark,
+    tmp_path,
+    mlflow_run,
+    mnist_like_data_dir,
+    classifier,
+    num_workers,
+    prefetch,
+) -> None:
+
+    distance_metrics = benchmark(
+        fgm.create_adversarial_fgm_dataset,
+        data_dir=str(mnist_like_data_dir),
+        adv_data_dir=tmp_path / "adv",
+        keras_classifier=classifier,
+        image_size=IMAGE_SIZE,
+        distance_metrics_list=[("linf_norm", _l_inf_norm)],
+        batch_size=BATCH_SIZE,
+        num_workers=num_workers,
+        prefetch=prefetch,
+        rounds=3,
+        items=N_IMAGES,
+    )
+
+    assert len(distance_metrics) == N_IMAGES
+    assert len(list((tmp_path / "adv").glob("*/*.png"))) == N_IMAGES
@@ -0,0 +1,79 @@
+# This Software (Dioptra) is being made available as a public service by the
+# National Institute of Standards and Technology (NIST), an Agency of the United
+# States Department of Commerce. This software was developed in part by employees of
+# NIST and in part by NIST contractors. Copyright in portions of this software that
+# were developed by NIST contractors has been licensed or assigned to NIST. Pursuant
+# to Title 17 United States Code Section 105, works of NIST employees are not
+# subject to copyright protection in the United States. However, NIST may hold
+# international copyright in software created by its employees and domestic
+# copyright (or licensing rights) in portions of software that were assigned or
+# licensed to NIST. To the extent that NIST holds copyright in this software, it is
+# being made available under the Creative Commons Attribution 4.0 International
+# license (CC BY 4.0). The disclaimers of the CC BY 4.0 license apply to all parts
+# of the software developed or licensed by NIST.
+#
+# ACCESS THE FULL CC BY 4.0 LICENSE HERE:
+# https://creativecommons.org/licenses/by/4.0/legalcode
+import numpy as np
+import pytest
+from dioptra_builtins.metrics.performance import (
+    StreamingPerformanceMetrics,
+    get_performance_metric_list,
+)
+
+BATCH_SIZE = 10_000
+NUM_CLASSES = 10
+NUM_SAMPLES = 1_000_000
+FUNCS = ["accuracy", "categorical_accuracy", "f1", "mcc", "precision", "recall"]
+AVERAGED_FUNCS = {"f1", "precision", "recall"}
+
+
+@pytest.fixture(scope="module")
+def labels_and_predictions():
+    rng = np.random.default_rng(0)
+    y_true = rng.integers(0, NUM_CLASSES, size=NUM_SAMPLES)
+    y_pred = np.where(
+        rng.random(NUM_SAMPLES) < 0.7,
+        y_true,
+        rng.integers(0, NUM_CLASSES, size=NUM_SAMPLES),
+    )
+
+    return y_true, y_pred
+
+
+def _evaluate_per_callable(y_true, y_pred):
+    metrics_list = get_performance_metric_list(
+        request=[{"name": x, "func": x} for x in FUNCS]
+    )
+
+    return {
+        name: metric(y_true, y_pred, average="weighted")
+        if name in AVERAGED_FUNCS
+        else metric(y_true, y_pred)
+        for name, metric in metrics_list
+    }
+
+
+def _evaluate_streaming(y_true, y_pred):
+    evaluator = StreamingPerformanceMetrics(
+        funcs=FUNCS, num_classes=NUM_CLASSES, average="weighted"
+    )
+
+    for start in range(0, len(y_true), BATCH_SIZE):
+        stop = start + BATCH_SIZE
+        evaluator.update(y_true=y_true[start:stop], y_pred=y_pred[start:stop])
+
+    return evaluator.result()
+
+
+@pytest.mark.parametrize(
+    "evaluate",
+    [_evaluate_per_callable, _evaluate_streaming],
+    ids=["per_callable", "streaming"],
+)
+def test_performance_metrics(benchmark, labels_and_predictions, evaluate) -> None:
+    y_true, y_pred = labels_and_predictions
+
+    metrics = benchmark(evaluate, y_true, y_pred, rounds=3, items=NUM_SAMPLES)
+
+    assert metrics == pytest.approx(_evaluate_per_callable(y_true, y_pred))
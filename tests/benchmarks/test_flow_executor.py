@@ -0,0 +1,148 @@
+# This Software (Dioptra) is being made available as a public service by the
+# National Institute of Standards and Technology (NIST), an Agency of the United
+# States Department of Commerce. This software was developed in part by employees of
+# NIST and in part by NIST contractors. Copyright in portions of this software that
+# were developed by NIST contractors has been licensed or assigned to NIST. Pursuant
+# to Title 17 United States Code Section 105, works of NIST employees are not
+# subject to copyright protection in the United States. However, NIST may hold
+# international copyright in software created by its employees and domestic
+# copyright (or licensing rights) in portions of software that were assigned or
+# licensed to NIST. To the extent that NIST holds copyright in this software, it is
+# being made available under the Creative Commons Attribution 4.0 International
+# license (CC BY 4.0). The disclaimers of the CC BY 4.0 license apply to all parts
+# of the software developed or licensed by NIST.
+#
+# ACCESS THE FULL CC BY 4.0 LICENSE HERE:
+# https://creativecommons.org/licenses/by/4.0/legalcode
+"""Wall-clock time of a plug-in workflow run sequentially and with run_flow.
+
+The workflow has the shape of the evasion attack examples. Loading the model and the
+dataset, and logging the parameters, are independent branches that wait on I/O,
+which is simulated with sleeps. They feed an attack task that is followed by two
+independent uploads. A second variant replaces the waits with pure Python
+computations registered with ``cpu_bound=True``, which run_flow is asked to run in
+processes.
+"""
+import os
+import textwrap
+
+import pytest
+from prefect import Flow, Parameter
+from prefect.executors import LocalExecutor
+
+from dioptra import pyplugs
+
+IO_DELAY = 0.1
+CPU_ITERATIONS = 1_500_000
+
+PLUGINS = {
+    "waits.py": f"""
+        import time
+
+        from dioptra import pyplugs
+
+
+        @pyplugs.register
+        def fetch(name, delay={IO_DELAY}):
+            time.sleep(delay)
+            return name
+
+
+        @pyplugs.register
+        def attack(model, dataset):
+            time.sleep({IO_DELAY})
+            return [model, dataset]
+
+
+        @pyplugs.register
+        def upload(data, delay={IO_DELAY}):
+            time.sleep(delay)
+            return len(data)
+    """,
+    "computations.py": f"""
+        from dioptra import pyplugs
+
+
+        @pyplugs.register(cpu_bound=True)
+        def fetch(name):
+            return sum(i * i for i in range({CPU_ITERATIONS})) and name
+
+
+        @pyplugs.register(cpu_bound=True)
+        def attack(model, dataset):
+            return sum(i * i for i in range({CPU_ITERATIONS})) and [model, dataset]
+
+
+        @pyplugs.register(cpu_bound=True)
+        def upload(data):
+            return sum(i * i for i in range({CPU_ITERATIONS})) and len(data)
+    """,
+}
+
+
+@pytest.fixture(scope="module")
+def plugin_package(tmp_path_factory):
+    base_dir = tmp_path_factory.mktemp("flow_plugins")
+    package_dir = base_dir / "benchmark_flow_plugins"
+    package_dir.mkdir()
+    (package_dir / "__init__.py").touch()
+
+    for filename, source in PLUGINS.items():
+        (package_dir / filename).write_text(textwrap.dedent(source))
+
+    with pytest.MonkeyPatch.context() as monkeypatch:
+        monkeypatch.syspath_prepend(str(base_dir))
+        monkeypatch.setenv("PYTHONPATH", str(base_dir))
+        monkeypatch.delenv("DIOPTRA_FLOW_EXECUTOR", raising=False)
+        yield "benchmark_flow_plugins"
+
+
+def _init_flow(package: str, plugin: str) -> Flow:
+    with Flow(f"Benchmark {plugin}") as flow:
+        model_name = Parameter("model_name")
+        model = pyplugs.call_task(package, plugin, "fetch", model_name)
+        dataset = pyplugs.call_task(package, plugin, "fetch", "dataset")
+        params = pyplugs.call_task(package, plugin, "fetch", "params")
+        adv_dataset = pyplugs.call_task(
+            package, plugin, "attack", model, dataset, upstream_tasks=[params]
+        )
+        pyplugs.call_task(package, plugin, "upload", adv_dataset)
+        pyplugs.call_task(package, plugin, "upload", [model_name])
+
+    return flow
+
+
+def _run(flow: Flow, executor, scheduler=None) -> None:
+    state = pyplugs.run_flow(
+        flow,
+        parameters=dict(model_name="mnist_classifier"),
+        executor=executor,
+        scheduler=scheduler,
+    )
+    assert state.is_successful()
+
+
+@pytest.mark.parametrize("executor", ["sequential", "run_flow"])
+def test_io_bound_workflow(benchmark, plugin_package, executor) -> None:
+    flow = _init_flow(plugin_package, "waits")
+    benchmark(
+        _run,
+        flow,
+        LocalExecutor() if executor == "sequential" else None,
+        rounds=3,
+        warmup=1,
+    )
+
+
+@pytest.mark.skipif((os.cpu_count() or 1) < 2, reason="needs more than one CPU")
+@pytest.mark.parametrize("executor", ["sequential", "run_flow"])
+def test_cpu_bound_workflow(benchmark, plugin_package, executor) -> None:
+    flow = _init_flow(plugin_package, "computations")
+    benchmark(
+        _run,
+        flow,
+        LocalExecutor() if executor == "sequential" else None,
+        scheduler="processes",
+        rounds=3,
+        warmup=1,
+    )
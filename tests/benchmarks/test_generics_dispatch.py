@@ -0,0 +1,54 @@
+# This Software (Dioptra) is being made available as a public service by the
+# National Institute of Standards and Technology (NIST), an Agency of the United
+# States Department of Commerce. This software was developed in part by employees of
+# NIST and in part by NIST contractors. Copyright in portions of this software that
+# were developed by NIST contractors has been licensed or assigned to NIST. Pursuant
+# to Title 17 United States Code Section 105, works of NIST employees are not
+# subject to copyright protection in the United States. However, NIST may hold
+# international copyright in software created by its employees and domestic
+# copyright (or licensing rights) in portions of software that were assigned or
+# licensed to NIST. To the extent that NIST holds copyright in this software, it is
+# being made available under the Creative Commons Attribution 4.0 International
+# license (CC BY 4.0). The disclaimers of the CC BY 4.0 license apply to all parts
+# of the software developed or licensed by NIST.
+#
+# ACCESS THE FULL CC BY 4.0 LICENSE HERE:
+# https://creativecommons.org/licenses/by/4.0/legalcode
+from typing import Any
+
+import numpy as np
+import pytest
+from multimethod import multimethod
+
+from dioptra.sdk.generics._multimethod import LazyMultimethod
+
+N_CALLS = 100_000
+
+
+class Estimator(object):
+    pass
+
+
+def _make_generic(decorator):
+    @decorator
+    def predict(estimator: Any, x: Any, pred_type: str) -> None:
+        return None
+
+    @predict.register
+    def _(estimator: Estimator, x: Any, pred_type: str) -> None:
+        return None
+
+    return predict
+
+
+def _dispatch(generic, estimator, x) -> None:
+    for _ in range(N_CALLS):
+        generic(estimator, x, "prob")
+
+
+@pytest.mark.parametrize(
+    "decorator", [multimethod, LazyMultimethod], ids=["multimethod", "lazy"]
+)
+def test_generic_dispatch_overhead(benchmark, decorator) -> None:
+    generic = _make_generic(decorator)
+    benchmark(_dispatch, generic, Estimator(), np.zeros(4), items=N_CALLS)
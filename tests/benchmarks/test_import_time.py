@@ -0,0 +1,111 @@
+# This Software (Dioptra) is being made available as a public service by the
+# National Institute of Standards and Technology (NIST), an Agency of the United
+# States Department of Commerce. This software was developed in part by employees of
+# NIST and in part by NIST contractors. Copyright in portions of this software that
+# were developed by NIST contractors has been licensed or assigned to NIST. Pursuant
+# to Title 17 United States Code Section 105, works of NIST employees are not
+# subject to copyright protection in the United States. However, NIST may hold
+# international copyright in software created by its employees and domestic
+# copyright (or licensing rights) in portions of software that were assigned or
+# licensed to NIST. To the extent that NIST holds copyright in this software, it is
+# being made available under the Creative Commons Attribution 4.0 International
+# license (CC BY 4.0). The disclaimers of the CC BY 4.0 license apply to all parts
+# of the software developed or licensed by NIST.
+#
+# ACCESS THE FULL CC BY 4.0 LICENSE HERE:
+# https://creativecommons.org/licenses/by/4.0/legalcode
+"""Import-time budgets for the dioptra package and the builtin task plugins.
+
+Each module is imported in a fresh interpreter with ``python -X importtime`` and its
+cumulative import time is checked against a budget. The budgets are loose enough to
+absorb slow CI machines, so the check that actually catches most regressions is that
+heavy optional dependencies are not imported at all until they are used.
+"""
+import os
+import subprocess
+import sys
+from pathlib import Path
+from typing import Dict, List, Set, Tuple
+
+import pytest
+
+TASK_PLUGINS_DIR = Path(__file__).parents[2] / "task-plugins"
+ROUNDS = 3
+
+HEAVY_MODULES = {"art", "keras", "prefect", "tensorflow", "torch"}
+IMPORT_TIME_BUDGETS: Dict[str, Tuple[float, Set[str]]] = {
+    "dioptra": (0.05, HEAVY_MODULES | {"mlflow", "numpy"}),
+    "dioptra.pyplugs": (0.5, HEAVY_MODULES),
+    "dioptra.restapi": (1.5, HEAVY_MODULES | {"alembic"}),
+}
+TASK_PLUGIN_MODULES = [
+    "dioptra_builtins.attacks.fgm",
+    "dioptra_builtins.backend_configs.tensorflow",
+    "dioptra_builtins.data.tensorflow",
+    "dioptra_builtins.estimators.keras_classifiers",
+    "dioptra_builtins.registry.art",
+    "dioptra_builtins.registry.mlflow",
+    "dioptra_builtins.tracking.mlflow",
+]
+
+
+def _import_time(module: str) -> Tuple[float, Set[str]]:
+    """Returns a module's cumulative import time and the modules it imported."""
+    env = dict(os.environ)
+    env["PYTHONPATH"] = os.pathsep.join(
+        [str(TASK_PLUGINS_DIR)] + [x for x in [env.get("PYTHONPATH")] if x]
+    )
+    completed = subprocess.run(
+        [sys.executable, "-X", "importtime", "-c", f"import {module}"],
+        capture_output=True,
+        check=True,
+        env=env,
+        text=True,
+    )
+    cumulative_us: int = 0
+    imported: Set[str] = set()
+
+    for line in completed.stderr.splitlines():
+        if not line.startswith("import time:") or "|" not in line:
+            continue
+
+        _, cumulative, name = line.split("|")
+
+        if not cumulative.strip().isdigit():
+            continue
+
+        imported.add(name.strip())
+
+        if name.strip() == module:
+            cumulative_us = int(cumulative)
+
+    return cumulative_us / 1e6, imported
+
+
+def _measure(benchmark, module: str) -> Tuple[float, Set[str]]:
+    timings: List[float] = []
+    imported: Set[str] = set()
+
+    for _ in range(ROUNDS):
+        seconds, imported = _import_time(module)
+        timings.append(seconds)
+
+    benchmark.record(timings)
+
+    return min(timings), {x.partition(".")[0] for x in imported}
+
+
+@pytest.mark.parametrize("module", list(IMPORT_TIME_BUDGETS))
+def test_dioptra_import_time_budget(benchmark, module) -> None:
+    budget, forbidden = IMPORT_TIME_BUDGETS[module]
+    seconds, imported = _measure(benchmark, module)
+
+    assert not imported & forbidden
+    assert seconds < budget
+
+
+@pytest.mark.parametrize("module", TASK_PLUGIN_MODULES)
+def test_task_plugins_defer_heavy_imports(benchmark, module) -> None:
+    _, imported = _measure(benchmark, module)
+
+    assert not imported & HEAVY_MODULES
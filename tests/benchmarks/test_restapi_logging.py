@@ -0,0 +1,134 @@
+# This Software (Dioptra) is being made available as a public service by the
+# National Institute of Standards and Technology (NIST), an Agency of the United
+# States Department of Commerce. This software was developed in part by employees of
+# NIST and in part by NIST contractors. Copyright in portions of this software that
+# were developed by NIST contractors has been licensed or assigned to NIST. Pursuant
+# to Title 17 United States Code Section 105, works of NIST employees are not
+# subject to copyright protection in the United States. However, NIST may hold
+# international copyright in software created by its employees and domestic
+# copyright (or licensing rights) in portions of software that were assigned or
+# licensed to NIST. To the extent that NIST holds copyright in this software, it is
+# being made available under the Creative Commons Attribution 4.0 International
+# license (CC BY 4.0). The disclaimers of the CC BY 4.0 license apply to all parts
+# of the software developed or licensed by NIST.
+#
+# ACCESS THE FULL CC BY 4.0 LICENSE HERE:
+# https://creativecommons.org/licenses/by/4.0/legalcode
+"""The per-request overhead of logging in the REST API.
+
+Every variant serves the same queue listing requests in a fresh interpreter, because
+structlog caches its configuration in each logger the first time it is used. The
+rendered log records are written to :py:data:`os.devnull`, so the timings include the
+cost of processing and rendering the events, but not of any terminal or log shipper.
+"""
+import json
+import subprocess
+import sys
+from typing import Dict, List
+
+import pytest
+
+ROUNDS = 5
+REQUESTS = 200
+
+LOGGING_VARIANTS: Dict[str, Dict[str, object]] = {
+    "off": {"level": "ERROR", "sample_rates": {}},
+    "info": {"level": "INFO", "sample_rates": {}},
+    "info-sampled": {
+        "level": "INFO",
+        "sample_rates": {
+            "Request received": 100,
+            "Get full list of unlocked queues": 100,
+        },
+    },
+}
+
+SERVE_REQUESTS = """
+import datetime
+import json
+import os
+import sys
+import time
+
+stdout = sys.stdout
+sys.stdout = open(os.devnull, "w")
+
+from flask_injector import FlaskInjector
+
+from dioptra.restapi import create_app
+from dioptra.restapi.app import db
+from dioptra.restapi.queue.dependencies import QueueRegistrationFormSchemaModule
+from dioptra.restapi.queue.model import Queue
+from dioptra.sdk.utilities.logging import (
+    attach_stdout_stream_handler,
+    configure_structlog,
+    set_logging_level,
+)
+
+level, sample_rates, rounds, requests = sys.argv[1:]
+
+attach_stdout_stream_handler(as_json=True)
+set_logging_level(level)
+configure_structlog(sample_rates=json.loads(sample_rates))
+
+app = create_app(env="test", inject_dependencies=False)
+FlaskInjector(app=app, modules=[QueueRegistrationFormSchemaModule()])
+timings = []
+
+with app.app_context():
+    db.create_all()
+    timestamp = datetime.datetime.now()
+
+    for i in range(10):
+        db.session.add(
+            Queue(
+                queue_id=i + 1,
+                name=f"queue{i}",
+                created_on=timestamp,
+                last_modified=timestamp,
+            )
+        )
+
+    db.session.commit()
+
+with app.test_client() as client:
+    for _ in range(int(requests)):
+        client.get("/api/queue/")
+
+    for _ in range(int(rounds)):
+        start = time.perf_counter()
+
+        for _ in range(int(requests)):
+            client.get("/api/queue/")
+
+        timings.append((time.perf_counter() - start) / int(requests))
+
+print(json.dumps(timings), file=stdout)
+"""
+
+
+def _serve_requests(level: str, sample_rates: Dict[str, int]) -> List[float]:
+    completed = subprocess.run(
+        [
+            sys.executable,
+            "-c",
+            SERVE_REQUESTS,
+            level,
+            json.dumps(sample_rates),
+            str(ROUNDS),
+            str(REQUESTS),
+        ],
+        capture_output=True,
+        check=True,
+        text=True,
+    )
+
+    return json.loads(completed.stdout.splitlines()[-1])
+
+
+@pytest.mark.parametrize("variant", list(LOGGING_VARIANTS))
+def test_restapi_request_logging_overhead(benchmark, variant) -> None:
+    timings = _serve_requests(**LOGGING_VARIANTS[variant])  # type: ignore[arg-type]
+    benchmark.record(timings, items=1)
+
+    assert len(timings) == ROUNDS
@@ -0,0 +1,128 @@
+# This Software (Dioptra) is being made available as a public service by the
+# National Institute of Standards and Technology (NIST), an Agency of the United
+# States Department of Commerce. This software was developed in part by employees of
+# NIST and in part by NIST contractors. Copyright in portions of this software that
+# were developed by NIST contractors has been licensed or assigned to NIST. Pursuant
+# to Title 17 United States Code Section 105, works of NIST employees are not
+# subject to copyright protection in the United States. However, NIST may hold
+# international copyright in software created by its employees and domestic
+# copyright (or licensing rights) in portions of software that were assigned or
+# licensed to NIST. To the extent that NIST holds copyright in this software, it is
+# being made available under the Creative Commons Attribution 4.0 International
+# license (CC BY 4.0). The disclaimers of the CC BY 4.0 license apply to all parts
+# of the software developed or licensed by NIST.
+#
+# ACCESS THE FULL CC BY 4.0 LICENSE HERE:
+# https://creativecommons.org/licenses/by/4.0/legalcode
+import numpy as np
+import pytest
+
+tf = pytest.importorskip("tensorflow")
+
+from dioptra.generics_plugins.estimator_predict import tf_keras_model  # noqa: E402,F401
+from dioptra.sdk.exceptions import EstimatorPredictGenericPredTypeError  # noqa: E402
+from dioptra.sdk.generics import estimator_predict  # noqa: E402
+
+NUM_CLASSES = 4
+NUM_SAMPLES = 37
+
+
+class _OneHotSequence(object):
+    def __init__(self, x: np.ndarray, y: np.ndarray, batch_size: int) -> None:
+        self.x = x
+        self.y = np.eye(NUM_CLASSES, dtype="float32")[y]
+        self.batch_size = batch_size
+        self.n = len(x)
+
+    def __len__(self) -> int:
+        return -(-self.n // self.batch_size)
+
+    def __getitem__(self, index: int):
+        batch = slice(index * self.batch_size, (index + 1) * self.batch_size)
+        return self.x[batch], self.y[batch]
+
+
+@pytest.fixture(scope="module")
+def model():
+    tf.keras.utils.set_random_seed(0)
+    return tf.keras.Sequential(
+        [
+            tf.keras.layers.Dense(8, activation="relu", input_shape=(5,)),
+            tf.keras.layers.Dense(NUM_CLASSES, activation="softmax"),
+        ]
+    )
+
+
+@pytest.fixture
+def data():
+    rng = np.random.default_rng(0)
+    x = rng.normal(size=(NUM_SAMPLES, 5)).astype("float32")
+    y = rng.integers(0, NUM_CLASSES, size=NUM_SAMPLES)
+    return x, y
+
+
+@pytest.mark.parametrize("pred_type", ["prob", "label"])
+def test_chunked_predict_matches_predict(model, data, pred_type) -> None:
+    x, _ = data
+    expected = estimator_predict(model, x, pred_type)
+    result = estimator_predict(model, x, pred_type, chunk_size=8)
+
+    assert result.shape == expected.shape
+    np.testing.assert_allclose(result, expected, rtol=1e-5, atol=1e-6)
+
+
+def test_chunked_predict_returns_aligned_y_true(model, data, tmp_path) -> None:
+    x, y = data
+    y_true, y_pred = estimator_predict(
+        model,
+        _OneHotSequence(x, y, batch_size=10),
+        "label",
+        output_dir=tmp_path,
+        return_y_true=True,
+    )
+
+    np.testing.assert_array_equal(y_true, y)
+    np.testing.assert_array_equal(y_pred, estimator_predict(model, x, "label"))
+    np.testing.assert_array_equal(np.load(tmp_path / "y_true.npy"), y)
+    assert isinstance(y_pred, np.memmap)
+
+
+def test_chunked_predict_tf_data(model, data) -> None:
+    x, y = data
+    dataset = tf.data.Dataset.from_tensor_slices((x, y)).batch(16)
+
+    with pytest.raises(ValueError):
+        estimator_predict(model, dataset, "prob", return_y_true=True)
+
+    y_true, y_pred = estimator_predict(
+        model, dataset, "prob", num_samples=NUM_SAMPLES, return_y_true=True
+    )
+
+    np.testing.assert_array_equal(y_true, y)
+    assert y_pred.shape == (NUM_SAMPLES, NUM_CLASSES)
+
+
+def test_chunked_predict_unknown_pred_type(model, data) -> None:
+    x, _ = data
+
+    with pytest.raises(EstimatorPredictGenericPredTypeError):
+        estimator_predict(model, x, "logits", chunk_size=8)
+
+
+@pytest.mark.parametrize(
+    "kwargs",
+    [
+        dict(chunk_size=16, batch_size=4),
+        dict(chunk_size=8, batch_size=64, verbose=0),
+        dict(num_samples=NUM_SAMPLES, batch_size=10),
+        dict(output_dir=None, chunk_size=8, verbose=0),
+    ],
+    ids=["small_batch", "large_batch_verbose", "batch_as_chunk", "verbose"],
+)
+def test_chunked_predict_accepts_predict_kwargs(model, data, kwargs) -> None:
+    x, _ = data
+    expected = estimator_predict(model, x, "prob")
+    result = estimator_predict(model, x, "prob", **kwargs)
+
+    assert result.shape == expected.shape
+    np.testing.assert_allclose(result, expected, rtol=1e-5, atol=1e-6)
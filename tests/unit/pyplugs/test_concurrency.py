@@ -0,0 +1,208 @@
+# This Software (Dioptra) is being made available as a public service by the
+# National Institute of Standards and Technology (NIST), an Agency of the United
+# States Department of Commerce. This software was developed in part by employees of
+# NIST and in part by NIST contractors. Copyright in portions of this software that
+# were developed by NIST contractors has been licensed or assigned to NIST. Pursuant
+# to Title 17 United States Code Section 105, works of NIST employees are not
+# subject to copyright protection in the United States. However, NIST may hold
+# international copyright in software created by its employees and domestic
+# copyright (or licensing rights) in portions of software that were assigned or
+# licensed to NIST. To the extent that NIST holds copyright in this software, it is
+# being made available under the Creative Commons Attribution 4.0 International
+# license (CC BY 4.0). The disclaimers of the CC BY 4.0 license apply to all parts
+# of the software developed or licensed by NIST.
+#
+# ACCESS THE FULL CC BY 4.0 LICENSE HERE:
+# https://creativecommons.org/licenses/by/4.0/legalcode
+"""Stress tests for concurrent use of the plug-in registry"""
+import importlib
+import sys
+import textwrap
+import threading
+import uuid
+from concurrent.futures import ThreadPoolExecutor
+
+import pytest
+
+from dioptra import pyplugs
+from dioptra.sdk.exceptions import UnknownPluginError
+
+NUM_THREADS = 16
+NUM_SLOW_PLUGINS = 4
+
+COUNTER_SOURCE = """
+import collections
+import threading
+
+imports = collections.Counter()
+lock = threading.Lock()
+
+
+def hit(name):
+    with lock:
+        imports[name] += 1
+"""
+
+SLOW_PLUGIN_SOURCE = '''
+import time
+
+from dioptra import pyplugs
+
+from . import _counter
+
+_counter.hit(__name__)
+
+
+@pyplugs.register
+def first():
+    """The first part"""
+    return "first"
+
+
+time.sleep(0.05)
+
+
+@pyplugs.register
+def second():
+    """The second part"""
+    return "second"
+
+
+time.sleep(0.05)
+
+
+@pyplugs.register
+def third():
+    """The third part"""
+    return "third"
+'''
+
+BROKEN_PLUGIN_SOURCE = """
+from dioptra import pyplugs
+
+from . import _counter
+
+_counter.hit(__name__)
+
+raise ImportError("missing dependency")
+
+
+@pyplugs.register
+def broken():
+    return "broken"
+"""
+
+
+@pytest.fixture
+def plugin_package(tmp_path, monkeypatch):
+    monkeypatch.syspath_prepend(str(tmp_path))
+    package_name = f"concurrent_plugins_{uuid.uuid4().hex}"
+    package_dir = tmp_path / package_name
+    package_dir.mkdir()
+    (package_dir / "__init__.py").write_text("")
+    (package_dir / "_counter.py").write_text(textwrap.dedent(COUNTER_SOURCE))
+    (package_dir / "broken.py").write_text(textwrap.dedent(BROKEN_PLUGIN_SOURCE))
+
+    for index in range(NUM_SLOW_PLUGINS):
+        (package_dir / f"slow_{index}.py").write_text(
+            textwrap.dedent(SLOW_PLUGIN_SOURCE)
+        )
+
+    yield package_name
+
+    for module in [x for x in sys.modules if x.startswith(package_name)]:
+        monkeypatch.delitem(sys.modules, module)
+
+
+def _run_concurrently(func):
+    barrier = threading.Barrier(NUM_THREADS)
+
+    def run(thread_index):
+        barrier.wait()
+        return func(thread_index)
+
+    with ThreadPoolExecutor(max_workers=NUM_THREADS) as executor:
+        return list(executor.map(run, range(NUM_THREADS)))
+
+
+def test_concurrent_first_lookups_import_each_plugin_once(plugin_package):
+    expected_names = ["broken"] + [f"slow_{x}" for x in range(NUM_SLOW_PLUGINS)]
+
+    def lookup(thread_index):
+        plugin = f"slow_{thread_index % NUM_SLOW_PLUGINS}"
+        results = [
+            pyplugs.names(plugin_package),
+            pyplugs.call(plugin_package, plugin, func="third"),
+            pyplugs.funcs(plugin_package, plugin),
+            pyplugs.info(plugin_package, plugin, func="second").func(),
+        ]
+
+        with pytest.raises(ImportError, match="missing dependency"):
+            pyplugs.get(plugin_package, "broken")
+
+        return results
+
+    results = _run_concurrently(lookup)
+    counter = importlib.import_module(f"{plugin_package}._counter")
+
+    assert all(
+        x == [expected_names, "third", ["first", "second", "third"], "second"]
+        for x in results
+    )
+    assert counter.imports == {f"{plugin_package}.{x}": 1 for x in expected_names}
+
+
+def test_concurrent_lookups_of_missing_plugins_are_cached(plugin_package, monkeypatch):
+    attempts = []
+    import_module = importlib.import_module
+
+    def counting_import_module(name, *args, **kwargs):
+        if name.endswith(".missing"):
+            attempts.append(name)
+
+        return import_module(name, *args, **kwargs)
+
+    monkeypatch.setattr(importlib, "import_module", counting_import_module)
+
+    def lookup(thread_index):
+        results = [pyplugs.exists(plugin_package, "missing") for _ in range(10)]
+
+        with pytest.raises(UnknownPluginError):
+            pyplugs.get(plugin_package, "missing")
+
+        return results
+
+    assert not any(any(x) for x in _run_concurrently(lookup))
+    assert len(attempts) == 1
+
+    pyplugs.invalidate_caches()
+    assert not pyplugs.exists(plugin_package, "missing")
+    assert len(attempts) == 2
+
+
+def test_registering_while_listing_names(plugin_package):
+    stop = threading.Event()
+
+    def register_plugins():
+        index = 0
+
+        while not stop.is_set():
+            func = lambda: None  # noqa: E731
+            func.__module__ = f"{plugin_package}.registered_{index % 50}"
+            func.__name__ = f"func_{index}"
+            sys.modules.setdefault(func.__module__, type(sys)(func.__module__))
+            pyplugs.register(func)
+            index += 1
+
+    thread = threading.Thread(target=register_plugins)
+    thread.start()
+
+    try:
+        for _ in range(200):
+            names = pyplugs.names(plugin_package)
+            assert len(names) == len(set(names))
+            assert {f"slow_{x}" for x in range(NUM_SLOW_PLUGINS)} <= set(names)
+
+    finally:
+        stop.set()
+        thread.join()
@@ -0,0 +1,189 @@
+# This Software (Dioptra) is being made available as a public service by the
+# National Institute of Standards and Technology (NIST), an Agency of the United
+# States Department of Commerce. This software was developed in part by employees of
+# NIST and in part by NIST contractors. Copyright in portions of this software that
+# were developed by NIST contractors has been licensed or assigned to NIST. Pursuant
+# to Title 17 United States Code Section 105, works of NIST employees are not
+# subject to copyright protection in the United States. However, NIST may hold
+# international copyright in software created by its employees and domestic
+# copyright (or licensing rights) in portions of software that were assigned or
+# licensed to NIST. To the extent that NIST holds copyright in this software, it is
+# being made available under the Creative Commons Attribution 4.0 International
+# license (CC BY 4.0). The disclaimers of the CC BY 4.0 license apply to all parts
+# of the software developed or licensed by NIST.
+#
+# ACCESS THE FULL CC BY 4.0 LICENSE HERE:
+# https://creativecommons.org/licenses/by/4.0/legalcode
+import pathlib
+import threading
+
+import mlflow
+import pytest
+from prefect import Flow, Parameter, task
+from prefect.executors import LocalDaskExecutor, LocalExecutor
+
+from dioptra import pyplugs
+from dioptra.pyplugs._flows import FLOW_EXECUTOR_ENV_VAR
+
+
+@pytest.fixture
+def plugin_package():
+    """Name of the test plugin package"""
+    plugins_dir = pathlib.Path(__file__).absolute().parent / "plugin_directory"
+    relative = plugins_dir.relative_to(pathlib.Path.cwd())
+
+    return ".".join(relative.parts)
+
+
+@pytest.fixture(autouse=True)
+def no_executor_override(monkeypatch):
+    monkeypatch.delenv(FLOW_EXECUTOR_ENV_VAR, raising=False)
+    monkeypatch.setattr("os.cpu_count", lambda: 4)
+
+
+def _branching_flow(plugin_package, func):
+    with Flow("Test Branches") as flow:
+        value = Parameter("value")
+        first = pyplugs.call_task(plugin_package, "plugin_cpu_bound", func, value)
+        second = pyplugs.call_task(plugin_package, "plugin_cpu_bound", func, value)
+        pyplugs.call_task(
+            plugin_package,
+            "plugin_cpu_bound",
+            "plugin_io_bound",
+            value,
+            upstream_tasks=[first, second],
+        )
+
+    return flow
+
+
+def test_select_executor_runs_chains_sequentially(plugin_package):
+    """Test that a flow without independent branches uses the local executor"""
+    with Flow("Test Chain") as flow:
+        value = Parameter("value")
+        first = pyplugs.call_task(
+            plugin_package, "plugin_cpu_bound", "plugin_io_bound", value
+        )
+        pyplugs.call_task(plugin_package, "plugin_cpu_bound", "plugin_io_bound", first)
+
+    assert isinstance(pyplugs.select_executor(flow), LocalExecutor)
+
+
+@pytest.mark.parametrize("func", ["plugin_io_bound", "plugin_cpu_bound"])
+def test_select_executor_parallelizes_branches(plugin_package, func):
+    """Test that independent branches run in threads, whatever the cpu_bound hint"""
+    flow = _branching_flow(plugin_package, func)
+    executor = pyplugs.select_executor(flow)
+
+    assert isinstance(executor, LocalDaskExecutor)
+    assert executor.scheduler == "threads"
+    assert executor.dask_config == {"num_workers": 2}
+    assert pyplugs.select_executor(flow, num_workers=8).dask_config == {
+        "num_workers": 8
+    }
+
+
+def test_select_executor_runs_processes_on_request(plugin_package):
+    """Test that processes are only used when asked for"""
+    flow = _branching_flow(plugin_package, "plugin_cpu_bound")
+    executor = pyplugs.select_executor(flow, scheduler="processes")
+
+    assert isinstance(executor, LocalDaskExecutor)
+    assert executor.scheduler == "processes"
+
+    with pytest.raises(ValueError):
+        pyplugs.select_executor(flow, scheduler="cluster")
+
+
+def test_select_executor_can_be_overridden(plugin_package, monkeypatch):
+    """Test that the environment variable overrides the choice of executor"""
+    flow = _branching_flow(plugin_package, "plugin_cpu_bound")
+
+    monkeypatch.setenv(FLOW_EXECUTOR_ENV_VAR, "local")
+    assert isinstance(pyplugs.select_executor(flow), LocalExecutor)
+    assert isinstance(
+        pyplugs.select_executor(flow, scheduler="processes"), LocalExecutor
+    )
+
+    monkeypatch.setenv(FLOW_EXECUTOR_ENV_VAR, "processes")
+    assert pyplugs.select_executor(flow).scheduler == "processes"
+
+    monkeypatch.setenv(FLOW_EXECUTOR_ENV_VAR, "cluster")
+    with pytest.raises(ValueError):
+        pyplugs.select_executor(flow)
+
+
+def test_run_flow_mixes_cpu_bound_and_unpicklable_tasks(plugin_package):
+    """Test that a cpu_bound plugin does not move unpicklable results to processes"""
+
+    @task
+    def make_lock():
+        return threading.Lock()
+
+    @task
+    def use_lock(lock, value):
+        with lock:
+            return value
+
+    with Flow("Test Mixed") as flow:
+        value = Parameter("value")
+        computed = pyplugs.call_task(
+            plugin_package, "plugin_cpu_bound", "plugin_cpu_bound", value
+        )
+        locked = use_lock(make_lock(), value)
+        result = pyplugs.call_task(
+            plugin_package,
+            "plugin_cpu_bound",
+            "plugin_io_bound",
+            value,
+            upstream_tasks=[computed, locked],
+        )
+
+    assert pyplugs.select_executor(flow).scheduler == "threads"
+
+    state = pyplugs.run_flow(flow, parameters=dict(value=3))
+
+    assert state.is_successful()
+    assert state.result[computed].result == 5
+    assert state.result[locked].result == 3
+    assert state.result[result].result == 3
+
+
+def test_run_flow_shares_mlflow_run_with_worker_threads(plugin_package, tmp_path):
+    """Test that tasks in worker threads log to the flow's MLflow run"""
+    mlflow.set_tracking_uri((tmp_path / "mlruns").as_uri())
+    threads = set()
+
+    @task
+    def log_param(name, value):
+        threads.add(threading.get_ident())
+        mlflow.log_param(name, value)
+
+    with Flow("Test MLflow") as flow:
+        value = Parameter("value")
+        first = log_param("first", value)
+        second = log_param("second", value)
+        pyplugs.call_task(
+            plugin_package,
+            "plugin_cpu_bound",
+            "plugin_io_bound",
+            value,
+            upstream_tasks=[first, second],
+        )
+
+    try:
+        with mlflow.start_run() as active_run:
+            state = pyplugs.run_flow(flow, parameters=dict(value=3))
+
+        run_id = active_run.info.run_id
+        params = mlflow.tracking.MlflowClient().get_run(run_id).data.params
+
+    finally:
+        mlflow.set_tracking_uri(None)
+
+    assert state.is_successful()
+    assert threading.get_ident() not in threads
+    assert params == {"first": "3", "second": "3"}
+    assert [x.task for x in pyplugs.get_task_timeline(run_id)] == [
+        "plugin_cpu_bound.plugin_io_bound"
+    ]
@@ -0,0 +1,168 @@
+# This Software (Dioptra) is being made available as a public service by the
+# National Institute of Standards and Technology (NIST), an Agency of the United
+# States Department of Commerce. This software was developed in part by employees of
+# NIST and in part by NIST contractors. Copyright in portions of this software that
+# were developed by NIST contractors has been licensed or assigned to NIST. Pursuant
+# to Title 17 United States Code Section 105, works of NIST employees are not
+# subject to copyright protection in the United States. However, NIST may hold
+# international copyright in software created by its employees and domestic
+# copyright (or licensing rights) in portions of software that were assigned or
+# licensed to NIST. To the extent that NIST holds copyright in this software, it is
+# being made available under the Creative Commons Attribution 4.0 International
+# license (CC BY 4.0). The disclaimers of the CC BY 4.0 license apply to all parts
+# of the software developed or licensed by NIST.
+#
+# ACCESS THE FULL CC BY 4.0 LICENSE HERE:
+# https://creativecommons.org/licenses/by/4.0/legalcode
+import json
+import pathlib
+
+import mlflow
+import numpy as np
+import pytest
+from prefect import Flow
+
+from dioptra import pyplugs
+from dioptra.pyplugs._instrumentation import INSTRUMENTATION_ENV_VAR, _estimate_size
+
+
+@pytest.fixture
+def plugin_package():
+    """Name of the test plugin package"""
+    plugins_dir = pathlib.Path(__file__).absolute().parent / "plugin_directory"
+    relative = plugins_dir.relative_to(pathlib.Path.cwd())
+
+    return ".".join(relative.parts)
+
+
+@pytest.fixture
+def mlflow_run(tmp_path):
+    """An active MLflow run that is tracked in a temporary directory"""
+    mlflow.set_tracking_uri((tmp_path / "mlruns").as_uri())
+
+    with mlflow.start_run() as active_run:
+        yield active_run
+
+    pyplugs.flush_task_measurements()
+    mlflow.set_tracking_uri(None)
+
+
+def test_get_task_logs_measurements_to_mlflow(plugin_package, mlflow_run, tmp_path):
+    """Test that each run of a plug-in task is measured and logged to MLflow"""
+    with Flow("Test Instrumentation") as flow:
+        pyplugs.call_task(plugin_package, "plugin_task_nout", "plugin_with_nout")
+        pyplugs.call_task(plugin_package, "plugin_task_nout", "plugin_without_nout")
+
+    assert flow.run().is_successful()
+
+    run_id = mlflow_run.info.run_id
+    pyplugs.flush_task_measurements(run_id)
+    timeline = pyplugs.get_task_timeline(run_id)
+    metrics = mlflow.tracking.MlflowClient().get_run(run_id).data.metrics
+    artifact = pathlib.Path(
+        mlflow.artifacts.download_artifacts(
+            run_id=run_id,
+            artifact_path="pyplugs/task_timeline.json",
+            dst_path=str(tmp_path / "artifacts"),
+        )
+    )
+
+    assert [x.task for x in timeline] == [
+        "plugin_task_nout.plugin_with_nout",
+        "plugin_task_nout.plugin_without_nout",
+    ]
+    assert all(x.succeeded and x.wall_time >= 0 for x in timeline)
+    assert all(x.result_bytes and x.result_bytes > 0 for x in timeline)
+    assert {
+        "pyplugs.plugin_task_nout.plugin_with_nout.wall_time_seconds",
+        "pyplugs.plugin_task_nout.plugin_with_nout.cpu_time_seconds",
+        "pyplugs.plugin_task_nout.plugin_with_nout.peak_rss_bytes",
+        "pyplugs.plugin_task_nout.plugin_with_nout.peak_rss_growth_bytes",
+        "pyplugs.plugin_task_nout.plugin_with_nout.result_bytes",
+    } <= set(metrics)
+    assert [x["task"] for x in json.loads(artifact.read_text())] == [
+        x.task for x in timeline
+    ]
+
+
+def test_measurements_are_uploaded_once_per_flush(mlflow_run, monkeypatch):
+    """Test that measurements are buffered instead of uploaded after every task"""
+    calls = []
+    client_cls = mlflow.tracking.MlflowClient
+    monkeypatch.setattr(
+        client_cls,
+        "log_batch",
+        lambda self, run_id, metrics: calls.append(("log_batch", len(metrics))),
+    )
+    monkeypatch.setattr(
+        client_cls,
+        "log_artifact",
+        lambda self, run_id, local_path, artifact_path=None: calls.append(
+            ("log_artifact", pathlib.Path(local_path).name)
+        ),
+    )
+    instrumented = pyplugs.instrument_task(lambda: 1, "test.buffered")
+
+    for _ in range(20):
+        instrumented()
+
+    assert calls == []
+
+    pyplugs.flush_task_measurements()
+    pyplugs.flush_task_measurements()
+
+    assert [x[0] for x in calls] == ["log_batch", "log_artifact"]
+    assert calls[0][1] >= 20 * 4
+    assert calls[1][1] == "task_timeline.json"
+
+
+def test_measurements_are_flushed_at_an_interval(mlflow_run, monkeypatch):
+    """Test that long runs send their measurements while tasks keep finishing"""
+    flushed = []
+    monkeypatch.setattr("dioptra.pyplugs._instrumentation.FLUSH_INTERVAL_SECONDS", 0.0)
+    monkeypatch.setattr(
+        "dioptra.pyplugs._instrumentation.flush_task_measurements", flushed.append
+    )
+    instrumented = pyplugs.instrument_task(lambda: 1, "test.interval")
+
+    instrumented()
+    instrumented()
+
+    assert flushed == [mlflow_run.info.run_id] * 2
+
+
+def test_instrumented_task_records_failures():
+    """Test that a failing task is measured and its error is raised"""
+
+    def fails():
+        raise RuntimeError("failed")
+
+    instrumented = pyplugs.instrument_task(fails, "test.fails")
+    before = len(pyplugs.get_task_timeline())
+
+    with pytest.raises(RuntimeError):
+        instrumented()
+
+    measurement = pyplugs.get_task_timeline()[before]
+
+    assert measurement.task == "test.fails"
+    assert not measurement.succeeded
+    assert measurement.result_bytes is None
+
+
+def test_instrumentation_can_be_disabled(monkeypatch):
+    """Test that nothing is measured when instrumentation is turned off"""
+    monkeypatch.setenv(INSTRUMENTATION_ENV_VAR, "0")
+    instrumented = pyplugs.instrument_task(lambda: 1, "test.disabled")
+    before = len(pyplugs.get_task_timeline())
+
+    assert instrumented() == 1
+    assert len(pyplugs.get_task_timeline()) == before
+
+
+def test_estimate_size_uses_array_buffers():
+    """Test that the size of arrays inside containers is their buffer size"""
+    array = np.zeros((100, 100), dtype="float64")
+
+    assert _estimate_size(array) == 80000
+    assert _estimate_size((array, array)) > 160000
@@ -0,0 +1,207 @@
+# This Software (Dioptra) is being made available as a public service by the
+# National Institute of Standards and Technology (NIST), an Agency of the United
+# States Department of Commerce. This software was developed in part by employees of
+# NIST and in part by NIST contractors. Copyright in portions of this software that
+# were developed by NIST contractors has been licensed or assigned to NIST. Pursuant
+# to Title 17 United States Code Section 105, works of NIST employees are not
+# subject to copyright protection in the United States. However, NIST may hold
+# international copyright in software created by its employees and domestic
+# copyright (or licensing rights) in portions of software that were assigned or
+# licensed to NIST. To the extent that NIST holds copyright in this software, it is
+# being made available under the Creative Commons Attribution 4.0 International
+# license (CC BY 4.0). The disclaimers of the CC BY 4.0 license apply to all parts
+# of the software developed or licensed by NIST.
+#
+# ACCESS THE FULL CC BY 4.0 LICENSE HERE:
+# https://creativecommons.org/licenses/by/4.0/legalcode
+import os
+import sys
+import textwrap
+import uuid
+
+import pytest
+
+from dioptra import pyplugs
+from dioptra.pyplugs._manifest import (
+    MANIFEST_CACHE_FILENAME,
+    build_package_manifest,
+    parse_module,
+)
+
+PLUGIN_DIRECTORY_MODULES = [
+    "plugin_first",
+    "plugin_last",
+    "plugin_parts",
+    "plugin_plain",
+    "plugin_task_nout",
+]
+
+
+@pytest.fixture
+def make_package(tmp_path, monkeypatch):
+    """Creates a plug-in package on a temporary import path"""
+    monkeypatch.syspath_prepend(str(tmp_path))
+    package_name = f"manifest_plugins_{uuid.uuid4().hex}"
+    package_dir = tmp_path / package_name
+    package_dir.mkdir()
+    (package_dir / "__init__.py").write_text("")
+
+    def make_package(**modules: str) -> str:
+        for name, source in modules.items():
+            (package_dir / f"{name}.py").write_text(textwrap.dedent(source))
+
+        return package_name
+
+    yield make_package
+
+    for module in [x for x in sys.modules if x.startswith(package_name)]:
+        monkeypatch.delitem(sys.modules, module)
+
+
+def test_parse_module_extracts_registered_plugins() -> None:
+    manifest = parse_module(
+        textwrap.dedent(
+            '''
+            """Module docs"""
+            from dioptra import pyplugs
+            from dioptra.pyplugs import register as reg
+
+
+            @pyplugs.register(sort_value=-5)
+            @pyplugs.task_nout(2)
+            def first():
+                """Short description
+
+                Longer documentation.
+                """
+
+
+            @reg
+            def second():
+                pass
+
+
+            def not_a_plugin():
+                pass
+            '''
+        ).encode("utf-8")
+    )
+
+    assert manifest.module_doc == "Module docs"
+    assert not manifest.dynamic
+    assert [x.func_name for x in manifest.plugins] == ["first", "second"]
+    assert manifest.plugins[0].description == "Short description"
+    assert manifest.plugins[0].doc == "Longer documentation."
+    assert manifest.plugins[0].sort_value == -5
+    assert manifest.plugins[0].task_nout == 2
+    assert manifest.plugins[1].task_nout is None
+
+
+@pytest.mark.parametrize(
+    "source",
+    [
+        "from dioptra import pyplugs\nf = pyplugs.register(lambda: 1)\n",
+        "from dioptra import pyplugs\n@pyplugs.register(sort_value=VALUE)\n"
+        "def f(): pass\n",
+        "from dioptra import pyplugs\nclass A:\n    @pyplugs.register\n"
+        "    def f(self): pass\n",
+        "def f(:\n",
+    ],
+    ids=["direct_call", "computed_sort_value", "nested", "syntax_error"],
+)
+def test_parse_module_marks_dynamic_registrations(source) -> None:
+    assert parse_module(source.encode("utf-8")).dynamic
+
+
+@pytest.mark.parametrize("plugin", PLUGIN_DIRECTORY_MODULES)
+def test_manifest_matches_registered_plugins(plugin) -> None:
+    package = "tests.unit.pyplugs.plugin_directory"
+    package_dir = os.path.join(os.path.dirname(__file__), "plugin_directory")
+    manifest = build_package_manifest([package_dir])[plugin]
+
+    for entry in manifest.plugins:
+        registered = pyplugs.get(package, plugin, entry.func_name)
+        registered_info = pyplugs.info(package, plugin, entry.func_name)
+
+        assert registered_info.description == entry.description
+        assert registered_info.doc == entry.doc
+        assert registered_info.sort_value == entry.sort_value
+        assert registered_info.module_doc == manifest.module_doc
+        assert getattr(registered, "_task_nout", None) == entry.task_nout
+
+
+def test_names_and_info_do_not_import_plugins(make_package) -> None:
+    package = make_package(
+        heavy='''
+        """A plug-in with expensive imports"""
+        from dioptra import pyplugs
+
+        raise RuntimeError("imported")
+
+
+        @pyplugs.register(sort_value=1)
+        def heavy_plugin():
+            """Does heavy things"""
+        ''',
+        light='''
+        from dioptra import pyplugs
+
+
+        @pyplugs.register
+        def light_plugin():
+            """Does light things"""
+            return "light"
+        ''',
+    )
+
+    assert pyplugs.names(package) == ["light", "heavy"]
+    assert pyplugs.funcs(package, "heavy") == ["heavy_plugin"]
+    assert pyplugs.info(package, "heavy").description == "Does heavy things"
+    assert pyplugs.exists(package, "heavy")
+    assert f"{package}.heavy" not in sys.modules
+    assert f"{package}.light" not in sys.modules
+
+    assert pyplugs.call(package, "light") == "light"
+
+    with pytest.raises(RuntimeError, match="imported"):
+        pyplugs.get(package, "heavy")
+
+
+def test_dynamic_plugins_are_imported(make_package) -> None:
+    package = make_package(
+        dynamic="""
+        from dioptra import pyplugs
+
+
+        def dynamic_plugin():
+            return "dynamic"
+
+
+        pyplugs.register(dynamic_plugin)
+        """,
+    )
+
+    assert pyplugs.names(package) == ["dynamic"]
+    assert f"{package}.dynamic" in sys.modules
+
+
+def test_manifest_cache_tracks_source_changes(tmp_path, monkeypatch) -> None:
+    monkeypatch.setattr(sys, "dont_write_bytecode", False)
+    module_path = tmp_path / "plugin.py"
+    module_path.write_text(
+        "from dioptra import pyplugs\n@pyplugs.register\ndef old(): pass\n"
+    )
+
+    assert build_package_manifest([str(tmp_path)])["plugin"].plugins[0].func_name == (
+        "old"
+    )
+    assert (tmp_path / "__pycache__" / MANIFEST_CACHE_FILENAME).exists()
+
+    module_path.write_text(
+        "from dioptra import pyplugs\n@pyplugs.register\ndef new(): pass\n"
+    )
+    os.utime(module_path, ns=(0, 0))
+
+    assert build_package_manifest([str(tmp_path)])["plugin"].plugins[0].func_name == (
+        "new"
+    )
@@ -0,0 +1,68 @@
+# This Software (Dioptra) is being made available as a public service by the
+# National Institute of Standards and Technology (NIST), an Agency of the United
+# States Department of Commerce. This software was developed in part by employees of
+# NIST and in part by NIST contractors. Copyright in portions of this software that
+# were developed by NIST contractors has been licensed or assigned to NIST. Pursuant
+# to Title 17 United States Code Section 105, works of NIST employees are not
+# subject to copyright protection in the United States. However, NIST may hold
+# international copyright in software created by its employees and domestic
+# copyright (or licensing rights) in portions of software that were assigned or
+# licensed to NIST. To the extent that NIST holds copyright in this software, it is
+# being made available under the Creative Commons Attribution 4.0 International
+# license (CC BY 4.0). The disclaimers of the CC BY 4.0 license apply to all parts
+# of the software developed or licensed by NIST.
+#
+# ACCESS THE FULL CC BY 4.0 LICENSE HERE:
+# https://creativecommons.org/licenses/by/4.0/legalcode
+from __future__ import annotations
+
+import boto3
+import pytest
+from botocore.stub import Stubber
+from redis import Redis
+from redis.exceptions import ConnectionError
+
+from dioptra.restapi.instrumentation import (
+    MetricsRegistry,
+    instrument_boto3_client,
+    instrument_redis_client,
+)
+from dioptra.restapi.instrumentation.clients import OUTBOUND_CALL_DURATION
+
+
+def _outbound_calls(registry: MetricsRegistry, service: str, operation: str) -> int:
+    return registry.histogram(OUTBOUND_CALL_DURATION, "").count(service, operation)
+
+
+def test_instrument_boto3_client_times_api_calls() -> None:
+    registry = MetricsRegistry()
+    client = boto3.Session(region_name="us-east-1").client(
+        "s3", aws_access_key_id="test", aws_secret_access_key="test"
+    )
+
+    assert instrument_boto3_client(client, registry=registry) is client
+    assert instrument_boto3_client(client, registry=registry) is client
+
+    with Stubber(client) as stubber:
+        stubber.add_response("list_buckets", {"Buckets": []})
+        client.list_buckets()
+
+    assert _outbound_calls(registry, "s3", "ListBuckets") == 1
+
+
+def test_instrument_redis_client_times_failed_commands() -> None:
+    registry = MetricsRegistry()
+    redis = instrument_redis_client(
+        Redis.from_url("redis://localhost:1"), registry=registry
+    )
+
+    with pytest.raises(ConnectionError):
+        redis.ping()
+
+    with pytest.raises(ConnectionError):
+        pipe = redis.pipeline()
+        pipe.ping()
+        pipe.execute()
+
+    assert _outbound_calls(registry, "redis", "PING") == 1
+    assert _outbound_calls(registry, "redis", "PIPELINE") == 1
@@ -0,0 +1,48 @@
+# This Software (Dioptra) is being made available as a public service by the
+# National Institute of Standards and Technology (NIST), an Agency of the United
+# States Department of Commerce. This software was developed in part by employees of
+# NIST and in part by NIST contractors. Copyright in portions of this software that
+# were developed by NIST contractors has been licensed or assigned to NIST. Pursuant
+# to Title 17 United States Code Section 105, works of NIST employees are not
+# subject to copyright protection in the United States. However, NIST may hold
+# international copyright in software created by its employees and domestic
+# copyright (or licensing rights) in portions of software that were assigned or
+# licensed to NIST. To the extent that NIST holds copyright in this software, it is
+# being made available under the Creative Commons Attribution 4.0 International
+# license (CC BY 4.0). The disclaimers of the CC BY 4.0 license apply to all parts
+# of the software developed or licensed by NIST.
+#
+# ACCESS THE FULL CC BY 4.0 LICENSE HERE:
+# https://creativecommons.org/licenses/by/4.0/legalcode
+from __future__ import annotations
+
+from dioptra.restapi.instrumentation import MetricsRegistry
+
+
+def test_histogram_renders_cumulative_buckets() -> None:
+    registry = MetricsRegistry()
+    histogram = registry.histogram(
+        "request_seconds", "Request duration.", ("route",), buckets=(0.1, 1.0)
+    )
+
+    for value in (0.05, 0.1, 0.5, 3.0):
+        histogram.observe(value, '/a"b')
+
+    assert histogram.count('/a"b') == 4
+    assert histogram.count("/other") == 0
+    assert registry.render().splitlines() == [
+        "# HELP request_seconds Request duration.",
+        "# TYPE request_seconds histogram",
+        'request_seconds_bucket{route="/a\\"b",le="0.1"} 2',
+        'request_seconds_bucket{route="/a\\"b",le="1"} 3',
+        'request_seconds_bucket{route="/a\\"b",le="+Inf"} 4',
+        'request_seconds_count{route="/a\\"b"} 4',
+        'request_seconds_sum{route="/a\\"b"} 3.65',
+    ]
+
+
+def test_registry_returns_existing_histograms() -> None:
+    registry = MetricsRegistry()
+
+    assert registry.histogram("a", "A.") is registry.histogram("a", "A.")
+    assert registry.render() == "# HELP a A.\n# TYPE a histogram\n"
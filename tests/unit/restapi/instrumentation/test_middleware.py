@@ -0,0 +1,105 @@
+# This Software (Dioptra) is being made available as a public service by the
+# National Institute of Standards and Technology (NIST), an Agency of the United
+# States Department of Commerce. This software was developed in part by employees of
+# NIST and in part by NIST contractors. Copyright in portions of this software that
+# were developed by NIST contractors has been licensed or assigned to NIST. Pursuant
+# to Title 17 United States Code Section 105, works of NIST employees are not
+# subject to copyright protection in the United States. However, NIST may hold
+# international copyright in software created by its employees and domestic
+# copyright (or licensing rights) in portions of software that were assigned or
+# licensed to NIST. To the extent that NIST holds copyright in this software, it is
+# being made available under the Creative Commons Attribution 4.0 International
+# license (CC BY 4.0). The disclaimers of the CC BY 4.0 license apply to all parts
+# of the software developed or licensed by NIST.
+#
+# ACCESS THE FULL CC BY 4.0 LICENSE HERE:
+# https://creativecommons.org/licenses/by/4.0/legalcode
+from __future__ import annotations
+
+import re
+from pathlib import Path
+from typing import Any, List
+
+import pytest
+from _pytest.monkeypatch import MonkeyPatch
+from flask import Flask
+from flask_injector import FlaskInjector
+
+from dioptra.restapi.queue.routes import BASE_ROUTE as QUEUE_BASE_ROUTE
+
+
+@pytest.fixture
+def app(
+    dependency_modules: List[Any], monkeypatch: MonkeyPatch, tmp_path: Path
+) -> Flask:
+    from dioptra.restapi import create_app
+    from dioptra.restapi.config import config_by_name
+
+    config = config_by_name["test"]
+    monkeypatch.setattr(config, "DIOPTRA_METRICS_ENABLED", True)
+    monkeypatch.setattr(config, "DIOPTRA_PROFILING_ENABLED", True)
+    monkeypatch.setattr(config, "DIOPTRA_PROFILING_BACKEND", "cprofile")
+    monkeypatch.setattr(config, "DIOPTRA_PROFILING_DIR", str(tmp_path))
+
+    app: Flask = create_app(env="test", inject_dependencies=False)
+    FlaskInjector(app=app, modules=dependency_modules)
+
+    return app
+
+
+def _sample(metrics: str, name: str, labels: str) -> float:
+    match = re.search(rf"^{name}{{{re.escape(labels)}}} (\S+)$", metrics, re.M)
+
+    return 0.0 if match is None else float(match.group(1))
+
+
+def test_metrics_endpoint_reports_requests(app: Flask) -> None:
+    route = f"/api/{QUEUE_BASE_ROUTE}/"
+    labels = f'method="GET",route="{route}"'
+
+    with app.test_client() as client:
+        before: str = client.get("/metrics").get_data(as_text=True)
+        client.get(route)
+        client.get(route)
+        client.get("/does/not/exist")
+        response = client.get("/metrics")
+
+    after: str = response.get_data(as_text=True)
+
+    assert response.status_code == 200
+    assert response.content_type.startswith("text/plain; version=0.0.4")
+
+    for name, labels_ in [
+        ("dioptra_restapi_request_duration_seconds_count", f'{labels},status="200"'),
+        ("dioptra_restapi_request_sql_queries_count", labels),
+    ]:
+        assert _sample(after, name, labels_) - _sample(before, name, labels_) == 2
+
+    sql_queries = "dioptra_restapi_request_sql_queries_sum"
+    assert (
+        _sample(after, sql_queries, labels) - _sample(before, sql_queries, labels) >= 2
+    )
+    assert (
+        _sample(
+            after,
+            "dioptra_restapi_request_duration_seconds_count",
+            'method="GET",route="<unmatched>",status="404"',
+        )
+        >= 1
+    )
+
+
+def test_requests_with_profiling_header_are_profiled(
+    app: Flask, tmp_path: Path
+) -> None:
+    with app.test_client() as client:
+        unprofiled = client.get(f"/api/{QUEUE_BASE_ROUTE}/")
+        profiled = client.get(
+            f"/api/{QUEUE_BASE_ROUTE}/", headers={"X-Dioptra-Profile": "1"}
+        )
+
+    assert "X-Dioptra-Profile" not in unprofiled.headers
+    assert (tmp_path / profiled.headers["X-Dioptra-Profile"]).suffix == ".prof"
+    assert [x.name for x in tmp_path.iterdir()] == [
+        profiled.headers["X-Dioptra-Profile"]
+    ]
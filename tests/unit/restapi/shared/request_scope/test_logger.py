@@ -0,0 +1,67 @@
+# This Software (Dioptra) is being made available as a public service by the
+# National Institute of Standards and Technology (NIST), an Agency of the United
+# States Department of Commerce. This software was developed in part by employees of
+# NIST and in part by NIST contractors. Copyright in portions of this software that
+# were developed by NIST contractors has been licensed or assigned to NIST. Pursuant
+# to Title 17 United States Code Section 105, works of NIST employees are not
+# subject to copyright protection in the United States. However, NIST may hold
+# international copyright in software created by its employees and domestic
+# copyright (or licensing rights) in portions of software that were assigned or
+# licensed to NIST. To the extent that NIST holds copyright in this software, it is
+# being made available under the Creative Commons Attribution 4.0 International
+# license (CC BY 4.0). The disclaimers of the CC BY 4.0 license apply to all parts
+# of the software developed or licensed by NIST.
+#
+# ACCESS THE FULL CC BY 4.0 LICENSE HERE:
+# https://creativecommons.org/licenses/by/4.0/legalcode
+from __future__ import annotations
+
+from typing import List
+
+from _pytest.monkeypatch import MonkeyPatch
+from flask import Flask
+
+from dioptra.restapi.models import Queue
+from dioptra.restapi.queue.routes import BASE_ROUTE as QUEUE_BASE_ROUTE
+from dioptra.restapi.queue.service import QueueService
+from dioptra.restapi.shared.request_scope.logger import get_request_logger
+
+
+def test_get_request_logger_is_shared_within_a_request(app: Flask) -> None:
+    with app.test_request_context("/"):
+        log = get_request_logger()
+
+        assert get_request_logger() is log
+        assert "request_id" in log._context
+
+    with app.test_request_context("/"):
+        assert get_request_logger() is not log
+        assert get_request_logger()._context["request_id"] != log._context["request_id"]
+
+
+def test_get_request_logger_outside_of_a_request() -> None:
+    log = get_request_logger()
+
+    assert get_request_logger() is not log
+    assert log._context == {}
+
+
+def test_controller_and_service_share_the_request_id(
+    app: Flask, monkeypatch: MonkeyPatch
+) -> None:
+    request_ids: List[str] = []
+
+    def mockgetallunlocked(self, *args, **kwargs) -> List[Queue]:
+        request_ids.append(kwargs["log"]._context["request_id"])
+        request_ids.append(get_request_logger()._context["request_id"])
+        return []
+
+    monkeypatch.setattr(QueueService, "get_all_unlocked", mockgetallunlocked)
+
+    with app.test_client() as client:
+        client.get(f"/api/{QUEUE_BASE_ROUTE}/")
+        client.get(f"/api/{QUEUE_BASE_ROUTE}/")
+
+    assert request_ids[0] == request_ids[1]
+    assert request_ids[2] == request_ids[3]
+    assert request_ids[0] != request_ids[2]
@@ -29,3 +29,9 @@ def test_app_healthy(app: Flask):
         assert resp.status_code == 200
         assert resp.is_json
         assert resp.json == "healthy"
+
+
+def test_app_metrics_disabled_by_default(app: Flask):
+    with app.test_client() as client:
+        resp: Response = client.get("/metrics")
+        assert resp.status_code == 404
@@ -0,0 +1,183 @@
+# This Software (Dioptra) is being made available as a public service by the
+# National Institute of Standards and Technology (NIST), an Agency of the United
+# States Department of Commerce. This software was developed in part by employees of
+# NIST and in part by NIST contractors. Copyright in portions of this software that
+# were developed by NIST contractors has been licensed or assigned to NIST. Pursuant
+# to Title 17 United States Code Section 105, works of NIST employees are not
+# subject to copyright protection in the United States. However, NIST may hold
+# international copyright in software created by its employees and domestic
+# copyright (or licensing rights) in portions of software that were assigned or
+# licensed to NIST. To the extent that NIST holds copyright in this software, it is
+# being made available under the Creative Commons Attribution 4.0 International
+# license (CC BY 4.0). The disclaimers of the CC BY 4.0 license apply to all parts
+# of the software developed or licensed by NIST.
+#
+# ACCESS THE FULL CC BY 4.0 LICENSE HERE:
+# https://creativecommons.org/licenses/by/4.0/legalcode
+import base64
+import hashlib
+import json
+from pathlib import Path
+
+import pytest
+from click.testing import CliRunner
+
+pytest.importorskip("cryptography")
+
+from cryptography.exceptions import InvalidSignature  # noqa: E402
+
+from dioptra.sdk.cryptography.common import hash_payload, load_payload  # noqa: E402
+from dioptra.sdk.cryptography.keygen import (  # noqa: E402
+    generate_rsa_key_pair,
+    save_private_key,
+    save_public_key,
+)
+from dioptra.sdk.cryptography.manifest import (  # noqa: E402
+    create_manifest,
+    manifest,
+    sign_manifest,
+    verify_manifest,
+)
+from dioptra.sdk.cryptography.sign import (  # noqa: E402
+    sign_payload,
+    sign_payload_digest,
+)
+from dioptra.sdk.cryptography.verify import (  # noqa: E402
+    verify_payload,
+    verify_payload_digest,
+)
+
+
+@pytest.fixture(scope="module")
+def key_pair():
+    return generate_rsa_key_pair(key_size=2048)
+
+
+@pytest.fixture
+def payload_dir(tmp_path) -> Path:
+    payload_dir = tmp_path / "payloads"
+    (payload_dir / "nested").mkdir(parents=True)
+    (payload_dir / "model.bin").write_bytes(bytes(range(256)) * 5000)
+    (payload_dir / "nested" / "data.csv").write_text("a,b\n1,2\n")
+    (payload_dir / "empty.txt").write_bytes(b"")
+
+    return payload_dir
+
+
+@pytest.mark.parametrize("chunk_size", [1, 1000, 1024 * 1024])
+def test_hash_payload_matches_full_payload_digest(payload_dir, chunk_size) -> None:
+    filepath = str(payload_dir / "model.bin")
+
+    assert (
+        hash_payload(filepath, chunk_size=chunk_size)
+        == hashlib.sha256(load_payload(filepath)).digest()
+    )
+
+
+def test_digest_and_payload_signatures_are_interchangeable(
+    key_pair, payload_dir, tmp_path
+) -> None:
+    private_key, public_key = key_pair
+    filepath = str(payload_dir / "model.bin")
+    payload = load_payload(filepath)
+    digest = hash_payload(filepath, chunk_size=4096)
+
+    digest_signature = base64.b64decode(
+        sign_payload_digest(digest, private_key, str(tmp_path / "digest.sig"))
+    )
+    payload_signature = base64.b64decode(
+        sign_payload(payload, private_key, str(tmp_path / "payload.sig"))
+    )
+
+    assert verify_payload(payload, digest_signature, public_key)
+    assert verify_payload_digest(digest, payload_signature, public_key)
+
+    with pytest.raises(InvalidSignature):
+        verify_payload_digest(
+            hashlib.sha256(b"other").digest(), digest_signature, public_key
+        )
+
+
+@pytest.mark.parametrize("max_workers", [1, 2])
+def test_verify_manifest_reports_modified_and_missing_files(
+    key_pair, payload_dir, tmp_path, max_workers
+) -> None:
+    private_key, public_key = key_pair
+    manifest_file = str(tmp_path / "MANIFEST.json")
+    payload_manifest = create_manifest(
+        [str(payload_dir)], root_dir=str(tmp_path), max_workers=max_workers
+    )
+    signature = base64.b64decode(
+        sign_manifest(payload_manifest, private_key, manifest_file)
+    )
+
+    assert [x["path"] for x in payload_manifest["files"]] == [
+        "payloads/empty.txt",
+        "payloads/model.bin",
+        "payloads/nested/data.csv",
+    ]
+    assert (
+        verify_manifest(manifest_file, signature, public_key, root_dir=str(tmp_path))
+        == {}
+    )
+
+    (payload_dir / "nested" / "data.csv").write_text("a,b\n1,3\n")
+    (payload_dir / "empty.txt").unlink()
+
+    assert verify_manifest(
+        manifest_file,
+        signature,
+        public_key,
+        root_dir=str(tmp_path),
+        max_workers=max_workers,
+    ) == {"payloads/empty.txt": "missing", "payloads/nested/data.csv": "modified"}
+
+
+def test_verify_manifest_rejects_tampered_manifest(
+    key_pair, payload_dir, tmp_path
+) -> None:
+    private_key, public_key = key_pair
+    manifest_file = tmp_path / "MANIFEST.json"
+    payload_manifest = create_manifest([str(payload_dir)], root_dir=str(tmp_path))
+    signature = base64.b64decode(
+        sign_manifest(payload_manifest, private_key, str(manifest_file))
+    )
+    payload_manifest["files"].pop()
+    manifest_file.write_text(json.dumps(payload_manifest))
+
+    with pytest.raises(InvalidSignature):
+        verify_manifest(
+            str(manifest_file), signature, public_key, root_dir=str(tmp_path)
+        )
+
+
+def test_create_manifest_rejects_files_outside_root_dir(payload_dir) -> None:
+    with pytest.raises(ValueError):
+        create_manifest([str(payload_dir)], root_dir=str(payload_dir / "nested"))
+
+
+def test_manifest_cli_signs_and_verifies_directory(
+    key_pair, payload_dir, tmp_path
+) -> None:
+    private_key, public_key = key_pair
+    save_private_key(private_key, str(tmp_path / "private.key"))
+    save_public_key(public_key, str(tmp_path / "public.pem"))
+    runner = CliRunner()
+    common_args = ["--manifest-file", str(payload_dir / "MANIFEST.json")]
+    common_args += ["--root-dir", str(payload_dir), "--max-workers", "1"]
+
+    result = runner.invoke(
+        manifest,
+        ["sign", "--private-key-file", str(tmp_path / "private.key")]
+        + common_args
+        + [str(payload_dir)],
+    )
+    assert result.exit_code == 0, result.output
+    assert "Signed 3 files" in result.output
+
+    result = runner.invoke(
+        manifest,
+        ["verify", "--public-key-file", str(tmp_path / "public.pem")] + common_args,
+    )
+    assert result.exit_code == 0, result.output
+    assert result.output.strip() == "OK"
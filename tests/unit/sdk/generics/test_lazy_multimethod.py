@@ -0,0 +1,159 @@
+# This Software (Dioptra) is being made available as a public service by the
+# National Institute of Standards and Technology (NIST), an Agency of the United
+# States Department of Commerce. This software was developed in part by employees of
+# NIST and in part by NIST contractors. Copyright in portions of this software that
+# were developed by NIST contractors has been licensed or assigned to NIST. Pursuant
+# to Title 17 United States Code Section 105, works of NIST employees are not
+# subject to copyright protection in the United States. However, NIST may hold
+# international copyright in software created by its employees and domestic
+# copyright (or licensing rights) in portions of software that were assigned or
+# licensed to NIST. To the extent that NIST holds copyright in this software, it is
+# being made available under the Creative Commons Attribution 4.0 International
+# license (CC BY 4.0). The disclaimers of the CC BY 4.0 license apply to all parts
+# of the software developed or licensed by NIST.
+#
+# ACCESS THE FULL CC BY 4.0 LICENSE HERE:
+# https://creativecommons.org/licenses/by/4.0/legalcode
+from typing import Any, List, Optional
+
+import pytest
+
+from dioptra.sdk.generics import _registry
+from dioptra.sdk.generics._multimethod import LazyMultimethod
+
+
+class BackendEstimator(object):
+    pass
+
+
+BackendEstimator.__module__ = "fake_backend.estimators"
+
+
+class SubclassedBackendEstimator(BackendEstimator):
+    pass
+
+
+class OtherEstimator(object):
+    pass
+
+
+def make_generic() -> LazyMultimethod:
+    @LazyMultimethod
+    def predict(estimator: Any, x: Any) -> str:
+        return "generic"
+
+    return predict
+
+
+def register_backend(generic: LazyMultimethod, calls: List[str]) -> None:
+    calls.append("loaded")
+
+    @generic.register
+    def _(estimator: BackendEstimator, x: Any) -> str:
+        return "backend"
+
+
+def test_lazy_loader_runs_once_on_first_matching_type() -> None:
+    generic = make_generic()
+    calls: List[str] = []
+    generic.register_lazy(
+        ["fake_backend", "other_backend"], lambda: register_backend(generic, calls)
+    )
+
+    assert generic(OtherEstimator(), 1) == "generic"
+    assert calls == []
+
+    assert generic(SubclassedBackendEstimator(), 1) == "backend"
+    assert generic(BackendEstimator(), 1) == "backend"
+    assert calls == ["loaded"]
+
+
+def test_dispatch_cache_is_cleared_on_register() -> None:
+    generic = make_generic()
+
+    assert generic(OtherEstimator(), 1) == "generic"
+    assert (OtherEstimator, int) in generic._dispatch_cache
+
+    @generic.register
+    def _(estimator: OtherEstimator, x: int) -> str:
+        return "other"
+
+    assert generic._dispatch_cache == {}
+    assert generic(OtherEstimator(), 1) == "other"
+    assert generic(OtherEstimator(), "1") == "generic"
+
+
+def test_dispatch_cache_distinguishes_number_of_arguments() -> None:
+    @LazyMultimethod
+    def fit(estimator: Any, x: Any) -> str:
+        return "x"
+
+    @fit.register
+    def _(estimator: Any, x: Any, y: Any) -> str:
+        return "x, y"
+
+    assert fit(OtherEstimator(), 1) == "x"
+    assert fit(OtherEstimator(), 1, 2) == "x, y"
+
+
+class FakeEntryPoint(object):
+    def __init__(self, name: str, module_name: Optional[str] = None) -> None:
+        self.name = name
+        self.module_name = module_name or f"fake_package.{name}"
+        self.loaded = False
+
+    def load(self) -> str:
+        self.loaded = True
+        return self.name
+
+
+def test_register_entrypoints_defers_entrypoints_with_dispatch_packages(
+    monkeypatch,
+) -> None:
+    generic = make_generic()
+    lazy = FakeEntryPoint("lazy")
+    eager = FakeEntryPoint("eager")
+    declaration = FakeEntryPoint(
+        "estimator_predict.lazy.fake_backend", module_name="fake_backend"
+    )
+    groups = {
+        "dioptra.generics.estimator_predict": [lazy, eager],
+        "dioptra.generics.dispatch_packages": [declaration],
+    }
+    monkeypatch.setattr(_registry, "_GENERICS", {"estimator_predict": generic})
+    monkeypatch.setattr(_registry, "_GENERICS_ENTRYPOINTS", {})
+    monkeypatch.setattr(
+        _registry.entrypoints, "get_group_all", lambda group: groups.get(group, [])
+    )
+
+    _registry.register_entrypoints()
+
+    assert eager.loaded and not lazy.loaded and not declaration.loaded
+
+    generic(OtherEstimator(), 1)
+    assert not lazy.loaded
+
+    generic(BackendEstimator(), 1)
+    assert lazy.loaded
+    assert _registry._GENERICS_ENTRYPOINTS["estimator_predict"] == {
+        "eager": "eager",
+        "lazy": "lazy",
+    }
+
+
+@pytest.mark.parametrize("generic_name", ["estimator_predict", "fit_estimator"])
+def test_generics_use_lazy_multimethod(generic_name) -> None:
+    assert isinstance(_registry._GENERICS[generic_name], LazyMultimethod)
+
+
+@pytest.mark.parametrize("generic_name", ["estimator_predict", "fit_estimator"])
+def test_builtin_entrypoints_have_dispatch_packages(generic_name) -> None:
+    entrypoint = FakeEntryPoint("tf_keras_model")
+    declarations = _registry.entrypoints.get_group_all(
+        _registry._DISPATCH_PACKAGES_GROUP
+    )
+
+    assert _registry._dispatch_packages(generic_name, entrypoint, declarations) == (
+        "keras",
+        "tensorflow",
+    )
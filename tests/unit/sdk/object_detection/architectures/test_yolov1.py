@@ -0,0 +1,158 @@
+# This Software (Dioptra) is being made available as a public service by the
+# National Institute of Standards and Technology (NIST), an Agency of the United
+# States Department of Commerce. This software was developed in part by employees of
+# NIST and in part by NIST contractors. Copyright in portions of this software that
+# were developed by NIST contractors has been licensed or assigned to NIST. Pursuant
+# to Title 17 United States Code Section 105, works of NIST employees are not
+# subject to copyright protection in the United States. However, NIST may hold
+# international copyright in software created by its employees and domestic
+# copyright (or licensing rights) in portions of software that were assigned or
+# licensed to NIST. To the extent that NIST holds copyright in this software, it is
+# being made available under the Creative Commons Attribution 4.0 International
+# license (CC BY 4.0). The disclaimers of the CC BY 4.0 license apply to all parts
+# of the software developed or licensed by NIST.
+#
+# ACCESS THE FULL CC BY 4.0 LICENSE HERE:
+# https://creativecommons.org/licenses/by/4.0/legalcode
+import numpy as np
+import pytest
+
+tf = pytest.importorskip("tensorflow")
+
+from dioptra.sdk.object_detection.architectures import (  # noqa: E402
+    ARTYOLOV1ObjectDetector,
+    YOLOV1ObjectDetector,
+)
+from dioptra.sdk.object_detection.bounding_boxes.iou import (  # noqa: E402
+    TensorflowBoundingBoxesBatchedGridIOU,
+)
+from dioptra.sdk.object_detection.bounding_boxes.postprocessing import (  # noqa: E402
+    TensorflowBoundingBoxesYOLOV1NMS,
+)
+from dioptra.sdk.object_detection.losses import YOLOV1FusedLoss  # noqa: E402
+
+
+@pytest.fixture(scope="module")
+def art_detector() -> ARTYOLOV1ObjectDetector:
+    model = YOLOV1ObjectDetector(
+        input_shape=(64, 64, 3),
+        n_bounding_boxes=2,
+        n_classes=3,
+        backbone="mobilenetv2",
+        detector="shallow",
+        backbone_weights=None,
+    )
+    model.compile(
+        loss=YOLOV1FusedLoss(
+            bbox_grid_iou=TensorflowBoundingBoxesBatchedGridIOU.on_grid_shape(
+                model.output_grid_shape
+            )
+        )
+    )
+
+    return ARTYOLOV1ObjectDetector(
+        model=model,
+        n_classes=3,
+        bounding_boxes_postprocessing=TensorflowBoundingBoxesYOLOV1NMS.on_grid_shape(
+            model.output_grid_shape, score_threshold=0.0
+        ),
+    )
+
+
+@pytest.fixture(scope="module")
+def images() -> np.ndarray:
+    rng = np.random.default_rng(0)
+    return rng.uniform(0, 255, size=(5, 64, 64, 3)).astype("float32")
+
+
+@pytest.fixture(scope="module")
+def targets() -> list:
+    return [
+        {
+            "boxes": np.array([[0.1, 0.2, 0.5, 0.6], [0.5, 0.5, 0.9, 0.8]], "float32"),
+            "labels": np.array([i % 3, (i + 1) % 3]),
+            "scores": np.array([1.0, 1.0 if i % 2 else 0.0], "float32"),
+        }
+        for i in range(5)
+    ]
+
+
+@pytest.mark.parametrize("precision_policy", ["float32", "mixed_bfloat16"])
+def test_yolov1_precision_policy_outputs_float32(precision_policy) -> None:
+    global_policy = tf.keras.mixed_precision.global_policy().name
+    model = YOLOV1ObjectDetector(
+        input_shape=(64, 64, 3),
+        n_bounding_boxes=2,
+        n_classes=3,
+        backbone="mobilenetv2",
+        detector="shallow",
+        precision_policy=precision_policy,
+        backbone_weights=None,
+    )
+    outputs = model(np.zeros((1, 64, 64, 3), dtype="float32"))
+
+    assert tf.keras.mixed_precision.global_policy().name == global_policy
+    assert model.backbone.dtype_policy.name == precision_policy
+    assert [x.dtype for x in outputs] == [tf.float32, tf.float32, tf.float32]
+
+
+def test_yolov1_invalid_precision_policy_raises() -> None:
+    global_policy = tf.keras.mixed_precision.global_policy().name
+
+    with pytest.raises(ValueError):
+        YOLOV1ObjectDetector(
+            input_shape=(64, 64, 3),
+            n_bounding_boxes=2,
+            n_classes=3,
+            backbone="mobilenetv2",
+            precision_policy="float16",
+            backbone_weights=None,
+        )
+
+    assert tf.keras.mixed_precision.global_policy().name == global_policy
+
+
+@pytest.mark.parametrize("use_output_dir", [False, True])
+def test_art_yolov1_predict_stream_matches_predict(
+    art_detector, images, tmp_path, use_output_dir
+) -> None:
+    expected = art_detector.predict(images, batch_size=5)
+    outputs = art_detector.predict_stream(
+        (x for x in images),
+        num_samples=len(images),
+        batch_size=2,
+        output_dir=tmp_path if use_output_dir else None,
+    )
+
+    if use_output_dir:
+        assert isinstance(outputs["boxes"], np.memmap)
+        assert (tmp_path / "boxes.npy").exists()
+
+    for i, prediction in enumerate(expected):
+        num_kept = min(len(prediction["scores"]), outputs["scores"].shape[1])
+        np.testing.assert_allclose(
+            outputs["boxes"][i, :num_kept], prediction["boxes"][:num_kept], atol=1e-5
+        )
+        np.testing.assert_allclose(
+            outputs["scores"][i, :num_kept], prediction["scores"][:num_kept], atol=1e-5
+        )
+
+
+def test_art_yolov1_loss_gradient_stream_matches_loss_gradient(
+    art_detector, images, targets
+) -> None:
+    expected = art_detector.loss_gradient(images, targets)
+    dataset = tf.data.Dataset.from_tensor_slices(images)
+    grads = art_detector.loss_gradient_stream(
+        zip(dataset.batch(3).as_numpy_iterator(), [targets[:3], targets[3:]]),
+        num_samples=len(images),
+        batch_size=2,
+    )
+
+    assert grads.shape == images.shape
+    np.testing.assert_allclose(grads, expected, rtol=1e-4, atol=1e-7)
+
+
+def test_art_yolov1_predict_stream_requires_num_samples(art_detector, images) -> None:
+    with pytest.raises(ValueError):
+        art_detector.predict_stream(x for x in images)
@@ -0,0 +1,121 @@
+# This Software (Dioptra) is being made available as a public service by the
+# National Institute of Standards and Technology (NIST), an Agency of the United
+# States Department of Commerce. This software was developed in part by employees of
+# NIST and in part by NIST contractors. Copyright in portions of this software that
+# were developed by NIST contractors has been licensed or assigned to NIST. Pursuant
+# to Title 17 United States Code Section 105, works of NIST employees are not
+# subject to copyright protection in the United States. However, NIST may hold
+# international copyright in software created by its employees and domestic
+# copyright (or licensing rights) in portions of software that were assigned or
+# licensed to NIST. To the extent that NIST holds copyright in this software, it is
+# being made available under the Creative Commons Attribution 4.0 International
+# license (CC BY 4.0). The disclaimers of the CC BY 4.0 license apply to all parts
+# of the software developed or licensed by NIST.
+#
+# ACCESS THE FULL CC BY 4.0 LICENSE HERE:
+# https://creativecommons.org/licenses/by/4.0/legalcode
+import numpy as np
+import pytest
+
+from dioptra.sdk.object_detection.augmentations import (
+    NumpyObjectDetectionAugmentations,
+)
+
+
+@pytest.fixture
+def images() -> np.ndarray:
+    rng = np.random.default_rng(0)
+    return rng.integers(0, 256, size=(3, 8, 10, 3)).astype("float32")
+
+
+@pytest.fixture
+def bounding_boxes() -> np.ndarray:
+    return np.array(
+        [
+            [[0.1, 0.2, 0.4, 0.5], [0.0, 0.0, 0.0, 0.0]],
+            [[0.5, 0.5, 0.9, 0.75], [0.2, 0.25, 0.3, 0.5]],
+            [[0.0, 0.0, 0.0, 0.0], [0.0, 0.0, 0.0, 0.0]],
+        ],
+        dtype="float32",
+    )
+
+
+@pytest.fixture
+def labels() -> np.ndarray:
+    return np.array([[1, -1], [0, 2], [-1, -1]], dtype="int32")
+
+
+def test_augment_batch_fliplr(images, bounding_boxes, labels) -> None:
+    augmentations = NumpyObjectDetectionAugmentations(
+        image_dimensions=(8, 10), fliplr=1.0
+    )
+    augmented_images, augmented_bboxes, augmented_labels = augmentations.augment_batch(
+        images=images, bounding_boxes=bounding_boxes, labels=labels
+    )
+
+    np.testing.assert_array_equal(augmented_images, images[:, :, ::-1, :])
+    np.testing.assert_allclose(
+        augmented_bboxes[1],
+        [[0.1, 0.5, 0.5, 0.75], [0.7, 0.25, 0.8, 0.5]],
+        rtol=1e-6,
+    )
+    np.testing.assert_array_equal(augmented_labels, labels)
+    np.testing.assert_array_equal(augmented_bboxes[2], np.zeros((2, 4)))
+
+
+def test_augment_batch_per_sample_seeds(images, bounding_boxes, labels) -> None:
+    augmentations = NumpyObjectDetectionAugmentations.use_light_augmenters(
+        image_dimensions=(8, 10), seed=42
+    )
+    full_batch = augmentations.augment_batch(
+        images=images,
+        bounding_boxes=bounding_boxes,
+        labels=labels,
+        seeds=np.array([7, 8, 9]),
+    )
+    partial_batch = augmentations.augment_batch(
+        images=images[1:2],
+        bounding_boxes=bounding_boxes[1:2],
+        labels=labels[1:2],
+        seeds=np.array([8]),
+    )
+
+    for full, partial in zip(full_batch, partial_batch):
+        np.testing.assert_array_equal(full[1:2], partial)
+
+
+def test_augment_batch_falls_back_to_original_sample(
+    images, bounding_boxes, labels
+) -> None:
+    augmentations = NumpyObjectDetectionAugmentations(
+        image_dimensions=(8, 10),
+        fliplr=0.0,
+        translate_percent=(1.0, 1.0),
+        brightness=(0.5, 0.5),
+        max_retries=3,
+    )
+    augmented_images, augmented_bboxes, augmented_labels = augmentations.augment_batch(
+        images=images, bounding_boxes=bounding_boxes, labels=labels
+    )
+
+    np.testing.assert_array_equal(augmented_images[:2], images[:2])
+    np.testing.assert_array_equal(augmented_bboxes[:2], bounding_boxes[:2])
+    np.testing.assert_array_equal(augmented_labels, labels)
+    np.testing.assert_array_equal(augmented_images[2], np.zeros_like(images[2]))
+
+
+def test_augment_removes_boxes_out_of_image() -> None:
+    augmentations = NumpyObjectDetectionAugmentations(
+        image_dimensions=(8, 10), fliplr=0.0, translate_percent=(0.5, 0.5)
+    )
+    image, bboxes, labels = augmentations.augment(
+        image=np.ones((8, 10, 3), dtype="float32"),
+        bounding_boxes=np.array(
+            [[0.1, 0.1, 0.3, 0.3], [0.6, 0.6, 0.9, 0.9]], dtype="float32"
+        ),
+        labels=np.array([0, 1], dtype="int32"),
+    )
+
+    assert image.shape == (8, 10, 3)
+    np.testing.assert_allclose(bboxes, [[0.6, 0.6, 0.8, 0.8]], rtol=1e-6)
+    np.testing.assert_array_equal(labels, [0])
@@ -0,0 +1,97 @@
+# This Software (Dioptra) is being made available as a public service by the
+# National Institute of Standards and Technology (NIST), an Agency of the United
+# States Department of Commerce. This software was developed in part by employees of
+# NIST and in part by NIST contractors. Copyright in portions of this software that
+# were developed by NIST contractors has been licensed or assigned to NIST. Pursuant
+# to Title 17 United States Code Section 105, works of NIST employees are not
+# subject to copyright protection in the United States. However, NIST may hold
+# international copyright in software created by its employees and domestic
+# copyright (or licensing rights) in portions of software that were assigned or
+# licensed to NIST. To the extent that NIST holds copyright in this software, it is
+# being made available under the Creative Commons Attribution 4.0 International
+# license (CC BY 4.0). The disclaimers of the CC BY 4.0 license apply to all parts
+# of the software developed or licensed by NIST.
+#
+# ACCESS THE FULL CC BY 4.0 LICENSE HERE:
+# https://creativecommons.org/licenses/by/4.0/legalcode
+import numpy as np
+import pytest
+
+from dioptra.sdk.object_detection.bounding_boxes import (
+    NumpyBoundingBoxCoordinates,
+    NumpyBoundingBoxesBatchedGrid,
+)
+
+
+@pytest.fixture
+def bboxes_corner() -> np.ndarray:
+    return np.array(
+        [
+            [[0.1, 0.1, 0.3, 0.3], [0.12, 0.1, 0.28, 0.3], [0.6, 0.5, 1.0, 1.0]],
+            [[0.0, 0.0, 0.5, 0.5], [0.0, 0.0, 0.0, 0.0], [0.0, 0.0, 0.0, 0.0]],
+        ],
+        dtype="float32",
+    )
+
+
+@pytest.fixture
+def bboxes_labels() -> np.ndarray:
+    return np.array([[0, 1, 2], [1, -1, -1]], dtype="int32")
+
+
+def test_find_no_obj_cell_ij() -> None:
+    bbox_coord = NumpyBoundingBoxCoordinates(grid_shape=(2, 3))
+    no_obj_cell_ij = bbox_coord.find_no_obj_cell_ij(
+        np.array([[0, 1], [1, 2], [0, 1]], dtype="int32")
+    )
+
+    np.testing.assert_array_equal(no_obj_cell_ij, [[0, 0], [0, 2], [1, 0], [1, 1]])
+
+
+def test_find_bbox_cell_ij_clamps_to_last_cell() -> None:
+    bbox_coord = NumpyBoundingBoxCoordinates(grid_shape=(4, 5))
+    bboxes_cell_ij = bbox_coord.find_bbox_cell_ij(
+        x_center=np.array([0.0, 0.5, 1.0], dtype="float32"),
+        y_center=np.array([0.3, 0.99, 1.0], dtype="float32"),
+    )
+
+    np.testing.assert_array_equal(bboxes_cell_ij, [[1, 0], [3, 2], [3, 4]])
+
+
+def test_embed_batch_matches_embed(bboxes_corner, bboxes_labels) -> None:
+    batched_grid = NumpyBoundingBoxesBatchedGrid.on_grid_shape(grid_shape=(4, 4))
+    batch_embedding = batched_grid.embed_batch(
+        bboxes_corner=bboxes_corner, bboxes_labels=bboxes_labels, n_classes=3
+    )
+
+    for idx, (bboxes, labels) in enumerate(zip(bboxes_corner, bboxes_labels)):
+        is_box = labels >= 0
+        embedding = batched_grid.embed(
+            bboxes_corner=bboxes[is_box], bboxes_labels=labels[is_box], n_classes=3
+        )
+
+        for batch_grid, grid in zip(batch_embedding, embedding):
+            np.testing.assert_array_equal(batch_grid[idx], grid)
+
+
+def test_embed_batch_one_object_per_cell(bboxes_corner, bboxes_labels) -> None:
+    batched_grid = NumpyBoundingBoxesBatchedGrid.on_grid_shape(grid_shape=(4, 4))
+    (
+        bboxes_cell_xywh_grid,
+        bboxes_labels_grid,
+        bboxes_object_mask,
+        bboxes_no_object_mask,
+    ) = batched_grid.embed_batch(
+        bboxes_corner=bboxes_corner, bboxes_labels=bboxes_labels, n_classes=3
+    )
+
+    assert bboxes_cell_xywh_grid.shape == (2, 4, 4, 1, 4)
+    assert bboxes_labels_grid.shape == (2, 4, 4, 3)
+    np.testing.assert_array_equal(
+        np.argwhere(bboxes_object_mask), [[0, 0, 0], [0, 3, 3], [1, 1, 1]]
+    )
+    np.testing.assert_array_equal(bboxes_labels_grid[0, 0, 0], [1.0, 0.0, 0.0])
+    np.testing.assert_allclose(
+        bboxes_cell_xywh_grid[1, 1, 1, 0], [0.0, 0.0, 0.5, 0.5], atol=1e-6
+    )
+    np.testing.assert_array_equal(bboxes_object_mask + bboxes_no_object_mask, 1.0)
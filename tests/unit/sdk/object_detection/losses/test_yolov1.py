@@ -0,0 +1,111 @@
+# This Software (Dioptra) is being made available as a public service by the
+# National Institute of Standards and Technology (NIST), an Agency of the United
+# States Department of Commerce. This software was developed in part by employees of
+# NIST and in part by NIST contractors. Copyright in portions of this software that
+# were developed by NIST contractors has been licensed or assigned to NIST. Pursuant
+# to Title 17 United States Code Section 105, works of NIST employees are not
+# subject to copyright protection in the United States. However, NIST may hold
+# international copyright in software created by its employees and domestic
+# copyright (or licensing rights) in portions of software that were assigned or
+# licensed to NIST. To the extent that NIST holds copyright in this software, it is
+# being made available under the Creative Commons Attribution 4.0 International
+# license (CC BY 4.0). The disclaimers of the CC BY 4.0 license apply to all parts
+# of the software developed or licensed by NIST.
+#
+# ACCESS THE FULL CC BY 4.0 LICENSE HERE:
+# https://creativecommons.org/licenses/by/4.0/legalcode
+from typing import Tuple
+
+import numpy as np
+import pytest
+
+tf = pytest.importorskip("tensorflow")
+
+from dioptra.sdk.object_detection.bounding_boxes import (  # noqa: E402
+    NumpyBoundingBoxesBatchedGrid,
+)
+from dioptra.sdk.object_detection.bounding_boxes.iou import (  # noqa: E402
+    TensorflowBoundingBoxesBatchedGridIOU,
+)
+from dioptra.sdk.object_detection.losses import (  # noqa: E402
+    YOLOV1FusedLoss,
+    YOLOV1Loss,
+)
+
+GRID_SHAPE = (5, 4)
+N_BOUNDING_BOXES = 3
+N_CLASSES = 4
+
+
+@pytest.fixture
+def y_true() -> Tuple[np.ndarray, ...]:
+    rng = np.random.default_rng(0)
+    corner_min = rng.uniform(0.0, 0.7, size=(6, 5, 2))
+    corner_max = corner_min + rng.uniform(0.05, 0.3, size=(6, 5, 2))
+    bboxes = np.concatenate([corner_min, corner_max], axis=-1).astype("float32")
+    labels = rng.integers(0, N_CLASSES, size=(6, 5)).astype("int32")
+    labels[:, 3:] = -1
+
+    return tuple(
+        x.astype("float32")
+        for x in NumpyBoundingBoxesBatchedGrid.on_grid_shape(GRID_SHAPE).embed_batch(
+            bboxes, labels, n_classes=N_CLASSES
+        )
+    )
+
+
+@pytest.fixture
+def y_pred() -> Tuple[np.ndarray, ...]:
+    rng = np.random.default_rng(1)
+    bboxes = rng.uniform(0.05, 0.95, size=(6, *GRID_SHAPE, N_BOUNDING_BOXES, 4))
+    conf = rng.uniform(0.0, 1.0, size=(6, *GRID_SHAPE, N_BOUNDING_BOXES))
+    logits = rng.normal(size=(6, *GRID_SHAPE, N_CLASSES))
+    labels = np.exp(logits) / np.exp(logits).sum(axis=-1, keepdims=True)
+
+    return tuple(x.astype("float32") for x in (bboxes, conf, labels))
+
+
+@pytest.mark.parametrize("wh_loss_type", ["sq_relative_diff", "sq_diff_sqrt"])
+@pytest.mark.parametrize(
+    "classification_loss_type",
+    ["categorical_crossentropy", "binary_crossentropy", "original"],
+)
+def test_yolov1_fused_loss_matches_yolov1_loss(
+    y_true, y_pred, wh_loss_type, classification_loss_type
+) -> None:
+    bbox_grid_iou = TensorflowBoundingBoxesBatchedGridIOU.on_grid_shape(GRID_SHAPE)
+    loss_kwargs = dict(
+        bbox_grid_iou=bbox_grid_iou,
+        wh_loss_type=wh_loss_type,
+        classification_loss_type=classification_loss_type,
+    )
+    y_pred_vars = [tf.Variable(x) for x in y_pred]
+
+    with tf.GradientTape(persistent=True) as tape:
+        loss = YOLOV1Loss(**loss_kwargs)(y_true, y_pred_vars)
+        fused_loss = YOLOV1FusedLoss(**loss_kwargs)(y_true, y_pred_vars)
+
+    np.testing.assert_allclose(fused_loss.numpy(), loss.numpy(), rtol=1e-5)
+
+    for grad, fused_grad in zip(
+        tape.gradient(loss, y_pred_vars), tape.gradient(fused_loss, y_pred_vars)
+    ):
+        np.testing.assert_allclose(
+            fused_grad.numpy(), grad.numpy(), rtol=1e-4, atol=1e-6
+        )
+
+
+def test_max_iou_mask_selects_one_bbox_per_cell(y_true, y_pred) -> None:
+    bbox_grid_iou = TensorflowBoundingBoxesBatchedGridIOU.on_grid_shape(GRID_SHAPE)
+    max_iou, max_iou_mask = bbox_grid_iou.max_iou_mask(
+        bboxes_cell_xywh=y_pred[0], bboxes_cell_xywh_ground_truth=y_true[0]
+    )
+
+    np.testing.assert_allclose(
+        max_iou.numpy(),
+        bbox_grid_iou.max_iou(y_pred[0], y_true[0]).numpy(),
+        rtol=1e-5,
+        atol=1e-6,
+    )
+    assert max_iou_mask.shape == (6, *GRID_SHAPE, N_BOUNDING_BOXES)
+    np.testing.assert_array_equal(max_iou_mask.numpy().sum(axis=-1), 1.0)
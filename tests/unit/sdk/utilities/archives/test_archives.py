@@ -0,0 +1,145 @@
+# This Software (Dioptra) is being made available as a public service by the
+# National Institute of Standards and Technology (NIST), an Agency of the United
+# States Department of Commerce. This software was developed in part by employees of
+# NIST and in part by NIST contractors. Copyright in portions of this software that
+# were developed by NIST contractors has been licensed or assigned to NIST. Pursuant
+# to Title 17 United States Code Section 105, works of NIST employees are not
+# subject to copyright protection in the United States. However, NIST may hold
+# international copyright in software created by its employees and domestic
+# copyright (or licensing rights) in portions of software that were assigned or
+# licensed to NIST. To the extent that NIST holds copyright in this software, it is
+# being made available under the Creative Commons Attribution 4.0 International
+# license (CC BY 4.0). The disclaimers of the CC BY 4.0 license apply to all parts
+# of the software developed or licensed by NIST.
+#
+# ACCESS THE FULL CC BY 4.0 LICENSE HERE:
+# https://creativecommons.org/licenses/by/4.0/legalcode
+import gzip
+import io
+import os
+import tarfile
+from pathlib import Path
+from typing import Dict
+
+import numpy as np
+import pytest
+
+from dioptra.sdk.utilities.archives import (
+    ParallelGzipWriter,
+    create_tarball,
+    extract_tarball,
+)
+
+
+@pytest.fixture
+def source_dir(tmp_path) -> Path:
+    rng = np.random.default_rng(0)
+    source_dir = tmp_path / "adv_testing"
+
+    for class_index in range(3):
+        class_dir = source_dir / f"class{class_index}"
+        class_dir.mkdir(parents=True)
+
+        for image_index in range(20):
+            data = rng.integers(0, 8, size=int(rng.integers(1, 5000)), dtype="uint8")
+            (class_dir / f"{image_index}.png").write_bytes(data.tobytes())
+
+    (source_dir / "empty").mkdir()
+    os.symlink("class0/0.png", source_dir / "link.png")
+
+    return source_dir
+
+
+def _read_tree(directory: Path) -> Dict[str, bytes]:
+    return {
+        str(path.relative_to(directory)): (
+            os.readlink(path).encode("utf-8")
+            if path.is_symlink()
+            else path.read_bytes()
+        )
+        for path in directory.rglob("*")
+        if path.is_file() or path.is_symlink()
+    }
+
+
+@pytest.mark.parametrize("num_threads", [1, 4])
+@pytest.mark.parametrize("block_size", [7, 1000, 1 << 20])
+def test_parallel_gzip_writer_round_trip(num_threads, block_size) -> None:
+    data = np.random.default_rng(0).integers(0, 4, size=50_000, dtype="uint8")
+    output = io.BytesIO()
+
+    with ParallelGzipWriter(
+        output, num_threads=num_threads, block_size=block_size
+    ) as f:
+        for start in range(0, len(data), 3000):
+            f.write(data[start : start + 3000].tobytes())  # noqa: E203
+
+    assert gzip.decompress(output.getvalue()) == data.tobytes()
+    assert not output.closed
+
+
+def test_parallel_gzip_writer_rejects_writes_after_close(tmp_path) -> None:
+    f = ParallelGzipWriter(tmp_path / "data.gz")
+    f.close()
+
+    with pytest.raises(ValueError):
+        f.write(b"data")
+
+
+@pytest.mark.parametrize("num_threads", [1, 4])
+def test_create_tarball_is_readable_by_tarfile(tmp_path, source_dir, num_threads):
+    tarball_path = create_tarball(
+        source_dir, tmp_path / "adv_testing.tar.gz", num_threads=num_threads
+    )
+
+    with tarfile.open(tarball_path, "r:gz") as f:
+        f.extractall(tmp_path / "output")
+
+    assert _read_tree(tmp_path / "output" / "adv_testing") == _read_tree(source_dir)
+
+
+@pytest.mark.parametrize("num_threads", [1, 4])
+@pytest.mark.parametrize("write_mode,read_mode", [("w:gz", "r:gz"), ("w:bz2", "r")])
+def test_extract_tarball_matches_tarfile(
+    tmp_path, source_dir, num_threads, write_mode, read_mode
+) -> None:
+    tarball_path = tmp_path / "adv_testing.tar"
+
+    with tarfile.open(tarball_path, write_mode) as f:
+        f.add(source_dir, arcname=source_dir.name)
+
+    output_dir = extract_tarball(
+        tarball_path,
+        tmp_path / "output",
+        tarball_read_mode=read_mode,
+        num_threads=num_threads,
+    )
+
+    extracted_dir = output_dir / "adv_testing"
+    assert _read_tree(extracted_dir) == _read_tree(source_dir)
+    assert (extracted_dir / "empty").is_dir()
+    assert (extracted_dir / "link.png").is_symlink()
+    assert (extracted_dir / "class1" / "3.png").stat().st_mtime == pytest.approx(
+        (source_dir / "class1" / "3.png").stat().st_mtime, abs=1
+    )
+
+
+def test_extract_tarball_rejects_paths_outside_output_dir(tmp_path) -> None:
+    tarball_path = tmp_path / "evil.tar.gz"
+
+    with tarfile.open(tarball_path, "w:gz") as f:
+        member = tarfile.TarInfo("../evil.txt")
+        member.size = 4
+        f.addfile(member, io.BytesIO(b"evil"))
+
+    with pytest.raises(ValueError):
+        extract_tarball(tarball_path, tmp_path / "output")
+
+    assert not (tmp_path / "evil.txt").exists()
+
+
+def test_extract_tarball_rejects_write_modes(tmp_path, source_dir) -> None:
+    tarball_path = create_tarball(source_dir, tmp_path / "adv_testing.tar.gz")
+
+    with pytest.raises(ValueError):
+        extract_tarball(tarball_path, tmp_path / "output", tarball_read_mode="w:gz")
@@ -0,0 +1,57 @@
+# This Software (Dioptra) is being made available as a public service by the
+# National Institute of Standards and Technology (NIST), an Agency of the United
+# States Department of Commerce. This software was developed in part by employees of
+# NIST and in part by NIST contractors. Copyright in portions of this software that
+# were developed by NIST contractors has been licensed or assigned to NIST. Pursuant
+# to Title 17 United States Code Section 105, works of NIST employees are not
+# subject to copyright protection in the United States. However, NIST may hold
+# international copyright in software created by its employees and domestic
+# copyright (or licensing rights) in portions of software that were assigned or
+# licensed to NIST. To the extent that NIST holds copyright in this software, it is
+# being made available under the Creative Commons Attribution 4.0 International
+# license (CC BY 4.0). The disclaimers of the CC BY 4.0 license apply to all parts
+# of the software developed or licensed by NIST.
+#
+# ACCESS THE FULL CC BY 4.0 LICENSE HERE:
+# https://creativecommons.org/licenses/by/4.0/legalcode
+import importlib
+import sys
+
+import pytest
+
+from dioptra.sdk.exceptions.base import BaseOptionalDependencyError
+from dioptra.sdk.utilities.decorators import require_package
+
+
+@require_package("dioptra_missing_package")
+def needs_missing_package() -> str:
+    return "called"
+
+
+@require_package("json")
+def needs_json() -> str:
+    return "called"
+
+
+def test_require_package_calls_function_if_package_installed() -> None:
+    assert needs_json() == "called"
+
+
+def test_require_package_raises_if_package_blocked(monkeypatch) -> None:
+    monkeypatch.setitem(sys.modules, "json", None)
+
+    with pytest.raises(BaseOptionalDependencyError):
+        needs_json()
+
+
+def test_require_package_remembers_missing_packages(monkeypatch) -> None:
+    with pytest.raises(BaseOptionalDependencyError):
+        needs_missing_package()
+
+    def fail_import(name, *args, **kwargs):
+        raise AssertionError(f"{name} should not be imported again")
+
+    monkeypatch.setattr(importlib, "import_module", fail_import)
+
+    with pytest.raises(BaseOptionalDependencyError):
+        needs_missing_package()
@@ -0,0 +1,78 @@
+# This Software (Dioptra) is being made available as a public service by the
+# National Institute of Standards and Technology (NIST), an Agency of the United
+# States Department of Commerce. This software was developed in part by employees of
+# NIST and in part by NIST contractors. Copyright in portions of this software that
+# were developed by NIST contractors has been licensed or assigned to NIST. Pursuant
+# to Title 17 United States Code Section 105, works of NIST employees are not
+# subject to copyright protection in the United States. However, NIST may hold
+# international copyright in software created by its employees and domestic
+# copyright (or licensing rights) in portions of software that were assigned or
+# licensed to NIST. To the extent that NIST holds copyright in this software, it is
+# being made available under the Creative Commons Attribution 4.0 International
+# license (CC BY 4.0). The disclaimers of the CC BY 4.0 license apply to all parts
+# of the software developed or licensed by NIST.
+#
+# ACCESS THE FULL CC BY 4.0 LICENSE HERE:
+# https://creativecommons.org/licenses/by/4.0/legalcode
+import sys
+import textwrap
+from types import ModuleType
+
+import pytest
+
+from dioptra.sdk.utilities.imports import LazyModule, lazy_import
+
+
+@pytest.fixture
+def heavy_module(tmp_path, monkeypatch) -> str:
+    name = "dioptra_lazy_heavy_module"
+    (tmp_path / f"{name}.py").write_text(
+        textwrap.dedent(
+            """
+            def answer():
+                return 42
+            """
+        )
+    )
+    monkeypatch.syspath_prepend(str(tmp_path))
+    monkeypatch.delitem(sys.modules, name, raising=False)
+
+    return name
+
+
+def test_lazy_import_defers_import_until_attribute_access(heavy_module) -> None:
+    module = lazy_import(heavy_module)
+
+    assert isinstance(module, ModuleType)
+    assert not module.is_loaded
+    assert heavy_module not in sys.modules
+
+    assert module.answer() == 42
+    assert module.is_loaded
+    assert heavy_module in sys.modules
+
+
+def test_lazy_module_sees_changes_to_imported_module(heavy_module, monkeypatch) -> None:
+    module = lazy_import(heavy_module)
+    module.answer()
+    monkeypatch.setattr(sys.modules[heavy_module], "answer", lambda: 0)
+
+    assert module.answer() == 0
+    assert "answer" in dir(module)
+
+
+def test_lazy_import_of_missing_package_fails_on_access() -> None:
+    module = lazy_import("dioptra_missing_package.submodule")
+
+    assert "not loaded" in repr(module)
+
+    with pytest.raises(ModuleNotFoundError):
+        module.anything
+
+
+def test_lazy_module_respects_blocked_imports(heavy_module, monkeypatch) -> None:
+    monkeypatch.setitem(sys.modules, heavy_module, None)
+    module = LazyModule(heavy_module)
+
+    with pytest.raises(ImportError):
+        module.answer
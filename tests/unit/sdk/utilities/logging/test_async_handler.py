@@ -0,0 +1,154 @@
+# This Software (Dioptra) is being made available as a public service by the
+# National Institute of Standards and Technology (NIST), an Agency of the United
+# States Department of Commerce. This software was developed in part by employees of
+# NIST and in part by NIST contractors. Copyright in portions of this software that
+# were developed by NIST contractors has been licensed or assigned to NIST. Pursuant
+# to Title 17 United States Code Section 105, works of NIST employees are not
+# subject to copyright protection in the United States. However, NIST may hold
+# international copyright in software created by its employees and domestic
+# copyright (or licensing rights) in portions of software that were assigned or
+# licensed to NIST. To the extent that NIST holds copyright in this software, it is
+# being made available under the Creative Commons Attribution 4.0 International
+# license (CC BY 4.0). The disclaimers of the CC BY 4.0 license apply to all parts
+# of the software developed or licensed by NIST.
+#
+# ACCESS THE FULL CC BY 4.0 LICENSE HERE:
+# https://creativecommons.org/licenses/by/4.0/legalcode
+import io
+import logging
+import os
+import threading
+
+import pytest
+
+from dioptra.sdk.utilities.logging import AsyncLogHandler
+
+
+class BlockingStream(io.StringIO):
+    def __init__(self) -> None:
+        super().__init__()
+        self.unblocked = threading.Event()
+        self.writes = 0
+
+    def write(self, s: str) -> int:
+        self.unblocked.wait()
+        self.writes += 1
+        return super().write(s)
+
+
+@pytest.fixture
+def logger(request) -> logging.Logger:
+    logger = logging.getLogger(f"dioptra.tests.{request.node.name}")
+    logger.propagate = False
+    logger.setLevel(logging.INFO)
+    yield logger
+
+    for handler in list(logger.handlers):
+        logger.removeHandler(handler)
+        handler.close()
+
+
+def make_handler(stream, **kwargs) -> AsyncLogHandler:
+    stream_handler = logging.StreamHandler(stream)
+    stream_handler.setFormatter(logging.Formatter("%(levelname)s %(message)s"))
+    return AsyncLogHandler(stream_handler, **kwargs)
+
+
+def test_async_handler_writes_records_in_order(logger) -> None:
+    stream = io.StringIO()
+    handler = make_handler(stream)
+    logger.addHandler(handler)
+
+    for i in range(1000):
+        logger.info("message %d", i)
+
+    handler.flush()
+
+    assert stream.getvalue().splitlines() == [f"INFO message {i}" for i in range(1000)]
+
+
+def test_async_handler_batches_writes(logger) -> None:
+    stream = BlockingStream()
+    handler = make_handler(stream, batch_size=100)
+    logger.addHandler(handler)
+    logger.info("first")
+
+    for i in range(250):
+        logger.info("message %d", i)
+
+    stream.unblocked.set()
+    handler.flush()
+
+    assert len(stream.getvalue().splitlines()) == 251
+    assert stream.writes <= 5
+
+
+def test_async_handler_drop_policy_reports_dropped_records(logger) -> None:
+    stream = BlockingStream()
+    handler = make_handler(stream, max_queue_size=10, overflow="drop", batch_size=1)
+    logger.addHandler(handler)
+
+    for i in range(100):
+        logger.info("message %d", i)
+
+    stream.unblocked.set()
+    handler.flush()
+    logger.info("last")
+    handler.flush()
+    lines = stream.getvalue().splitlines()
+
+    assert handler.dropped > 0
+    assert lines[-1] == "INFO last"
+    assert f"WARNING Dropped {handler.dropped} log records" in stream.getvalue()
+    assert len(lines) == 100 - handler.dropped + 2
+
+
+def test_async_handler_rejects_unknown_overflow_policy() -> None:
+    with pytest.raises(ValueError):
+        make_handler(io.StringIO(), overflow="ignore")
+
+
+@pytest.mark.skipif(not hasattr(os, "fork"), reason="requires os.fork")
+def test_async_handler_logs_after_fork(logger, tmp_path) -> None:
+    filepath = tmp_path / "log.txt"
+
+    with filepath.open("w") as stream:
+        handler = make_handler(stream)
+        logger.addHandler(handler)
+        logger.info("parent")
+        pid = os.fork()
+
+        if pid == 0:  # pragma: nocover
+            logger.info("child")
+            handler.flush()
+            os._exit(0)
+
+        os.waitpid(pid, 0)
+        logger.removeHandler(handler)
+        handler.close()
+
+    assert sorted(filepath.read_text().splitlines()) == ["INFO child", "INFO parent"]
+
+
+@pytest.mark.skipif(not hasattr(os, "fork"), reason="requires os.fork")
+def test_async_handler_writes_all_records_before_os_exit(logger, tmp_path) -> None:
+    filepath = tmp_path / "log.txt"
+
+    with filepath.open("w") as stream:
+        handler = make_handler(stream)
+        logger.addHandler(handler)
+        pid = os.fork()
+
+        if pid == 0:  # pragma: nocover
+            for i in range(2000):
+                logger.info("message %d", i)
+
+            os._exit(0)
+
+        os.waitpid(pid, 0)
+        logger.removeHandler(handler)
+        handler.close()
+
+    assert filepath.read_text().splitlines() == [
+        f"INFO message {i}" for i in range(2000)
+    ]
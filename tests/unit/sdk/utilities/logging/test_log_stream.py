@@ -0,0 +1,58 @@
+# This Software (Dioptra) is being made available as a public service by the
+# National Institute of Standards and Technology (NIST), an Agency of the United
+# States Department of Commerce. This software was developed in part by employees of
+# NIST and in part by NIST contractors. Copyright in portions of this software that
+# were developed by NIST contractors has been licensed or assigned to NIST. Pursuant
+# to Title 17 United States Code Section 105, works of NIST employees are not
+# subject to copyright protection in the United States. However, NIST may hold
+# international copyright in software created by its employees and domestic
+# copyright (or licensing rights) in portions of software that were assigned or
+# licensed to NIST. To the extent that NIST holds copyright in this software, it is
+# being made available under the Creative Commons Attribution 4.0 International
+# license (CC BY 4.0). The disclaimers of the CC BY 4.0 license apply to all parts
+# of the software developed or licensed by NIST.
+#
+# ACCESS THE FULL CC BY 4.0 LICENSE HERE:
+# https://creativecommons.org/licenses/by/4.0/legalcode
+import logging
+
+from dioptra.sdk.utilities.logging import StderrLogStream, StdoutLogStream
+
+
+def test_log_stream_coalesces_progress_updates(caplog) -> None:
+    caplog.set_level(logging.INFO, logger="STDERR")
+
+    with StderrLogStream(as_json=False, progress_interval=3600) as stream:
+        for i in range(100):
+            stream.write(f"\r{i:3d}%|####")
+
+        stream.write("done\n")
+
+        for i in range(3):
+            stream.write("\b\b\b\b" + f"\r{i}/3")
+
+    assert [x.getMessage() for x in caplog.records] == [
+        "0%|####",
+        "99%|####",
+        "done",
+        "2/3",
+    ]
+
+
+def test_log_stream_logs_every_update_without_interval(caplog) -> None:
+    caplog.set_level(logging.INFO, logger="STDOUT")
+
+    with StdoutLogStream(as_json=True, progress_interval=0):
+        for i in range(5):
+            print(f"\rstep {i}", end="")
+
+        print("first line\nsecond line")
+
+    assert [x.getMessage() for x in caplog.records] == [
+        "step 0",
+        "step 1",
+        "step 2",
+        "step 3",
+        "step 4",
+        "first line\nsecond line",
+    ]
@@ -0,0 +1,89 @@
+# This Software (Dioptra) is being made available as a public service by the
+# National Institute of Standards and Technology (NIST), an Agency of the United
+# States Department of Commerce. This software was developed in part by employees of
+# NIST and in part by NIST contractors. Copyright in portions of this software that
+# were developed by NIST contractors has been licensed or assigned to NIST. Pursuant
+# to Title 17 United States Code Section 105, works of NIST employees are not
+# subject to copyright protection in the United States. However, NIST may hold
+# international copyright in software created by its employees and domestic
+# copyright (or licensing rights) in portions of software that were assigned or
+# licensed to NIST. To the extent that NIST holds copyright in this software, it is
+# being made available under the Creative Commons Attribution 4.0 International
+# license (CC BY 4.0). The disclaimers of the CC BY 4.0 license apply to all parts
+# of the software developed or licensed by NIST.
+#
+# ACCESS THE FULL CC BY 4.0 LICENSE HERE:
+# https://creativecommons.org/licenses/by/4.0/legalcode
+import pytest
+from structlog.exceptions import DropEvent
+
+from dioptra.sdk.utilities.logging import SamplingProcessor, parse_sample_rates
+
+
+def _process(processor, method_name, event):
+    try:
+        return processor(None, method_name, {"event": event})
+
+    except DropEvent:
+        return None
+
+
+def test_sampling_processor_keeps_every_nth_event() -> None:
+    processor = SamplingProcessor({"Request received": 4})
+    kept = [_process(processor, "info", "Request received") for _ in range(10)]
+
+    assert [x is not None for x in kept] == [
+        True,
+        False,
+        False,
+        False,
+        True,
+        False,
+        False,
+        False,
+        True,
+        False,
+    ]
+    assert kept[0] == {"event": "Request received", "sample_rate": 4}
+
+
+@pytest.mark.parametrize("method_name", ["warning", "error", "exception"])
+def test_sampling_processor_never_drops_warnings_and_errors(method_name) -> None:
+    processor = SamplingProcessor({"Request received": 100})
+
+    for _ in range(5):
+        assert _process(processor, method_name, "Request received") == {
+            "event": "Request received"
+        }
+
+
+def test_sampling_processor_passes_through_other_events() -> None:
+    processor = SamplingProcessor({"Request received": 100, "Job submitted": 1})
+
+    for _ in range(5):
+        assert _process(processor, "info", "Job submitted") == {
+            "event": "Job submitted"
+        }
+
+
+@pytest.mark.parametrize(
+    "value, expected",
+    [
+        (None, {}),
+        ("", {}),
+        (
+            '{"Request received": 10, "Job submitted": "2"}',
+            {
+                "Request received": 10,
+                "Job submitted": 2,
+            },
+        ),
+    ],
+)
+def test_parse_sample_rates(value, expected) -> None:
+    assert parse_sample_rates(value) == expected
+
+
+def test_parse_sample_rates_rejects_non_objects() -> None:
+    with pytest.raises(ValueError):
+        parse_sample_rates("[10]")
@@ -0,0 +1,126 @@
+# This Software (Dioptra) is being made available as a public service by the
+# National Institute of Standards and Technology (NIST), an Agency of the United
+# States Department of Commerce. This software was developed in part by employees of
+# NIST and in part by NIST contractors. Copyright in portions of this software that
+# were developed by NIST contractors has been licensed or assigned to NIST. Pursuant
+# to Title 17 United States Code Section 105, works of NIST employees are not
+# subject to copyright protection in the United States. However, NIST may hold
+# international copyright in software created by its employees and domestic
+# copyright (or licensing rights) in portions of software that were assigned or
+# licensed to NIST. To the extent that NIST holds copyright in this software, it is
+# being made available under the Creative Commons Attribution 4.0 International
+# license (CC BY 4.0). The disclaimers of the CC BY 4.0 license apply to all parts
+# of the software developed or licensed by NIST.
+#
+# ACCESS THE FULL CC BY 4.0 LICENSE HERE:
+# https://creativecommons.org/licenses/by/4.0/legalcode
+import json
+
+import numpy as np
+import pytest
+import scipy.stats
+
+from dioptra.sdk.utilities.metrics import (
+    KLLSketch,
+    ParquetSpillWriter,
+    StreamingStatistics,
+)
+
+
+@pytest.fixture
+def values() -> np.ndarray:
+    return np.random.default_rng(0).lognormal(size=50_000)
+
+
+def _accumulate(values: np.ndarray, batch_size: int) -> StreamingStatistics:
+    statistics = StreamingStatistics(seed=0)
+
+    for start in range(0, len(values), batch_size):
+        statistics.update(values[start : start + batch_size])  # noqa: E203
+
+    return statistics
+
+
+@pytest.mark.parametrize("batch_size", [1, 37, 1024])
+def test_streaming_statistics_moments(values, batch_size) -> None:
+    statistics = _accumulate(values[:5000], batch_size)
+
+    assert statistics.count == 5000
+    assert statistics.mean == pytest.approx(values[:5000].mean(), rel=1e-12)
+    assert statistics.std == pytest.approx(values[:5000].std(), rel=1e-12)
+    assert statistics.min == values[:5000].min()
+    assert statistics.max == values[:5000].max()
+
+
+def test_streaming_statistics_quantiles_within_rank_error(values) -> None:
+    statistics = _accumulate(values, 1000)
+
+    for q, estimate in [
+        (0.25, statistics.quantile(0.25)),
+        (0.5, statistics.median),
+        (0.75, statistics.quantile(0.75)),
+    ]:
+        rank = scipy.stats.percentileofscore(values, estimate) / 100
+        assert abs(rank - q) < 0.02
+
+    assert statistics.iqr == pytest.approx(scipy.stats.iqr(values), rel=0.05)
+
+
+def test_kll_sketch_is_exact_before_compaction() -> None:
+    sketch = KLLSketch(k=200)
+    sketch.update(np.arange(101, dtype="float64"))
+
+    assert sketch.quantile(0.5) == 50.0
+    assert list(sketch.quantile([0.0, 1.0])) == [0.0, 100.0]
+
+
+def test_kll_sketch_memory_is_sublinear(values) -> None:
+    sketch = KLLSketch(k=200, seed=0)
+    sketch.update(values)
+
+    assert sketch.count == len(values)
+    assert sum(len(x) for x in sketch.to_dict()["levels"]) < 1000
+
+
+def test_streaming_statistics_merge_matches_single_pass(values) -> None:
+    shards = [_accumulate(x, 512) for x in np.array_split(values, 4)]
+    merged = StreamingStatistics.from_dict(json.loads(json.dumps(shards[0].to_dict())))
+
+    for shard in shards[1:]:
+        merged.merge(shard)
+
+    single_pass = _accumulate(values, 512)
+
+    assert merged.count == single_pass.count
+    assert merged.mean == pytest.approx(single_pass.mean, rel=1e-12)
+    assert merged.variance == pytest.approx(single_pass.variance, rel=1e-9)
+    assert merged.min == single_pass.min and merged.max == single_pass.max
+    assert merged.median == pytest.approx(np.median(values), rel=0.05)
+
+
+def test_streaming_statistics_empty() -> None:
+    statistics = StreamingStatistics()
+    statistics.merge(StreamingStatistics())
+
+    assert statistics.count == 0
+    assert all(np.isnan(x) for x in statistics.summary().values())
+
+
+def test_parquet_spill_writer(tmp_path) -> None:
+    pq = pytest.importorskip("pyarrow.parquet")
+    spill_path = tmp_path / "spill" / "distance_metrics.parquet"
+
+    with ParquetSpillWriter(spill_path) as spill_writer:
+        for batch_num in range(3):
+            spill_writer.write_batch(
+                {
+                    "image": [f"{batch_num}_{x}.png" for x in range(4)],
+                    "l2": np.arange(4, dtype="float64") + batch_num,
+                }
+            )
+
+    table = pq.read_table(spill_path)
+
+    assert spill_writer.num_rows == 12
+    assert table.num_rows == 12
+    assert table.column("l2").to_pylist()[4:8] == [1.0, 2.0, 3.0, 4.0]
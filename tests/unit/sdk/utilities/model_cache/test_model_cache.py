@@ -0,0 +1,203 @@
+# This Software (Dioptra) is being made available as a public service by the
+# National Institute of Standards and Technology (NIST), an Agency of the United
+# States Department of Commerce. This software was developed in part by employees of
+# NIST and in part by NIST contractors. Copyright in portions of this software that
+# were developed by NIST contractors has been licensed or assigned to NIST. Pursuant
+# to Title 17 United States Code Section 105, works of NIST employees are not
+# subject to copyright protection in the United States. However, NIST may hold
+# international copyright in software created by its employees and domestic
+# copyright (or licensing rights) in portions of software that were assigned or
+# licensed to NIST. To the extent that NIST holds copyright in this software, it is
+# being made available under the Creative Commons Attribution 4.0 International
+# license (CC BY 4.0). The disclaimers of the CC BY 4.0 license apply to all parts
+# of the software developed or licensed by NIST.
+#
+# ACCESS THE FULL CC BY 4.0 LICENSE HERE:
+# https://creativecommons.org/licenses/by/4.0/legalcode
+import os
+import threading
+from concurrent.futures import ThreadPoolExecutor
+from pathlib import Path
+from types import SimpleNamespace
+from typing import Dict, List
+
+import pytest
+
+from dioptra.sdk.utilities.model_cache import ModelCache, _model_cache
+
+
+class FakeRegistry(object):
+    def __init__(self) -> None:
+        self.downloads: List[str] = []
+        self.sources: Dict[str, str] = {}
+
+    def get_model_version(self, name: str, version: str) -> SimpleNamespace:
+        return SimpleNamespace(
+            source=self.sources.get(f"{name}/{version}", f"s3://models/{name}"),
+            run_id="abc123",
+            creation_timestamp=1,
+        )
+
+    def repository(self, uri: str) -> SimpleNamespace:
+        def download_artifacts(artifact_path: str, dst_path: str) -> str:
+            self.downloads.append(uri)
+            Path(dst_path).mkdir(parents=True)
+            Path(dst_path, "weights.bin").write_bytes(uri.encode("utf-8"))
+            return dst_path
+
+        return SimpleNamespace(download_artifacts=download_artifacts)
+
+
+@pytest.fixture
+def registry(monkeypatch) -> FakeRegistry:
+    registry = FakeRegistry()
+    monkeypatch.setattr(_model_cache, "MlflowClient", lambda: registry)
+    monkeypatch.setattr(_model_cache, "ModelsArtifactRepository", registry.repository)
+    return registry
+
+
+def _loader(model_path: str) -> Dict[str, bytes]:
+    return {"weights": Path(model_path, "weights.bin").read_bytes()}
+
+
+def test_model_cache_serves_repeated_loads_from_memory(tmp_path, registry) -> None:
+    cache = ModelCache(cache_dir=tmp_path, max_models=2)
+
+    model = cache.load("mnist_le_net", 1, loader=_loader)
+
+    assert model == {"weights": b"models:/mnist_le_net/1"}
+    assert cache.load("mnist_le_net", "1", loader=_loader) is model
+    assert registry.downloads == ["models:/mnist_le_net/1"]
+    assert cache.stats()["misses"] == 1
+    assert cache.stats()["memory_hits"] == 1
+    assert cache.stats()["hit_rate"] == 0.5
+
+
+def test_model_cache_reuses_downloads_across_processes(tmp_path, registry) -> None:
+    ModelCache(cache_dir=tmp_path).load("mnist_le_net", 1, loader=_loader)
+    cache = ModelCache(cache_dir=tmp_path)
+
+    model = cache.load("mnist_le_net", 1, loader=_loader)
+
+    assert model == {"weights": b"models:/mnist_le_net/1"}
+    assert len(registry.downloads) == 1
+    assert cache.stats()["disk_hits"] == 1
+    assert cache.stats()["load_seconds_saved"] >= 0.0
+
+
+def test_model_cache_downloads_reregistered_versions(tmp_path, registry) -> None:
+    cache = ModelCache(cache_dir=tmp_path)
+    first_model = cache.load("mnist_le_net", 1, loader=_loader)
+    registry.sources["mnist_le_net/1"] = "s3://models/retrained"
+
+    second_model = cache.load("mnist_le_net", 1, loader=_loader)
+
+    assert second_model is not first_model
+    assert len(registry.downloads) == 2
+    assert len(list((tmp_path / "mnist_le_net" / "1").iterdir())) == 2
+
+
+def test_model_cache_discards_corrupted_downloads(tmp_path, registry) -> None:
+    ModelCache(cache_dir=tmp_path).load("mnist_le_net", 1, loader=_loader)
+    (weights_path,) = tmp_path.rglob("weights.bin")
+    weights_path.write_bytes(b"truncated")
+
+    model = ModelCache(cache_dir=tmp_path).load("mnist_le_net", 1, loader=_loader)
+
+    assert model == {"weights": b"models:/mnist_le_net/1"}
+    assert len(registry.downloads) == 2
+
+
+def test_model_cache_skips_checksum_for_unchanged_files(
+    tmp_path, registry, monkeypatch
+) -> None:
+    ModelCache(cache_dir=tmp_path).load("mnist_le_net", 1, loader=_loader)
+    checksums: List[Path] = []
+    checksum = _model_cache._checksum
+    monkeypatch.setattr(
+        _model_cache,
+        "_checksum",
+        lambda directory: checksums.append(directory) or checksum(directory),
+    )
+
+    ModelCache(cache_dir=tmp_path).load("mnist_le_net", 1, loader=_loader)
+    assert checksums == []
+
+    (weights_path,) = tmp_path.rglob("weights.bin")
+    os.utime(weights_path, ns=(0, 0))
+    model = ModelCache(cache_dir=tmp_path).load("mnist_le_net", 1, loader=_loader)
+
+    assert model == {"weights": b"models:/mnist_le_net/1"}
+    assert len(checksums) == 1
+    assert len(registry.downloads) == 1
+
+
+def test_model_cache_loads_different_models_concurrently(tmp_path, registry) -> None:
+    cache = ModelCache(cache_dir=tmp_path)
+    barrier = threading.Barrier(2, timeout=5)
+
+    def loader(model_path: str) -> Dict[str, bytes]:
+        barrier.wait()
+        return _loader(model_path)
+
+    with ThreadPoolExecutor(max_workers=2) as executor:
+        models = list(
+            executor.map(
+                lambda version: cache.load("mnist_le_net", version, loader=loader),
+                [1, 2],
+            )
+        )
+
+    assert models == [
+        {"weights": b"models:/mnist_le_net/1"},
+        {"weights": b"models:/mnist_le_net/2"},
+    ]
+
+
+def test_model_cache_loads_the_same_model_once(tmp_path, registry) -> None:
+    cache = ModelCache(cache_dir=tmp_path)
+    loads: List[str] = []
+
+    def loader(model_path: str) -> Dict[str, bytes]:
+        loads.append(model_path)
+        return _loader(model_path)
+
+    with ThreadPoolExecutor(max_workers=4) as executor:
+        models = list(
+            executor.map(
+                lambda _: cache.load("mnist_le_net", 1, loader=loader), range(8)
+            )
+        )
+
+    assert all(x is models[0] for x in models)
+    assert len(loads) == 1
+    assert len(registry.downloads) == 1
+    assert cache.stats()["memory_hits"] == 7
+
+
+def test_model_cache_evicts_least_recently_used_models(tmp_path, registry) -> None:
+    cache = ModelCache(cache_dir=tmp_path, max_models=1)
+    first_model = cache.load("mnist_le_net", 1, loader=_loader)
+    cache.load("mnist_le_net", 2, loader=_loader)
+
+    reloaded_model = cache.load("mnist_le_net", 1, loader=_loader)
+
+    assert reloaded_model == first_model
+    assert reloaded_model is not first_model
+    assert cache.stats()["disk_hits"] == 1
+    assert len(registry.downloads) == 2
+
+
+def test_model_cache_keys_memory_by_flavor(tmp_path, registry) -> None:
+    cache = ModelCache(cache_dir=tmp_path)
+    graph_model = cache.load("mnist_le_net", 1, loader=_loader, flavor="graph")
+
+    eager_model = cache.load("mnist_le_net", 1, loader=_loader, flavor="eager")
+
+    assert eager_model is not graph_model
+    assert len(registry.downloads) == 1
+
+
+def test_model_cache_rejects_negative_size(tmp_path) -> None:
+    with pytest.raises(ValueError):
+        ModelCache(cache_dir=tmp_path, max_models=-1)
@@ -0,0 +1,184 @@
+# This Software (Dioptra) is being made available as a public service by the
+# National Institute of Standards and Technology (NIST), an Agency of the United
+# States Department of Commerce. This software was developed in part by employees of
+# NIST and in part by NIST contractors. Copyright in portions of this software that
+# were developed by NIST contractors has been licensed or assigned to NIST. Pursuant
+# to Title 17 United States Code Section 105, works of NIST employees are not
+# subject to copyright protection in the United States. However, NIST may hold
+# international copyright in software created by its employees and domestic
+# copyright (or licensing rights) in portions of software that were assigned or
+# licensed to NIST. To the extent that NIST holds copyright in this software, it is
+# being made available under the Creative Commons Attribution 4.0 International
+# license (CC BY 4.0). The disclaimers of the CC BY 4.0 license apply to all parts
+# of the software developed or licensed by NIST.
+#
+# ACCESS THE FULL CC BY 4.0 LICENSE HERE:
+# https://creativecommons.org/licenses/by/4.0/legalcode
+from pathlib import Path
+
+import mlflow
+import numpy as np
+import pandas as pd
+import pytest
+from dioptra_builtins.attacks import fgm
+
+from dioptra.sdk.utilities.metrics import StreamingStatistics
+
+BATCH_SIZE = 4
+IMAGE_SIZE = (8, 8, 1)
+N_CLASSES = 3
+N_IMAGES = 10
+
+
+@pytest.mark.parametrize(
+    "num_batches, num_shards",
+    [(12, 1), (12, 3), (10, 3), (7, 4), (3, 5), (0, 2)],
+)
+def test_shard_batches_cover_every_batch_once(num_batches, num_shards) -> None:
+    shards = [
+        fgm._shard_batches(
+            num_batches=num_batches, shard_index=shard_index, num_shards=num_shards
+        )
+        for shard_index in range(num_shards)
+    ]
+    batch_nums = [batch_num for shard in shards for batch_num in shard]
+    shard_sizes = [len(shard) for shard in shards]
+
+    assert batch_nums == list(range(num_batches))
+    assert max(shard_sizes) - min(shard_sizes) <= 1
+
+
+@pytest.mark.parametrize("shard_index, num_shards", [(0, 0), (-1, 2), (2, 2), (5, 3)])
+def test_shard_batches_invalid_shard(shard_index, num_shards) -> None:
+    with pytest.raises(ValueError, match="Invalid shard"):
+        fgm._shard_batches(
+            num_batches=10, shard_index=shard_index, num_shards=num_shards
+        )
+
+
+def test_create_adversarial_fgm_dataset_invalid_shard(tmp_path) -> None:
+    with pytest.raises(ValueError, match="Invalid shard"):
+        fgm.create_adversarial_fgm_dataset(
+            data_dir=str(tmp_path),
+            adv_data_dir=tmp_path / "adv",
+            keras_classifier=None,
+            image_size=IMAGE_SIZE,
+            shard_index=1,
+            num_shards=1,
+        )
+
+
+@pytest.fixture(scope="module")
+def data_dir(tmp_path_factory) -> Path:
+    keras_image = pytest.importorskip("tensorflow.keras.preprocessing.image")
+    data_dir = tmp_path_factory.mktemp("images")
+    rng = np.random.default_rng(0)
+
+    for image_num in range(N_IMAGES):
+        label_dir = data_dir / f"{image_num % N_CLASSES}"
+        label_dir.mkdir(exist_ok=True)
+        keras_image.save_img(
+            path=str(label_dir / f"{image_num:02d}.png"),
+            x=rng.integers(0, 256, size=IMAGE_SIZE).astype("uint8"),
+            scale=False,
+        )
+
+    return data_dir
+
+
+@pytest.fixture(scope="module")
+def classifier():
+    tf = pytest.importorskip("tensorflow")
+    art_classification = pytest.importorskip("art.estimators.classification")
+    tf.keras.utils.set_random_seed(0)
+    model = tf.keras.Sequential(
+        [
+            tf.keras.layers.Flatten(input_shape=IMAGE_SIZE),
+            tf.keras.layers.Dense(N_CLASSES),
+        ]
+    )
+
+    return art_classification.TensorFlowV2Classifier(
+        model=model,
+        nb_classes=N_CLASSES,
+        input_shape=IMAGE_SIZE,
+        loss_object=tf.keras.losses.CategoricalCrossentropy(from_logits=True),
+        clip_values=(0.0, 1.0),
+    )
+
+
+@pytest.fixture
+def mlflow_run(tmp_path):
+    mlflow.set_tracking_uri((tmp_path / "mlruns").as_uri())
+
+    with mlflow.start_run() as run:
+        yield run
+
+
+def _l_inf_norm(y_true: np.ndarray, y_pred: np.ndarray) -> np.ndarray:
+    return np.abs(y_true - y_pred).reshape(len(y_true), -1).max(axis=1)
+
+
+@pytest.mark.parametrize("num_shards", [2, 3, 4], ids=lambda x: f"{x}_shards")
+def test_sharded_generation_matches_unsharded(
+    tmp_path, mlflow_run, data_dir, classifier, num_shards
+) -> None:
+    def generate(adv_data_dir, **kwargs) -> pd.DataFrame:
+        return fgm.create_adversarial_fgm_dataset(
+            data_dir=str(data_dir),
+            adv_data_dir=adv_data_dir,
+            keras_classifier=classifier,
+            image_size=IMAGE_SIZE,
+            distance_metrics_list=[("linf_norm", _l_inf_norm)],
+            batch_size=BATCH_SIZE,
+            num_workers=0,
+            prefetch=0,
+            **kwargs,
+        )
+
+    expected = generate(tmp_path / "unsharded")
+    result = pd.concat(
+        [
+            generate(
+                tmp_path / "sharded", shard_index=shard_index, num_shards=num_shards
+            )
+            for shard_index in range(num_shards)
+        ],
+        ignore_index=True,
+    )
+
+    assert len(expected) == N_IMAGES
+    pd.testing.assert_frame_equal(result, expected)
+    assert sorted(
+        x.relative_to(tmp_path / "sharded") for x in tmp_path.glob("sharded/*/*.png")
+    ) == sorted(
+        x.relative_to(tmp_path / "unsharded")
+        for x in tmp_path.glob("unsharded/*/*.png")
+    )
+
+
+@pytest.mark.parametrize("in_memory", [True, False], ids=["in_memory", "spilled"])
+def test_log_distance_metrics_median_and_iqr(monkeypatch, in_memory) -> None:
+    scipy_stats = pytest.importorskip("scipy.stats")
+    values = np.random.default_rng(0).exponential(size=1001)
+    statistics = StreamingStatistics(k=8, seed=0)
+    statistics.update(values)
+    logged = {}
+    monkeypatch.setattr(
+        fgm.mlflow, "log_metric", lambda key, value: logged.__setitem__(key, value)
+    )
+
+    fgm._log_distance_metrics(
+        {"l2_norm": statistics},
+        distance_metrics_={"l2_norm": list(values)} if in_memory else None,
+    )
+
+    if in_memory:
+        assert logged["l2_norm_median"] == np.median(values)
+        assert logged["l2_norm_iqr"] == scipy_stats.iqr(values)
+
+    else:
+        assert logged["l2_norm_median"] == statistics.median
+        assert logged["l2_norm_iqr"] == statistics.iqr
+
+    assert logged["l2_norm_mean"] == pytest.approx(values.mean())
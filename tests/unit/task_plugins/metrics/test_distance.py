@@ -0,0 +1,179 @@
+# This Software (Dioptra) is being made available as a public service by the
+# National Institute of Standards and Technology (NIST), an Agency of the United
+# States Department of Commerce. This software was developed in part by employees of
+# NIST and in part by NIST contractors. Copyright in portions of this software that
+# were developed by NIST contractors has been licensed or assigned to NIST. Pursuant
+# to Title 17 United States Code Section 105, works of NIST employees are not
+# subject to copyright protection in the United States. However, NIST may hold
+# international copyright in software created by its employees and domestic
+# copyright (or licensing rights) in portions of software that were assigned or
+# licensed to NIST. To the extent that NIST holds copyright in this software, it is
+# being made available under the Creative Commons Attribution 4.0 International
+# license (CC BY 4.0). The disclaimers of the CC BY 4.0 license apply to all parts
+# of the software developed or licensed by NIST.
+#
+# ACCESS THE FULL CC BY 4.0 LICENSE HERE:
+# https://creativecommons.org/licenses/by/4.0/legalcode
+import numpy as np
+import pytest
+from dioptra_builtins.metrics import distance
+
+scipy_stats = pytest.importorskip("scipy.stats")
+
+FUSED_FUNCS = sorted(distance.FUSED_DISTANCE_METRICS)
+REQUEST = [{"name": f"{x}_metric", "func": x} for x in FUSED_FUNCS]
+
+
+@pytest.fixture
+def batches():
+    rng = np.random.default_rng(0)
+    y_true = rng.random((6, 4, 4, 3), dtype="float32")
+    y_pred = y_true + rng.uniform(-0.1, 0.1, size=y_true.shape).astype("float32")
+    return y_true, y_pred
+
+
+@pytest.mark.parametrize("func", FUSED_FUNCS)
+def test_fused_metric_matches_unfused(batches, func) -> None:
+    y_true, y_pred = batches
+    evaluator = distance.FusedDistanceMetrics(FUSED_FUNCS)
+    expected = distance.DISTANCE_METRICS_REGISTRY[func](y_true, y_pred)
+
+    np.testing.assert_allclose(evaluator(y_true, y_pred)[func], expected, rtol=1e-5)
+    np.testing.assert_allclose(
+        evaluator(y_true, y_pred, funcs=[func])[func], expected, rtol=1e-5
+    )
+
+
+def test_fused_metric_list_matches_unfused(batches) -> None:
+    y_true, y_pred = batches
+    fused = distance.get_distance_metric_list(REQUEST, fused=True)
+    unfused = distance.get_distance_metric_list(REQUEST, fused=False)
+    expected = distance.evaluate_distance_metrics(unfused, y_true, y_pred)
+    result = distance.evaluate_distance_metrics(fused, y_true, y_pred)
+
+    assert list(result) == [x["name"] for x in REQUEST]
+
+    for name, metric in fused:
+        np.testing.assert_allclose(result[name], expected[name], rtol=1e-5)
+        np.testing.assert_allclose(metric(y_true, y_pred), expected[name], rtol=1e-5)
+
+
+def test_fused_metrics_batch_mutated_in_place(batches) -> None:
+    y_true, y_pred = batches
+    fused = distance.get_distance_metric_list(REQUEST, fused=True)
+    distance.evaluate_distance_metrics(fused, y_true, y_pred)
+
+    y_pred += 0.5
+    result = distance.evaluate_distance_metrics(fused, y_true, y_pred)
+
+    for name, metric in fused:
+        expected = distance.DISTANCE_METRICS_REGISTRY[metric.func](y_true, y_pred)
+        np.testing.assert_allclose(result[name], expected, rtol=1e-5)
+        np.testing.assert_allclose(metric(y_true, y_pred), expected, rtol=1e-5)
+
+
+def test_fused_metrics_unknown_func() -> None:
+    with pytest.raises(distance.UnknownDistanceMetricError):
+        distance.FusedDistanceMetrics(["paired_wasserstein_distances"])
+
+    evaluator = distance.FusedDistanceMetrics(["l_2_norm"])
+
+    with pytest.raises(distance.UnknownDistanceMetricError):
+        evaluator(np.zeros((1, 2)), np.zeros((1, 2)), funcs=["l_1_norm"])
+
+
+def test_evaluate_distance_metrics_mixed_list(batches) -> None:
+    y_true, y_pred = batches
+    request = [
+        {"name": "wasserstein", "func": "paired_wasserstein_distances"},
+        {"name": "l2", "func": "l_2_norm"},
+    ]
+    result = distance.evaluate_distance_metrics(
+        distance.get_distance_metric_list(request), y_true, y_pred
+    )
+
+    assert list(result) == ["wasserstein", "l2"]
+    np.testing.assert_allclose(
+        result["wasserstein"],
+        distance.paired_wasserstein_distances(y_true, y_pred),
+    )
+    np.testing.assert_allclose(
+        result["l2"], distance.l_2_norm(y_true, y_pred), rtol=1e-5
+    )
+
+
+def _scipy_wasserstein_distances(y_true, y_pred, **kwargs):
+    return np.array(
+        [
+            scipy_stats.wasserstein_distance(
+                u_values=u_values, v_values=v_values, **kwargs
+            )
+            for u_values, v_values in zip(
+                y_true.reshape(len(y_true), -1), y_pred.reshape(len(y_pred), -1)
+            )
+        ]
+    )
+
+
+@pytest.mark.parametrize("dtype", ["uint8", "int64", "float32", "float64"])
+def test_paired_wasserstein_distances_matches_scipy(dtype) -> None:
+    rng = np.random.default_rng(0)
+    y_true = rng.integers(0, 256, size=(5, 4, 4, 3)).astype(dtype)
+    y_pred = rng.integers(0, 256, size=(5, 4, 4, 3)).astype(dtype)
+
+    np.testing.assert_allclose(
+        distance.paired_wasserstein_distances(y_true, y_pred),
+        _scipy_wasserstein_distances(y_true, y_pred),
+        rtol=1e-10,
+    )
+
+
+def test_paired_wasserstein_distances_uint8_does_not_wrap() -> None:
+    y_true = np.array([[0, 10, 20]], dtype="uint8")
+    y_pred = np.array([[5, 15, 25]], dtype="uint8")
+
+    np.testing.assert_allclose(
+        distance.paired_wasserstein_distances(y_true, y_pred),
+        _scipy_wasserstein_distances(y_true, y_pred),
+    )
+    np.testing.assert_allclose(
+        distance.paired_wasserstein_distances(y_true, y_pred), [5.0]
+    )
+
+
+@pytest.mark.parametrize("dtype", ["uint8", "float32"])
+def test_weighted_paired_wasserstein_distances_matches_scipy(dtype) -> None:
+    rng = np.random.default_rng(0)
+    y_true = rng.integers(0, 8, size=(40, 3, 3)).astype(dtype)
+    y_pred = rng.integers(0, 8, size=(40, 3, 3)).astype(dtype)
+    u_weights = rng.random(9)
+    v_weights = rng.random(9)
+
+    np.testing.assert_allclose(
+        distance.paired_wasserstein_distances(
+            y_true, y_pred, u_weights=u_weights, v_weights=v_weights
+        ),
+        _scipy_wasserstein_distances(
+            y_true, y_pred, u_weights=u_weights, v_weights=v_weights
+        ),
+        rtol=1e-10,
+        atol=1e-12,
+    )
+    np.testing.assert_allclose(
+        distance.paired_wasserstein_distances(y_true, y_pred, u_weights=u_weights),
+        _scipy_wasserstein_distances(y_true, y_pred, u_weights=u_weights),
+        rtol=1e-10,
+        atol=1e-12,
+    )
+
+
+def test_weighted_paired_wasserstein_distances_invalid_weights() -> None:
+    y_true = np.zeros((2, 3))
+
+    with pytest.raises(ValueError):
+        distance.paired_wasserstein_distances(y_true, y_true, u_weights=np.ones(2))
+
+    with pytest.raises(ValueError):
+        distance.paired_wasserstein_distances(
+            y_true, y_true, v_weights=np.array([1.0, -1.0, 1.0])
+        )
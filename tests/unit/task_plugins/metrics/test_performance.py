@@ -0,0 +1,132 @@
+# This Software (Dioptra) is being made available as a public service by the
+# National Institute of Standards and Technology (NIST), an Agency of the United
+# States Department of Commerce. This software was developed in part by employees of
+# NIST and in part by NIST contractors. Copyright in portions of this software that
+# were developed by NIST contractors has been licensed or assigned to NIST. Pursuant
+# to Title 17 United States Code Section 105, works of NIST employees are not
+# subject to copyright protection in the United States. However, NIST may hold
+# international copyright in software created by its employees and domestic
+# copyright (or licensing rights) in portions of software that were assigned or
+# licensed to NIST. To the extent that NIST holds copyright in this software, it is
+# being made available under the Creative Commons Attribution 4.0 International
+# license (CC BY 4.0). The disclaimers of the CC BY 4.0 license apply to all parts
+# of the software developed or licensed by NIST.
+#
+# ACCESS THE FULL CC BY 4.0 LICENSE HERE:
+# https://creativecommons.org/licenses/by/4.0/legalcode
+import numpy as np
+import pytest
+from dioptra_builtins.metrics.performance import StreamingPerformanceMetrics
+
+sklearn_metrics = pytest.importorskip("sklearn.metrics")
+
+AVERAGED_FUNCS = ["f1", "precision", "recall"]
+SKLEARN_AVERAGED_METRICS = {
+    "f1": sklearn_metrics.f1_score,
+    "precision": sklearn_metrics.precision_score,
+    "recall": sklearn_metrics.recall_score,
+}
+
+
+def _evaluate(y_true, y_pred, num_classes, batch_size=7, **kwargs):
+    evaluator = StreamingPerformanceMetrics(
+        funcs=["accuracy", "mcc", *AVERAGED_FUNCS],
+        num_classes=num_classes,
+        **kwargs,
+    )
+
+    for start in range(0, len(y_true), batch_size):
+        evaluator.update(
+            y_true=y_true[start : start + batch_size],  # noqa: E203
+            y_pred=y_pred[start : start + batch_size],  # noqa: E203
+        )
+
+    return evaluator.result()
+
+
+@pytest.fixture
+def multiclass_labels():
+    # Class 4 appears in neither y_true nor y_pred, class 3 only in y_pred.
+    rng = np.random.default_rng(0)
+    y_true = rng.integers(0, 3, size=50)
+    y_pred = np.where(rng.random(50) < 0.7, y_true, rng.integers(0, 4, size=50))
+    return y_true, y_pred
+
+
+@pytest.mark.parametrize("average", ["micro", "macro", "weighted"])
+def test_multiclass_metrics_match_sklearn(multiclass_labels, average) -> None:
+    y_true, y_pred = multiclass_labels
+    result = _evaluate(y_true, y_pred, num_classes=5, average=average)
+
+    assert result["accuracy"] == pytest.approx(
+        sklearn_metrics.accuracy_score(y_true, y_pred)
+    )
+    assert result["mcc"] == pytest.approx(
+        sklearn_metrics.matthews_corrcoef(y_true, y_pred)
+    )
+
+    for func in AVERAGED_FUNCS:
+        expected = SKLEARN_AVERAGED_METRICS[func](
+            y_true, y_pred, average=average, zero_division=0
+        )
+        assert result[func] == pytest.approx(expected), func
+
+
+@pytest.mark.parametrize("pos_label", [0, 1])
+def test_binary_metrics_match_sklearn(pos_label) -> None:
+    rng = np.random.default_rng(0)
+    y_true = rng.integers(0, 2, size=40)
+    y_pred = np.where(rng.random(40) < 0.8, y_true, 1 - y_true)
+    result = _evaluate(y_true, y_pred, num_classes=2, pos_label=pos_label)
+
+    for func in AVERAGED_FUNCS:
+        expected = SKLEARN_AVERAGED_METRICS[func](
+            y_true, y_pred, pos_label=pos_label, zero_division=0
+        )
+        assert result[func] == pytest.approx(expected), func
+
+
+def test_binary_average_with_multiclass_labels_raises(multiclass_labels) -> None:
+    y_true, y_pred = multiclass_labels
+
+    with pytest.raises(ValueError, match="average='binary'"):
+        sklearn_metrics.f1_score(y_true, y_pred, average="binary")
+
+    with pytest.raises(ValueError, match="average='binary'"):
+        _evaluate(y_true, y_pred, num_classes=5, average="binary")
+
+
+def test_binary_average_with_two_present_classes_matches_sklearn() -> None:
+    y_true = np.array([0, 2, 2, 0, 2, 2])
+    y_pred = np.array([0, 2, 0, 0, 2, 0])
+    result = _evaluate(y_true, y_pred, num_classes=3, pos_label=2)
+
+    for func in AVERAGED_FUNCS:
+        expected = SKLEARN_AVERAGED_METRICS[func](y_true, y_pred, pos_label=2)
+        assert result[func] == pytest.approx(expected), func
+
+    with pytest.raises(ValueError, match="pos_label"):
+        _evaluate(y_true, y_pred, num_classes=3, pos_label=1)
+
+
+def test_invalid_pos_label_raises() -> None:
+    with pytest.raises(ValueError, match="pos_label"):
+        StreamingPerformanceMetrics(funcs=["f1"], num_classes=2, pos_label=2)
+
+
+def test_roc_auc_matches_sklearn() -> None:
+    rng = np.random.default_rng(0)
+    y_true = rng.integers(0, 3, size=200)
+    y_score = rng.dirichlet(np.ones(3), size=200)
+    y_score[np.arange(200), y_true] += 0.5
+    y_score /= y_score.sum(axis=1, keepdims=True)
+    evaluator = StreamingPerformanceMetrics(funcs=["roc_auc"], num_classes=3)
+
+    for start in range(0, 200, 32):
+        evaluator.update(
+            y_true=y_true[start : start + 32],  # noqa: E203
+            y_score=y_score[start : start + 32],  # noqa: E203
+        )
+
+    expected = sklearn_metrics.roc_auc_score(y_true, y_score, multi_class="ovr")
+    assert evaluator.result()["roc_auc"] == pytest.approx(expected, abs=1e-2)